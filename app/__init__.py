@@ -96,6 +96,30 @@ def create_app():
             """헬스체크 엔드포인트"""
             return {'status': 'ok', 'service': 'insight'}, 200
 
+        @app.route('/health/db-pool')
+        def health_db_pool():
+            """현재 워커의 DB 커넥션 풀 상태 (고갈/대기 지표 포함)"""
+            from app.utils.db_utils import get_pool_status
+            return {'status': 'ok', 'pool': get_pool_status()}, 200
+
+        @app.route('/health/banner-counters')
+        def health_banner_counters():
+            """현재 워커의 배너 카운터/이벤트 로그 버퍼 상태 (대기 이벤트 수, 반영 지연 시간)"""
+            from app.services.banner_counters import get_banner_counter_status
+            from app.services.banner_analytics import get_banner_event_log_status
+            return {
+                'status': 'ok',
+                'buffer': get_banner_counter_status(),
+                'event_log': get_banner_event_log_status()
+            }, 200
+
+        @app.route('/health/banner-cache')
+        def health_banner_cache():
+            """현재 워커의 활성 배너 캐시 상태 (적중/미스/무효화 횟수)"""
+            from app.services.banner_cache import get_banner_cache
+            cache = get_banner_cache()
+            return {'status': 'ok', 'cache': cache.status() if cache else {'enabled': False}}, 200
+
     # 네이버 사이트 소유권 확인 파일 (인증 불필요)
     @app.route('/naver5c5df9165d15c739c9d6c9a94a4bc39a.html')
     def naver_verification():
@@ -8,6 +8,7 @@ import os
 import pandas as pd
 import numpy as np
 import logging
+from datetime import date, timedelta
 from flask import (
     Blueprint, render_template, request, jsonify,
     session, redirect, url_for, send_file, send_from_directory, current_app, g
@@ -15,9 +16,21 @@ from flask import (
 from werkzeug.utils import secure_filename
 import flask
 
-from app.services.ad_analyzer import AdAnalyzer
+from app.services.ad_analyzer import AdAnalyzer, SNAPSHOT_PAGE_SIZE
+from app.services.ad_trend import TREND_MAX_POINTS
+from app.services.ad_compare import DIFF_TOP_K, DIFF_TOP_K_MAX
 from app.services.ai_insights import AIInsights
+from app.services.insight_cache import get_insight_cache
+from app.services.coupang_scoring import build_recommendations
+from app.services.coupang_report import (
+    process_coupang_report, CoupangReportError, COUPANG_REPORT_COLUMNS, REPORT_PARSER_VERSION
+)
+from app.services.dataset_store import get_dataset_store
+from app.services.upload_cache import UploadCache, get_upload_cache
+from app.services.upload_jobs import get_upload_job_queue
+from app.services.snapshot_store import get_snapshot_store
 from app.utils.db_utils import execute_query, execute_insert, execute_update, DatabaseError
+from app.utils.excel_reader import read_excel_columns
 from app.utils.helpers import (
     allowed_file, clean_filename, get_unique_filename,
     create_error_response, create_success_response,
@@ -68,16 +81,6 @@ def is_social_bot(user_agent_string):
     ua_lower = user_agent_string.lower()
     return any(bot.lower() in ua_lower for bot in BOT_USER_AGENTS)
 
-# ========================================
-# 제외 키워드 판정 상수
-# ========================================
-EXCLUDE_MIN_SPEND = 5000      # 최소 광고비 (원)
-EXCLUDE_MIN_CLICKS = 10       # 최소 클릭수
-EXCLUDE_CPC_CRITICAL = 500    # CPC 심각 기준 (원)
-EXCLUDE_CPC_VERY_HIGH = 800   # CPC 매우 높음 기준 (원)
-EXCLUDE_CLICKS_CRITICAL = 30  # 전환없음 즉시제외 클릭수
-EXCLUDE_CLICKS_HIGH = 15      # 전환없음 조속히제외 클릭수
-
 # ========================================
 # 임시 인증 함수 (TODO: 추후 재설계)
 # ========================================
@@ -108,6 +111,23 @@ COLUMN_MAPPING = {
     '매출액': 'revenue'
 }
 
+# 일반 업로드에서 읽을 컬럼 (한글/영문 모두 허용)
+UPLOAD_COLUMNS = list(COLUMN_MAPPING.keys()) + list(COLUMN_MAPPING.values())
+
+# 일반 업로드 시트 우선순위: 일별데이터 > 광고데이터 > 입력양식 > 첫 번째 시트
+UPLOAD_SHEET_PRIORITY = ['일별데이터', '광고데이터', '입력양식', 0]
+
+
+class UploadDataError(ValueError):
+    """업로드 데이터 형식 오류 (필수 컬럼 누락 등) - 사용자에게 그대로 안내"""
+    pass
+
+
+class SnapshotTooLargeError(UploadDataError):
+    """분석 데이터가 스냅샷 저장소 크기 제한(SNAPSHOT_MAX_BLOB_MB)을 넘는 경우 - 413으로 안내"""
+    status_code = 413
+
+
 # 광고유형 값 매핑 (한글 → 영문)
 AD_TYPE_MAPPING = {
     '매출형': 'sales',
@@ -352,9 +372,154 @@ def logout():
 # 2. 데이터 업로드 API
 # ========================================
 
+def _wants_async_job():
+    """async=true 요청이고 작업 큐가 활성화된 경우 비동기 처리"""
+    return request.form.get('async', 'false').lower() == 'true' and get_upload_job_queue() is not None
+
+
+def _enqueue_upload_job(file, kind, handler, params):
+    """
+    업로드 파일을 작업 큐에 등록하고 job_id 즉시 반환 (202)
+
+    Args:
+        file: 업로드 파일 (FileStorage)
+        kind (str): 작업 종류 ('upload', 'coupang')
+        handler (callable): 처리 함수 (_process_upload 등)
+        params (dict): 처리 함수 추가 인자
+    """
+    user_id = get_current_user_id()
+    job_id = get_upload_job_queue().submit(file.stream, handler, {
+        'user_id': user_id,
+        'kind': kind,
+        'filename': file.filename
+    }, {**params, 'filename': file.filename, 'user_id': user_id})
+
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status': 'queued',
+        'status_url': url_for('ad_analysis.get_upload_job', job_id=job_id),
+        'result_url': url_for('ad_analysis.get_upload_job_result', job_id=job_id)
+    }), 202
+
+
+def _store_snapshot(user_id, snapshot_id, df, meta):
+    """
+    업로드/수기입력 결과를 스냅샷 저장소에 보관
+
+    Raises:
+        SnapshotTooLargeError: 압축 후 크기가 SNAPSHOT_MAX_BLOB_MB를 넘어 저장되지 않은 경우
+    """
+    if get_snapshot_store().put(user_id, snapshot_id, df, meta) is None:
+        limit_mb = current_app.config.get('SNAPSHOT_MAX_BLOB_MB', 20)
+        raise SnapshotTooLargeError(
+            f'데이터가 너무 큽니다 ({len(df):,}행). 압축 후 {limit_mb}MB 이하가 되도록 기간을 나눠 업로드해주세요'
+        )
+
+
+def _process_upload(source, filename, user_id, snapshot_name, progress=None):
+    """
+    일반 업로드 처리 (파싱 → 정규화 → 지표 → 인사이트 → 스냅샷 저장)
+    동기 요청과 비동기 작업(풀 워커 프로세스)에서 공통 사용
+
+    Args:
+        source: 업로드 파일 스트림
+        filename (str): 원본 파일명
+        user_id (str): 사용자 ID
+        snapshot_name (str): 스냅샷 이름
+        progress (callable, optional): 단계 알림 콜백 progress(stage)
+
+    Returns:
+        dict: 응답 payload (snapshot_id, metrics, insights)
+
+    Raises:
+        UploadDataError: 필수 컬럼이 없는 경우
+        SnapshotTooLargeError: 스냅샷 크기 제한을 넘는 경우
+    """
+    progress = progress or (lambda stage: None)
+
+    # 파일 읽기
+    progress('parse')
+    if filename.endswith('.csv'):
+        df = pd.read_csv(source)
+    else:
+        # Excel 파일인 경우, 우선순위에 따라 시트를 찾아 필요한 컬럼만 스트리밍으로 읽기
+        df = read_excel_columns(
+            source, columns=UPLOAD_COLUMNS, sheet_name=UPLOAD_SHEET_PRIORITY,
+            engine=current_app.config.get('EXCEL_READER_ENGINE', 'auto')
+        )
+
+    # 컬럼 정규화 (한글 → 영문 변환 + 광고유형 처리)
+    progress('normalize')
+    df = normalize_columns(df)
+
+    # 필수 컬럼 확인 (ad_type은 normalize_columns에서 자동 추가됨)
+    required_cols = ['date', 'campaign_name', 'spend', 'clicks', 'conversions', 'revenue']
+    missing_cols = [col for col in required_cols if col not in df.columns]
+
+    if missing_cols:
+        # 한글 컬럼명으로 에러 메시지 표시
+        kor_missing = [k for k, v in COLUMN_MAPPING.items() if v in missing_cols]
+        raise UploadDataError(f'필수 컬럼 누락: {kor_missing or missing_cols}')
+
+    # Impression 데이터 처리 (없거나 0이면 추정)
+    impressions_estimated = False
+    if 'impressions' not in df.columns or df['impressions'].sum() == 0:
+        # CTR 2% 가정하여 노출수 추정
+        df['impressions'] = (df['clicks'] * 50).astype(int)
+        impressions_estimated = True
+        logger.info('Impressions column missing or zero - estimated from clicks (CTR ~2%)')
+
+    # 임시 스냅샷 ID 생성 (DB 대신 메모리 사용)
+    snapshot_id = int(pd.Timestamp.now().timestamp())
+
+    # In-Memory 방식으로 지표 계산 (DB 없이)
+    progress('metrics')
+    metrics = _calculate_metrics_inmemory(df)
+
+    # Add impression estimation flag to metrics
+    metrics['impressions_estimated'] = impressions_estimated
+
+    # AI 인사이트 요청 (OpenAI 호출은 백그라운드, 응답에는 캐시 결과 또는 기본 인사이트)
+    progress('insights')
+    try:
+        insights = AIInsights().request_insights(metrics, df)
+    except Exception as ai_error:
+        logger.warning(f'AI insights generation failed: {ai_error}')
+        insights = {
+            'insights_id': None,
+            'status': 'done',
+            'insights': '✅ 분석 완료! 데이터가 성공적으로 처리되었습니다.',
+            'source': 'fallback'
+        }
+
+    # 스냅샷 저장소에 보관 (세션에는 포인터만 저장)
+    _store_snapshot(user_id, snapshot_id, df, {
+        'name': snapshot_name,
+        'metrics': metrics,
+        'insights': insights['insights'],
+        'insights_id': insights['insights_id']
+    })
+
+    logger.info(f'File uploaded and processed in-memory: {filename}, snapshot_id: {snapshot_id}')
+
+    return {
+        'success': True,
+        'snapshot_id': snapshot_id,
+        'metrics': metrics,
+        'insights': insights['insights'],
+        'insights_id': insights['insights_id'],
+        'insights_status': insights['status']
+    }
+
+
 @ad_bp.route('/api/ad-analysis/upload', methods=['POST'])
 def upload_data():
-    """Excel/CSV 파일 업로드 및 분석 (데이터베이스 저장)"""
+    """
+    Excel/CSV 파일 업로드 및 분석 (데이터베이스 저장)
+
+    async=true면 작업 큐에 등록하고 job_id를 즉시 반환 (202)
+    """
     user_id = get_current_user_id()
 
     if 'file' not in request.files:
@@ -365,89 +530,111 @@ def upload_data():
     if file.filename == '':
         return jsonify({'success': False, 'error': '파일명이 비어있습니다'}), 400
 
+    # 스냅샷 이름 생성
+    snapshot_name = request.form.get('snapshot_name', f'업로드 {pd.Timestamp.now().strftime("%Y-%m-%d %H:%M")}')
+
     try:
-        # 파일 읽기
-        if file.filename.endswith('.csv'):
-            df = pd.read_csv(file)
-        else:
-            # Excel 파일인 경우, 자동으로 적절한 시트 찾기
-            xl_file = pd.ExcelFile(file)
-
-            # 시트 우선순위: 일별데이터 > 광고데이터 > 첫 번째 시트
-            if '일별데이터' in xl_file.sheet_names:
-                df = pd.read_excel(xl_file, sheet_name='일별데이터')
-            elif '광고데이터' in xl_file.sheet_names:
-                df = pd.read_excel(xl_file, sheet_name='광고데이터')
-            else:
-                # 첫 번째 시트 읽기 (입력양식 시트 우선)
-                if '입력양식' in xl_file.sheet_names:
-                    df = pd.read_excel(xl_file, sheet_name='입력양식')
-                else:
-                    df = pd.read_excel(xl_file, sheet_name=0)
+        if _wants_async_job():
+            return _enqueue_upload_job(file, 'upload', _process_upload, {'snapshot_name': snapshot_name})
 
-        # 컬럼 정규화 (한글 → 영문 변환 + 광고유형 처리)
-        df = normalize_columns(df)
+        result = _process_upload(file.stream, file.filename, user_id, snapshot_name)
+        session['snapshot_id'] = result['snapshot_id']
+        return jsonify(result)
 
-        # 필수 컬럼 확인 (ad_type은 normalize_columns에서 자동 추가됨)
-        required_cols = ['date', 'campaign_name', 'spend', 'clicks', 'conversions', 'revenue']
-        missing_cols = [col for col in required_cols if col not in df.columns]
+    except SnapshotTooLargeError as e:
+        return jsonify({'success': False, 'error': str(e)}), e.status_code
 
-        if missing_cols:
-            # 한글 컬럼명으로 에러 메시지 표시
-            kor_missing = [k for k, v in COLUMN_MAPPING.items() if v in missing_cols]
-            return jsonify({'success': False, 'error': f'필수 컬럼 누락: {kor_missing or missing_cols}'}), 400
+    except UploadDataError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
 
-        # Impression 데이터 처리 (없거나 0이면 추정)
-        impressions_estimated = False
-        if 'impressions' not in df.columns or df['impressions'].sum() == 0:
-            # CTR 2% 가정하여 노출수 추정
-            df['impressions'] = (df['clicks'] * 50).astype(int)
-            impressions_estimated = True
-            logger.info('Impressions column missing or zero - estimated from clicks (CTR ~2%)')
+    except Exception as e:
+        logger.error(f'File upload failed: {e}')
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': f'처리 중 오류: {str(e)}'}), 500
 
-        # 스냅샷 이름 생성
-        snapshot_name = request.form.get('snapshot_name', f'업로드 {pd.Timestamp.now().strftime("%Y-%m-%d %H:%M")}')
 
-        # 임시 스냅샷 ID 생성 (DB 대신 메모리 사용)
-        snapshot_id = int(pd.Timestamp.now().timestamp())
+def _process_coupang_upload(source, filename, user_id, include_data=True, progress=None):
+    """
+    쿠팡 보고서 업로드 처리 (캐시 확인 → 파싱 → 가공 → 데이터셋 저장)
+    동기 요청과 비동기 작업(풀 워커 프로세스)에서 공통 사용
 
-        # In-Memory 방식으로 지표 계산 (DB 없이)
-        metrics = _calculate_metrics_inmemory(df)
+    Args:
+        source: 업로드 파일 스트림 (seek 가능)
+        filename (str): 원본 파일명
+        user_id (str): 사용자 ID
+        include_data (bool): 응답에 키워드 배열 포함 여부
+        progress (callable, optional): 단계 알림 콜백 progress(stage)
 
-        # Add impression estimation flag to metrics
-        metrics['impressions_estimated'] = impressions_estimated
+    Returns:
+        dict: 응답 payload (dataset_id, summary, data 등)
 
-        # AI 인사이트 생성 (선택사항)
-        try:
-            ai = AIInsights()
-            insights = ai.generate_insights(metrics, df)
-        except Exception as ai_error:
-            logger.warning(f'AI insights generation failed: {ai_error}')
-            insights = '✅ 분석 완료! 데이터가 성공적으로 처리되었습니다.'
-
-        # 세션에 저장 (선택사항)
-        session[f'snapshot_{snapshot_id}'] = {
-            'name': snapshot_name,
-            'data': df.to_dict('records'),
-            'metrics': metrics,
-            'insights': insights,
-            'created_at': pd.Timestamp.now().isoformat()
-        }
+    Raises:
+        CoupangReportError: 매출액 또는 필수 컬럼이 없는 경우
+    """
+    progress = progress or (lambda stage: None)
+
+    # 동일 파일 재업로드 시 캐시된 가공 결과 사용 (파일 내용 해시 + 가공 로직 버전)
+    progress('parse')
+    upload_cache = get_upload_cache()
+    cache_key = UploadCache.content_key(source, REPORT_PARSER_VERSION) if upload_cache else None
+    cached = upload_cache.get(cache_key) if upload_cache else None
+
+    if cached is not None:
+        df, meta = cached
+        summary, data_type, warning_message = meta['summary'], meta['data_type'], meta.get('warning')
+        logger.info(f'Coupang upload cache hit: {filename}, keywords: {len(df)}')
+    else:
+        # Excel 파일 읽기 (업로드 스트림에서 필요한 컬럼만 스트리밍 파싱)
+        df = read_excel_columns(
+            source, columns=COUPANG_REPORT_COLUMNS,
+            engine=current_app.config.get('EXCEL_READER_ENGINE', 'auto')
+        )
+        logger.info(f'Coupang file uploaded: {filename}, rows: {len(df)}, columns: {len(df.columns)}')
+
+        progress('normalize')
+        report = process_coupang_report(df)
+        df, summary = report['df'], report['summary']
+        data_type, warning_message = report['data_type'], report['warning']
+
+        if upload_cache:
+            upload_cache.put(cache_key, df, {
+                'summary': summary,
+                'data_type': data_type,
+                'warning': warning_message
+            })
 
-        logger.info(f'File uploaded and processed in-memory: {file.filename}, snapshot_id: {snapshot_id}')
+    # 서버 측 데이터셋 저장소에 보관 (추천/필터/페이징은 dataset_id로 요청)
+    progress('metrics')
+    dataset_id = get_dataset_store().put(df, {
+        'user_id': user_id,
+        'kind': 'coupang',
+        'filename': filename,
+        'summary': summary,
+        'data_type': data_type,
+        'warning': warning_message
+    })
+
+    logger.info(f'Coupang data processed successfully: {len(df)} keywords, dataset_id: {dataset_id}')
+
+    # JSON 응답 생성
+    response_data = {
+        'success': True,
+        'dataset_id': dataset_id,
+        'summary': summary,
+        'data_type': data_type,
+        'cached': cached is not None
+    }
 
-        return jsonify({
-            'success': True,
-            'snapshot_id': snapshot_id,
-            'metrics': metrics,
-            'insights': insights
-        })
+    # include_data=false면 키워드 배열을 응답에서 생략 (페이징 API 사용)
+    if include_data:
+        response_data['data'] = _records_for_json(df)
 
-    except Exception as e:
-        logger.error(f'File upload failed: {e}')
-        import traceback
-        traceback.print_exc()
-        return jsonify({'success': False, 'error': f'처리 중 오류: {str(e)}'}), 500
+    # 경고 메시지가 있으면 포함
+    if warning_message:
+        response_data['warning'] = warning_message
+
+    return response_data
 
 
 @ad_bp.route('/api/ad-analysis/upload-coupang', methods=['POST'])
@@ -459,6 +646,8 @@ def upload_coupang():
     - 키워드, 노출수, 클릭수, 광고비, 클릭률
     - 총 주문수(1일), 총 판매수량(1일), 총 전환매출액(1일)
     - 총광고수익률(1일) = ROAS
+
+    async=true면 작업 큐에 등록하고 job_id를 즉시 반환 (202)
     """
     user_id = get_current_user_id()
 
@@ -470,289 +659,114 @@ def upload_coupang():
     if file.filename == '':
         return jsonify({'success': False, 'error': '파일명이 비어있습니다'}), 400
 
+    include_data = request.form.get('include_data', 'true').lower() != 'false'
+
     try:
-        # Excel 파일 읽기 (인코딩 문제 해결 - BytesIO 사용)
-        import io
-        file_content = file.read()
-        df = pd.read_excel(io.BytesIO(file_content), engine='openpyxl')
-        logger.info(f'Coupang file uploaded: {file.filename}, rows: {len(df)}, columns: {len(df.columns)}')
-
-        # 필수 컬럼 확인 (매출액은 14일 우선, 없으면 1일 사용)
-        required_cols_base = ['키워드', '노출수', '클릭수', '광고비', '클릭률']
-
-        # 경고 메시지 초기화
-        warning_message = None
-        data_type = '14일'
-
-        # 매출액 컬럼 선택: 14일 우선, 없으면 1일 사용
-        if '총 전환매출액(14일)' in df.columns:
-            revenue_col = '총 전환매출액(14일)'
-            data_type = '14일'
-            logger.info('Using 14-day revenue data')
-        elif '총 전환매출액(1일)' in df.columns:
-            revenue_col = '총 전환매출액(1일)'
-            data_type = '1일'
-            warning_message = '⚠️ 주의: 14일 데이터가 없어 1일 데이터를 사용합니다. ROAS가 실제보다 낮게 표시될 수 있습니다.'
-            logger.warning('Using 1-day revenue data (14-day not available)')
-        else:
-            logger.error('No revenue column found')
-            return jsonify({'success': False, 'error': '매출액 컬럼 없음 (총 전환매출액(14일) 또는 총 전환매출액(1일) 필요)'}), 400
-
-        # ROAS 컬럼 선택
-        if '총광고수익률(14일)' in df.columns:
-            roas_col = '총광고수익률(14일)'
-        elif '총광고수익률(1일)' in df.columns:
-            roas_col = '총광고수익률(1일)'
-        else:
-            roas_col = None
+        if _wants_async_job():
+            return _enqueue_upload_job(file, 'coupang', _process_coupang_upload, {'include_data': include_data})
 
-        # 주문수/판매수량 컬럼 선택
-        if '총 주문수(14일)' in df.columns:
-            order_col = '총 주문수(14일)'
-            quantity_col = '총 판매수량(14일)' if '총 판매수량(14일)' in df.columns else '총 판매수량(1일)'
-        else:
-            order_col = '총 주문수(1일)'
-            quantity_col = '총 판매수량(1일)'
-
-        required_cols = required_cols_base + [order_col, quantity_col, revenue_col]
-        if roas_col:
-            required_cols.append(roas_col)
-
-        missing = [col for col in required_cols if col not in df.columns]
-        if missing:
-            logger.error(f'Missing required columns: {missing}')
-            return jsonify({'success': False, 'error': f'필수 컬럼 누락: {missing}'}), 400
-
-        # 컬럼명 통일 (14일/1일 상관없이 동일한 이름으로 사용)
-        df = df.rename(columns={
-            revenue_col: '총 전환매출액',
-            order_col: '총 주문수',
-            quantity_col: '총 판매수량'
-        })
-        if roas_col:
-            df = df.rename(columns={roas_col: '총광고수익률'})
-
-        logger.info(f'Column mapping: revenue={revenue_col}, orders={order_col}')
-
-        # 키워드 정규화: 연속된 공백을 하나로 통일
-        if '키워드' in df.columns:
-            original_keywords = df['키워드'].nunique()
-            df['키워드'] = df['키워드'].astype(str).str.replace(r'\s+', ' ', regex=True).str.strip()
-            normalized_keywords = df['키워드'].nunique()
-            if original_keywords != normalized_keywords:
-                logger.info(f'Keyword normalization: {original_keywords} → {normalized_keywords} unique keywords')
-
-        # 데이터 정제
-        # 1. 모든 광고 노출 지면 데이터 포함 (검색영역 + 비검색영역 + 리타겟팅)
-        # 키워드가 '-'여도 포함 (비검색영역, 리타겟팅의 키워드는 '-'임)
-        if '광고 노출 지면' in df.columns:
-            exposure_types = df['광고 노출 지면'].value_counts()
-            logger.info(f'Ad exposure types included: {exposure_types.to_dict()}')
-
-        # 🔥 비검색영역 및 리타겟팅 통합 처리
-        if '광고 노출 지면' in df.columns:
-            # 1) 비검색영역 통합
-            non_search_mask = df['광고 노출 지면'].str.contains('비검색', na=False)
-            # 2) 리타겟팅 통합
-            retargeting_mask = df['광고 노출 지면'].str.contains('리타겟팅', na=False)
-
-            # 검색영역만 남김 (비검색, 리타겟팅 제외)
-            search_only_df = df[~(non_search_mask | retargeting_mask)].copy()
-
-            aggregated_rows = []
-
-            # === 비검색영역 통합 ===
-            if non_search_mask.sum() > 0:
-                non_search_df = df[non_search_mask].copy()
-                logger.info(f'비검색영역 통합 전: {non_search_mask.sum()}개 행')
-
-                # 비검색영역 지표 합산
-                non_search_aggregated = {
-                    '키워드': '비검색영역 (통합)',
-                    '광고 노출 지면': '비검색영역 (통합)',
-                    '노출수': non_search_df['노출수'].sum(),
-                    '클릭수': non_search_df['클릭수'].sum(),
-                    '광고비': non_search_df['광고비'].sum(),
-                    '총 주문수': non_search_df['총 주문수'].sum(),
-                    '총 판매수량': non_search_df['총 판매수량'].sum(),
-                    '총 전환매출액': non_search_df['총 전환매출액'].sum()
-                }
+        result = _process_coupang_upload(file.stream, file.filename, user_id, include_data)
+        session['coupang_dataset_id'] = result['dataset_id']
+        return jsonify(result)
 
-                # 클릭률 재계산
-                if non_search_aggregated['노출수'] > 0:
-                    non_search_aggregated['클릭률'] = (non_search_aggregated['클릭수'] / non_search_aggregated['노출수']) * 100
-                else:
-                    non_search_aggregated['클릭률'] = 0
+    except CoupangReportError as e:
+        logger.error(f'Coupang report invalid: {e}')
+        return jsonify({'success': False, 'error': str(e)}), 400
 
-                # ROAS 재계산 (문자열 형식으로 저장하여 Excel 데이터와 일치)
-                if non_search_aggregated['광고비'] > 0:
-                    roas_value = (non_search_aggregated['총 전환매출액'] / non_search_aggregated['광고비']) * 100
-                    non_search_aggregated['총광고수익률'] = f"{roas_value:.2f}%"
-                else:
-                    non_search_aggregated['총광고수익률'] = "0.00%"
+    except Exception as e:
+        logger.error(f'Coupang file upload failed: {e}')
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': f'처리 중 오류: {str(e)}'}), 500
 
-                aggregated_rows.append(non_search_aggregated)
-                logger.info(f'비검색영역 통합 완료: 1개 행으로 통합됨')
-            else:
-                logger.info('비검색영역 데이터 없음')
-
-            # === 리타겟팅 통합 ===
-            if retargeting_mask.sum() > 0:
-                retargeting_df = df[retargeting_mask].copy()
-                logger.info(f'리타겟팅 통합 전: {retargeting_mask.sum()}개 행')
-
-                # 리타겟팅 지표 합산
-                retargeting_aggregated = {
-                    '키워드': '리타겟팅 (통합)',
-                    '광고 노출 지면': '리타겟팅 (통합)',
-                    '노출수': retargeting_df['노출수'].sum(),
-                    '클릭수': retargeting_df['클릭수'].sum(),
-                    '광고비': retargeting_df['광고비'].sum(),
-                    '총 주문수': retargeting_df['총 주문수'].sum(),
-                    '총 판매수량': retargeting_df['총 판매수량'].sum(),
-                    '총 전환매출액': retargeting_df['총 전환매출액'].sum()
-                }
 
-                # 클릭률 재계산
-                if retargeting_aggregated['노출수'] > 0:
-                    retargeting_aggregated['클릭률'] = (retargeting_aggregated['클릭수'] / retargeting_aggregated['노출수']) * 100
-                else:
-                    retargeting_aggregated['클릭률'] = 0
+@ad_bp.route('/api/ad-analysis/insights/<insights_id>')
+def get_insights(insights_id):
+    """
+    백그라운드 AI 인사이트 조회 (업로드 응답의 insights_id)
 
-                # ROAS 재계산 (문자열 형식으로 저장하여 Excel 데이터와 일치)
-                if retargeting_aggregated['광고비'] > 0:
-                    roas_value = (retargeting_aggregated['총 전환매출액'] / retargeting_aggregated['광고비']) * 100
-                    retargeting_aggregated['총광고수익률'] = f"{roas_value:.2f}%"
-                else:
-                    retargeting_aggregated['총광고수익률'] = "0.00%"
+    Response:
+        - 생성 중: 202 {"status": "pending"}
+        - 완료: 200 {"status": "done", "insights": "...", "source": "ai" | "fallback"}
+    """
+    entry = get_insight_cache().get(insights_id)
+    if entry is None:
+        return jsonify({'success': False, 'error': '인사이트를 찾을 수 없습니다'}), 404
 
-                aggregated_rows.append(retargeting_aggregated)
-                logger.info(f'리타겟팅 통합 완료: 1개 행으로 통합됨')
-            else:
-                logger.info('리타겟팅 데이터 없음')
+    if entry['status'] == 'pending':
+        return jsonify({'success': True, 'insights_id': insights_id, 'status': 'pending'}), 202
 
-            # 통합된 데이터 병합
-            if aggregated_rows:
-                aggregated_df = pd.DataFrame(aggregated_rows)
-                df = pd.concat([search_only_df, aggregated_df], ignore_index=True)
-            else:
-                df = search_only_df
-
-        logger.info(f'Total keywords to analyze (before dedup): {len(df)}개')
-
-        # 🔥 키워드 중복 제거 - 동일 키워드는 데이터 합산
-        if '키워드' in df.columns:
-            keyword_groups = df.groupby('키워드', as_index=False).agg({
-                '노출수': 'sum',
-                '클릭수': 'sum',
-                '광고비': 'sum',
-                '총 주문수': 'sum',
-                '총 판매수량': 'sum',
-                '총 전환매출액': 'sum',
-                '광고 노출 지면': 'first',  # 첫 번째 값 사용
-            })
+    return jsonify({
+        'success': True,
+        'insights_id': insights_id,
+        'status': 'done',
+        'insights': entry['insights'],
+        'source': entry['source']
+    })
 
-            # 클릭률 재계산 (Infinity 방지)
-            keyword_groups['클릭률'] = (keyword_groups['클릭수'] / keyword_groups['노출수'] * 100).replace([np.inf, -np.inf], 0).fillna(0)
 
-            # ROAS 재계산
-            keyword_groups['총광고수익률'] = keyword_groups.apply(
-                lambda row: f"{(row['총 전환매출액'] / row['광고비'] * 100):.2f}%" if row['광고비'] > 0 else "0.00%",
-                axis=1
-            )
+# ========================================
+# 2-1. 업로드 작업 API (비동기 업로드)
+# ========================================
 
-            df = keyword_groups
-            logger.info(f'Keyword deduplication completed: {len(df)}개 (unique keywords)')
+def _get_own_job(job_id):
+    """현재 사용자의 작업 상태 (없거나 다른 사용자 작업이면 None)"""
+    queue = get_upload_job_queue()
+    if queue is None:
+        return None, None
+    status = queue.store.get_status(job_id)
+    if status is None or status.get('user_id') != get_current_user_id():
+        return queue, None
+    return queue, status
 
-        # 2. 클릭률 처리 (이미 % 형식이면 그대로, 소수점이면 100 곱하기)
-        if df['클릭률'].max() <= 1:
-            df['클릭률'] = df['클릭률'] * 100
 
-        # 3. ROAS 파싱
-        if df['총광고수익률'].dtype == 'object':
-            # "356.78%" → 356.78 변환
-            df['ROAS'] = df['총광고수익률'].str.rstrip('%').astype(float)
-        else:
-            df['ROAS'] = df['총광고수익률']
-            if df['ROAS'].max() <= 10:  # 소수점 형식 (3.56 → 356)
-                df['ROAS'] = df['ROAS'] * 100
-
-        # 4. CPC 계산 (클릭당 단가) - Infinity 방지
-        df['CPC'] = (df['광고비'] / df['클릭수']).replace([np.inf, -np.inf], 0).fillna(0)
-
-        # 5. 결측치 및 Infinity 처리 (JSON 직렬화 오류 방지)
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            df[col] = df[col].replace([np.inf, -np.inf], 0).fillna(0)
-
-        logger.info(f'Processed {len(df)} valid keywords')
-
-        # 요약 지표 계산
-        total_spend = df['광고비'].sum()
-        total_revenue = df['총 전환매출액'].sum()
-
-        # 평균CTR 계산 (Infinity 방지)
-        avg_ctr = df['클릭률'].mean()
-        if np.isinf(avg_ctr) or np.isnan(avg_ctr):
-            avg_ctr = 0
-
-        summary = {
-            '총광고비': int(total_spend),
-            '총매출액': int(total_revenue),
-            '평균ROAS': round((total_revenue / total_spend * 100), 2) if total_spend > 0 else 0,
-            '총클릭수': int(df['클릭수'].sum()),
-            '평균CTR': round(float(avg_ctr), 2),
-            '총노출수': int(df['노출수'].sum()),
-            '총주문수': int(df['총 주문수'].sum())
-        }
+@ad_bp.route('/api/ad-analysis/jobs/<job_id>')
+def get_upload_job(job_id):
+    """업로드 작업 진행 상황 조회 (status: queued → running(stage, progress) → done/failed)"""
+    _, status = _get_own_job(job_id)
+    if status is None:
+        return jsonify({'success': False, 'error': '작업을 찾을 수 없습니다'}), 404
 
-        # JSON 안전 변환 함수
-        import math
-        def sanitize_for_json(obj):
-            """Infinity, -Infinity, NaN을 JSON 안전 값으로 변환"""
-            if isinstance(obj, (float, np.floating)):
-                if math.isinf(float(obj)) or math.isnan(float(obj)):
-                    return 0
-                return float(obj)
-            elif isinstance(obj, np.integer):
-                return int(obj)
-            return obj
-
-        # DataFrame을 dict로 변환 후 Infinity/NaN 처리
-        data = df.to_dict('records')
-        for row in data:
-            for key, value in row.items():
-                row[key] = sanitize_for_json(value)
-
-        # 세션에 저장 (선택사항)
-        snapshot_id = int(pd.Timestamp.now().timestamp())
-        session[f'coupang_snapshot_{snapshot_id}'] = {
-            'data': data,
-            'summary': summary,
-            'created_at': pd.Timestamp.now().isoformat()
-        }
+    job = {key: status.get(key) for key in [
+        'job_id', 'kind', 'filename', 'status', 'stage', 'progress', 'error', 'created_at', 'updated_at'
+    ]}
+    if status['status'] == 'done':
+        job['result_url'] = url_for('ad_analysis.get_upload_job_result', job_id=job_id)
 
-        logger.info(f'Coupang data processed successfully: {len(data)} keywords')
+    return jsonify({'success': True, 'job': job})
 
-        # JSON 응답 생성
-        response_data = {
-            'success': True,
-            'data': data,
-            'summary': summary,
-            'data_type': data_type
-        }
 
-        # 경고 메시지가 있으면 포함
-        if warning_message:
-            response_data['warning'] = warning_message
+@ad_bp.route('/api/ad-analysis/jobs/<job_id>/result')
+def get_upload_job_result(job_id):
+    """
+    완료된 업로드 작업 결과 조회 (동기 업로드 응답과 동일한 형식)
+
+    완료 전이면 202와 현재 상태, 실패 시 오류 메시지 반환
+    """
+    queue, status = _get_own_job(job_id)
+    if status is None:
+        return jsonify({'success': False, 'error': '작업을 찾을 수 없습니다'}), 404
 
-        return jsonify(response_data)
+    if status['status'] == 'failed':
+        return jsonify({'success': False, 'error': status.get('error')}), status.get('status_code', 500)
 
-    except Exception as e:
-        logger.error(f'Coupang file upload failed: {e}')
-        import traceback
-        traceback.print_exc()
-        return jsonify({'success': False, 'error': f'처리 중 오류: {str(e)}'}), 500
+    result = queue.store.get_result(job_id) if status['status'] == 'done' else None
+    if result is None:
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status': status['status'],
+            'stage': status.get('stage'),
+            'progress': status.get('progress', 0)
+        }), 202
+
+    # 동기 업로드와 동일하게 세션에 결과 포인터 저장
+    if 'snapshot_id' in result:
+        session['snapshot_id'] = result['snapshot_id']
+    if 'dataset_id' in result:
+        session['coupang_dataset_id'] = result['dataset_id']
+
+    return jsonify(result)
 
 
 @ad_bp.route('/api/ad-analysis/coupang-recommendations', methods=['POST'])
@@ -762,7 +776,9 @@ def coupang_recommendations():
 
     Request Body:
         {
-            "data": [...],  # 키워드 데이터
+            "dataset_id": "...",          # 업로드 시 받은 데이터셋 핸들 (권장)
+            "excluded_keywords": [...],   # dataset_id 사용 시 클라이언트에서 제외한 키워드
+            "data": [...],                # 또는 키워드 데이터 직접 전송
             "criteria": {
                 "target_roas": 400  # 목표 ROAS (기본값: 400%)
             }
@@ -802,377 +818,130 @@ def coupang_recommendations():
     """
     try:
         data = request.get_json()
-        keywords = data.get('data', [])
         criteria = data.get('criteria', {})
+        dataset_id = data.get('dataset_id')
+
+        if dataset_id:
+            # 서버에 저장된 데이터셋으로 재스코어링 (데이터 재전송 없음)
+            df = get_dataset_store().get(dataset_id, user_id=get_current_user_id())
+            if df is None:
+                return jsonify({
+                    'success': False,
+                    'expired': True,
+                    'error': '데이터셋이 만료되었거나 찾을 수 없습니다'
+                }), 404
+
+            excluded = data.get('excluded_keywords') or []
+            if excluded:
+                df = df[~df['키워드'].isin(excluded)]
+        else:
+            keywords = data.get('data', [])
+            if not keywords:
+                return jsonify({'success': False, 'error': '데이터가 없습니다'}), 400
+            df = pd.DataFrame(keywords)
 
-        if not keywords:
-            return jsonify({'success': False, 'error': '데이터가 없습니다'}), 400
-
-        df = pd.DataFrame(keywords)
         logger.info(f'Analyzing {len(df)} keywords with enhanced scoring system')
 
-        # ===== 중요: 검색영역만 추천 대상으로 분석 =====
-        # 비검색영역, 리타겟팅은 추천에서 제외
-        if '광고 노출 지면' in df.columns:
-            original_count = len(df)
-            df = df[df['광고 노출 지면'] == '검색 영역'].copy()
-            logger.info(f'Filtered to search area only: {len(df)} keywords (from {original_count})')
-
-        if len(df) == 0:
-            return jsonify({
-                'success': True,
-                'recommendations': [],
-                'summary': {
-                    'total_waste': 0,
-                    'total_opportunity_loss': 0,
-                    'keywords_to_exclude': 0,
-                    'potential_savings': '0%',
-                    'critical_priority': 0,
-                    'high_priority': 0,
-                    'medium_priority': 0,
-                    'low_priority': 0
-                }
-            })
-
-        # 기본 통계 계산
-        total_spend = df['광고비'].sum()
-        total_revenue = df['총 전환매출액'].sum()
-        avg_roas = (total_revenue / total_spend * 100) if total_spend > 0 else 0
+        # 컬럼 단위 스코어링 엔진 (검색영역 필터링 포함)
         target_roas = criteria.get('target_roas', 400)  # 목표 ROAS 400%
+        recommendations, summary = build_recommendations(df, target_roas)
 
-        # === Phase 2: 중앙값 기반 통계 (Robust Statistics) ===
-        median_cpc = df['CPC'].median()
-        median_ctr = df['클릭률'].median()
-
-        # CPC 백분위수
-        cpc_percentiles = {
-            'p25': df['CPC'].quantile(0.25),
-            'p50': df['CPC'].quantile(0.50),
-            'p75': df['CPC'].quantile(0.75),
-            'p90': df['CPC'].quantile(0.90)
-        }
-
-        # 지출액 백분위수
-        spend_percentiles = {
-            'p25': df['광고비'].quantile(0.25),
-            'p50': df['광고비'].quantile(0.50),
-            'p75': df['광고비'].quantile(0.75),
-            'p90': df['광고비'].quantile(0.90)
-        }
-
-        # 성과 구간별 통계
-        tier_stats = {}
-        tier_definitions = {
-            'elite': df[df['ROAS'] >= 500],
-            'high': df[(df['ROAS'] >= 300) & (df['ROAS'] < 500)],
-            'mid': df[(df['ROAS'] >= 150) & (df['ROAS'] < 300)],
-            'low': df[df['ROAS'] < 150]
-        }
+        return jsonify({
+            'success': True,
+            'recommendations': recommendations,
+            'summary': summary
+        })
 
-        for tier_name, tier_df in tier_definitions.items():
-            if len(tier_df) > 0:
-                tier_stats[tier_name] = {
-                    'median_cpc': tier_df['CPC'].median(),
-                    'p75_cpc': tier_df['CPC'].quantile(0.75),
-                    'count': len(tier_df),
-                    'avg_roas': tier_df['ROAS'].mean()
-                }
+    except Exception as e:
+        logger.error(f'Recommendation generation failed: {e}')
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': f'추천 생성 실패: {str(e)}'}), 500
 
-        # 상위 성과 키워드 기준 (기회비용 계산용)
-        top_performers = df[df['ROAS'] >= target_roas]
-        if len(top_performers) > 0:
-            top_avg_roas = top_performers['ROAS'].mean()
-        else:
-            top_avg_roas = avg_roas
-
-        recommendations = []
-
-        for _, row in df.iterrows():
-            keyword = row['키워드']
-            spend = float(row['광고비'])
-            revenue = float(row['총 전환매출액'])
-            roas = float(row.get('ROAS', 0))
-            clicks = int(row['클릭수'])
-            ctr = float(row['클릭률'])
-            cpc = float(row['CPC'])
-
-            # === Phase 2: 새로운 스코어링 시스템 ===
-            reasons = []
-
-            # === 1. 수익성 점수 (0-50점) - ROAS 기반 ===
-            if revenue == 0:
-                profitability_score = 50
-                reasons.append("전환 0원")
-            elif roas < 20:
-                profitability_score = 45
-                reasons.append(f"ROAS {roas:.1f}% (극심한 손실)")
-            elif roas < 50:
-                profitability_score = 40
-                reasons.append(f"ROAS {roas:.1f}% (심각한 손실)")
-            elif roas < 100:
-                profitability_score = 35
-                reasons.append(f"ROAS {roas:.1f}% (손실)")
-            elif roas < 150:
-                profitability_score = 25
-                reasons.append(f"ROAS {roas:.1f}% (낮은 수익)")
-            elif roas < 200:
-                profitability_score = 15
-                reasons.append(f"ROAS {roas:.1f}% (목표 미달)")
-            elif roas < 300:
-                profitability_score = 10
-                reasons.append(f"ROAS {roas:.1f}% (목표 근접)")
-            else:
-                profitability_score = 0  # ROAS >= 300%
-
-            # === 2. 효율성 점수 (0-25점) - 성과 구간별 CPC 비교 ===
-            # 키워드 성과 구간 판정
-            if roas >= 500:
-                tier = 'elite'
-            elif roas >= 300:
-                tier = 'high'
-            elif roas >= 150:
-                tier = 'mid'
-            else:
-                tier = 'low'
 
-            # 해당 구간의 중앙값 CPC
-            if tier in tier_stats and tier_stats[tier]['count'] >= 3:
-                tier_median_cpc = tier_stats[tier]['median_cpc']
-            else:
-                tier_median_cpc = median_cpc  # fallback
+@ad_bp.route('/api/ad-analysis/datasets/<dataset_id>/keywords')
+def get_dataset_keywords(dataset_id):
+    """
+    저장된 쿠팡 데이터셋 키워드 조회 (필터링 + 정렬 + 페이징)
 
-            # CPC 비율 계산
-            if tier_median_cpc > 0:
-                cpc_ratio = cpc / tier_median_cpc
-            else:
-                cpc_ratio = 1.0
-
-            # 성과 구간별로 다른 기준 적용
-            if tier in ['elite', 'high']:
-                # 고성과 키워드: CPC 기준 관대
-                if cpc_ratio > 3.0:
-                    efficiency_score = 10
-                    reasons.append(f"CPC 과다 ({cpc:.0f}원)")
-                elif cpc_ratio > 2.5:
-                    efficiency_score = 5
-                else:
-                    efficiency_score = 0
-            elif tier == 'mid':
-                # 중성과 키워드: 보통 기준
-                if cpc_ratio > 2.5:
-                    efficiency_score = 20
-                    reasons.append(f"CPC 높음 ({cpc:.0f}원)")
-                elif cpc_ratio > 2.0:
-                    efficiency_score = 15
-                elif cpc_ratio > 1.5:
-                    efficiency_score = 10
-                else:
-                    efficiency_score = 0
-            else:
-                # 저성과 키워드: CPC 기준 엄격
-                if cpc_ratio > 2.0:
-                    efficiency_score = 25
-                    reasons.append(f"CPC 과다 ({cpc:.0f}원)")
-                elif cpc_ratio > 1.5:
-                    efficiency_score = 20
-                elif cpc_ratio > 1.2:
-                    efficiency_score = 15
-                else:
-                    efficiency_score = 5
-
-            # === 3. 규모 리스크 점수 (0-25점) - 지출액 + ROAS 조합 ===
-            # 지출 수준 판정
-            if spend > spend_percentiles['p90']:
-                spend_level = 'very_high'
-            elif spend > spend_percentiles['p75']:
-                spend_level = 'high'
-            elif spend > spend_percentiles['p50']:
-                spend_level = 'medium'
-            else:
-                spend_level = 'low'
-
-            # ROAS와 지출 조합으로 점수 계산
-            if roas == 0:
-                # 전환 0원 케이스
-                if spend_level == 'very_high':
-                    scale_risk_score = 25
-                    reasons.append(f"고지출 ({spend:,.0f}원)")
-                elif spend_level == 'high':
-                    scale_risk_score = 20
-                    reasons.append(f"중간 지출")
-                elif spend_level == 'medium':
-                    scale_risk_score = 15
-                else:
-                    scale_risk_score = 10
-            elif roas < 100:
-                # 손실 케이스
-                if spend_level == 'very_high':
-                    scale_risk_score = 20
-                    reasons.append(f"고지출 ({spend:,.0f}원)")
-                elif spend_level == 'high':
-                    scale_risk_score = 15
-                elif spend_level == 'medium':
-                    scale_risk_score = 10
-                else:
-                    scale_risk_score = 5
-            elif roas < 200:
-                # 낮은 수익 케이스
-                if spend_level in ['very_high', 'high']:
-                    scale_risk_score = 10
-                else:
-                    scale_risk_score = 0
-            elif roas < 300:
-                # 목표 미달 케이스
-                if spend_level == 'very_high':
-                    scale_risk_score = 5
-                else:
-                    scale_risk_score = 0
-            else:
-                # 목표 달성 (ROAS >= 300%)
-                scale_risk_score = 0
-
-            # 총점 계산
-            score = profitability_score + efficiency_score + scale_risk_score
-
-            # === Phase 3: 개선된 우선순위 결정 (조건 기반) ===
-            # 0단계: 데이터 부족 판정
-            if spend < EXCLUDE_MIN_SPEND and clicks < EXCLUDE_MIN_CLICKS:
-                priority = None
-                priority_label = '데이터 부족'
-                reasons.append('데이터 부족')
-            # 1단계: 고CPC + 저ROAS → 즉시제외 (광고비 무관)
-            elif cpc >= EXCLUDE_CPC_CRITICAL and roas < 100:
-                priority = 'critical'
-                priority_label = '즉시 제외'
-                reasons.append(f'고CPC({cpc:.0f}원) + 저ROAS')
-            elif cpc >= EXCLUDE_CPC_VERY_HIGH and roas < 200:
-                priority = 'critical'
-                priority_label = '즉시 제외'
-                reasons.append(f'초고CPC({cpc:.0f}원) + 저ROAS')
-            # 2단계: 전환없음 (ROAS 0%)
-            elif revenue == 0:
-                if clicks >= EXCLUDE_CLICKS_CRITICAL:
-                    priority = 'critical'
-                    priority_label = '즉시 제외'
-                    reasons.append(f'{clicks}클릭 전환없음')
-                elif clicks >= EXCLUDE_CLICKS_HIGH:
-                    priority = 'high'
-                    priority_label = '조속히 제외'
-                    reasons.append(f'{clicks}클릭 전환없음')
-                else:
-                    priority = 'medium'
-                    priority_label = '검토 필요'
-                    reasons.append('전환없음 검토')
-            # 3단계: ROAS 1~100% (손실)
-            elif roas < 100:
-                if spend >= spend_percentiles['p75']:
-                    priority = 'critical'
-                    priority_label = '즉시 제외'
-                    reasons.append('저ROAS + 고지출')
-                elif spend >= spend_percentiles['p50']:
-                    priority = 'high'
-                    priority_label = '조속히 제외'
-                    reasons.append('저ROAS + 중지출')
-                else:
-                    priority = 'medium'
-                    priority_label = '검토 필요'
-            # 4단계: ROAS 100~200% (저조)
-            elif roas < 200:
-                if spend >= spend_percentiles['p75']:
-                    priority = 'high'
-                    priority_label = '조속히 제외'
-                    reasons.append('저조ROAS + 고지출')
-                else:
-                    priority = 'medium'
-                    priority_label = '검토 필요'
-            # 5단계: ROAS 200~300% (목표 근접)
-            elif roas < 300:
-                priority = 'medium'
-                priority_label = '검토 필요'
-                reasons.append('ROAS 개선필요')
-            # 6단계: ROAS 300%+ (양호)
-            else:
-                priority = 'low'
-                priority_label = '모니터링'
-
-            # === 낭비 및 기회비용 계산 ===
-            if spend == 0:
-                # 광고비 0원인 경우 - 비정상 데이터 (낭비 없음)
-                waste = 0
-                waste_rate = 0
-                expected_revenue = 0
-                opportunity_loss = 0
-            elif roas < 100:
-                # 손실 케이스: 광고비 - 매출
-                waste = spend - revenue
-                waste_rate = 100 - roas
-                # 기회비용: 이 광고비를 상위 성과 키워드에 투자했을 때의 기대 매출
-                expected_revenue = spend * (top_avg_roas / 100)
-                opportunity_loss = expected_revenue - revenue
-            else:
-                # 목표 미달 케이스: 낭비 없음
-                waste = 0
-                waste_rate = 0
-                # 기회비용: 이 광고비를 상위 성과 키워드에 투자했을 때의 기대 매출
-                expected_revenue = spend * (top_avg_roas / 100)
-                opportunity_loss = expected_revenue - revenue
-
-            # === 추천 사유 생성 ===
-            reason = f"{priority_label} - " + ", ".join(reasons[:3])  # 최대 3개 사유
-
-            recommendations.append({
-                'keyword': keyword,
-                'score': int(score),
-                'priority': priority,
-                'reason': reason,
-                'spend': spend,
-                'revenue': revenue,
-                'roas': roas,
-                'waste': float(waste),
-                'waste_rate': float(waste_rate),
-                'opportunity_loss': float(opportunity_loss),
-                'clicks': clicks,
-                'ctr': ctr,
-                'cpc': cpc
-            })
+    Query Params:
+        - q: 키워드 검색어 (부분 일치)
+        - placement: 광고 노출 지면 (예: 검색 영역)
+        - min_spend: 최소 광고비
+        - min_roas / max_roas: ROAS 범위 (%)
+        - sort: 정렬 컬럼 (기본: 광고비)
+        - order: asc/desc (기본: desc)
+        - page: 페이지 번호 (1부터, 기본 1)
+        - page_size: 페이지 크기 (기본 100, 최대 1000)
 
-        # === 정렬: 점수 높은 순 ===
-        recommendations.sort(key=lambda x: -x['score'])
-
-        # === 요약 통계 ===
-        total_waste = sum(r['waste'] for r in recommendations)
-        total_opportunity_loss = sum(r['opportunity_loss'] for r in recommendations)
-
-        # 데이터 부족 키워드 분리
-        insufficient_data = [r for r in recommendations if r['priority'] is None]
-        valid_recommendations = [r for r in recommendations if r['priority'] is not None]
-
-        summary = {
-            'total_waste': int(total_waste),
-            'total_opportunity_loss': int(total_opportunity_loss),
-            'keywords_to_exclude': len(valid_recommendations),
-            'potential_savings': f"{(total_waste / total_spend * 100):.1f}%" if total_spend > 0 else "0%",
-            'critical_priority': len([r for r in valid_recommendations if r['priority'] == 'critical']),
-            'high_priority': len([r for r in valid_recommendations if r['priority'] == 'high']),
-            'medium_priority': len([r for r in valid_recommendations if r['priority'] == 'medium']),
-            'low_priority': len([r for r in valid_recommendations if r['priority'] == 'low']),
-            'insufficient_data': len(insufficient_data),
-            'avg_score': int(sum(r['score'] for r in valid_recommendations) / len(valid_recommendations)) if valid_recommendations else 0
+    Response:
+        {
+            "success": true,
+            "dataset_id": "...",
+            "total": 1234,
+            "page": 1,
+            "page_size": 100,
+            "data": [...],
+            "summary": {...}
         }
+    """
+    store = get_dataset_store()
+    meta = store.get_meta(dataset_id, user_id=get_current_user_id())
+    if meta is None:
+        return jsonify({'success': False, 'expired': True, 'error': '데이터셋이 만료되었거나 찾을 수 없습니다'}), 404
 
-        logger.info(f'Generated {len(recommendations)} recommendations (avg score: {summary["avg_score"]}, total waste: {total_waste:.0f}원)')
+    try:
+        df = store.get(dataset_id, user_id=get_current_user_id())
+        if df is None:
+            return jsonify({'success': False, 'expired': True, 'error': '데이터셋이 만료되었거나 찾을 수 없습니다'}), 404
+
+        # 필터링
+        query = request.args.get('q', '').strip()
+        if query:
+            df = df[df['키워드'].astype(str).str.contains(query, regex=False, na=False)]
+
+        placement = request.args.get('placement')
+        if placement and '광고 노출 지면' in df.columns:
+            df = df[df['광고 노출 지면'] == placement]
+
+        min_spend = request.args.get('min_spend', type=float)
+        if min_spend is not None:
+            df = df[df['광고비'] >= min_spend]
+
+        min_roas = request.args.get('min_roas', type=float)
+        if min_roas is not None:
+            df = df[df['ROAS'] >= min_roas]
+
+        max_roas = request.args.get('max_roas', type=float)
+        if max_roas is not None:
+            df = df[df['ROAS'] <= max_roas]
+
+        # 정렬
+        sort_col = request.args.get('sort', '광고비')
+        if sort_col not in df.columns:
+            return jsonify({'success': False, 'error': f'정렬할 수 없는 컬럼입니다: {sort_col}'}), 400
+        ascending = request.args.get('order', 'desc').lower() == 'asc'
+        df = df.sort_values(sort_col, ascending=ascending, kind='stable')
+
+        # 페이징
+        page = max(request.args.get('page', 1, type=int), 1)
+        page_size = min(max(request.args.get('page_size', 100, type=int), 1), 1000)
+        offset = (page - 1) * page_size
 
         return jsonify({
             'success': True,
-            'recommendations': recommendations,
-            'summary': summary
+            'dataset_id': dataset_id,
+            'total': len(df),
+            'page': page,
+            'page_size': page_size,
+            'data': _records_for_json(df.iloc[offset:offset + page_size]),
+            'summary': meta.get('summary', {}),
+            'data_type': meta.get('data_type')
         })
 
     except Exception as e:
-        logger.error(f'Recommendation generation failed: {e}')
-        import traceback
-        traceback.print_exc()
-        return jsonify({'success': False, 'error': f'추천 생성 실패: {str(e)}'}), 500
+        logger.error(f'Dataset keyword query failed: {e}')
+        return jsonify({'success': False, 'error': f'조회 실패: {str(e)}'}), 500
 
 
 @ad_bp.route('/api/ad-analysis/manual-input', methods=['POST'])
@@ -1207,13 +976,12 @@ def manual_input():
         # In-Memory 방식으로 지표 계산 (DB 없이)
         metrics = _calculate_metrics_inmemory(df)
 
-        # 세션에 저장 (선택사항)
-        session[f'snapshot_{snapshot_id}'] = {
+        # 스냅샷 저장소에 보관 (세션에는 포인터만 저장)
+        _store_snapshot(user_id, snapshot_id, df, {
             'name': snapshot_name,
-            'data': df.to_dict('records'),
-            'metrics': metrics,
-            'created_at': pd.Timestamp.now().isoformat()
-        }
+            'metrics': metrics
+        })
+        session['snapshot_id'] = snapshot_id
 
         logger.info(f'Manual data input processed in-memory: {len(df)} rows, snapshot_id: {snapshot_id}')
 
@@ -1223,6 +991,9 @@ def manual_input():
             'metrics': metrics
         })
 
+    except SnapshotTooLargeError as e:
+        return jsonify({'success': False, 'error': str(e)}), e.status_code
+
     except Exception as e:
         logger.error(f'Manual input failed: {e}')
         import traceback
@@ -1241,21 +1012,27 @@ def get_snapshots():
 
     Query Params:
         - saved_only: true/false (저장된 것만)
+        - limit: 페이지 크기 (기본 50, 최대 200)
+        - cursor: 이전 응답의 next_cursor (다음 페이지)
 
     Response:
         {
-            "snapshots": [...]
+            "snapshots": [...],   # metrics_summary는 요약 지표만 (campaigns, daily_trend 제외)
+            "next_cursor": "2026-10-17T10:00:00_123" | null
         }
     """
     user_id = get_current_user_id()  # 테스트용 임시 user_id
     saved_only = request.args.get('saved_only', 'false').lower() == 'true'
+    limit = request.args.get('limit', SNAPSHOT_PAGE_SIZE, type=int)
 
     try:
         analyzer = AdAnalyzer(user_id)
-        snapshots = analyzer.get_snapshots(saved_only)
+        snapshots, next_cursor = analyzer.get_snapshots(saved_only, limit, request.args.get('cursor'))
 
-        return jsonify({'snapshots': snapshots})
+        return jsonify({'snapshots': snapshots, 'next_cursor': next_cursor})
 
+    except ValueError as e:
+        return create_error_response(str(e), 400)
     except Exception as e:
         logger.error(f"Get snapshots failed: {e}")
         return create_error_response("분석 목록 조회 실패", 500)
@@ -1278,6 +1055,36 @@ def get_snapshot_detail(snapshot_id):
     user_id = get_current_user_id()  # 테스트용 임시 user_id
 
     try:
+        # 저장 전 임시 분석 (업로드/수기입력 직후) - 스냅샷 저장소에서 조회
+        stored = get_snapshot_store().get(user_id, snapshot_id)
+        if stored is not None:
+            df, meta = stored
+            metrics = meta.get('metrics', {})
+
+            # 백그라운드 AI 인사이트가 완료됐으면 업로드 시점의 기본 인사이트 대신 사용
+            insights, insights_status = meta.get('insights', ''), 'done'
+            if meta.get('insights_id'):
+                entry = get_insight_cache().get(meta['insights_id'])
+                if entry is not None and entry['status'] == 'pending':
+                    insights_status = 'pending'
+                elif entry is not None:
+                    insights = entry['insights']
+
+            return jsonify({
+                'snapshot': {
+                    'id': snapshot_id,
+                    'snapshot_name': meta.get('name'),
+                    'created_at': meta.get('created_at'),
+                    'is_saved': False
+                },
+                'daily_data': _records_for_json(df.astype({'date': str}) if 'date' in df.columns else df),
+                'metrics': metrics,
+                'insights': insights,
+                'insights_id': meta.get('insights_id'),
+                'insights_status': insights_status,
+                'campaigns': metrics.get('campaigns', [])
+            })
+
         analyzer = AdAnalyzer(user_id)
 
         # 소유권 확인
@@ -1371,42 +1178,133 @@ def delete_snapshot(snapshot_id):
 @ad_bp.route('/api/ad-analysis/compare')
 def compare_periods():
     """
-    기간 비교 분석
+    기간 비교 분석 (소유권 확인 + 지표 조회 1회 쿼리)
 
     Query Params:
-        - snapshot_a: 기준 분석 ID
-        - snapshot_b: 비교 분석 ID
+        - snapshot_ids: 비교할 분석 ID 목록 (쉼표 구분, 2~12개, 지정 시 N개 비교)
+        - baseline: N개 비교 변화율 기준 first(기본, 첫 분석) / previous(직전 분석)
+        - snapshot_a: 기준 분석 ID (2개 비교)
+        - snapshot_b: 비교 분석 ID (2개 비교)
+        - mode: campaigns 지정 시 2개 비교를 캠페인별 증감으로 (상위 증가/감소 캠페인 + 기여도)
+        - top: 캠페인별 증감의 증가/감소 각각 캠페인 수 (기본 10, 최대 100)
+        - sort: 캠페인별 증감 정렬 기준 revenue(기본) / spend / roas_contribution
 
     Response:
+        2개 비교:
         {
             "comparison": {...},
             "summary": "..."
         }
+        N개 비교:
+        {
+            "snapshots": [{"id": 1, "snapshot_name": "...", ...}, ...],
+            "metrics": {"avg_roas": {"values": [...], "change": [...], "trend": [...]}, ...},
+            "campaigns": {"names": [...], "metrics": {"roas": {"values": [[...]], "change": [[...]], "trend": [[...]]}, ...}},
+            "summary": "..."
+        }
+        캠페인별 증감 (mode=campaigns):
+        {
+            "totals": {"a": {...}, "b": {...}, "delta": {"spend": ..., "revenue": ..., "roas": ...}},
+            "gainers": [{"campaign_name": "...", "revenue_delta": ..., "revenue_contribution": 42.5, ...}],
+            "losers": [...],
+            "campaign_count": 5000, "new_campaigns": 12, "stopped_campaigns": 8
+        }
     """
     user_id = get_current_user_id()  # 테스트용 임시 user_id
 
+    snapshot_ids = request.args.get('snapshot_ids')
     snapshot_a = request.args.get('snapshot_a', type=int)
     snapshot_b = request.args.get('snapshot_b', type=int)
 
-    if not snapshot_a or not snapshot_b:
+    if not snapshot_ids and (not snapshot_a or not snapshot_b):
         return create_error_response("두 개의 스냅샷 ID가 필요합니다", 400)
 
     try:
         analyzer = AdAnalyzer(user_id)
 
-        # 소유권 확인
-        if not analyzer.check_ownership(snapshot_a) or not analyzer.check_ownership(snapshot_b):
-            return create_error_response("접근 권한이 없습니다", 403)
+        if snapshot_ids:
+            try:
+                ids = [int(value) for value in snapshot_ids.split(',') if value.strip()]
+            except ValueError:
+                return create_error_response("snapshot_ids는 쉼표로 구분한 숫자여야 합니다", 400)
+            comparison = analyzer.compare_many(ids, request.args.get('baseline', 'first'))
+        elif request.args.get('mode') == 'campaigns':
+            top_k = min(max(request.args.get('top', DIFF_TOP_K, type=int), 1), DIFF_TOP_K_MAX)
+            comparison = analyzer.compare_campaigns(
+                snapshot_a, snapshot_b, top_k, request.args.get('sort', 'revenue')
+            )
+        else:
+            comparison = analyzer.compare_snapshots(snapshot_a, snapshot_b)
 
-        comparison = analyzer.compare_snapshots(snapshot_a, snapshot_b)
+        # 소유권 확인 (없거나 다른 사용자 스냅샷)
+        if comparison is None:
+            return create_error_response("접근 권한이 없습니다", 403)
 
         return jsonify(comparison)
 
+    except ValueError as e:
+        return create_error_response(str(e), 400)
     except Exception as e:
         logger.error(f"Compare snapshots failed: {e}")
         return create_error_response("비교 분석 실패", 500)
 
 
+def _date_arg(name, default):
+    """YYYY-MM-DD 쿼리 파라미터 (없으면 default, 형식 오류 시 ValueError)"""
+    value = request.args.get(name)
+    if not value:
+        return default
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"{name}는 YYYY-MM-DD 형식이어야 합니다")
+
+
+@ad_bp.route('/api/ad-analysis/trend')
+def get_trend():
+    """
+    기간 성과 추이 (일/주/월 집계 테이블 조회, 스냅샷 단위가 아닌 전체 업로드 기준)
+
+    Query Params:
+        - start: 시작일 YYYY-MM-DD (기본 end 기준 1년 전)
+        - end: 종료일 YYYY-MM-DD (기본 오늘)
+        - granularity: auto(기본) / day / week / month
+        - campaign: 캠페인명 (없으면 전체 합계)
+        - points: 최대 구간 수 (기본/최대 400, auto일 때 이 수 이하인 가장 세밀한 단위 선택)
+
+    Response:
+        {
+            "granularity": "day",
+            "start": "2025-10-18",
+            "end": "2026-10-17",
+            "campaign_name": null,
+            "series": [{"date": "2026-10-17", "spend": 120000.0, "revenue": 480000.0, "roas": 4.0, ...}]
+        }
+    """
+    user_id = get_current_user_id()  # 테스트용 임시 user_id
+    points = min(max(request.args.get('points', TREND_MAX_POINTS, type=int), 1), TREND_MAX_POINTS)
+
+    try:
+        end = _date_arg('end', date.today())
+        start = _date_arg('start', end - timedelta(days=364))
+
+        analyzer = AdAnalyzer(user_id)
+        trend = analyzer.get_trend(
+            start, end,
+            granularity=request.args.get('granularity', 'auto'),
+            campaign_name=request.args.get('campaign') or None,
+            max_points=points
+        )
+
+        return jsonify(trend)
+
+    except ValueError as e:
+        return create_error_response(str(e), 400)
+    except Exception as e:
+        logger.error(f"Get trend failed: {e}")
+        return create_error_response("추이 조회 실패", 500)
+
+
 # ========================================
 # 5. 목표 관리 API
 # ========================================
@@ -1513,6 +1411,8 @@ def budget_pacing():
 
         return jsonify(pacing)
 
+    except ValueError as e:
+        return create_error_response(str(e), 400)
     except Exception as e:
         logger.error(f"Budget pacing failed: {e}")
         return create_error_response("예산 분석 실패", 500)
@@ -1935,6 +1835,37 @@ def download_template(template_type):
 # Helper Functions
 # ========================================
 
+def _records_for_json(df):
+    """
+    DataFrame을 JSON 응답용 레코드 리스트로 변환
+
+    Infinity, -Infinity, NaN은 0으로, NumPy 스칼라는 Python 기본 타입으로 변환
+
+    Args:
+        df: pandas DataFrame
+
+    Returns:
+        list: 레코드 리스트
+    """
+    import math
+
+    def sanitize_for_json(obj):
+        """Infinity, -Infinity, NaN을 JSON 안전 값으로 변환"""
+        if isinstance(obj, (float, np.floating)):
+            if math.isinf(float(obj)) or math.isnan(float(obj)):
+                return 0
+            return float(obj)
+        elif isinstance(obj, np.integer):
+            return int(obj)
+        return obj
+
+    data = df.to_dict('records')
+    for row in data:
+        for key, value in row.items():
+            row[key] = sanitize_for_json(value)
+    return data
+
+
 def _calculate_creative_metrics(df):
     """
     소재별 성과 지표 계산
@@ -111,6 +111,8 @@ def update_banner(banner_id):
         else:
             return jsonify({'success': False, 'message': '배너를 찾을 수 없습니다'}), 404
 
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     except Exception as e:
         return jsonify({'success': False, 'message': f'배너 수정 실패: {str(e)}'}), 500
 
@@ -142,6 +144,8 @@ def reorder_banners():
 
         if not banner_type or not order_list:
             return jsonify({'success': False, 'message': '배너 타입과 순서 목록이 필요합니다'}), 400
+        if not all(isinstance(banner_id, int) and not isinstance(banner_id, bool) for banner_id in order_list):
+            return jsonify({'success': False, 'message': '순서 목록은 배너 ID 배열이어야 합니다'}), 400
 
         success = BannerService.reorder_banners(banner_type, order_list)
 
@@ -150,6 +154,8 @@ def reorder_banners():
         else:
             return jsonify({'success': False, 'message': '순서 변경 실패'}), 500
 
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 409
     except Exception as e:
         return jsonify({'success': False, 'message': f'순서 변경 실패: {str(e)}'}), 500
 
@@ -157,7 +163,47 @@ def reorder_banners():
 @admin_bp.route('/api/banners/stats', methods=['GET'])
 @require_admin
 def get_stats():
-    """배너 통계 API"""
+    """
+    배너 통계 API
+
+    Query Parameters:
+        banner_type: 배너 타입 (없으면 전체)
+        days: 최근 N일 기간 통계 포함 (선택, 1~365)
+    """
     banner_type = request.args.get('banner_type')
-    stats = BannerService.get_banner_stats(banner_type)
+    days = request.args.get('days', type=int)
+    if days is not None:
+        days = min(max(days, 1), 365)
+    stats = BannerService.get_banner_stats(banner_type, days)
     return jsonify({'success': True, 'stats': stats})
+
+
+@admin_bp.route('/api/banners/timeseries', methods=['GET'])
+@require_admin
+def get_timeseries():
+    """
+    배너 노출/클릭/CTR 시계열 API (집계 테이블 조회)
+
+    Query Parameters:
+        banner_id: 배너 ID (없으면 전체 합산)
+        banner_type: 배너 타입 (없으면 전체)
+        days: 최근 N일 (기본 30, 일별 최대 365 / 시간별 최대 14)
+        granularity: day(기본) 또는 hour
+
+    Response:
+        {"success": true, "granularity": "day", "series": [{"date": "2026-10-17", "impressions": 120, "clicks": 3, "ctr": 2.5}]}
+    """
+    granularity = request.args.get('granularity', 'day')
+    if granularity not in ('day', 'hour'):
+        return jsonify({'success': False, 'message': 'granularity는 day 또는 hour만 가능합니다'}), 400
+
+    max_days = 14 if granularity == 'hour' else 365
+    days = min(max(request.args.get('days', 30, type=int), 1), max_days)
+
+    series = BannerService.get_banner_timeseries(
+        banner_id=request.args.get('banner_id', type=int),
+        banner_type=request.args.get('banner_type'),
+        days=days,
+        granularity=granularity
+    )
+    return jsonify({'success': True, 'granularity': granularity, 'days': days, 'series': series})
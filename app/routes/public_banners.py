@@ -1,15 +1,76 @@
 """
 공개 배너 API 라우트
-- 활성 배너 조회
+- 활성 배너 조회 (타입별 / 여러 타입 묶음 + ETag)
 - 노출/클릭 카운트
 """
 
-from flask import Blueprint, jsonify, request
+import json
+import hashlib
+from flask import Blueprint, jsonify, request, current_app
 from app.services.banner_service import BannerService
+from app.services.banner_counters import aggregate_events
 
 public_banner_bp = Blueprint('public_banners', __name__)
 
 
+def _client_info():
+    """
+    이벤트 로그용 클라이언트 정보
+
+    Returns:
+        tuple: (IP - 프록시 뒤에서는 X-Forwarded-For 첫 번째 값, User-Agent)
+    """
+    ip_address = request.access_route[0] if request.access_route else request.remote_addr
+    return ip_address, request.headers.get('User-Agent')
+
+
+# 공개 응답에 포함할 배너 필드 (노출/클릭 수 제외 → 카운터가 바뀌어도 ETag 유지)
+PUBLIC_BANNER_FIELDS = ('id', 'banner_type', 'title', 'image_url', 'mobile_image_url', 'image_variants',
+                        'link_url', 'position_order')
+
+# 묶음 조회 허용 배너 타입 (banners.banner_type ENUM)
+BANNER_TYPES = ('home_top', 'home_bottom', 'home_grid', 'grid_general', 'grid_coupang',
+                'grid_profit', 'grid_efficiency', 'grid_keyword')
+
+
+@public_banner_bp.route('/api/banners', methods=['GET'])
+def get_banner_sets():
+    """
+    여러 배너 타입 묶음 조회 API (공개, ETag/304 지원)
+
+    Query Parameters:
+        types: 콤마로 구분한 배너 타입 (예: home_top,home_grid,home_bottom)
+
+    Response:
+        {"success": true, "banners": {"home_top": [...], "home_grid": [...]}}
+        If-None-Match가 현재 ETag와 같으면 본문 없이 304
+    """
+    banner_types = list(dict.fromkeys(t.strip() for t in request.args.get('types', '').split(',') if t.strip()))
+    invalid = [t for t in banner_types if t not in BANNER_TYPES]
+    if not banner_types or invalid:
+        return jsonify({'success': False, 'message': f'잘못된 배너 타입입니다: {", ".join(invalid) or "(없음)"}'}), 400
+
+    try:
+        banners = {
+            banner_type: [
+                {field: banner.get(field) for field in PUBLIC_BANNER_FIELDS}
+                for banner in BannerService.get_active_banners(banner_type)
+            ]
+            for banner_type in banner_types
+        }
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
+
+    payload = {'success': True, 'banners': banners}
+    body = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str)
+
+    response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(hashlib.sha256(body.encode('utf-8')).hexdigest()[:32])
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config.get('BANNER_HTTP_MAX_AGE', 60)
+    return response.make_conditional(request)
+
+
 @public_banner_bp.route('/api/banners/<banner_type>', methods=['GET'])
 def get_banners(banner_type):
     """
@@ -48,7 +109,7 @@ def track_impression(banner_id):
         banner_id: 배너 ID
     """
     try:
-        BannerService.increment_impression(banner_id)
+        BannerService.increment_impression(banner_id, *_client_info())
         return jsonify({'success': True})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
@@ -63,7 +124,38 @@ def track_click(banner_id):
         banner_id: 배너 ID
     """
     try:
-        BannerService.increment_click(banner_id)
+        BannerService.increment_click(banner_id, *_client_info())
         return jsonify({'success': True})
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)}), 500
+
+
+@public_banner_bp.route('/api/banners/events', methods=['POST'])
+def track_events():
+    """
+    배너 노출/클릭 이벤트 일괄 기록 (페이지당 1회 beacon)
+
+    Request Body (application/json 또는 navigator.sendBeacon의 text/plain):
+        {"events": [{"banner_id": 1, "event_type": "impression", "ts": 1700000000000}, ...]}
+        또는 이벤트 배열
+
+    Response:
+        {"success": true, "accepted": 8, "rejected": 0}
+    """
+    data = request.get_json(force=True, silent=True)
+    events = data.get('events') if isinstance(data, dict) else data
+
+    if not isinstance(events, list):
+        return jsonify({'success': False, 'message': 'events 배열이 필요합니다'}), 400
+
+    max_events = current_app.config.get('BANNER_EVENT_BATCH_MAX', 200)
+    if len(events) > max_events:
+        return jsonify({'success': False, 'message': f'이벤트는 최대 {max_events}개까지 전송할 수 있습니다'}), 413
+
+    counts, accepted, rejected = aggregate_events(events)
+
+    try:
+        BannerService.record_events(counts, *_client_info())
+        return jsonify({'success': True, 'accepted': accepted, 'rejected': rejected})
+    except Exception as e:
+        return jsonify({'success': False, 'message': str(e)}), 500
@@ -3,7 +3,8 @@
 - 데이터 저장 및 조회
 - 지표 계산 (ROAS, CTR, CPA, CVR 등)
 - 캠페인 통계
-- 기간 비교
+- 기간 비교 (2개 / N개 스냅샷)
+- 성과 추이 (일/주/월 집계)
 - 예산 페이싱
 """
 
@@ -13,10 +14,14 @@ import json
 import logging
 from datetime import datetime, timedelta
 from calendar import monthrange
-
-from app.utils.db_utils import (
-    execute_query, execute_insert, execute_update,
-    execute_delete, execute_many, transaction
+from flask import current_app
+
+from app.utils.db_utils import execute_query, execute_update, transaction
+from app.services.ad_bulk_loader import prepare_daily_frame, upsert_daily_facts, INSERT_CHUNK_ROWS
+from app.services.ad_spend_rollup import get_monthly_spend, month_range
+from app.services.ad_trend import refresh_metric_rollups, get_trend, TREND_MAX_POINTS
+from app.services.ad_compare import (
+    build_metric_matrix, build_campaign_matrix, diff_campaigns, COMPARE_BASELINES, DIFF_TOP_K
 )
 from app.utils.helpers import (
     calculate_roas, calculate_ctr, calculate_cpc,
@@ -25,6 +30,24 @@ from app.utils.helpers import (
 
 logger = logging.getLogger(__name__)
 
+# 목록 조회용 요약 컬럼 (ad_analysis_snapshots, calculate_metrics 시 metrics_summary와 함께 갱신)
+# 기간이 겹치는 업로드/삭제로 일별 팩트가 바뀌면 같은 트랜잭션에서 겹치는 스냅샷의 요약도 다시 계산
+SUMMARY_INT_COLUMNS = ('total_impressions', 'total_clicks', 'total_conversions', 'total_days')
+SUMMARY_COLUMNS = ('total_spend', 'total_revenue', 'avg_roas', 'avg_ctr', 'avg_cpc', 'avg_cpa', 'cvr') + SUMMARY_INT_COLUMNS
+
+# 일별 데이터 집계 컬럼 (calculate_metrics)
+AGGREGATE_COLUMNS = ('spend', 'revenue', 'clicks', 'conversions', 'impressions')
+
+# 일별 팩트/이전 값 지표 컬럼
+FACT_METRIC_COLUMNS = ('spend', 'impressions', 'clicks', 'conversions', 'revenue')
+
+# 목록 페이지 크기 기본값/최대값
+SNAPSHOT_PAGE_SIZE = 50
+SNAPSHOT_PAGE_SIZE_MAX = 200
+
+# 한 번에 비교할 수 있는 최대 스냅샷 수
+COMPARE_SNAPSHOTS_MAX = 12
+
 
 class AdAnalyzer:
     """광고 데이터 분석 서비스 클래스"""
@@ -36,13 +59,15 @@ class AdAnalyzer:
         """
         self.user_id = user_id
 
-    def save_snapshot(self, df, snapshot_name):
+    def save_snapshot(self, df, snapshot_name, store_data_json=None):
         """
         데이터프레임을 스냅샷으로 저장
 
         Args:
             df (pandas.DataFrame): 광고 데이터
             snapshot_name (str): 스냅샷 이름
+            store_data_json (bool, optional): 원본 데이터 JSON 사본(data_json) 저장 여부
+                                              (None이면 AD_SNAPSHOT_STORE_DATA_JSON 설정)
 
         Returns:
             int: 생성된 snapshot_id
@@ -56,19 +81,30 @@ class AdAnalyzer:
             - revenue: 매출액
             - impressions: 노출수 (선택)
         """
+        config = current_app.config
+        if store_data_json is None:
+            store_data_json = config.get('AD_SNAPSHOT_STORE_DATA_JSON', False)
+
         try:
-            # 캠페인명 정제
-            df['campaign_name'] = df['campaign_name'].apply(sanitize_campaign_name)
+            # 캠페인명 정제 (캠페인 수만큼만 정제 후 매핑)
+            names = df['campaign_name']
+            unique_names = names.dropna().unique()
+            df['campaign_name'] = names.map(
+                dict(zip(unique_names, map(sanitize_campaign_name, unique_names)))
+            ).fillna(sanitize_campaign_name(None))
 
             # 날짜 변환
-            df['date'] = pd.to_datetime(df['date']).dt.date
+            df['date'] = pd.to_datetime(df['date']).dt.normalize()
 
             # 기간 추출
-            period_start = df['date'].min()
-            period_end = df['date'].max()
+            period_start = df['date'].min().date()
+            period_end = df['date'].max().date()
+
+            # 적재용 컬럼 형변환 (컬럼 단위)
+            daily = prepare_daily_frame(df)
 
-            # 데이터 JSON 변환
-            data_json = df.to_json(orient='records', date_format='iso')
+            # 원본 데이터 JSON 사본 (일별 팩트와 중복이므로 설정 시에만)
+            data_json = df.to_json(orient='records', date_format='iso') if store_data_json else None
 
             # 스냅샷 생성
             with transaction() as cursor:
@@ -89,28 +125,19 @@ class AdAnalyzer:
                 snapshot_id = cursor.lastrowid
                 logger.info(f"Created snapshot {snapshot_id} for user {self.user_id}")
 
-                # 일별 데이터 삽입
-                daily_data_sql = """
-                    INSERT INTO ad_daily_data
-                    (snapshot_id, date, campaign_name, spend, impressions, clicks, conversions, revenue)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """
+                # 사용자 일별 팩트에 반영 (같은 날짜/캠페인은 이번 업로드 값으로 덮어씀)
+                upserted, method = upsert_daily_facts(
+                    cursor, self.user_id, snapshot_id, daily,
+                    chunk_rows=config.get('AD_BULK_INSERT_CHUNK_ROWS', INSERT_CHUNK_ROWS),
+                    local_infile=config.get('DB_LOCAL_INFILE', False)
+                )
+                logger.info(f"Upserted {upserted} daily facts for snapshot {snapshot_id} ({method})")
 
-                daily_records = []
-                for _, row in df.iterrows():
-                    daily_records.append((
-                        snapshot_id,
-                        row['date'],
-                        row['campaign_name'],
-                        float(row['spend']),
-                        int(row.get('impressions', 0)),
-                        int(row['clicks']),
-                        int(row['conversions']),
-                        float(row['revenue'])
-                    ))
-
-                cursor.executemany(daily_data_sql, daily_records)
-                logger.info(f"Inserted {len(daily_records)} daily records for snapshot {snapshot_id}")
+                # 추이/예산 페이싱용 일·주·월 집계 갱신
+                refresh_metric_rollups(cursor, self.user_id, period_start, period_end)
+
+                # 덮어쓴 기간과 겹치는 기존 스냅샷 요약 갱신
+                self._refresh_overlapping_summaries(cursor, period_start, period_end)
 
             return snapshot_id
 
@@ -122,6 +149,9 @@ class AdAnalyzer:
         """
         스냅샷의 모든 지표 계산
 
+        결과는 metrics_summary와 요약 컬럼에 저장됨. 이후 기간이 겹치는 업로드/삭제로 일별 팩트가 바뀌면
+        save_snapshot/delete_snapshot이 같은 트랜잭션에서 다시 계산함 (_refresh_overlapping_summaries)
+
         Args:
             snapshot_id (int): 스냅샷 ID
 
@@ -129,62 +159,19 @@ class AdAnalyzer:
             dict: 계산된 지표
         """
         try:
-            # 일별 데이터 조회
-            sql = """
-                SELECT * FROM ad_daily_data
-                WHERE snapshot_id = %s
-                ORDER BY date
-            """
-            data = execute_query(sql, (snapshot_id,))
-
-            if not data:
-                logger.warning(f"No data found for snapshot {snapshot_id}")
+            snapshot = self._get_snapshot_range(snapshot_id)
+            if not snapshot:
+                logger.warning(f"Snapshot not found: {snapshot_id}")
                 return {}
 
-            df = pd.DataFrame(data)
-
-            # 전체 지표 계산
-            total_spend = df['spend'].sum()
-            total_revenue = df['revenue'].sum()
-            total_clicks = df['clicks'].sum()
-            total_conversions = df['conversions'].sum()
-            total_impressions = df['impressions'].sum()
-
-            metrics = {
-                # 기본 지표
-                'total_spend': float(total_spend),
-                'total_revenue': float(total_revenue),
-                'total_clicks': int(total_clicks),
-                'total_conversions': int(total_conversions),
-                'total_impressions': int(total_impressions),
-
-                # 계산 지표
-                'avg_roas': calculate_roas(total_revenue, total_spend),
-                'avg_ctr': calculate_ctr(total_clicks, total_impressions),
-                'avg_cpc': calculate_cpc(total_spend, total_clicks),
-                'avg_cpa': calculate_cpa(total_spend, total_conversions),
-                'cvr': calculate_cvr(total_conversions, total_clicks),
-                'avg_order_value': round(total_revenue / total_conversions, 0) if total_conversions > 0 else 0,
-
-                # 캠페인별 통계
-                'campaigns': self._calculate_campaign_metrics(df),
-
-                # 일별 트렌드
-                'daily_trend': self._calculate_daily_trend(df),
-
-                # 기간 정보
-                'period_start': str(df['date'].min()),
-                'period_end': str(df['date'].max()),
-                'total_days': len(df['date'].unique())
-            }
+            metrics = self._build_metrics(snapshot)
+
+            if not metrics:
+                logger.warning(f"No data found for snapshot {snapshot_id}")
+                return {}
 
-            # metrics_summary 업데이트
-            update_sql = """
-                UPDATE ad_analysis_snapshots
-                SET metrics_summary = %s
-                WHERE id = %s
-            """
-            execute_update(update_sql, (json.dumps(metrics), snapshot_id))
+            # metrics_summary + 목록용 요약 컬럼 업데이트 (1개 문장)
+            execute_update(*self._summary_update(snapshot_id, metrics))
 
             logger.info(f"Metrics calculated for snapshot {snapshot_id}")
 
@@ -194,110 +181,278 @@ class AdAnalyzer:
             logger.error(f"Failed to calculate metrics: {e}")
             raise
 
-    def _calculate_campaign_metrics(self, df):
-        """캠페인별 지표 계산"""
-        campaign_stats = df.groupby('campaign_name').agg({
-            'spend': 'sum',
-            'revenue': 'sum',
-            'clicks': 'sum',
-            'conversions': 'sum',
-            'impressions': 'sum'
-        }).reset_index()
+    def _build_metrics(self, snapshot, cursor=None):
+        """
+        스냅샷 기간의 일별 팩트로 지표 계산
 
-        # 계산 지표 추가
-        campaign_stats['roas'] = campaign_stats.apply(
-            lambda row: calculate_roas(row['revenue'], row['spend']), axis=1
-        )
-        campaign_stats['ctr'] = campaign_stats.apply(
-            lambda row: calculate_ctr(row['clicks'], row['impressions']), axis=1
-        )
-        campaign_stats['cpa'] = campaign_stats.apply(
-            lambda row: calculate_cpa(row['spend'], row['conversions']), axis=1
-        )
-        campaign_stats['cvr'] = campaign_stats.apply(
-            lambda row: calculate_cvr(row['conversions'], row['clicks']), axis=1
-        )
-        campaign_stats['cpc'] = campaign_stats.apply(
-            lambda row: calculate_cpc(row['spend'], row['clicks']), axis=1
-        )
+        Args:
+            snapshot (dict): {'user_id', 'period_start', 'period_end'}
+            cursor: DB 커서 (호출한 트랜잭션, None이면 풀 연결로 조회)
 
-        # ROAS 순위 계산
-        campaign_stats = campaign_stats.sort_values('roas', ascending=False)
-        campaign_stats['rank'] = range(1, len(campaign_stats) + 1)
+        Returns:
+            dict: 계산된 지표 (기간에 데이터가 없으면 빈 dict)
+        """
+        # 일별/캠페인별 합계만 조회 (집계는 DB에서, 원본 행은 전송하지 않음)
+        daily = self._aggregate_daily_data(snapshot, 'date', cursor)
 
-        # 상태 판정 (ROAS 기준)
-        def get_status(roas):
-            if roas >= 4.0:
-                return 'excellent'
-            elif roas >= 3.0:
-                return 'good'
-            else:
-                return 'poor'
+        if daily.empty:
+            return {}
+
+        campaigns = self._aggregate_daily_data(snapshot, 'campaign_name', cursor)
+
+        # 전체 지표 계산 (일별 합계의 합)
+        total_spend = daily['spend'].sum()
+        total_revenue = daily['revenue'].sum()
+        total_clicks = daily['clicks'].sum()
+        total_conversions = daily['conversions'].sum()
+        total_impressions = daily['impressions'].sum()
+
+        return {
+            # 기본 지표
+            'total_spend': float(total_spend),
+            'total_revenue': float(total_revenue),
+            'total_clicks': int(total_clicks),
+            'total_conversions': int(total_conversions),
+            'total_impressions': int(total_impressions),
+
+            # 계산 지표
+            'avg_roas': calculate_roas(total_revenue, total_spend),
+            'avg_ctr': calculate_ctr(total_clicks, total_impressions),
+            'avg_cpc': calculate_cpc(total_spend, total_clicks),
+            'avg_cpa': calculate_cpa(total_spend, total_conversions),
+            'cvr': calculate_cvr(total_conversions, total_clicks),
+            'avg_order_value': round(total_revenue / total_conversions, 0) if total_conversions > 0 else 0,
+
+            # 캠페인별 통계
+            'campaigns': self._calculate_campaign_metrics(campaigns),
+
+            # 일별 트렌드
+            'daily_trend': self._calculate_daily_trend(daily),
+
+            # 기간 정보
+            'period_start': str(daily['date'].min()),
+            'period_end': str(daily['date'].max()),
+            'total_days': len(daily)
+        }
+
+    @staticmethod
+    def _summary_update(snapshot_id, metrics):
+        """
+        metrics_summary + 목록용 요약 컬럼 UPDATE 문 (지표가 비어 있으면 NULL로 초기화)
+
+        Returns:
+            tuple: (sql, params)
+        """
+        sql = f"""
+            UPDATE ad_analysis_snapshots
+            SET metrics_summary = %s, {', '.join(f'{column} = %s' for column in SUMMARY_COLUMNS)}
+            WHERE id = %s
+        """
+        if not metrics:
+            return sql, (None, *(None for _ in SUMMARY_COLUMNS), snapshot_id)
+        return sql, (json.dumps(metrics), *(metrics[column] for column in SUMMARY_COLUMNS), snapshot_id)
+
+    def _refresh_overlapping_summaries(self, cursor, period_start, period_end):
+        """
+        기간이 겹치는 스냅샷 중 지표를 계산해 둔 스냅샷의 요약을 현재 일별 팩트로 다시 계산
 
-        campaign_stats['status'] = campaign_stats['roas'].apply(get_status)
+        일별 팩트를 바꾼 트랜잭션(저장/삭제) 안에서 호출해 상세의 일별 데이터와 요약이 항상 일치하도록 함
 
-        # 숫자 타입 변환
+        Args:
+            cursor: DB 커서 (호출한 트랜잭션)
+            period_start (date): 바뀐 기간 시작일
+            period_end (date): 바뀐 기간 종료일
+
+        Returns:
+            int: 다시 계산한 스냅샷 수
+        """
+        cursor.execute("""
+            SELECT id, user_id, period_start, period_end
+            FROM ad_analysis_snapshots
+            WHERE user_id = %s AND period_start <= %s AND period_end >= %s AND metrics_summary IS NOT NULL
+        """, (self.user_id, period_end, period_start))
+        snapshots = cursor.fetchall()
+
+        for snapshot in snapshots:
+            cursor.execute(*self._summary_update(snapshot['id'], self._build_metrics(snapshot, cursor)))
+
+        if snapshots:
+            logger.info(f"Refreshed summaries of {len(snapshots)} overlapping snapshots")
+        return len(snapshots)
+
+    @staticmethod
+    def _get_snapshot_range(snapshot_id):
+        """
+        스냅샷 소유자/기간 조회
+
+        Returns:
+            dict | None: {'user_id', 'period_start', 'period_end'}
+        """
+        sql = "SELECT user_id, period_start, period_end FROM ad_analysis_snapshots WHERE id = %s"
+        return execute_query(sql, (snapshot_id,), fetch_one=True)
+
+    @staticmethod
+    def _fact_range_params(snapshot):
+        """스냅샷 기간의 일별 팩트 조회 조건 파라미터 (user_id, 시작일, 종료일 다음 날 - 반열린 범위)"""
+        return snapshot['user_id'], snapshot['period_start'], snapshot['period_end'] + timedelta(days=1)
+
+    def _aggregate_daily_data(self, snapshot, group_column, cursor=None):
+        """
+        스냅샷 기간의 사용자 일별 팩트를 DB에서 그룹별 합계로 집계
+
+        Args:
+            snapshot (dict): _get_snapshot_range() 결과
+            group_column (str): 'date' 또는 'campaign_name'
+            cursor: DB 커서 (호출한 트랜잭션, None이면 풀 연결로 조회)
+
+        Returns:
+            pandas.DataFrame: group_column, spend, revenue, clicks, conversions, impressions (group_column 순)
+        """
+        sql = f"""
+            SELECT
+                {group_column},
+                COALESCE(SUM(spend), 0) AS spend,
+                COALESCE(SUM(revenue), 0) AS revenue,
+                COALESCE(SUM(clicks), 0) AS clicks,
+                COALESCE(SUM(conversions), 0) AS conversions,
+                COALESCE(SUM(impressions), 0) AS impressions
+            FROM ad_daily_facts
+            WHERE user_id = %s AND date >= %s AND date < %s
+            GROUP BY {group_column}
+            ORDER BY {group_column}
+        """
+        if cursor is None:
+            rows = execute_query(sql, self._fact_range_params(snapshot))
+        else:
+            cursor.execute(sql, self._fact_range_params(snapshot))
+            rows = cursor.fetchall()
+
+        frame = pd.DataFrame(rows, columns=[group_column, *AGGREGATE_COLUMNS])
+
+        # SUM 결과(Decimal) 타입 변환
         for col in ['spend', 'revenue']:
-            campaign_stats[col] = campaign_stats[col].astype(float)
+            frame[col] = frame[col].astype(float)
 
         for col in ['clicks', 'conversions', 'impressions']:
-            campaign_stats[col] = campaign_stats[col].astype(int)
+            frame[col] = frame[col].astype('int64')
 
-        return campaign_stats.to_dict('records')
+        return frame
 
-    def _calculate_daily_trend(self, df):
-        """일별 트렌드 계산"""
-        daily = df.groupby('date').agg({
-            'spend': 'sum',
-            'revenue': 'sum',
-            'clicks': 'sum',
-            'conversions': 'sum',
-            'impressions': 'sum'
-        }).reset_index()
+    @staticmethod
+    def _ratio(func, numerators, denominators):
+        """집계 행별 지표 계산 (helpers 함수와 같은 반올림)"""
+        return [func(a, b) for a, b in zip(numerators.tolist(), denominators.tolist())]
+
+    def _calculate_campaign_metrics(self, campaign_stats):
+        """
+        캠페인별 지표 계산
+
+        Args:
+            campaign_stats (pandas.DataFrame): 캠페인별 합계 (_aggregate_daily_data)
+        """
+        campaign_stats = campaign_stats.copy()
 
         # 계산 지표 추가
-        daily['roas'] = daily.apply(
-            lambda row: calculate_roas(row['revenue'], row['spend']), axis=1
-        )
-        daily['ctr'] = daily.apply(
-            lambda row: calculate_ctr(row['clicks'], row['impressions']), axis=1
-        )
-        daily['cvr'] = daily.apply(
-            lambda row: calculate_cvr(row['conversions'], row['clicks']), axis=1
+        campaign_stats['roas'] = self._ratio(calculate_roas, campaign_stats['revenue'], campaign_stats['spend'])
+        campaign_stats['ctr'] = self._ratio(calculate_ctr, campaign_stats['clicks'], campaign_stats['impressions'])
+        campaign_stats['cpa'] = self._ratio(calculate_cpa, campaign_stats['spend'], campaign_stats['conversions'])
+        campaign_stats['cvr'] = self._ratio(calculate_cvr, campaign_stats['conversions'], campaign_stats['clicks'])
+        campaign_stats['cpc'] = self._ratio(calculate_cpc, campaign_stats['spend'], campaign_stats['clicks'])
+
+        # ROAS 순위 계산 (동률은 캠페인명 순)
+        campaign_stats = campaign_stats.sort_values('roas', ascending=False, kind='stable')
+        campaign_stats['rank'] = range(1, len(campaign_stats) + 1)
+
+        # 상태 판정 (ROAS 기준)
+        campaign_stats['status'] = np.select(
+            [campaign_stats['roas'] >= 4.0, campaign_stats['roas'] >= 3.0],
+            ['excellent', 'good'],
+            default='poor'
         )
 
+        return campaign_stats.to_dict('records')
+
+    def _calculate_daily_trend(self, daily):
+        """
+        일별 트렌드 계산
+
+        Args:
+            daily (pandas.DataFrame): 일별 합계 (_aggregate_daily_data, 날짜 순)
+        """
+        daily = daily.copy()
+
+        # 계산 지표 추가
+        daily['roas'] = self._ratio(calculate_roas, daily['revenue'], daily['spend'])
+        daily['ctr'] = self._ratio(calculate_ctr, daily['clicks'], daily['impressions'])
+        daily['cvr'] = self._ratio(calculate_cvr, daily['conversions'], daily['clicks'])
+
         # 7일 이동평균 계산
         daily['roas_ma7'] = daily['roas'].rolling(window=7, min_periods=1).mean().round(2)
 
         # 날짜를 문자열로 변환
         daily['date'] = daily['date'].astype(str)
 
-        # 숫자 타입 변환
-        for col in ['spend', 'revenue']:
-            daily[col] = daily[col].astype(float)
+        return daily.to_dict('records')
 
-        for col in ['clicks', 'conversions', 'impressions']:
-            daily[col] = daily[col].astype(int)
+    @staticmethod
+    def _pop_summary(row):
+        """
+        행에서 요약 컬럼을 꺼내 metrics_summary 형태(dict)로 변환
 
-        return daily.to_dict('records')
+        Returns:
+            dict: 요약 지표 (지표 계산 전이면 빈 dict)
+        """
+        values = {column: row.pop(column, None) for column in SUMMARY_COLUMNS}
+        if values['total_spend'] is None:
+            return {}
+        return {
+            column: (int(value) if column in SUMMARY_INT_COLUMNS else float(value)) if value is not None else None
+            for column, value in values.items()
+        }
 
-    def get_snapshots(self, saved_only=False):
+    @staticmethod
+    def encode_cursor(snapshot):
+        """목록 다음 페이지 커서 ('<created_at>_<id>')"""
+        return f"{snapshot['created_at']}_{snapshot['id']}".replace(' ', 'T')
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """
+        목록 커서 해석
+
+        Returns:
+            tuple: (created_at, id)
+
+        Raises:
+            ValueError: 형식이 잘못된 경우
         """
-        저장된 분석 목록 조회
+        try:
+            created_at, snapshot_id = cursor.rsplit('_', 1)
+            return datetime.strptime(created_at, '%Y-%m-%dT%H:%M:%S'), int(snapshot_id)
+        except (AttributeError, ValueError):
+            raise ValueError(f"잘못된 커서입니다: {cursor}")
+
+    def get_snapshots(self, saved_only=False, limit=SNAPSHOT_PAGE_SIZE, cursor=None):
+        """
+        저장된 분석 목록 조회 (요약 컬럼만, created_at 기준 keyset 페이지네이션)
 
         Args:
             saved_only (bool): True면 저장된 것만
+            limit (int): 페이지 크기
+            cursor (str, optional): 이전 페이지의 next_cursor
 
         Returns:
-            list: 스냅샷 목록
+            tuple: (스냅샷 목록, 다음 페이지 커서 - 마지막 페이지면 None)
         """
-        sql = """
+        limit = min(max(int(limit), 1), SNAPSHOT_PAGE_SIZE_MAX)
+
+        sql = f"""
             SELECT
                 id,
                 snapshot_name,
                 period_start,
                 period_end,
-                metrics_summary,
+                {', '.join(SUMMARY_COLUMNS)},
                 created_at,
                 tags,
                 memo,
@@ -305,28 +460,34 @@ class AdAnalyzer:
             FROM ad_analysis_snapshots
             WHERE user_id = %s
         """
+        params = [self.user_id]
 
         if saved_only:
             sql += " AND is_saved = TRUE"
 
-        sql += " ORDER BY created_at DESC"
+        if cursor:
+            created_at, snapshot_id = self.decode_cursor(cursor)
+            sql += " AND (created_at < %s OR (created_at = %s AND id < %s))"
+            params.extend([created_at, created_at, snapshot_id])
 
-        snapshots = execute_query(sql, (self.user_id,))
+        # 다음 페이지 존재 여부 확인용으로 1개 더 조회
+        sql += " ORDER BY created_at DESC, id DESC LIMIT %s"
+        params.append(limit + 1)
+
+        snapshots = execute_query(sql, tuple(params))
+        has_more = len(snapshots) > limit
+        snapshots = snapshots[:limit]
 
-        # metrics_summary JSON 파싱
         for snapshot in snapshots:
-            if snapshot['metrics_summary']:
-                try:
-                    snapshot['metrics_summary'] = json.loads(snapshot['metrics_summary'])
-                except:
-                    snapshot['metrics_summary'] = {}
+            snapshot['metrics_summary'] = self._pop_summary(snapshot)
 
             # 날짜 포맷팅
             snapshot['period_start'] = str(snapshot['period_start'])
             snapshot['period_end'] = str(snapshot['period_end'])
             snapshot['created_at'] = snapshot['created_at'].strftime('%Y-%m-%d %H:%M:%S')
 
-        return snapshots
+        next_cursor = self.encode_cursor(snapshots[-1]) if has_more else None
+        return snapshots, next_cursor
 
     def get_snapshot_detail(self, snapshot_id):
         """
@@ -348,13 +509,17 @@ class AdAnalyzer:
         if not snapshot:
             raise ValueError(f"Snapshot not found: {snapshot_id}")
 
-        # 일별 데이터
+        # 일별 데이터 (스냅샷 기간의 사용자 일별 팩트)
         daily_sql = """
-            SELECT * FROM ad_daily_data
-            WHERE snapshot_id = %s
-            ORDER BY date
+            SELECT date, campaign_name, spend, impressions, clicks, conversions, revenue
+            FROM ad_daily_facts
+            WHERE user_id = %s AND date >= %s AND date < %s
+            ORDER BY date, campaign_name
         """
-        daily_data = execute_query(daily_sql, (snapshot_id,))
+        daily_data = execute_query(daily_sql, self._fact_range_params(snapshot))
+
+        # 목록용 요약 컬럼은 metrics_summary와 중복이므로 제외
+        self._pop_summary(snapshot)
 
         # metrics_summary 파싱
         metrics = {}
@@ -423,7 +588,11 @@ class AdAnalyzer:
 
     def delete_snapshot(self, snapshot_id):
         """
-        스냅샷 삭제 (CASCADE로 일별 데이터도 자동 삭제)
+        스냅샷 삭제
+
+        이 업로드 값이 남아 있는 일별 팩트(source_snapshot_id)는 남은 업로드 중 가장 최근 업로드의
+        이전 값(ad_daily_fact_versions)으로 복원하고, 다른 업로드에 없던 (날짜, 캠페인)만 삭제.
+        같은 트랜잭션에서 스냅샷 기간이 걸친 일·주·월 집계(추이/예산 페이싱)와 겹치는 스냅샷 요약을 다시 계산
 
         Args:
             snapshot_id (int): 스냅샷 ID
@@ -431,16 +600,56 @@ class AdAnalyzer:
         Returns:
             bool: 성공 여부
         """
-        sql = """
-            DELETE FROM ad_analysis_snapshots
-            WHERE id = %s AND user_id = %s
-        """
-
-        rows_deleted = execute_delete(sql, (snapshot_id, self.user_id))
-
-        logger.info(f"Deleted snapshot {snapshot_id}: {rows_deleted} rows")
-
-        return rows_deleted > 0
+        metrics = ', '.join(FACT_METRIC_COLUMNS)
+
+        with transaction() as cursor:
+            cursor.execute("""
+                SELECT period_start, period_end FROM ad_analysis_snapshots
+                WHERE id = %s AND user_id = %s
+                FOR UPDATE
+            """, (snapshot_id, self.user_id))
+            snapshot = cursor.fetchone()
+            if not snapshot:
+                return False
+
+            # 남은 업로드 중 가장 최근 이전 값으로 복원
+            restored = cursor.execute(f"""
+                INSERT INTO ad_daily_facts (user_id, date, campaign_name, {metrics}, source_snapshot_id)
+                SELECT v.user_id, v.date, v.campaign_name, {', '.join(f'v.{column}' for column in FACT_METRIC_COLUMNS)},
+                       v.snapshot_id
+                FROM ad_daily_facts f
+                JOIN ad_daily_fact_versions v
+                    ON v.user_id = f.user_id AND v.date = f.date AND v.campaign_name = f.campaign_name
+                WHERE f.user_id = %s AND f.source_snapshot_id = %s
+                    AND v.snapshot_id = (
+                        SELECT MAX(latest.snapshot_id) FROM ad_daily_fact_versions latest
+                        WHERE latest.user_id = v.user_id AND latest.date = v.date
+                            AND latest.campaign_name = v.campaign_name AND latest.snapshot_id <> %s
+                    )
+                ON DUPLICATE KEY UPDATE
+                    {', '.join(f'{column} = VALUES({column})' for column in ('source_snapshot_id', *FACT_METRIC_COLUMNS))}
+            """, (self.user_id, snapshot_id, snapshot_id))
+
+            # 다른 업로드에 없던 (날짜, 캠페인)
+            facts_deleted = cursor.execute(
+                "DELETE FROM ad_daily_facts WHERE user_id = %s AND source_snapshot_id = %s",
+                (self.user_id, snapshot_id)
+            )
+            # 이전 값은 FK ON DELETE CASCADE로 함께 삭제
+            cursor.execute(
+                "DELETE FROM ad_analysis_snapshots WHERE id = %s AND user_id = %s",
+                (snapshot_id, self.user_id)
+            )
+
+            # 추이/예산 페이싱용 일·주·월 집계 갱신
+            refresh_metric_rollups(cursor, self.user_id, snapshot['period_start'], snapshot['period_end'])
+
+            # 복원/삭제한 기간과 겹치는 스냅샷 요약 갱신
+            self._refresh_overlapping_summaries(cursor, snapshot['period_start'], snapshot['period_end'])
+
+        logger.info(f"Deleted snapshot {snapshot_id}: {facts_deleted} daily facts deleted, {restored} restore rows")
+
+        return True
 
     def check_ownership(self, snapshot_id):
         """
@@ -490,37 +699,24 @@ class AdAnalyzer:
             snapshot_b_id (int): 비교 스냅샷 ID (이전)
 
         Returns:
-            dict: 비교 결과
+            dict | None: 비교 결과 (스냅샷이 없거나 다른 사용자 것이면 None)
         """
-        # 두 스냅샷의 지표 조회
-        metrics_a = self._get_snapshot_metrics(snapshot_a_id)
-        metrics_b = self._get_snapshot_metrics(snapshot_b_id)
-
-        comparison = {}
+        snapshots = self._get_compare_snapshots([snapshot_b_id, snapshot_a_id])
+        if snapshots is None:
+            return None
 
-        metrics_to_compare = ['avg_roas', 'avg_ctr', 'avg_cpa', 'cvr', 'avg_cpc']
+        (info_b, summary_b), (info_a, summary_a) = snapshots
+        matrix = build_metric_matrix([snapshot_b_id, snapshot_a_id], [summary_b, summary_a])
 
-        for key in metrics_to_compare:
-            val_a = metrics_a.get(key, 0)
-            val_b = metrics_b.get(key, 0)
-
-            if val_b > 0:
-                change_pct = round(((val_a - val_b) / val_b * 100), 1)
-            else:
-                change_pct = 0.0
-
-            # CPA, CPC는 낮을수록 좋음
-            if key in ['avg_cpa', 'avg_cpc']:
-                trend = 'up' if change_pct < 0 else ('down' if change_pct > 0 else 'flat')
-            else:
-                trend = 'up' if change_pct > 0 else ('down' if change_pct < 0 else 'flat')
-
-            comparison[key] = {
-                'a': val_a,
-                'b': val_b,
-                'change': change_pct,
-                'trend': trend
+        comparison = {
+            key: {
+                'a': data['values'][1],
+                'b': data['values'][0],
+                'change': data['change'][1],
+                'trend': data['trend'][1]
             }
+            for key, data in matrix.items()
+        }
 
         # 개선 요약 생성
         summary = self._generate_comparison_summary(comparison)
@@ -528,37 +724,107 @@ class AdAnalyzer:
         return {
             'comparison': comparison,
             'summary': summary,
-            'snapshot_a': self._get_snapshot_info(snapshot_a_id),
-            'snapshot_b': self._get_snapshot_info(snapshot_b_id)
+            'snapshot_a': info_a,
+            'snapshot_b': info_b
         }
 
-    def _get_snapshot_metrics(self, snapshot_id):
-        """스냅샷의 metrics_summary 조회"""
-        sql = "SELECT metrics_summary FROM ad_analysis_snapshots WHERE id = %s"
-        result = execute_query(sql, (snapshot_id,), fetch_one=True)
+    def compare_campaigns(self, snapshot_a_id, snapshot_b_id, top_k=DIFF_TOP_K, sort='revenue'):
+        """
+        두 스냅샷의 캠페인별 증감 비교 (상위 증가/감소 캠페인 + 기여도)
 
-        if result and result['metrics_summary']:
-            try:
-                return json.loads(result['metrics_summary'])
-            except:
-                pass
+        Args:
+            snapshot_a_id (int): 기준 스냅샷 ID (현재)
+            snapshot_b_id (int): 비교 스냅샷 ID (이전)
+            top_k (int): 증가/감소 각각 반환할 캠페인 수
+            sort (str): 정렬 기준 'revenue' | 'spend' | 'roas_contribution'
 
-        return {}
+        Returns:
+            dict | None: 증감 결과 (ad_compare.diff_campaigns + snapshot_a/snapshot_b),
+                         스냅샷이 없거나 다른 사용자 것이면 None
 
-    def _get_snapshot_info(self, snapshot_id):
-        """스냅샷 기본 정보 조회"""
-        sql = """
-            SELECT id, snapshot_name, period_start, period_end
+        Raises:
+            ValueError: sort가 잘못된 경우
+        """
+        snapshots = self._get_compare_snapshots([snapshot_b_id, snapshot_a_id])
+        if snapshots is None:
+            return None
+
+        (info_b, summary_b), (info_a, summary_a) = snapshots
+        result = diff_campaigns(summary_a.get('campaigns'), summary_b.get('campaigns'), top_k, sort)
+
+        return {**result, 'snapshot_a': info_a, 'snapshot_b': info_b}
+
+    def compare_many(self, snapshot_ids, baseline='first'):
+        """
+        스냅샷 N개 비교 (전체 지표 + 캠페인별 지표 행렬)
+
+        Args:
+            snapshot_ids (list): 스냅샷 ID (열 순서, 중복은 제거)
+            baseline (str): 변화율 기준 'first'(첫 스냅샷) 또는 'previous'(직전 스냅샷)
+
+        Returns:
+            dict | None: {'snapshots', 'baseline', 'metrics', 'campaigns', 'summary'}
+                         (스냅샷이 하나라도 없거나 다른 사용자 것이면 None)
+
+        Raises:
+            ValueError: 스냅샷 수나 baseline이 잘못된 경우
+        """
+        snapshot_ids = list(dict.fromkeys(snapshot_ids))
+        if not 2 <= len(snapshot_ids) <= COMPARE_SNAPSHOTS_MAX:
+            raise ValueError(f"비교할 스냅샷은 2~{COMPARE_SNAPSHOTS_MAX}개여야 합니다")
+        if baseline not in COMPARE_BASELINES:
+            raise ValueError("baseline은 first 또는 previous만 가능합니다")
+
+        snapshots = self._get_compare_snapshots(snapshot_ids)
+        if snapshots is None:
+            return None
+
+        infos = [info for info, _ in snapshots]
+        summaries = [summary for _, summary in snapshots]
+        metrics = build_metric_matrix(snapshot_ids, summaries, baseline)
+
+        # 마지막 스냅샷의 기준 대비 변화 요약
+        latest = {key: {'change': data['change'][-1], 'trend': data['trend'][-1]} for key, data in metrics.items()}
+
+        return {
+            'snapshots': infos,
+            'baseline': baseline,
+            'metrics': metrics,
+            'campaigns': build_campaign_matrix(snapshot_ids, summaries, baseline),
+            'summary': self._generate_comparison_summary(latest)
+        }
+
+    def _get_compare_snapshots(self, snapshot_ids):
+        """
+        비교할 스냅샷의 기본 정보/지표 일괄 조회 (소유권 확인 포함, 1회 쿼리)
+
+        Returns:
+            list | None: [(기본 정보 dict, metrics_summary dict)] (snapshot_ids 순서),
+                         하나라도 없거나 다른 사용자 것이면 None
+        """
+        placeholders = ', '.join(['%s'] * len(snapshot_ids))
+        sql = f"""
+            SELECT id, snapshot_name, period_start, period_end, metrics_summary
             FROM ad_analysis_snapshots
-            WHERE id = %s
+            WHERE id IN ({placeholders}) AND user_id = %s
         """
-        snapshot = execute_query(sql, (snapshot_id,), fetch_one=True)
+        rows = {row['id']: row for row in execute_query(sql, (*snapshot_ids, self.user_id)) or []}
+        if len(rows) != len(set(snapshot_ids)):
+            return None
 
-        if snapshot:
-            snapshot['period_start'] = str(snapshot['period_start'])
-            snapshot['period_end'] = str(snapshot['period_end'])
+        snapshots = []
+        for snapshot_id in snapshot_ids:
+            row = dict(rows[snapshot_id])
+            try:
+                summary = json.loads(row.pop('metrics_summary') or '{}')
+            except (TypeError, ValueError):
+                summary = {}
 
-        return snapshot
+            row['period_start'] = str(row['period_start'])
+            row['period_end'] = str(row['period_end'])
+            snapshots.append((row, summary))
+
+        return snapshots
 
     def _generate_comparison_summary(self, comparison):
         """비교 요약 텍스트 생성"""
@@ -596,6 +862,25 @@ class AdAnalyzer:
 
         return "\n".join(summary) if summary else "큰 변화 없음"
 
+    def get_trend(self, start, end, granularity='auto', campaign_name=None, max_points=TREND_MAX_POINTS):
+        """
+        기간 성과 추이 (스냅샷과 무관하게 사용자의 전체 업로드 기준)
+
+        Args:
+            start (date): 시작일
+            end (date): 종료일
+            granularity (str): 'auto', 'day', 'week', 'month'
+            campaign_name (str, optional): 캠페인명 (None이면 전체 합계)
+            max_points (int): 최대 구간 수
+
+        Returns:
+            dict: 추이 데이터 (ad_trend.get_trend)
+
+        Raises:
+            ValueError: 기간/단위가 잘못된 경우
+        """
+        return get_trend(self.user_id, start, end, granularity, campaign_name, max_points)
+
     def calculate_budget_pacing(self, year_month):
         """
         예산 소진율 계산
@@ -605,7 +890,12 @@ class AdAnalyzer:
 
         Returns:
             dict: 예산 페이싱 정보
+
+        Raises:
+            ValueError: year_month 형식이 잘못된 경우
         """
+        month_range(year_month)
+
         # 월별 목표 조회
         goal = self._get_monthly_goal(year_month)
 
@@ -614,16 +904,8 @@ class AdAnalyzer:
 
         budget = float(goal['budget'])
 
-        # 해당 월의 지출 합계
-        sql = """
-            SELECT COALESCE(SUM(spend), 0) as total_spend
-            FROM ad_daily_data d
-            JOIN ad_analysis_snapshots s ON d.snapshot_id = s.id
-            WHERE s.user_id = %s
-            AND DATE_FORMAT(d.date, '%%Y-%%m') = %s
-        """
-        result = execute_query(sql, (self.user_id, year_month), fetch_one=True)
-        spent = float(result['total_spend'] or 0)
+        # 해당 월의 지출 합계 (겹치는 스냅샷 중복 제거된 월별 집계 1행)
+        spent = get_monthly_spend(self.user_id, year_month)
 
         # 진행률 계산
         year, month = map(int, year_month.split('-'))
@@ -0,0 +1,215 @@
+"""
+광고 일별 데이터 일괄 적재 (사용자별 일별 팩트 테이블 ad_daily_facts)
+- 행 단위(iterrows) 변환 대신 컬럼 단위 NumPy 형변환 후 (날짜, 캠페인)별로 합산
+- (user_id, date, campaign_name) 기준 마지막 업로드 값으로 덮어씀 (last-write-wins)
+- 덮어쓰기 전 기존 값은 원래 업로드의 이전 값(ad_daily_fact_versions)으로 보관
+  (최신 업로드 스냅샷을 삭제하면 남은 업로드 중 가장 최근 값으로 복원)
+- 다중 행 INSERT ... ON DUPLICATE KEY UPDATE를 청크 단위로 실행 (기본 경로)
+- DB_LOCAL_INFILE 설정 + 서버 local_infile=ON이면 LOAD DATA LOCAL INFILE ... REPLACE로 TSV 1회 전송
+  (pymysql은 파일 경로로만 전송하므로 TSV는 임시 파일로 기록 후 삭제)
+"""
+
+import os
+import csv
+import logging
+import tempfile
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# ad_daily_facts 적재 컬럼 (user_id, source_snapshot_id 제외)
+DAILY_COLUMNS = ('date', 'campaign_name', 'spend', 'impressions', 'clicks', 'conversions', 'revenue')
+METRIC_COLUMNS = DAILY_COLUMNS[2:]
+
+# 다중 행 INSERT 1문장당 행 수 (9컬럼 기준 약 120KB, max_allowed_packet 기본값보다 충분히 작음)
+INSERT_CHUNK_ROWS = 2000
+
+# 이 행 수 이상일 때만 LOAD DATA 사용 (작은 데이터는 임시 파일 비용이 더 큼)
+LOAD_DATA_MIN_ROWS = 5000
+
+FACT_INSERT_SQL = (
+    "INSERT INTO ad_daily_facts "
+    "(user_id, source_snapshot_id, date, campaign_name, spend, impressions, clicks, conversions, revenue) VALUES "
+)
+FACT_ROW_PLACEHOLDER = '(%s, %s, %s, %s, %s, %s, %s, %s, %s)'
+FACT_UPSERT_SUFFIX = (
+    " ON DUPLICATE KEY UPDATE "
+    + ', '.join(f'{column} = VALUES({column})' for column in ('source_snapshot_id', *METRIC_COLUMNS))
+)
+
+# 이번 업로드가 덮어쓸 기존 팩트 -> 이전 값 보관 (키 목록은 (date, campaign_name) 행 생성자 IN)
+VERSION_ARCHIVE_SQL = (
+    "INSERT IGNORE INTO ad_daily_fact_versions "
+    "(user_id, snapshot_id, date, campaign_name, spend, impressions, clicks, conversions, revenue) "
+    "SELECT user_id, source_snapshot_id, date, campaign_name, spend, impressions, clicks, conversions, revenue "
+    "FROM ad_daily_facts "
+    "WHERE user_id = %s AND source_snapshot_id IS NOT NULL AND (date, campaign_name) IN "
+)
+VERSION_KEY_PLACEHOLDER = '(%s, %s)'
+
+FACT_LOAD_DATA_SQL = (
+    "LOAD DATA LOCAL INFILE %s REPLACE INTO TABLE ad_daily_facts "
+    "CHARACTER SET utf8mb4 "
+    "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\' "
+    "LINES TERMINATED BY '\\n' "
+    "(date, campaign_name, spend, impressions, clicks, conversions, revenue) "
+    "SET user_id = %s, source_snapshot_id = %s"
+)
+
+
+def prepare_daily_frame(df):
+    """
+    적재용 컬럼 형변환 + (날짜, 캠페인)별 합산 (컬럼 단위)
+
+    Args:
+        df (pandas.DataFrame): date(datetime64 또는 변환 가능한 값), campaign_name, spend, clicks,
+                               conversions, revenue, impressions(선택) 컬럼
+
+    Returns:
+        pandas.DataFrame: DAILY_COLUMNS 순서, (date, campaign_name)당 1행, date는 'YYYY-MM-DD' 문자열,
+                          금액은 소수 2자리 float64, 수량은 int64
+
+    Raises:
+        ValueError: 수치 컬럼에 숫자로 변환할 수 없는 값(빈 값 포함)이 있는 경우
+    """
+    impressions = df['impressions'].fillna(0) if 'impressions' in df.columns else 0
+
+    daily = pd.DataFrame({
+        'date': pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d'),
+        'campaign_name': df['campaign_name'].astype(str),
+        'spend': df['spend'].astype('float64'),
+        'impressions': pd.Series(impressions, index=df.index).astype('int64'),
+        'clicks': df['clicks'].astype('int64'),
+        'conversions': df['conversions'].astype('int64'),
+        'revenue': df['revenue'].astype('float64'),
+    }, index=df.index)
+
+    # 같은 날짜/캠페인이 여러 행(광고그룹 등)이면 합산 - 팩트 테이블 키당 1행
+    daily = daily.groupby(['date', 'campaign_name'], sort=False, as_index=False).sum()
+    daily['spend'] = np.round(daily['spend'], 2)
+    daily['revenue'] = np.round(daily['revenue'], 2)
+    return daily
+
+
+def build_fact_upserts(user_id, snapshot_id, daily, chunk_rows=INSERT_CHUNK_ROWS):
+    """
+    일별 데이터를 청크 단위 다중 행 INSERT ... ON DUPLICATE KEY UPDATE 문으로 변환
+
+    Args:
+        user_id (str): 사용자 ID
+        snapshot_id (int): 업로드한 스냅샷 ID (source_snapshot_id)
+        daily (pandas.DataFrame): prepare_daily_frame() 결과
+        chunk_rows (int): 1문장당 행 수
+
+    Yields:
+        tuple: (sql, params)
+    """
+    # 컬럼별 tolist()는 C 루프로 Python 값 변환 (numpy 스칼라가 아닌 int/float/str)
+    columns = [daily[column].tolist() for column in DAILY_COLUMNS]
+    rows = list(zip([user_id] * len(daily), [snapshot_id] * len(daily), *columns))
+
+    for start in range(0, len(rows), chunk_rows):
+        chunk = rows[start:start + chunk_rows]
+        sql = FACT_INSERT_SQL + ', '.join([FACT_ROW_PLACEHOLDER] * len(chunk)) + FACT_UPSERT_SUFFIX
+        yield sql, list(chain.from_iterable(chunk))
+
+
+def build_version_archives(user_id, daily, chunk_rows=INSERT_CHUNK_ROWS):
+    """
+    이번 업로드가 덮어쓸 (날짜, 캠페인)의 기존 팩트를 이전 값 테이블로 복사하는 문장 (청크 단위)
+
+    Args:
+        user_id (str): 사용자 ID
+        daily (pandas.DataFrame): prepare_daily_frame() 결과
+        chunk_rows (int): 1문장당 키 수
+
+    Yields:
+        tuple: (sql, params)
+    """
+    keys = list(zip(daily['date'].tolist(), daily['campaign_name'].tolist()))
+
+    for start in range(0, len(keys), chunk_rows):
+        chunk = keys[start:start + chunk_rows]
+        sql = VERSION_ARCHIVE_SQL + '(' + ', '.join([VERSION_KEY_PLACEHOLDER] * len(chunk)) + ')'
+        yield sql, [user_id, *chain.from_iterable(chunk)]
+
+
+def build_daily_tsv(daily):
+    """
+    LOAD DATA용 TSV 생성 (MySQL 기본 이스케이프 규칙: 역슬래시로 탭/개행/역슬래시 이스케이프)
+
+    금액은 prepare_daily_frame()에서 이미 소수 2자리로 반올림되어 있으므로 float_format 없이 기록
+
+    Args:
+        daily (pandas.DataFrame): prepare_daily_frame() 결과
+
+    Returns:
+        bytes: UTF-8 TSV (헤더 없음)
+    """
+    text = daily[list(DAILY_COLUMNS)].to_csv(
+        sep='\t', header=False, index=False, lineterminator='\n',
+        quoting=csv.QUOTE_NONE, escapechar='\\'
+    )
+    return text.encode('utf-8')
+
+
+def _local_infile_enabled(cursor):
+    cursor.execute("SELECT @@GLOBAL.local_infile AS enabled")
+    row = cursor.fetchone()
+    return bool(row and int(row['enabled']))
+
+
+def load_daily_facts(cursor, user_id, snapshot_id, daily):
+    """
+    LOAD DATA LOCAL INFILE ... REPLACE로 적재 (기존 키는 새 값으로 교체)
+
+    Args:
+        cursor: local_infile=True로 연결된 커넥션의 커서
+        user_id (str): 사용자 ID
+        snapshot_id (int): 업로드한 스냅샷 ID
+        daily (pandas.DataFrame): prepare_daily_frame() 결과
+
+    Returns:
+        int: 적재된 행 수
+    """
+    fd, path = tempfile.mkstemp(prefix='ad_daily_', suffix='.tsv')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(build_daily_tsv(daily))
+        cursor.execute(FACT_LOAD_DATA_SQL, (path, user_id, snapshot_id))
+        return len(daily)
+    finally:
+        os.remove(path)
+
+
+def upsert_daily_facts(cursor, user_id, snapshot_id, daily, chunk_rows=INSERT_CHUNK_ROWS, local_infile=False):
+    """
+    일별 팩트 일괄 적재 (호출한 트랜잭션 안에서 실행, 같은 키는 마지막 업로드 값으로 덮어씀)
+
+    덮어쓰기 전에 기존 값을 원래 업로드의 이전 값으로 보관 (스냅샷 삭제 시 복원용)
+
+    Args:
+        cursor: DB 커서 (transaction())
+        user_id (str): 사용자 ID
+        snapshot_id (int): 업로드한 스냅샷 ID
+        daily (pandas.DataFrame): prepare_daily_frame() 결과
+        chunk_rows (int): 다중 행 INSERT 1문장당 행 수
+        local_infile (bool): 클라이언트에서 LOAD DATA LOCAL INFILE 허용 여부 (DB_LOCAL_INFILE)
+
+    Returns:
+        tuple: (적재 행 수, 방식 'load_data' | 'insert')
+    """
+    for sql, params in build_version_archives(user_id, daily, chunk_rows):
+        cursor.execute(sql, params)
+
+    if local_infile and len(daily) >= LOAD_DATA_MIN_ROWS:
+        if _local_infile_enabled(cursor):
+            return load_daily_facts(cursor, user_id, snapshot_id, daily), 'load_data'
+        logger.info("Server local_infile is OFF, falling back to multi-row INSERT")
+
+    for sql, params in build_fact_upserts(user_id, snapshot_id, daily, chunk_rows):
+        cursor.execute(sql, params)
+    return len(daily), 'insert'
@@ -0,0 +1,64 @@
+"""
+광고 지출 집계 (예산 페이싱용)
+- 월 지출은 월별 집계(ad_metrics_monthly)의 전체 캠페인 합계 행 1행만 읽음
+- 집계는 일별 팩트(ad_daily_facts, 기간이 겹치는 업로드는 마지막 값만 보관)에서 계산
+  (스냅샷 저장/삭제 시 ad_trend.refresh_metric_rollups()가 스냅샷 기간이 걸친 월만 갱신)
+"""
+
+import logging
+from datetime import date
+
+from app.utils.db_utils import execute_query
+
+logger = logging.getLogger(__name__)
+
+
+def month_start(value):
+    """날짜가 속한 달의 1일"""
+    return value.replace(day=1)
+
+
+def next_month(value):
+    """다음 달 1일"""
+    return date(value.year + 1, 1, 1) if value.month == 12 else date(value.year, value.month + 1, 1)
+
+
+def month_range(year_month):
+    """
+    월의 반열린 날짜 범위
+
+    Args:
+        year_month (str): YYYY-MM
+
+    Returns:
+        tuple: (해당 월 1일, 다음 달 1일)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    try:
+        year, month = map(int, year_month.split('-'))
+        start = date(year, month, 1)
+    except (AttributeError, TypeError, ValueError):
+        raise ValueError(f"잘못된 월 형식입니다 (YYYY-MM): {year_month}")
+    return start, next_month(start)
+
+
+def get_monthly_spend(user_id, year_month):
+    """
+    월 지출 합계 (겹치는 업로드 중복 제거 후)
+
+    Args:
+        user_id (str): 사용자 ID
+        year_month (str): YYYY-MM
+
+    Returns:
+        float: 지출 합계 (데이터 없으면 0)
+    """
+    start, _ = month_range(year_month)
+    result = execute_query(
+        "SELECT spend FROM ad_metrics_monthly WHERE user_id = %s AND campaign_name = '' AND month_start = %s",
+        (user_id, start),
+        fetch_one=True
+    )
+    return float(result['spend']) if result else 0.0
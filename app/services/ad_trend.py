@@ -0,0 +1,200 @@
+"""
+광고 성과 장기 추이 (일별/주별/월별 집계 테이블)
+- ad_metrics_daily / ad_metrics_weekly / ad_metrics_monthly: (user_id, campaign_name, 구간 시작일) 1행
+  (campaign_name = '' 행은 해당 구간의 전체 캠페인 합계)
+- 스냅샷 저장/삭제 트랜잭션 안에서 스냅샷 기간이 걸친 구간만 ad_daily_facts에서 다시 계산
+- 추이 조회는 구간 수(max_points)에 맞는 집계 테이블 1개를 기본키 범위로 1회 조회 (원본 스냅샷/팩트 조회 없음)
+"""
+
+import logging
+from datetime import timedelta
+
+from app.utils.db_utils import execute_query
+from app.services.ad_spend_rollup import month_start, next_month
+from app.utils.helpers import calculate_roas, calculate_ctr, calculate_cpc, calculate_cpa, calculate_cvr
+
+logger = logging.getLogger(__name__)
+
+# 전체 캠페인 합계 행의 campaign_name (sanitize_campaign_name()은 빈 문자열을 만들지 않음)
+ALL_CAMPAIGNS = ''
+
+# 집계 단위 (세밀한 순서 - 자동 선택 시 앞에서부터 확인)
+TREND_GRANULARITIES = ('day', 'week', 'month')
+
+# 집계 단위별 테이블/구간 컬럼
+ROLLUP_TABLES = {
+    'day': ('ad_metrics_daily', 'stat_date'),
+    'week': ('ad_metrics_weekly', 'week_start'),
+    'month': ('ad_metrics_monthly', 'month_start'),
+}
+
+# ad_daily_facts.date -> 구간 시작일 (주는 월요일 시작)
+BUCKET_EXPRESSIONS = {
+    'day': 'date',
+    'week': 'DATE_SUB(date, INTERVAL WEEKDAY(date) DAY)',
+    'month': "DATE_FORMAT(date, '%%Y-%%m-01')",
+}
+
+# 집계 지표 컬럼
+TREND_METRIC_COLUMNS = ('spend', 'revenue', 'impressions', 'clicks', 'conversions')
+
+# 응답 최대 구간 수 (기본값 - 1년 일별 365개)
+TREND_MAX_POINTS = 400
+
+
+def bucket_start(value, granularity):
+    """날짜가 속한 구간의 시작일"""
+    if granularity == 'week':
+        return value - timedelta(days=value.weekday())
+    if granularity == 'month':
+        return month_start(value)
+    return value
+
+
+def next_bucket(value, granularity):
+    """다음 구간 시작일 (value는 구간 시작일)"""
+    if granularity == 'week':
+        return value + timedelta(days=7)
+    if granularity == 'month':
+        return next_month(value)
+    return value + timedelta(days=1)
+
+
+def bucket_range(start, end, granularity):
+    """
+    기간을 덮는 구간들의 반열린 날짜 범위
+
+    Returns:
+        tuple: (첫 구간 시작일, 마지막 구간 다음 구간 시작일)
+    """
+    return bucket_start(start, granularity), next_bucket(bucket_start(end, granularity), granularity)
+
+
+def count_buckets(start, end, granularity):
+    """기간을 덮는 구간 수"""
+    first, stop = bucket_range(start, end, granularity)
+    if granularity == 'month':
+        return (stop.year - first.year) * 12 + stop.month - first.month
+    return (stop - first).days // (7 if granularity == 'week' else 1)
+
+
+def choose_granularity(start, end, max_points=TREND_MAX_POINTS):
+    """구간 수가 max_points 이하인 가장 세밀한 단위 (없으면 month)"""
+    for granularity in TREND_GRANULARITIES:
+        if count_buckets(start, end, granularity) <= max_points:
+            return granularity
+    return TREND_GRANULARITIES[-1]
+
+
+def refresh_metric_rollups(cursor, user_id, period_start, period_end):
+    """
+    기간이 걸친 일/주/월 구간의 캠페인별·전체 합계를 ad_daily_facts에서 다시 계산
+
+    Args:
+        cursor: DB 커서 (호출한 트랜잭션)
+        user_id (str): 사용자 ID
+        period_start (date): 기간 시작일
+        period_end (date): 기간 종료일
+    """
+    metrics = ', '.join(TREND_METRIC_COLUMNS)
+    sums = ', '.join(f'SUM({column})' for column in TREND_METRIC_COLUMNS)
+
+    for granularity in TREND_GRANULARITIES:
+        table, column = ROLLUP_TABLES[granularity]
+        expression = BUCKET_EXPRESSIONS[granularity]
+        start, end = bucket_range(period_start, period_end, granularity)
+        params = (user_id, start, end)
+
+        cursor.execute(
+            f"DELETE FROM {table} WHERE user_id = %s AND {column} >= %s AND {column} < %s",
+            params
+        )
+        # 캠페인별
+        cursor.execute(f"""
+            INSERT INTO {table} (user_id, campaign_name, {column}, {metrics})
+            SELECT user_id, campaign_name, {expression}, {sums}
+            FROM ad_daily_facts
+            WHERE user_id = %s AND date >= %s AND date < %s
+            GROUP BY user_id, campaign_name, {expression}
+        """, params)
+        # 전체 캠페인 합계
+        cursor.execute(f"""
+            INSERT INTO {table} (user_id, campaign_name, {column}, {metrics})
+            SELECT user_id, %s, {expression}, {sums}
+            FROM ad_daily_facts
+            WHERE user_id = %s AND date >= %s AND date < %s
+            GROUP BY user_id, {expression}
+        """, (ALL_CAMPAIGNS, *params))
+
+
+def _trend_point(row):
+    """집계 행 -> 추이 항목 (비율 지표 포함)"""
+    spend = float(row['spend'] or 0)
+    revenue = float(row['revenue'] or 0)
+    impressions = int(row['impressions'] or 0)
+    clicks = int(row['clicks'] or 0)
+    conversions = int(row['conversions'] or 0)
+
+    return {
+        'date': row['bucket'].strftime('%Y-%m-%d'),
+        'spend': spend,
+        'revenue': revenue,
+        'impressions': impressions,
+        'clicks': clicks,
+        'conversions': conversions,
+        'roas': calculate_roas(revenue, spend),
+        'ctr': calculate_ctr(clicks, impressions),
+        'cpc': calculate_cpc(spend, clicks),
+        'cpa': calculate_cpa(spend, conversions),
+        'cvr': calculate_cvr(conversions, clicks)
+    }
+
+
+def get_trend(user_id, start, end, granularity='auto', campaign_name=None, max_points=TREND_MAX_POINTS):
+    """
+    기간 성과 추이 (집계 테이블 1회 조회)
+
+    주/월 단위의 첫/마지막 구간은 기간 밖 날짜를 포함한 구간 전체 합계이며,
+    업로드되지 않은 구간은 0으로 채우지 않고 생략됨
+
+    Args:
+        user_id (str): 사용자 ID
+        start (date): 시작일 (포함)
+        end (date): 종료일 (포함)
+        granularity (str): 'auto'(구간 수가 max_points 이하인 가장 세밀한 단위), 'day', 'week', 'month'
+        campaign_name (str, optional): 캠페인명 (None이면 전체 캠페인 합계)
+        max_points (int): 최대 구간 수
+
+    Returns:
+        dict: {'granularity', 'start', 'end', 'campaign_name', 'series': [{'date', 'spend', ..., 'roas', ...}]}
+
+    Raises:
+        ValueError: 기간/단위가 잘못되었거나 지정한 단위의 구간 수가 max_points를 넘는 경우
+    """
+    if start > end:
+        raise ValueError("시작일이 종료일보다 늦습니다")
+
+    if granularity == 'auto':
+        granularity = choose_granularity(start, end, max_points)
+    elif granularity not in TREND_GRANULARITIES:
+        raise ValueError("granularity는 auto, day, week, month 중 하나여야 합니다")
+    elif count_buckets(start, end, granularity) > max_points:
+        raise ValueError(f"구간 수가 {max_points}개를 넘습니다. 기간을 줄이거나 더 큰 단위를 선택하세요")
+
+    table, column = ROLLUP_TABLES[granularity]
+    first, stop = bucket_range(start, end, granularity)
+
+    rows = execute_query(f"""
+        SELECT {column} AS bucket, {', '.join(TREND_METRIC_COLUMNS)}
+        FROM {table}
+        WHERE user_id = %s AND campaign_name = %s AND {column} >= %s AND {column} < %s
+        ORDER BY {column}
+    """, (user_id, campaign_name or ALL_CAMPAIGNS, first, stop))
+
+    return {
+        'granularity': granularity,
+        'start': start.strftime('%Y-%m-%d'),
+        'end': end.strftime('%Y-%m-%d'),
+        'campaign_name': campaign_name,
+        'series': [_trend_point(row) for row in rows or []]
+    }
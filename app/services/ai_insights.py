@@ -6,12 +6,35 @@ AI 인사이트 생성 서비스
 """
 
 import os
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI
 from flask import current_app
 
+from app.services.insight_cache import get_insight_cache
+
 logger = logging.getLogger(__name__)
 
+# 인사이트 생성 시스템 프롬프트 (캐시 키에 포함 - 변경 시 캐시 자동 무효화)
+INSIGHTS_SYSTEM_PROMPT = "당신은 10년 경력의 디지털 마케팅 전문가입니다. 광고 데이터를 분석하고 실행 가능한 조언을 제공합니다."
+
+
+_executor = None
+_executor_pid = None
+
+
+def _get_executor():
+    """백그라운드 인사이트 생성 스레드 풀 (프로세스당 1개 - OpenAI 호출 대기는 I/O)"""
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        _executor = ThreadPoolExecutor(
+            max_workers=current_app.config.get('AI_INSIGHTS_WORKERS', 4),
+            thread_name_prefix='ai-insights'
+        )
+        _executor_pid = os.getpid()
+    return _executor
+
 
 class AIInsights:
     """AI 인사이트 생성 클래스"""
@@ -21,14 +44,39 @@ class AIInsights:
         OpenAI 클라이언트 초기화
         """
         api_key = current_app.config.get('OPENAI_API_KEY') or os.getenv('OPENAI_API_KEY')
+        self.model = current_app.config.get('OPENAI_MODEL', 'gpt-4')
+
+        # 요청 1건 최대 대기 시간 (재시도 없음 → 초과 시 기본 인사이트로 대체)
+        self.timeout = current_app.config.get('AI_INSIGHTS_TIMEOUT', 30)
 
         if not api_key:
             logger.warning("OpenAI API key not configured")
             self.client = None
         else:
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, timeout=self.timeout, max_retries=0)
             logger.info("OpenAI client initialized")
 
+    def prompt_key(self, metrics, df=None):
+        """
+        인사이트 캐시 키 (모델 + 시스템 프롬프트 + _create_prompt 결과의 SHA-256)
+
+        Args:
+            metrics (dict): 계산된 지표
+            df (pd.DataFrame, optional): 원본 데이터프레임
+
+        Returns:
+            str: 캐시 키 (sha256 hex)
+        """
+        return self._prompt_key(self._create_prompt(metrics, df))
+
+    def _prompt_key(self, prompt):
+        """이미 만든 프롬프트의 캐시 키"""
+        digest = hashlib.sha256()
+        for part in (self.model, INSIGHTS_SYSTEM_PROMPT, prompt):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
     def generate_insights(self, metrics, df=None):
         """
         AI 인사이트 생성
@@ -48,35 +96,98 @@ class AIInsights:
             return self._generate_fallback_insights(metrics)
 
         try:
-            # 프롬프트 생성
-            prompt = self._create_prompt(metrics, df)
+            return self._complete(self._create_prompt(metrics, df))
 
-            # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model=current_app.config.get('OPENAI_MODEL', 'gpt-4'),
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "당신은 10년 경력의 디지털 마케팅 전문가입니다. 광고 데이터를 분석하고 실행 가능한 조언을 제공합니다."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=1500
-            )
+        except Exception as e:
+            logger.error(f"AI insights generation failed: {e}")
+            return self._generate_fallback_insights(metrics)
 
-            insights = response.choices[0].message.content
+    def request_insights(self, metrics, df=None):
+        """
+        인사이트 요청 (OpenAI 호출은 백그라운드 - 업로드 응답을 지연시키지 않음)
 
-            logger.info("AI insights generated successfully")
+        - 같은 프롬프트 결과가 캐시에 있으면 즉시 반환
+        - 없으면 백그라운드 생성을 시작하고 기본 인사이트를 먼저 반환 (AI 결과는 insights_id로 조회)
 
-            return insights
+        Args:
+            metrics (dict): 계산된 지표
+            df (pd.DataFrame, optional): 원본 데이터프레임
 
-        except Exception as e:
-            logger.error(f"AI insights generation failed: {e}")
-            return self._generate_fallback_insights(metrics)
+        Returns:
+            dict: {
+                'insights_id': 캐시 키 (AI 미사용 시 None),
+                'status': 'done' 또는 'pending',
+                'insights': 인사이트 텍스트 (pending이면 기본 인사이트),
+                'source': 'ai' 또는 'fallback'
+            }
+        """
+        fallback = self._generate_fallback_insights(metrics)
+        if not self.client:
+            return {'insights_id': None, 'status': 'done', 'insights': fallback, 'source': 'fallback'}
+
+        cache = get_insight_cache()
+        prompt = self._create_prompt(metrics, df)
+        key = self._prompt_key(prompt)
+        entry = cache.get(key)
+
+        if entry is not None and entry['status'] == 'done':
+            logger.info(f"AI insights cache hit: {key[:12]}")
+            return {'insights_id': key, 'status': 'done', 'insights': entry['insights'], 'source': entry['source']}
+
+        # 결과가 없거나 실패 후 재시도 허용 시간이 지난 경우에만 생성 시작 (진행 중이면 선점 실패)
+        if cache.claim(key):
+            _get_executor().submit(
+                self._generate_in_background, current_app._get_current_object(),
+                key, prompt, fallback
+            )
+        elif entry is not None and entry['status'] == 'failed':
+            return {'insights_id': key, 'status': 'done', 'insights': entry['insights'], 'source': 'fallback'}
+
+        return {'insights_id': key, 'status': 'pending', 'insights': fallback, 'source': 'fallback'}
+
+    def _generate_in_background(self, app, key, prompt, fallback):
+        """백그라운드 스레드에서 OpenAI 호출 후 캐시에 저장 (시간 초과/오류 시 기본 인사이트 저장)"""
+        with app.app_context():
+            cache = get_insight_cache()
+            try:
+                cache.put(key, 'done', self._complete(prompt), 'ai')
+                logger.info(f"AI insights cached: {key[:12]}")
+            except Exception as e:
+                logger.error(f"AI insights generation failed: {key[:12]} - {e}")
+                cache.put(key, 'failed', fallback, 'fallback')
+
+    def _complete(self, prompt):
+        """
+        OpenAI 인사이트 요청 (timeout 초과 시 예외, 재시도 없음)
+
+        Args:
+            prompt (str): _create_prompt 결과
+
+        Returns:
+            str: AI 생성 인사이트
+        """
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": INSIGHTS_SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            temperature=0.7,
+            max_tokens=1500,
+            timeout=self.timeout
+        )
+
+        insights = response.choices[0].message.content
+
+        logger.info("AI insights generated successfully")
+
+        return insights
 
     def _create_prompt(self, metrics, df=None):
         """
@@ -249,7 +360,7 @@ class AIInsights:
 """
 
         if excellent_campaigns and poor_campaigns:
-            insights += f"\n- 성과가 낮은 캠페인의 예산 20%를 우수 캠페인으로 이동"
+            insights += "\n- 성과가 낮은 캠페인의 예산 20%를 우수 캠페인으로 이동"
         else:
             insights += "\n- 현재 데이터로는 명확한 재배분 제안이 어렵습니다."
 
@@ -274,7 +385,7 @@ class AIInsights:
             prompt = self._create_comparison_prompt(comparison)
 
             response = self.client.chat.completions.create(
-                model=current_app.config.get('OPENAI_MODEL', 'gpt-4'),
+                model=self.model,
                 messages=[
                     {
                         "role": "system",
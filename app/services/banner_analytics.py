@@ -0,0 +1,373 @@
+"""
+배너 이벤트 로그 적재 + 시간별/일별 집계
+- 노출/클릭 이벤트를 워커 프로세스 메모리에 모았다가 banner_analytics에 다중 행 INSERT로 일괄 적재 (append-only)
+- 같은 트랜잭션에서 banner_stats_hourly / banner_stats_daily를 INSERT ... ON DUPLICATE KEY UPDATE로 증분 갱신
+- 통계/시계열 조회는 원본 이벤트 대신 집계 테이블만 읽음
+- 반영 실패 시 이벤트를 버퍼로 되돌려 다음 주기에 재시도 (max_backlog 초과분은 오래된 것부터 폐기)
+"""
+
+import os
+import time
+import atexit
+import logging
+import threading
+from datetime import datetime, timedelta
+from flask import current_app
+
+from app.utils.db_utils import get_db_cursor
+
+logger = logging.getLogger(__name__)
+
+# 다중 행 INSERT 1개 문장당 최대 행 수 (max_allowed_packet 여유)
+INSERT_CHUNK_ROWS = 1000
+
+# user_agent 저장 최대 길이
+MAX_USER_AGENT_LENGTH = 500
+
+# 시계열 단위별 집계 테이블/컬럼
+ROLLUP_TABLES = {
+    'hour': ('banner_stats_hourly', 'stat_hour'),
+    'day': ('banner_stats_daily', 'stat_date'),
+}
+
+
+def expand_events(counts, ip_address=None, user_agent=None, created_at=None):
+    """
+    배너별 증가분을 이벤트 행으로 펼침
+
+    Args:
+        counts (dict): {banner_id: (노출 수, 클릭 수)}
+        ip_address (str, optional): 클라이언트 IP
+        user_agent (str, optional): 브라우저 정보
+        created_at (datetime, optional): 발생 시각 (기본: 현재)
+
+    Returns:
+        list: [(banner_id, event_type, ip_address, user_agent, created_at)]
+    """
+    created_at = created_at or datetime.now().replace(microsecond=0)
+    if user_agent:
+        user_agent = user_agent[:MAX_USER_AGENT_LENGTH]
+
+    rows = []
+    for banner_id, (impressions, clicks) in counts.items():
+        rows.extend([(banner_id, 'impression', ip_address, user_agent, created_at)] * impressions)
+        rows.extend([(banner_id, 'click', ip_address, user_agent, created_at)] * clicks)
+    return rows
+
+
+def build_event_inserts(rows):
+    """
+    이벤트 행을 다중 행 INSERT 문으로 변환 (INSERT_CHUNK_ROWS 단위)
+
+    Returns:
+        list: [(sql, params)]
+    """
+    statements = []
+    for start in range(0, len(rows), INSERT_CHUNK_ROWS):
+        chunk = rows[start:start + INSERT_CHUNK_ROWS]
+        sql = (
+            "INSERT INTO banner_analytics (banner_id, event_type, ip_address, user_agent, created_at) VALUES "
+            + ', '.join(['(%s, %s, %s, %s, %s)'] * len(chunk))
+        )
+        statements.append((sql, tuple(value for row in chunk for value in row)))
+    return statements
+
+
+def rollup_events(rows):
+    """
+    이벤트 행을 시간별/일별로 합산
+
+    Returns:
+        dict: {'hour': {(banner_id, 정시 datetime): [노출, 클릭]}, 'day': {(banner_id, date): [노출, 클릭]}}
+    """
+    rollups = {'hour': {}, 'day': {}}
+    for banner_id, event_type, _, _, created_at in rows:
+        index = 0 if event_type == 'impression' else 1
+        keys = (
+            ('hour', created_at.replace(minute=0, second=0, microsecond=0)),
+            ('day', created_at.date()),
+        )
+        for granularity, bucket in keys:
+            counts = rollups[granularity].setdefault((banner_id, bucket), [0, 0])
+            counts[index] += 1
+    return rollups
+
+
+def build_rollup_upserts(rows):
+    """
+    시간별/일별 집계 증분 갱신 문 생성 (테이블당 1개 문장, 키 순서 고정으로 워커 간 교착 방지)
+
+    Returns:
+        list: [(sql, params)]
+    """
+    statements = []
+    for granularity, buckets in rollup_events(rows).items():
+        if not buckets:
+            continue
+        table, column = ROLLUP_TABLES[granularity]
+        keys = sorted(buckets)
+        sql = (
+            f"INSERT INTO {table} (banner_id, {column}, impressions, clicks) VALUES "
+            + ', '.join(['(%s, %s, %s, %s)'] * len(keys))
+            + " ON DUPLICATE KEY UPDATE impressions = impressions + VALUES(impressions), "
+            "clicks = clicks + VALUES(clicks)"
+        )
+        params = []
+        for banner_id, bucket in keys:
+            params.extend([banner_id, bucket, *buckets[(banner_id, bucket)]])
+        statements.append((sql, tuple(params)))
+    return statements
+
+
+def write_events(rows):
+    """
+    이벤트 적재 + 집계 갱신 (1개 트랜잭션)
+
+    삭제된/존재하지 않는 배너 이벤트는 FK 오류로 배치 전체가 실패하지 않도록 제외
+    """
+    banner_ids = sorted({row[0] for row in rows})
+
+    with get_db_cursor(commit=True) as cursor:
+        placeholders = ', '.join(['%s'] * len(banner_ids))
+        cursor.execute(f"SELECT id FROM banners WHERE id IN ({placeholders})", tuple(banner_ids))
+        existing = {row['id'] for row in cursor.fetchall()}
+
+        rows = [row for row in rows if row[0] in existing]
+        if not rows:
+            return
+
+        for sql, params in build_event_inserts(rows) + build_rollup_upserts(rows):
+            cursor.execute(sql, params)
+
+
+class BannerEventLog:
+    """이벤트 행 버퍼 (워커 프로세스당 1개, 백그라운드 스레드가 주기적으로 적재)"""
+
+    def __init__(self, writer=write_events, flush_interval=10, max_pending=5000, max_backlog=50000, app=None):
+        """
+        Args:
+            writer (callable): writer([이벤트 행]) - 적재 함수
+            flush_interval (float): 적재 주기 (초)
+            max_pending (int): 대기 이벤트가 이 수 이상이면 주기와 관계없이 즉시 적재
+            max_backlog (int): DB 장애 시 보관할 최대 이벤트 수 (초과분은 오래된 것부터 폐기)
+            app (Flask, optional): 백그라운드 적재 시 사용할 앱 (DB 설정 조회용)
+        """
+        self.writer = writer
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_backlog = max_backlog
+        self.app = app
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = []
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+
+        self._stats = {
+            'flushes': 0,
+            'failures': 0,
+            'flushed_events': 0,
+            'dropped_events': 0,
+            'last_flush_ms': None,
+            'max_flush_ms': 0.0,
+            'last_flush_at': None,
+        }
+
+    def add(self, rows):
+        """
+        이벤트 행 기록 (DB 접근 없음)
+
+        Args:
+            rows (list): expand_events() 결과
+        """
+        if not rows:
+            return
+
+        with self._lock:
+            self._pending.extend(rows)
+            full = len(self._pending) >= self.max_pending
+
+        self._ensure_thread()
+        if full:
+            self._wakeup.set()
+
+    def flush(self):
+        """
+        버퍼의 이벤트 적재 (실패 시 버퍼로 되돌림)
+
+        Returns:
+            int: 적재된 이벤트 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+
+            if not rows:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                if self.app is not None:
+                    with self.app.app_context():
+                        self.writer(rows)
+                else:
+                    self.writer(rows)
+            except Exception as e:
+                self._restore(rows)
+                self._stats['failures'] += 1
+                logger.warning(f"Banner event log flush failed ({len(rows)} events): {e}")
+                return 0
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._stats['flushes'] += 1
+            self._stats['flushed_events'] += len(rows)
+            self._stats['last_flush_ms'] = round(elapsed_ms, 2)
+            self._stats['max_flush_ms'] = round(max(self._stats['max_flush_ms'], elapsed_ms), 2)
+            self._stats['last_flush_at'] = time.time()
+            logger.debug(f"Banner events flushed: {len(rows)} events, {elapsed_ms:.1f}ms")
+            return len(rows)
+
+    def _restore(self, rows):
+        """적재 실패한 이벤트를 버퍼 앞쪽에 되돌림 (max_backlog 초과분은 오래된 것부터 폐기)"""
+        with self._lock:
+            self._pending = rows + self._pending
+            overflow = len(self._pending) - self.max_backlog
+            if overflow > 0:
+                del self._pending[:overflow]
+                self._stats['dropped_events'] += overflow
+                logger.warning(f"Banner event log backlog full: {overflow} events dropped")
+
+    def _ensure_thread(self):
+        # fork된 자식(gunicorn preload)에서는 부모의 스레드가 없으므로 새로 시작
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='banner-event-log-flush', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Banner event log flush thread error')
+
+    def status(self):
+        """
+        버퍼 상태 (모니터링용)
+
+        Returns:
+            dict: 대기 이벤트 수, 적재 횟수/실패/폐기/지연 시간
+        """
+        with self._lock:
+            pending_events = len(self._pending)
+        return {
+            'pending_events': pending_events,
+            'flush_interval': self.flush_interval,
+            **self._stats
+        }
+
+
+_event_log = None
+_event_log_lock = threading.Lock()
+
+
+def get_banner_event_log():
+    """
+    앱 설정 기반 이벤트 로그 버퍼 반환 (프로세스당 1개, 비활성화 시 None)
+
+    Returns:
+        BannerEventLog | None: 버퍼 인스턴스
+    """
+    global _event_log
+
+    config = current_app.config
+    if not config.get('BANNER_EVENT_LOG_ENABLED', True):
+        return None
+
+    if _event_log is None:
+        with _event_log_lock:
+            if _event_log is None:
+                _event_log = BannerEventLog(
+                    flush_interval=config.get('BANNER_EVENT_LOG_FLUSH_INTERVAL', 10),
+                    max_pending=config.get('BANNER_EVENT_LOG_MAX_PENDING', 5000),
+                    max_backlog=config.get('BANNER_EVENT_LOG_MAX_BACKLOG', 50000),
+                    app=current_app._get_current_object()
+                )
+                atexit.register(flush_banner_events)
+    return _event_log
+
+
+def log_banner_events(counts, ip_address=None, user_agent=None):
+    """
+    노출/클릭 이벤트 기록 (비활성화 시 무시)
+
+    Args:
+        counts (dict): {banner_id: (노출 수, 클릭 수)}
+        ip_address (str, optional): 클라이언트 IP
+        user_agent (str, optional): 브라우저 정보
+    """
+    event_log = get_banner_event_log()
+    if event_log is not None:
+        event_log.add(expand_events(counts, ip_address, user_agent))
+
+
+def flush_banner_events():
+    """남은 이벤트 즉시 적재 (gunicorn worker_exit 훅 / 프로세스 종료 시 호출)"""
+    event_log = _event_log
+    if event_log is None or event_log._pid not in (None, os.getpid()):
+        return 0
+    return event_log.flush()
+
+
+def get_banner_event_log_status():
+    """
+    현재 워커의 이벤트 로그 버퍼 상태 (모니터링용)
+
+    Returns:
+        dict: 버퍼 상태 (아직 생성되지 않았으면 {'initialized': False})
+    """
+    event_log = _event_log
+    if event_log is None:
+        return {'initialized': False}
+    return {'initialized': True, **event_log.status()}
+
+
+def fill_timeseries(rows, start, end, granularity='day'):
+    """
+    집계 행을 빈 구간 0으로 채운 시계열로 변환
+
+    Args:
+        rows (list): [{'bucket': datetime|date, 'impressions': int, 'clicks': int}]
+        start (datetime|date): 시작 구간 (포함)
+        end (datetime|date): 끝 구간 (포함)
+        granularity (str): 'hour' 또는 'day'
+
+    Returns:
+        list: [{'date': str, 'impressions': int, 'clicks': int, 'ctr': float}]
+    """
+    step = timedelta(hours=1) if granularity == 'hour' else timedelta(days=1)
+    fmt = '%Y-%m-%d %H:00' if granularity == 'hour' else '%Y-%m-%d'
+    by_bucket = {row['bucket']: row for row in rows}
+
+    series = []
+    bucket = start
+    while bucket <= end:
+        row = by_bucket.get(bucket, {})
+        impressions = int(row.get('impressions') or 0)
+        clicks = int(row.get('clicks') or 0)
+        series.append({
+            'date': bucket.strftime(fmt),
+            'impressions': impressions,
+            'clicks': clicks,
+            'ctr': round(clicks * 100.0 / impressions, 2) if impressions else 0
+        })
+        bucket += step
+    return series
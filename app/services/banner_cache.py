@@ -0,0 +1,169 @@
+"""
+활성 배너 조회 캐시
+- 배너 타입별 결과를 워커 프로세스 메모리에 TTL 동안 보관 (페이지 로드마다 DB 조회 방지)
+- 타입별 락으로 만료 시 한 스레드만 DB를 조회 (stampede 방지)
+- 배너 생성/수정/삭제/순서 변경 시 버전 파일을 교체해 모든 gunicorn 워커의 캐시를 무효화
+- 날짜가 바뀌면(게시 시작/종료일 기준) TTL과 관계없이 다시 조회
+- 조회 실패 시 만료된 캐시가 있으면 그대로 사용
+"""
+
+import os
+import time
+import uuid
+import logging
+import threading
+from datetime import date
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+
+class ActiveBannerCache:
+    """배너 타입별 TTL 캐시 + 버전 파일 기반 워커 간 무효화"""
+
+    def __init__(self, ttl_seconds=60, version_path=None):
+        """
+        Args:
+            ttl_seconds (float): 캐시 유지 시간 (초)
+            version_path (str, optional): 워커 간 무효화 신호 파일 경로 (없으면 프로세스 내에서만 무효화)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.version_path = version_path
+
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._type_locks = {}
+        self._stats = {'hits': 0, 'misses': 0, 'stale_served': 0, 'invalidations': 0}
+
+        if version_path:
+            os.makedirs(os.path.dirname(version_path) or '.', exist_ok=True)
+
+    def _version(self):
+        # os.replace로 교체되므로 inode + mtime 조합이 바뀜 (mtime 해상도가 낮아도 구분)
+        if not self.version_path:
+            return None
+        try:
+            stat = os.stat(self.version_path)
+            return stat.st_ino, stat.st_mtime_ns
+        except OSError:
+            return None
+
+    def _type_lock(self, banner_type):
+        with self._lock:
+            lock = self._type_locks.get(banner_type)
+            if lock is None:
+                lock = self._type_locks[banner_type] = threading.Lock()
+            return lock
+
+    def _fresh(self, entry, version):
+        return (entry is not None
+                and entry['version'] == version
+                and entry['day'] == date.today()
+                and time.monotonic() - entry['loaded_at'] < self.ttl_seconds)
+
+    def get(self, banner_type, loader):
+        """
+        캐시 조회 (만료 시 loader로 다시 조회)
+
+        Args:
+            banner_type (str): 배너 타입
+            loader (callable): loader(banner_type) -> 배너 리스트 (실패 시 예외)
+
+        Returns:
+            list: 배너 리스트
+        """
+        version = self._version()
+        entry = self._entries.get(banner_type)
+        if self._fresh(entry, version):
+            self._stats['hits'] += 1
+            return entry['value']
+
+        with self._type_lock(banner_type):
+            # 대기하는 동안 다른 스레드가 이미 갱신했으면 그대로 사용
+            entry = self._entries.get(banner_type)
+            if self._fresh(entry, version):
+                self._stats['hits'] += 1
+                return entry['value']
+
+            self._stats['misses'] += 1
+            try:
+                value = loader(banner_type)
+            except Exception as e:
+                if entry is None:
+                    raise
+                self._stats['stale_served'] += 1
+                logger.warning(f"Active banner reload failed ({banner_type}), serving stale cache: {e}")
+                return entry['value']
+
+            # 조회 전에 읽은 버전으로 저장 → 조회 중 무효화되면 다음 요청에서 다시 조회
+            self._entries[banner_type] = {
+                'value': value,
+                'version': version,
+                'day': date.today(),
+                'loaded_at': time.monotonic()
+            }
+            return value
+
+    def invalidate(self):
+        """현재 워커 캐시 비우기 + 버전 파일 교체 (다른 워커는 다음 조회 때 감지)"""
+        self._entries = {}
+        self._stats['invalidations'] += 1
+
+        if not self.version_path:
+            return
+
+        tmp_path = f"{self.version_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(uuid.uuid4().hex)
+            os.replace(tmp_path, self.version_path)
+        except OSError as e:
+            logger.warning(f"Banner cache version bump failed: {e}")
+
+    def status(self):
+        """
+        캐시 상태 (모니터링용)
+
+        Returns:
+            dict: 캐시된 타입 목록, 적중/미스/무효화 횟수
+        """
+        return {
+            'ttl_seconds': self.ttl_seconds,
+            'cached_types': sorted(self._entries),
+            **self._stats
+        }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_banner_cache():
+    """
+    앱 설정 기반 활성 배너 캐시 반환 (프로세스당 1개, 비활성화 시 None)
+
+    Returns:
+        ActiveBannerCache | None: 캐시 인스턴스
+    """
+    global _cache
+
+    config = current_app.config
+    ttl_seconds = config.get('BANNER_CACHE_TTL_SECONDS', 60)
+    if ttl_seconds <= 0:
+        return None
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ActiveBannerCache(
+                    ttl_seconds=ttl_seconds,
+                    version_path=config.get('BANNER_CACHE_VERSION_FILE', 'data/banner_cache.version')
+                )
+    return _cache
+
+
+def invalidate_banner_cache():
+    """배너 변경 후 호출 - 모든 워커의 활성 배너 캐시 무효화"""
+    cache = get_banner_cache()
+    if cache is not None:
+        cache.invalidate()
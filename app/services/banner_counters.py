@@ -0,0 +1,279 @@
+"""
+배너 노출/클릭 카운터 write-behind 버퍼
+- 이벤트마다 UPDATE 하지 않고 워커 프로세스 메모리에서 배너 ID별로 합산
+- 주기적으로(또는 대기 이벤트가 많으면 즉시) 1개의 다중 행 UPDATE로 반영
+- 워커 종료(gunicorn worker_exit, max_requests 재시작 포함) 시 남은 카운트 반영
+- 반영 실패 시 카운트를 버퍼로 되돌려 다음 주기에 재시도
+"""
+
+import os
+import time
+import atexit
+import logging
+import threading
+from flask import current_app
+
+from app.utils.db_utils import get_db_cursor
+
+logger = logging.getLogger(__name__)
+
+
+def build_counter_update(counts):
+    """
+    배너별 증가분을 1개의 UPDATE 문으로 변환
+
+    Args:
+        counts (dict): {banner_id: (노출 증가분, 클릭 증가분)}
+
+    Returns:
+        tuple: (sql, params)
+    """
+    banner_ids = sorted(counts)
+    impression_case = ' '.join(['WHEN %s THEN %s'] * len(banner_ids))
+    click_case = impression_case
+    placeholders = ', '.join(['%s'] * len(banner_ids))
+
+    sql = (
+        "UPDATE banners SET "
+        f"impression_count = impression_count + CASE id {impression_case} ELSE 0 END, "
+        f"click_count = click_count + CASE id {click_case} ELSE 0 END "
+        f"WHERE id IN ({placeholders})"
+    )
+
+    params = []
+    for banner_id in banner_ids:
+        params.extend([banner_id, counts[banner_id][0]])
+    for banner_id in banner_ids:
+        params.extend([banner_id, counts[banner_id][1]])
+    params.extend(banner_ids)
+
+    return sql, tuple(params)
+
+
+# 배치 이벤트 종류 → 증가분 위치 (노출, 클릭)
+EVENT_TYPES = {'impression': 0, 'click': 1}
+
+
+def aggregate_events(events):
+    """
+    배치 이벤트 검증 + 배너 ID별 합산 (1회 순회)
+
+    Args:
+        events (list): [{'banner_id': int, 'event_type': 'impression'|'click', 'ts': epoch ms(선택)}]
+
+    Returns:
+        tuple: ({banner_id: (노출, 클릭)}, 반영 이벤트 수, 거부 이벤트 수)
+    """
+    counts = {}
+    accepted = 0
+
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+        banner_id = event.get('banner_id')
+        index = EVENT_TYPES.get(event.get('event_type'))
+        ts = event.get('ts')
+
+        # bool은 int의 하위 타입이므로 별도 제외
+        if index is None or isinstance(banner_id, bool) or not isinstance(banner_id, int) or banner_id <= 0:
+            continue
+        if ts is not None and (isinstance(ts, bool) or not isinstance(ts, (int, float))):
+            continue
+
+        current = counts.get(banner_id, [0, 0])
+        current[index] += 1
+        counts[banner_id] = current
+        accepted += 1
+
+    return {banner_id: tuple(pair) for banner_id, pair in counts.items()}, accepted, len(events) - accepted
+
+
+def write_counts(counts):
+    """증가분을 DB에 반영 (1회 왕복)"""
+    sql, params = build_counter_update(counts)
+    with get_db_cursor(commit=True) as cursor:
+        cursor.execute(sql, params)
+
+
+class BannerCounterBuffer:
+    """배너 ID별 노출/클릭 증가분 버퍼 (워커 프로세스당 1개, 백그라운드 스레드가 주기적으로 반영)"""
+
+    def __init__(self, writer=write_counts, flush_interval=5, max_pending=1000, app=None):
+        """
+        Args:
+            writer (callable): writer({banner_id: (노출, 클릭)}) - 증가분 반영 함수
+            flush_interval (float): 반영 주기 (초)
+            max_pending (int): 대기 이벤트가 이 수 이상이면 주기와 관계없이 즉시 반영
+            app (Flask, optional): 백그라운드 반영 시 사용할 앱 (DB 설정 조회용)
+        """
+        self.writer = writer
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.app = app
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {}
+        self._pending_events = 0
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._pid = None
+
+        self._stats = {
+            'flushes': 0,
+            'failures': 0,
+            'flushed_events': 0,
+            'last_flush_ms': None,
+            'max_flush_ms': 0.0,
+            'last_flush_at': None,
+        }
+
+    def add(self, banner_id, impressions=0, clicks=0):
+        """
+        증가분 기록 (DB 접근 없음)
+
+        Args:
+            banner_id (int): 배너 ID
+            impressions (int): 노출 증가분
+            clicks (int): 클릭 증가분
+        """
+        with self._lock:
+            current = self._pending.get(banner_id, (0, 0))
+            self._pending[banner_id] = (current[0] + impressions, current[1] + clicks)
+            self._pending_events += impressions + clicks
+            full = self._pending_events >= self.max_pending
+
+        self._ensure_thread()
+        if full:
+            self._wakeup.set()
+
+    def flush(self):
+        """
+        버퍼의 증가분을 반영 (실패 시 버퍼로 되돌림)
+
+        Returns:
+            int: 반영된 이벤트 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                counts, self._pending = self._pending, {}
+                events, self._pending_events = self._pending_events, 0
+
+            if not counts:
+                return 0
+
+            started = time.perf_counter()
+            try:
+                if self.app is not None:
+                    with self.app.app_context():
+                        self.writer(counts)
+                else:
+                    self.writer(counts)
+            except Exception as e:
+                self._restore(counts, events)
+                self._stats['failures'] += 1
+                logger.warning(f"Banner counter flush failed ({len(counts)} banners, {events} events): {e}")
+                return 0
+
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._stats['flushes'] += 1
+            self._stats['flushed_events'] += events
+            self._stats['last_flush_ms'] = round(elapsed_ms, 2)
+            self._stats['max_flush_ms'] = round(max(self._stats['max_flush_ms'], elapsed_ms), 2)
+            self._stats['last_flush_at'] = time.time()
+            logger.debug(f"Banner counters flushed: {len(counts)} banners, {events} events, {elapsed_ms:.1f}ms")
+            return events
+
+    def _restore(self, counts, events):
+        """반영 실패한 증가분을 버퍼에 다시 합산"""
+        with self._lock:
+            for banner_id, (impressions, clicks) in counts.items():
+                current = self._pending.get(banner_id, (0, 0))
+                self._pending[banner_id] = (current[0] + impressions, current[1] + clicks)
+            self._pending_events += events
+
+    def _ensure_thread(self):
+        # fork된 자식(gunicorn preload)에서는 부모의 스레드가 없으므로 새로 시작
+        if self._thread is not None and self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._run, name='banner-counter-flush', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('Banner counter flush thread error')
+
+    def status(self):
+        """
+        버퍼 상태 (모니터링용)
+
+        Returns:
+            dict: 대기 배너/이벤트 수, 반영 횟수/실패/지연 시간
+        """
+        with self._lock:
+            pending_banners, pending_events = len(self._pending), self._pending_events
+        return {
+            'pending_banners': pending_banners,
+            'pending_events': pending_events,
+            'flush_interval': self.flush_interval,
+            **self._stats
+        }
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_banner_counter_buffer():
+    """
+    앱 설정 기반 카운터 버퍼 반환 (프로세스당 1개, 비활성화 시 None)
+
+    Returns:
+        BannerCounterBuffer | None: 버퍼 인스턴스
+    """
+    global _buffer
+
+    config = current_app.config
+    if not config.get('BANNER_COUNTER_BUFFER_ENABLED', True):
+        return None
+
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = BannerCounterBuffer(
+                    flush_interval=config.get('BANNER_COUNTER_FLUSH_INTERVAL', 5),
+                    max_pending=config.get('BANNER_COUNTER_MAX_PENDING', 1000),
+                    app=current_app._get_current_object()
+                )
+                atexit.register(flush_banner_counters)
+    return _buffer
+
+
+def flush_banner_counters():
+    """남은 카운트 즉시 반영 (gunicorn worker_exit 훅 / 프로세스 종료 시 호출)"""
+    buffer = _buffer
+    if buffer is None or buffer._pid not in (None, os.getpid()):
+        return 0
+    return buffer.flush()
+
+
+def get_banner_counter_status():
+    """
+    현재 워커의 카운터 버퍼 상태 (모니터링용)
+
+    Returns:
+        dict: 버퍼 상태 (아직 생성되지 않았으면 {'initialized': False})
+    """
+    buffer = _buffer
+    if buffer is None:
+        return {'initialized': False}
+    return {'initialized': True, **buffer.status()}
@@ -0,0 +1,277 @@
+"""
+배너 이미지 처리
+- 업로드 시 배너 타입별 규격(관리자 화면 권장 크기 기준 비율/최소 크기) 검증
+- 1x/2x 크기의 WebP + 대체 포맷(JPEG, 투명 이미지는 PNG) 변환본 생성, 메타데이터(EXIF 등) 제거
+- 변환본 URL은 banners.image_variants(JSON)에 기록
+- 큰 파일은 요청 스레드 밖(스레드 풀)에서 처리, 처리 전까지는 원본 image_url 사용
+"""
+
+import os
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from app.utils.db_utils import get_db_cursor
+from app.services.banner_cache import invalidate_banner_cache
+
+logger = logging.getLogger(__name__)
+
+# 배너 타입별 1x 기준 크기 (가로, 세로) - 관리자 화면 권장 크기(admin-banners.js BANNER_INFO)와 동일
+BANNER_IMAGE_SIZES = {
+    'home_top': (970, 90),
+    'home_bottom': (728, 90),
+    'home_grid': (838, 100),
+    'grid_general': (1644, 150),
+    'grid_coupang': (1644, 250),
+    'grid_profit': (1644, 150),
+    'grid_efficiency': (1644, 150),
+    'grid_keyword': (1644, 150),
+}
+
+# 기준 비율 허용 오차 (표시 영역은 object-fit: cover로 잘라내므로 약간의 차이는 허용)
+ASPECT_TOLERANCE = 0.10
+
+# 기준 없는 이미지(모바일)의 2x 최대 가로
+MAX_2X_WIDTH = 1940
+
+# 규격 없는 이미지는 가로가 이 값의 2배 이상일 때만 1x(절반) 생성
+MIN_1X_WIDTH = 320
+
+# 압축 폭탄 방지
+MAX_IMAGE_PIXELS = 40_000_000
+
+WEB_PATH_PREFIX = '/static/uploads/banners/'
+
+
+def inspect_image(path):
+    """
+    이미지 헤더만 읽어 크기/포맷 확인
+
+    Args:
+        path (str): 이미지 파일 경로
+
+    Returns:
+        tuple: (가로, 세로, 포맷, 애니메이션 여부)
+
+    Raises:
+        ValueError: 이미지가 아니거나 너무 큰 경우
+    """
+    try:
+        with Image.open(path) as img:
+            width, height = img.size
+            image_format = img.format
+            animated = getattr(img, 'is_animated', False)
+    except (UnidentifiedImageError, OSError):
+        raise ValueError("이미지 파일을 읽을 수 없습니다")
+
+    if width * height > MAX_IMAGE_PIXELS:
+        raise ValueError(f"이미지가 너무 큽니다: {width}x{height}")
+    return width, height, image_format, animated
+
+
+def validate_dimensions(banner_type, width, height):
+    """
+    배너 타입별 규격 검증 (기준 비율 ±10%, 기준 크기 이상)
+
+    Raises:
+        ValueError: 규격에 맞지 않는 경우
+    """
+    size = BANNER_IMAGE_SIZES.get(banner_type)
+    if not size:
+        return
+
+    target_width, target_height = size
+    ratio_error = abs((width / height) / (target_width / target_height) - 1)
+    if ratio_error > ASPECT_TOLERANCE or width < target_width or height < target_height * (1 - ASPECT_TOLERANCE):
+        raise ValueError(
+            f"{banner_type} 배너 이미지는 {target_width}x{target_height} 비율이어야 합니다 "
+            f"(최소 {target_width}x{target_height}, 권장 {target_width * 2}x{target_height * 2}, 업로드: {width}x{height})"
+        )
+
+
+def variant_sizes(banner_type, width, height):
+    """
+    생성할 변환본 크기 결정 (원본 비율 유지, 업스케일 없음)
+
+    Returns:
+        dict: {'1x': (가로, 세로), '2x': (가로, 세로)} - 원본이 작으면 '2x' 없음
+    """
+    size = BANNER_IMAGE_SIZES.get(banner_type)
+    if size:
+        target_width = min(size[0], width)
+        sizes = {'1x': (target_width, round(height * target_width / width))}
+        if width >= target_width * 2:
+            sizes['2x'] = (target_width * 2, round(height * target_width * 2 / width))
+        return sizes
+
+    if width > MAX_2X_WIDTH:
+        width, height = MAX_2X_WIDTH, round(height * MAX_2X_WIDTH / width)
+    if width < MIN_1X_WIDTH * 2:
+        return {'1x': (width, height)}
+    return {'1x': (width // 2, round(height / 2)), '2x': (width, height)}
+
+
+def _has_alpha(img):
+    return img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+
+
+def build_variants(path, banner_type=None, webp_quality=82, jpeg_quality=85):
+    """
+    원본 옆에 변환본 저장 (<원본이름>_<1x|2x>.<webp|jpg|png>)
+
+    Args:
+        path (str): 원본 이미지 경로
+        banner_type (str, optional): 배너 타입 (규격 크기 적용, 모바일 이미지는 None)
+        webp_quality (int): WebP 품질
+        jpeg_quality (int): JPEG 품질
+
+    Returns:
+        dict | None: {'width', 'height', 'webp': {'1x': 파일명, ...}, 'fallback': {...}}
+                     애니메이션 GIF는 변환하지 않음(None)
+    """
+    stem = os.path.splitext(path)[0]
+
+    with Image.open(path) as img:
+        if getattr(img, 'is_animated', False):
+            return None
+
+        # EXIF 회전 반영 후 메타데이터 없이 새 이미지로 저장
+        img = ImageOps.exif_transpose(img)
+        alpha = _has_alpha(img)
+        img = img.convert('RGBA' if alpha else 'RGB')
+        fallback_ext = 'png' if alpha else 'jpg'
+
+        sizes = variant_sizes(banner_type, *img.size)
+        variants = {'width': sizes['1x'][0], 'height': sizes['1x'][1], 'webp': {}, 'fallback': {}}
+
+        for density, size in sizes.items():
+            resized = img.resize(size, Image.LANCZOS) if size != img.size else img
+
+            webp_path = f"{stem}_{density}.webp"
+            resized.save(webp_path, 'WEBP', quality=webp_quality, method=6)
+            variants['webp'][density] = os.path.basename(webp_path)
+
+            fallback_path = f"{stem}_{density}.{fallback_ext}"
+            if alpha:
+                resized.save(fallback_path, 'PNG', optimize=True)
+            else:
+                resized.save(fallback_path, 'JPEG', quality=jpeg_quality, optimize=True, progressive=True)
+            variants['fallback'][density] = os.path.basename(fallback_path)
+
+    return variants
+
+
+def _url_to_path(upload_folder, image_url):
+    if not image_url or not image_url.startswith(WEB_PATH_PREFIX):
+        return None
+    return os.path.join(upload_folder, os.path.basename(image_url))
+
+
+def _to_urls(variants):
+    if not variants:
+        return None
+    for key in ('webp', 'fallback'):
+        variants[key] = {density: WEB_PATH_PREFIX + name for density, name in variants[key].items()}
+    return variants
+
+
+def process_banner_images(banner_id, banner_type, image_url, mobile_image_url=None):
+    """
+    배너 이미지 변환본 생성 후 banners.image_variants 갱신 (앱 컨텍스트 필요)
+
+    Returns:
+        dict: {'desktop': 변환본|None, 'mobile': 변환본|None}
+    """
+    config = current_app.config
+    upload_folder = config['BANNER_UPLOAD_FOLDER']
+    quality = config.get('BANNER_IMAGE_WEBP_QUALITY', 82)
+
+    result = {}
+    for key, url, spec_type in (('desktop', image_url, banner_type), ('mobile', mobile_image_url, None)):
+        path = _url_to_path(upload_folder, url)
+        result[key] = _to_urls(build_variants(path, spec_type, webp_quality=quality)) if path and os.path.exists(path) else None
+
+    with get_db_cursor(commit=True) as cursor:
+        cursor.execute(
+            "UPDATE banners SET image_variants = %s WHERE id = %s AND image_url = %s",
+            (json.dumps(result), banner_id, image_url)
+        )
+
+    invalidate_banner_cache()
+    return result
+
+
+def _process_in_background(app, *args):
+    with app.app_context():
+        try:
+            process_banner_images(*args)
+        except Exception as e:
+            logger.warning(f"Banner image processing failed (banner {args[0]}): {e}")
+
+
+_executor = None
+_executor_pid = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor, _executor_pid
+
+    # fork된 자식(gunicorn preload)에서는 부모의 스레드 풀을 쓸 수 없으므로 새로 생성
+    if _executor is None or _executor_pid != os.getpid():
+        with _executor_lock:
+            if _executor is None or _executor_pid != os.getpid():
+                _executor = ThreadPoolExecutor(
+                    max_workers=current_app.config.get('BANNER_IMAGE_WORKERS', 1),
+                    thread_name_prefix='banner-image'
+                )
+                _executor_pid = os.getpid()
+    return _executor
+
+
+def schedule_banner_image_processing(banner_id, banner_type, image_url, mobile_image_url=None):
+    """
+    변환본 생성 요청 (작은 파일은 즉시, 큰 파일은 백그라운드)
+
+    Returns:
+        bool: 즉시 처리 완료 시 True, 백그라운드 처리 예약 시 False
+    """
+    config = current_app.config
+    if not config.get('BANNER_IMAGE_PROCESSING_ENABLED', True):
+        return False
+
+    upload_folder = config['BANNER_UPLOAD_FOLDER']
+    total_bytes = sum(
+        os.path.getsize(path) for path in (_url_to_path(upload_folder, image_url), _url_to_path(upload_folder, mobile_image_url))
+        if path and os.path.exists(path)
+    )
+
+    args = (banner_id, banner_type, image_url, mobile_image_url)
+    if total_bytes <= config.get('BANNER_IMAGE_SYNC_MAX_BYTES', 512 * 1024):
+        try:
+            process_banner_images(*args)
+            return True
+        except Exception as e:
+            # 변환 실패해도 원본 이미지로 배너는 동작
+            logger.warning(f"Banner image processing failed (banner {banner_id}): {e}")
+            return False
+
+    _get_executor().submit(_process_in_background, current_app._get_current_object(), *args)
+    return False
+
+
+def delete_variants(image_url, upload_folder):
+    """원본 이미지의 변환본 파일 삭제"""
+    path = _url_to_path(upload_folder, image_url)
+    if not path:
+        return
+    stem = os.path.splitext(path)[0]
+    for density in ('1x', '2x'):
+        for ext in ('webp', 'jpg', 'png'):
+            try:
+                os.remove(f"{stem}_{density}.{ext}")
+            except FileNotFoundError:
+                pass
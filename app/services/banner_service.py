@@ -6,10 +6,17 @@
 """
 
 import os
+import json
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta
 from flask import current_app
 from app.utils.db_utils import get_db_cursor, DatabaseError
+from app.services.banner_counters import get_banner_counter_buffer, write_counts
+from app.services.banner_analytics import log_banner_events, fill_timeseries, ROLLUP_TABLES
+from app.services.banner_cache import get_banner_cache, invalidate_banner_cache
+from app.services.banner_images import (
+    inspect_image, validate_dimensions, schedule_banner_image_processing, delete_variants
+)
 
 
 class BannerService:
@@ -87,10 +94,31 @@ class BannerService:
         }
         return mock_data.get(banner_type, [])
 
+    @staticmethod
+    def _query_active_banners(banner_type):
+        """활성 배너 DB 조회 (실패 시 예외)"""
+        with get_db_cursor() as cursor:
+            query = """
+                SELECT id, banner_type, title, image_url, mobile_image_url, image_variants, link_url, position_order,
+                       click_count, impression_count
+                FROM banners
+                WHERE banner_type = %s
+                  AND is_active = TRUE
+                  AND (start_date IS NULL OR start_date <= CURDATE())
+                  AND (end_date IS NULL OR end_date >= CURDATE())
+                ORDER BY position_order ASC, created_at ASC
+            """
+            cursor.execute(query, (banner_type,))
+            banners = cursor.fetchall()
+
+        for banner in banners:
+            banner['image_variants'] = json.loads(banner['image_variants']) if banner.get('image_variants') else None
+        return banners
+
     @staticmethod
     def get_active_banners(banner_type):
         """
-        활성 배너 조회
+        활성 배너 조회 (캐시 사용 시 TTL 동안 워커 메모리에서 반환)
 
         Args:
             banner_type: 배너 타입 (home_top, home_bottom, home_grid, grid_general, grid_coupang)
@@ -99,19 +127,10 @@ class BannerService:
             list: 활성 배너 리스트
         """
         try:
-            with get_db_cursor() as cursor:
-                query = """
-                    SELECT id, banner_type, title, image_url, mobile_image_url, link_url, position_order,
-                           click_count, impression_count
-                    FROM banners
-                    WHERE banner_type = %s
-                      AND is_active = TRUE
-                      AND (start_date IS NULL OR start_date <= CURDATE())
-                      AND (end_date IS NULL OR end_date >= CURDATE())
-                    ORDER BY position_order ASC, created_at ASC
-                """
-                cursor.execute(query, (banner_type,))
-                return cursor.fetchall()
+            cache = get_banner_cache()
+            if cache is not None:
+                return cache.get(banner_type, BannerService._query_active_banners)
+            return BannerService._query_active_banners(banner_type)
         except Exception as e:
             current_app.logger.error(f"get_active_banners error: {e} - Using mock data")
             # 🔧 DB 연결 실패 시 Mock 데이터 반환
@@ -187,8 +206,8 @@ class BannerService:
             int: 생성된 배너 ID
         """
         try:
-            # 파일 저장
-            image_url = BannerService._save_banner_image(file)
+            # 파일 저장 (데스크톱 이미지는 배너 타입 규격 검증)
+            image_url = BannerService._save_banner_image(file, data['banner_type'])
             mobile_image_url = None
             if mobile_file:
                 mobile_image_url = BannerService._save_banner_image(mobile_file)
@@ -210,7 +229,14 @@ class BannerService:
                     data.get('start_date'),
                     data.get('end_date')
                 ))
-                return cursor.lastrowid
+                banner_id = cursor.lastrowid
+
+            # 커밋 후 무효화 (커밋 전이면 다른 워커가 이전 데이터를 다시 캐시할 수 있음)
+            invalidate_banner_cache()
+            schedule_banner_image_processing(banner_id, data['banner_type'], image_url, mobile_image_url)
+            return banner_id
+        except ValueError:
+            raise
         except Exception as e:
             current_app.logger.error(f"create_banner error: {e}")
             raise DatabaseError(f"배너 생성 실패: {str(e)}")
@@ -230,9 +256,13 @@ class BannerService:
             bool: 성공 여부
         """
         try:
+            banner_type = data.get('banner_type')
+            if (file or mobile_file) and not banner_type:
+                banner_type = BannerService._get_banner_type(banner_id)
+
             # 파일이 있으면 새로 저장
             if file:
-                image_url = BannerService._save_banner_image(file)
+                image_url = BannerService._save_banner_image(file, banner_type)
                 data['image_url'] = image_url
 
             # 모바일 이미지 파일이 있으면 새로 저장
@@ -258,7 +288,14 @@ class BannerService:
             with get_db_cursor(commit=True) as cursor:
                 query = f"UPDATE banners SET {', '.join(update_fields)} WHERE id = %s"
                 cursor.execute(query, values)
-                return cursor.rowcount > 0
+                updated = cursor.rowcount > 0
+
+            invalidate_banner_cache()
+            if updated and (file or mobile_file):
+                BannerService._schedule_image_processing(banner_id)
+            return updated
+        except ValueError:
+            raise
         except Exception as e:
             current_app.logger.error(f"update_banner error: {e}")
             raise DatabaseError(f"배너 수정 실패: {str(e)}")
@@ -281,49 +318,89 @@ class BannerService:
                 result = cursor.fetchone()
 
                 if result:
-                    # 데스크톱 이미지 파일 삭제
+                    # 데스크톱 이미지 파일 삭제 (변환본 포함)
                     if result.get('image_url'):
                         BannerService._delete_banner_image(result['image_url'])
-                    # 모바일 이미지 파일 삭제
+                    # 모바일 이미지 파일 삭제 (변환본 포함)
                     if result.get('mobile_image_url'):
                         BannerService._delete_banner_image(result['mobile_image_url'])
 
                 # DB 삭제
                 cursor.execute("DELETE FROM banners WHERE id = %s", (banner_id,))
-                return cursor.rowcount > 0
+                deleted = cursor.rowcount > 0
+
+            invalidate_banner_cache()
+            return deleted
         except Exception as e:
             current_app.logger.error(f"delete_banner error: {e}")
             return False
 
+    @staticmethod
+    def _build_reorder_query(banner_type, order_list):
+        """
+        전체 순서를 1개의 UPDATE 문으로 변환
+
+        Returns:
+            tuple: (sql, params)
+        """
+        cases = ' '.join(['WHEN %s THEN %s'] * len(order_list))
+        placeholders = ', '.join(['%s'] * len(order_list))
+        sql = (
+            f"UPDATE banners SET position_order = CASE id {cases} END "
+            f"WHERE banner_type = %s AND id IN ({placeholders})"
+        )
+
+        params = []
+        for index, banner_id in enumerate(order_list, start=1):
+            params.extend([banner_id, index])
+        params.append(banner_type)
+        params.extend(order_list)
+        return sql, tuple(params)
+
     @staticmethod
     def reorder_banners(banner_type, order_list):
         """
-        배너 순서 변경
+        배너 순서 변경 (1개 UPDATE 문으로 전체 순서 반영)
 
         Args:
             banner_type: 배너 타입
-            order_list: [banner_id, banner_id, ...] 순서대로
+            order_list: [banner_id, banner_id, ...] 순서대로 (해당 타입의 전체 배너)
 
         Returns:
             bool: 성공 여부
+
+        Raises:
+            ValueError: order_list가 해당 타입의 현재 배너 목록과 다른 경우
         """
         try:
             with get_db_cursor(commit=True) as cursor:
-                for index, banner_id in enumerate(order_list, start=1):
-                    query = """
-                        UPDATE banners
-                        SET position_order = %s
-                        WHERE id = %s AND banner_type = %s
-                    """
-                    cursor.execute(query, (index, banner_id, banner_type))
-                return True
+                # 같은 타입 배너 행 잠금 → 동시 생성/삭제/순서 변경과 직렬화
+                cursor.execute("SELECT id FROM banners WHERE banner_type = %s FOR UPDATE", (banner_type,))
+                current_ids = {row['id'] for row in cursor.fetchall()}
+
+                matches = len(order_list) == len(set(order_list)) and set(order_list) == current_ids
+                if matches:
+                    cursor.execute(*BannerService._build_reorder_query(banner_type, order_list))
         except Exception as e:
             current_app.logger.error(f"reorder_banners error: {e}")
             return False
 
+        if not matches:
+            raise ValueError("순서 목록이 현재 배너 목록과 일치하지 않습니다. 새로고침 후 다시 시도해주세요")
+
+        invalidate_banner_cache()
+        return True
+
     @staticmethod
-    def increment_impression(banner_id):
-        """노출 카운트 증가"""
+    def increment_impression(banner_id, ip_address=None, user_agent=None):
+        """노출 카운트 증가 + 이벤트 로그 기록 (버퍼 사용 시 주기적으로 일괄 반영)"""
+        log_banner_events({banner_id: (1, 0)}, ip_address, user_agent)
+
+        buffer = get_banner_counter_buffer()
+        if buffer is not None:
+            buffer.add(banner_id, impressions=1)
+            return True
+
         try:
             with get_db_cursor(commit=True) as cursor:
                 cursor.execute(
@@ -336,8 +413,15 @@ class BannerService:
             return False
 
     @staticmethod
-    def increment_click(banner_id):
-        """클릭 카운트 증가"""
+    def increment_click(banner_id, ip_address=None, user_agent=None):
+        """클릭 카운트 증가 + 이벤트 로그 기록 (버퍼 사용 시 주기적으로 일괄 반영)"""
+        log_banner_events({banner_id: (0, 1)}, ip_address, user_agent)
+
+        buffer = get_banner_counter_buffer()
+        if buffer is not None:
+            buffer.add(banner_id, clicks=1)
+            return True
+
         try:
             with get_db_cursor(commit=True) as cursor:
                 cursor.execute(
@@ -350,59 +434,174 @@ class BannerService:
             return False
 
     @staticmethod
-    def get_banner_stats(banner_type=None):
+    def record_events(counts, ip_address=None, user_agent=None):
+        """
+        배너별 노출/클릭 증가분 일괄 반영 + 이벤트 로그 기록 (배치 이벤트 API)
+
+        Args:
+            counts (dict): {banner_id: (노출 증가분, 클릭 증가분)}
+            ip_address (str, optional): 클라이언트 IP
+            user_agent (str, optional): 브라우저 정보
+
+        Returns:
+            bool: 성공 여부
+        """
+        if not counts:
+            return True
+
+        log_banner_events(counts, ip_address, user_agent)
+
+        buffer = get_banner_counter_buffer()
+        if buffer is not None:
+            for banner_id, (impressions, clicks) in counts.items():
+                buffer.add(banner_id, impressions=impressions, clicks=clicks)
+            return True
+
+        try:
+            write_counts(counts)
+            return True
+        except Exception as e:
+            current_app.logger.error(f"record_events error: {e}")
+            return False
+
+    @staticmethod
+    def get_banner_stats(banner_type=None, days=None):
         """
         배너 통계 조회
 
+        누적 수치는 banners의 카운터, 기간 수치는 일별 집계(banner_stats_daily)에서 읽음 (원본 이벤트 미조회)
+
         Args:
             banner_type: 배너 타입 (None이면 전체)
+            days: 최근 N일 기간 통계 포함 (None이면 누적만)
 
         Returns:
             dict: 통계 정보
         """
+        type_filter = "WHERE banner_type = %s" if banner_type else ""
+        type_params = (banner_type,) if banner_type else ()
+
         try:
             with get_db_cursor() as cursor:
-                if banner_type:
-                    query = """
-                        SELECT
-                            COUNT(*) as total_banners,
-                            SUM(impression_count) as total_impressions,
-                            SUM(click_count) as total_clicks,
-                            CASE
-                                WHEN SUM(impression_count) > 0
-                                THEN ROUND(SUM(click_count) * 100.0 / SUM(impression_count), 2)
-                                ELSE 0
-                            END as avg_ctr
-                        FROM banners
-                        WHERE banner_type = %s
-                    """
-                    cursor.execute(query, (banner_type,))
-                else:
-                    query = """
+                cursor.execute(f"""
+                    SELECT
+                        COUNT(*) as total_banners,
+                        SUM(impression_count) as total_impressions,
+                        SUM(click_count) as total_clicks,
+                        CASE
+                            WHEN SUM(impression_count) > 0
+                            THEN ROUND(SUM(click_count) * 100.0 / SUM(impression_count), 2)
+                            ELSE 0
+                        END as avg_ctr
+                    FROM banners
+                    {type_filter}
+                """, type_params)
+                stats = cursor.fetchone() or {}
+
+                if days:
+                    # stat_date 범위 조건만 사용 (PK/idx_date 인덱스 범위 스캔)
+                    cursor.execute(f"""
                         SELECT
-                            COUNT(*) as total_banners,
-                            SUM(impression_count) as total_impressions,
-                            SUM(click_count) as total_clicks,
-                            CASE
-                                WHEN SUM(impression_count) > 0
-                                THEN ROUND(SUM(click_count) * 100.0 / SUM(impression_count), 2)
-                                ELSE 0
-                            END as avg_ctr
-                        FROM banners
-                    """
-                    cursor.execute(query)
-                return cursor.fetchone() or {}
+                            COALESCE(SUM(s.impressions), 0) as period_impressions,
+                            COALESCE(SUM(s.clicks), 0) as period_clicks
+                        FROM banner_stats_daily s
+                        JOIN banners b ON b.id = s.banner_id
+                        WHERE s.stat_date >= %s
+                        {"AND b.banner_type = %s" if banner_type else ""}
+                    """, (datetime.now().date() - timedelta(days=days - 1), *type_params))
+                    period = cursor.fetchone() or {}
+                    impressions = int(period.get('period_impressions') or 0)
+                    clicks = int(period.get('period_clicks') or 0)
+                    stats.update({
+                        'period_days': days,
+                        'period_impressions': impressions,
+                        'period_clicks': clicks,
+                        'period_ctr': round(clicks * 100.0 / impressions, 2) if impressions else 0
+                    })
+                return stats
         except Exception as e:
             current_app.logger.error(f"get_banner_stats error: {e}")
             return {}
 
     @staticmethod
-    def _save_banner_image(file):
+    def get_banner_timeseries(banner_id=None, banner_type=None, days=30, granularity='day'):
+        """
+        배너 노출/클릭/CTR 시계열 조회 (시간별/일별 집계 테이블)
+
+        Args:
+            banner_id: 배너 ID (None이면 전체 합산)
+            banner_type: 배너 타입 (None이면 전체)
+            days: 최근 N일
+            granularity: 'day' 또는 'hour'
+
+        Returns:
+            list: [{'date', 'impressions', 'clicks', 'ctr'}] (빈 구간은 0)
+        """
+        table, column = ROLLUP_TABLES[granularity]
+
+        now = datetime.now()
+        if granularity == 'hour':
+            end = now.replace(minute=0, second=0, microsecond=0)
+            start = end - timedelta(days=days) + timedelta(hours=1)
+        else:
+            end = now.date()
+            start = end - timedelta(days=days - 1)
+
+        conditions = [f"s.{column} >= %s"]
+        params = [start]
+        if banner_id:
+            conditions.append("s.banner_id = %s")
+            params.append(banner_id)
+        if banner_type:
+            conditions.append("b.banner_type = %s")
+            params.append(banner_type)
+
+        join = "JOIN banners b ON b.id = s.banner_id" if banner_type else ""
+
+        try:
+            with get_db_cursor() as cursor:
+                cursor.execute(f"""
+                    SELECT s.{column} as bucket, SUM(s.impressions) as impressions, SUM(s.clicks) as clicks
+                    FROM {table} s
+                    {join}
+                    WHERE {' AND '.join(conditions)}
+                    GROUP BY s.{column}
+                    ORDER BY s.{column}
+                """, tuple(params))
+                rows = cursor.fetchall()
+        except Exception as e:
+            current_app.logger.error(f"get_banner_timeseries error: {e}")
+            rows = []
+
+        return fill_timeseries(rows, start, end, granularity)
+
+    @staticmethod
+    def _get_banner_type(banner_id):
+        """배너 타입 조회 (없으면 None)"""
+        with get_db_cursor() as cursor:
+            cursor.execute("SELECT banner_type FROM banners WHERE id = %s", (banner_id,))
+            row = cursor.fetchone()
+            return row['banner_type'] if row else None
+
+    @staticmethod
+    def _schedule_image_processing(banner_id):
+        """현재 배너 이미지 기준으로 변환본 생성 요청"""
+        with get_db_cursor() as cursor:
+            cursor.execute(
+                "SELECT banner_type, image_url, mobile_image_url FROM banners WHERE id = %s", (banner_id,)
+            )
+            row = cursor.fetchone()
+        if row:
+            schedule_banner_image_processing(banner_id, row['banner_type'], row['image_url'], row['mobile_image_url'])
+
+    @staticmethod
+    def _save_banner_image(file, banner_type=None):
         """
-        배너 이미지 저장
+        배너 이미지 저장 (이미지 형식/크기 검증)
 
         Args:
             file: 업로드 파일 객체
+            banner_type: 배너 타입 (있으면 타입별 규격 검증, 모바일 이미지는 None)
 
         Returns:
             str: 저장된 파일 경로 (상대경로)
@@ -429,6 +628,13 @@ class BannerService:
         file_path = os.path.join(upload_folder, new_filename)
         file.save(file_path)
 
+        try:
+            width, height, _, _ = inspect_image(file_path)
+            validate_dimensions(banner_type, width, height)
+        except ValueError:
+            os.remove(file_path)
+            raise
+
         # 웹 경로 반환 (static 기준 상대경로)
         return f"/static/uploads/banners/{new_filename}"
 
@@ -441,5 +647,6 @@ class BannerService:
                 file_path = image_url.replace('/static/', 'app/static/')
                 if os.path.exists(file_path):
                     os.remove(file_path)
+                delete_variants(image_url, current_app.config['BANNER_UPLOAD_FOLDER'])
         except Exception as e:
             current_app.logger.warning(f"Failed to delete image file: {e}")
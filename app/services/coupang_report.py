@@ -0,0 +1,269 @@
+"""
+쿠팡 광고 보고서 가공
+- 매출/ROAS/주문 컬럼 선택 (14일 우선, 없으면 1일)
+- 비검색영역/리타겟팅 통합, 키워드 중복 합산
+- 클릭률/ROAS/CPC 계산 및 요약 지표
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 보고서에서 읽을 컬럼 (14일/1일 기준 모두 포함, 나머지 컬럼은 파싱하지 않음)
+COUPANG_REPORT_COLUMNS = [
+    '키워드', '광고 노출 지면', '노출수', '클릭수', '광고비', '클릭률',
+    '총 주문수(14일)', '총 주문수(1일)',
+    '총 판매수량(14일)', '총 판매수량(1일)',
+    '총 전환매출액(14일)', '총 전환매출액(1일)',
+    '총광고수익률(14일)', '총광고수익률(1일)'
+]
+
+# 가공 로직 버전 - 결과가 달라지는 변경 시 올려서 업로드 캐시 무효화
+REPORT_PARSER_VERSION = '2'
+
+
+class CoupangReportError(ValueError):
+    """보고서 형식 오류 (필수 컬럼 누락 등) - 사용자에게 그대로 안내"""
+    pass
+
+
+# 통합 대상 광고 노출 지면 (지면 문자열 포함 여부 → 통합 키워드/지면명, 앞쪽이 우선)
+CONSOLIDATED_PLACEMENTS = [
+    ('비검색', '비검색영역 (통합)'),
+    ('리타겟팅', '리타겟팅 (통합)'),
+]
+
+# 키워드 단위로 합산하는 지표
+SUM_METRICS = ['노출수', '클릭수', '광고비', '총 주문수', '총 판매수량', '총 전환매출액']
+
+
+def _group_keys(df):
+    """
+    행별 그룹 키 계산 - 검색영역은 키워드, 비검색영역/리타겟팅은 통합 키워드
+
+    Returns:
+        tuple: (그룹 키 ndarray, 광고 노출 지면 Series 또는 None)
+    """
+    keys = df['키워드'].to_numpy(dtype=object, copy=True)
+    if '광고 노출 지면' not in df.columns:
+        return keys, None
+
+    placement = df['광고 노출 지면']
+    assigned = np.zeros(len(df), dtype=bool)
+    placement_override = placement.to_numpy(dtype=object, copy=True)
+
+    # 지면 종류는 몇 개뿐이므로 고유값에서만 문자열 검사 후 코드로 펼침 (결측 코드 -1 → 마지막 False)
+    codes, uniques = pd.factorize(placement)
+    uniques = pd.Series(uniques, dtype=object)
+
+    for pattern, name in CONSOLIDATED_PLACEMENTS:
+        unique_mask = np.append(uniques.str.contains(pattern, na=False).to_numpy(dtype=bool), False)
+        mask = unique_mask[codes] & ~assigned
+        count = int(mask.sum())
+        if count:
+            keys[mask] = name
+            placement_override[mask] = name
+            assigned |= mask
+            logger.info(f'{name} 통합: {count}개 행 → 1개 행')
+
+    return keys, pd.Series(placement_override, index=df.index)
+
+
+def _round_percent(values):
+    """
+    소수점 둘째 자리 반올림 - f"{x:.2f}" 문자열 변환 결과와 동일한 값
+
+    np.round는 x * 100 곱셈 오차로 .5 경계 부근에서 문자열 반올림과 다를 수 있어
+    경계에 걸친 값만 문자열 포맷으로 다시 계산
+
+    Args:
+        values (np.ndarray): float 배열
+
+    Returns:
+        np.ndarray: 반올림된 float 배열
+    """
+    scaled = values * 100
+    rounded = np.rint(scaled)
+    near_half = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) <= np.abs(scaled) * 1e-12 + 1e-12
+    result = rounded / 100
+    for i in np.flatnonzero(near_half):
+        result[i] = float(f"{values[i]:.2f}")
+    return result
+
+
+def _aggregate_keywords(df):
+    """
+    비검색영역/리타겟팅 통합과 키워드 중복 합산을 한 번의 groupby로 처리
+
+    - 그룹 키: 검색영역은 키워드, 비검색영역/리타겟팅은 통합 키워드 ('비검색영역 (통합)' 등)
+    - 그룹 키를 정렬된 정수 코드로 변환 후 지표 합산 (키워드 순 정렬)
+    - 클릭률/ROAS는 합산 결과에서 숫자로 계산, 총광고수익률은 ROAS로 포맷한 문자열
+
+    Args:
+        df (pd.DataFrame): 컬럼명이 통일된 보고서 데이터
+
+    Returns:
+        pd.DataFrame: 키워드별 데이터
+            (키워드, 합산 지표, 광고 노출 지면, 클릭률, 총광고수익률, ROAS)
+    """
+    keys, placement = _group_keys(df)
+    codes, uniques = pd.factorize(keys, sort=True)
+
+    grouped = df[SUM_METRICS].groupby(codes, sort=True)
+    result = grouped.sum()
+    result.insert(0, '키워드', uniques[result.index])
+    if placement is not None:
+        result['광고 노출 지면'] = placement.groupby(codes, sort=True).first()
+    result = result.reset_index(drop=True)
+
+    clicks = result['클릭수'].to_numpy(dtype=float)
+    impressions = result['노출수'].to_numpy(dtype=float)
+    spend = result['광고비'].to_numpy(dtype=float)
+    revenue = result['총 전환매출액'].to_numpy(dtype=float)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ctr = clicks / impressions * 100
+        roas = np.where(spend > 0, revenue / spend * 100, 0.0)
+    ctr[~np.isfinite(ctr)] = 0
+    roas = _round_percent(roas)
+
+    result['클릭률'] = ctr
+    result['총광고수익률'] = [f"{value:.2f}%" for value in roas]
+    result['ROAS'] = roas
+    return result
+
+
+def process_coupang_report(df):
+    """
+    쿠팡 광고 보고서 DataFrame을 키워드 단위 분석 데이터로 가공
+
+    Args:
+        df (pd.DataFrame): 보고서 원본 (COUPANG_REPORT_COLUMNS 중 존재하는 컬럼)
+
+    Returns:
+        dict: {
+            'df': 키워드별 데이터 (ROAS, CPC 포함),
+            'summary': 요약 지표,
+            'data_type': '14일' 또는 '1일',
+            'warning': 경고 메시지 (없으면 None)
+        }
+
+    Raises:
+        CoupangReportError: 매출액 또는 필수 컬럼이 없는 경우
+    """
+    # 필수 컬럼 확인 (매출액은 14일 우선, 없으면 1일 사용)
+    required_cols_base = ['키워드', '노출수', '클릭수', '광고비', '클릭률']
+
+    # 경고 메시지 초기화
+    warning_message = None
+    data_type = '14일'
+
+    # 매출액 컬럼 선택: 14일 우선, 없으면 1일 사용
+    if '총 전환매출액(14일)' in df.columns:
+        revenue_col = '총 전환매출액(14일)'
+        data_type = '14일'
+        logger.info('Using 14-day revenue data')
+    elif '총 전환매출액(1일)' in df.columns:
+        revenue_col = '총 전환매출액(1일)'
+        data_type = '1일'
+        warning_message = '⚠️ 주의: 14일 데이터가 없어 1일 데이터를 사용합니다. ROAS가 실제보다 낮게 표시될 수 있습니다.'
+        logger.warning('Using 1-day revenue data (14-day not available)')
+    else:
+        logger.error('No revenue column found')
+        raise CoupangReportError('매출액 컬럼 없음 (총 전환매출액(14일) 또는 총 전환매출액(1일) 필요)')
+
+    # ROAS 컬럼 선택
+    if '총광고수익률(14일)' in df.columns:
+        roas_col = '총광고수익률(14일)'
+    elif '총광고수익률(1일)' in df.columns:
+        roas_col = '총광고수익률(1일)'
+    else:
+        roas_col = None
+
+    # 주문수/판매수량 컬럼 선택
+    if '총 주문수(14일)' in df.columns:
+        order_col = '총 주문수(14일)'
+        quantity_col = '총 판매수량(14일)' if '총 판매수량(14일)' in df.columns else '총 판매수량(1일)'
+    else:
+        order_col = '총 주문수(1일)'
+        quantity_col = '총 판매수량(1일)'
+
+    required_cols = required_cols_base + [order_col, quantity_col, revenue_col]
+    if roas_col:
+        required_cols.append(roas_col)
+
+    missing = [col for col in required_cols if col not in df.columns]
+    if missing:
+        logger.error(f'Missing required columns: {missing}')
+        raise CoupangReportError(f'필수 컬럼 누락: {missing}')
+
+    # 컬럼명 통일 (14일/1일 상관없이 동일한 이름으로 사용)
+    df = df.rename(columns={
+        revenue_col: '총 전환매출액',
+        order_col: '총 주문수',
+        quantity_col: '총 판매수량'
+    })
+    if roas_col:
+        df = df.rename(columns={roas_col: '총광고수익률'})
+
+    logger.info(f'Column mapping: revenue={revenue_col}, orders={order_col}')
+
+    # 키워드 정규화: 연속된 공백을 하나로 통일
+    if '키워드' in df.columns:
+        # 중복 키워드가 많으므로 고유값만 정규화 후 코드로 펼침
+        codes, uniques = pd.factorize(df['키워드'].astype(str))
+        normalized = pd.Series(uniques, dtype=object).str.replace(r'\s+', ' ', regex=True).str.strip()
+        df['키워드'] = normalized.to_numpy()[codes]
+        original_keywords = len(uniques)
+        normalized_keywords = normalized.nunique()
+        if original_keywords != normalized_keywords:
+            logger.info(f'Keyword normalization: {original_keywords} → {normalized_keywords} unique keywords')
+
+    # 데이터 정제
+    # 1. 모든 광고 노출 지면 데이터 포함 (검색영역 + 비검색영역 + 리타겟팅)
+    # 키워드가 '-'여도 포함 (비검색영역, 리타겟팅의 키워드는 '-'임)
+    # 🔥 비검색영역/리타겟팅 통합 + 키워드 중복 합산을 한 번의 groupby로 처리
+    df = _aggregate_keywords(df)
+    logger.info(f'Keyword deduplication completed: {len(df)}개 (unique keywords)')
+
+    # 2. 클릭률 처리 (이미 % 형식이면 그대로, 소수점이면 100 곱하기)
+    if df['클릭률'].max() <= 1:
+        df['클릭률'] = df['클릭률'] * 100
+
+    # 3. CPC 계산 (클릭당 단가) - Infinity 방지
+    df['CPC'] = (df['광고비'] / df['클릭수']).replace([np.inf, -np.inf], 0).fillna(0)
+
+    # 4. 결측치 및 Infinity 처리 (JSON 직렬화 오류 방지)
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    for col in numeric_cols:
+        df[col] = df[col].replace([np.inf, -np.inf], 0).fillna(0)
+
+    logger.info(f'Processed {len(df)} valid keywords')
+
+    # 요약 지표 계산
+    total_spend = df['광고비'].sum()
+    total_revenue = df['총 전환매출액'].sum()
+
+    # 평균CTR 계산 (Infinity 방지)
+    avg_ctr = df['클릭률'].mean()
+    if np.isinf(avg_ctr) or np.isnan(avg_ctr):
+        avg_ctr = 0
+
+    summary = {
+        '총광고비': int(total_spend),
+        '총매출액': int(total_revenue),
+        '평균ROAS': round((total_revenue / total_spend * 100), 2) if total_spend > 0 else 0,
+        '총클릭수': int(df['클릭수'].sum()),
+        '평균CTR': round(float(avg_ctr), 2),
+        '총노출수': int(df['노출수'].sum()),
+        '총주문수': int(df['총 주문수'].sum())
+    }
+
+    return {
+        'df': df,
+        'summary': summary,
+        'data_type': data_type,
+        'warning': warning_message
+    }
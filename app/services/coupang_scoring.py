@@ -0,0 +1,295 @@
+"""
+쿠팡 키워드 제외 추천 스코어링 엔진
+- 컬럼 단위 계산 (NumPy select / digitize)
+- 0-100점 스코어링 (수익성 50 + 효율성 25 + 규모 리스크 25)
+- 우선순위 판정, 낭비액/기회비용 계산, 요약 통계
+"""
+
+import logging
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# ========================================
+# 제외 키워드 판정 상수
+# ========================================
+EXCLUDE_MIN_SPEND = 5000      # 최소 광고비 (원)
+EXCLUDE_MIN_CLICKS = 10       # 최소 클릭수
+EXCLUDE_CPC_CRITICAL = 500    # CPC 심각 기준 (원)
+EXCLUDE_CPC_VERY_HIGH = 800   # CPC 매우 높음 기준 (원)
+EXCLUDE_CLICKS_CRITICAL = 30  # 전환없음 즉시제외 클릭수
+EXCLUDE_CLICKS_HIGH = 15      # 전환없음 조속히제외 클릭수
+
+# 성과 구간 (ROAS 경계: low < 150 <= mid < 300 <= high < 500 <= elite)
+TIER_BINS = [150, 300, 500]
+TIER_LOW, TIER_MID, TIER_HIGH, TIER_ELITE = 0, 1, 2, 3
+TIER_NAMES = ['low', 'mid', 'high', 'elite']
+
+# 지출 수준 (지출 백분위 경계: low <= p50 < medium <= p75 < high <= p90 < very_high)
+SPEND_LOW, SPEND_MEDIUM, SPEND_HIGH, SPEND_VERY_HIGH = 0, 1, 2, 3
+
+# 우선순위 코드 → (priority, label)
+PRIORITIES = [
+    (None, '데이터 부족'),
+    ('critical', '즉시 제외'),
+    ('high', '조속히 제외'),
+    ('medium', '검토 필요'),
+    ('low', '모니터링'),
+]
+P_NONE, P_CRITICAL, P_HIGH, P_MEDIUM, P_LOW = range(5)
+
+EMPTY_SUMMARY = {
+    'total_waste': 0,
+    'total_opportunity_loss': 0,
+    'keywords_to_exclude': 0,
+    'potential_savings': '0%',
+    'critical_priority': 0,
+    'high_priority': 0,
+    'medium_priority': 0,
+    'low_priority': 0
+}
+
+
+def _fill_reason(reasons, mask, fmt, values=None):
+    """mask 위치에 사유 문자열 채우기 (values가 있으면 행별 포맷)"""
+    idx = np.flatnonzero(mask)
+    if len(idx) == 0:
+        return
+    if values is None:
+        reasons[idx] = fmt
+    else:
+        reasons[idx] = [fmt.format(v) for v in values[idx].tolist()]
+
+
+def build_recommendations(df, target_roas=400):
+    """
+    쿠팡 키워드 제외 추천 생성
+
+    Args:
+        df (pd.DataFrame): 업로드 처리된 키워드 데이터
+            (키워드, 광고비, 총 전환매출액, ROAS, 클릭수, 클릭률, CPC, 광고 노출 지면)
+        target_roas (float): 목표 ROAS (%) - 기회비용 기준 상위 키워드 판정용
+
+    Returns:
+        tuple: (recommendations, summary)
+            recommendations: 점수 내림차순 추천 리스트
+            summary: 낭비액/기회비용/우선순위별 개수 요약
+    """
+    # 검색영역만 추천 대상 (비검색영역, 리타겟팅 제외)
+    if '광고 노출 지면' in df.columns:
+        original_count = len(df)
+        df = df[df['광고 노출 지면'] == '검색 영역']
+        logger.info(f'Filtered to search area only: {len(df)} keywords (from {original_count})')
+
+    if len(df) == 0:
+        return [], dict(EMPTY_SUMMARY)
+
+    n = len(df)
+    spend = df['광고비'].to_numpy(dtype=np.float64)
+    revenue = df['총 전환매출액'].to_numpy(dtype=np.float64)
+    roas = df['ROAS'].to_numpy(dtype=np.float64) if 'ROAS' in df.columns else np.zeros(n)
+    clicks = df['클릭수'].to_numpy().astype(np.int64)
+    ctr = df['클릭률'].to_numpy(dtype=np.float64)
+    cpc = df['CPC'].to_numpy(dtype=np.float64)
+
+    # ===== 기본 통계 =====
+    total_spend = df['광고비'].sum()
+    total_revenue = df['총 전환매출액'].sum()
+    avg_roas = (total_revenue / total_spend * 100) if total_spend > 0 else 0
+
+    median_cpc = df['CPC'].median()
+    spend_p50, spend_p75, spend_p90 = (df['광고비'].quantile(q) for q in (0.50, 0.75, 0.90))
+
+    # 성과 구간 (NaN ROAS는 저성과 구간)
+    tier = np.digitize(roas, TIER_BINS)
+    tier[np.isnan(roas)] = TIER_LOW
+
+    # 구간별 중앙값 CPC (3개 미만 구간은 전체 중앙값으로 대체)
+    roas_series = df['ROAS'] if 'ROAS' in df.columns else pd.Series(roas, index=df.index)
+    tier_masks = [
+        roas_series < 150,
+        (roas_series >= 150) & (roas_series < 300),
+        (roas_series >= 300) & (roas_series < 500),
+        roas_series >= 500,
+    ]
+    tier_median_cpc = np.full(len(TIER_NAMES), median_cpc, dtype=np.float64)
+    for code, mask in enumerate(tier_masks):
+        if mask.sum() >= 3:
+            tier_median_cpc[code] = df['CPC'][mask].median()
+
+    row_median_cpc = tier_median_cpc[tier]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cpc_ratio = np.where(row_median_cpc > 0, cpc / row_median_cpc, 1.0)
+
+    # 상위 성과 키워드 평균 ROAS (기회비용 계산용)
+    top_mask = roas_series >= target_roas
+    top_avg_roas = roas_series[top_mask].mean() if top_mask.any() else avg_roas
+
+    # ===== 1. 수익성 점수 (0-50점) =====
+    profit_conds = [
+        revenue == 0,
+        roas < 20,
+        roas < 50,
+        roas < 100,
+        roas < 150,
+        roas < 200,
+        roas < 300,
+    ]
+    profit_bucket = np.select(profit_conds, range(len(profit_conds)), default=-1)
+    profitability_score = np.select(profit_conds, [50, 45, 40, 35, 25, 15, 10], default=0)
+
+    profit_reason = np.full(n, '', dtype=object)
+    _fill_reason(profit_reason, profit_bucket == 0, '전환 0원')
+    for bucket, label in enumerate(
+            ['극심한 손실', '심각한 손실', '손실', '낮은 수익', '목표 미달', '목표 근접'], start=1):
+        _fill_reason(profit_reason, profit_bucket == bucket, 'ROAS {:.1f}% (' + label + ')', roas)
+
+    # ===== 2. 효율성 점수 (0-25점) - 성과 구간별 CPC 비교 =====
+    top_tier = tier >= TIER_HIGH
+    mid_tier = tier == TIER_MID
+    low_tier = tier == TIER_LOW
+
+    efficiency_score = np.select(
+        [
+            top_tier & (cpc_ratio > 3.0), top_tier & (cpc_ratio > 2.5), top_tier,
+            mid_tier & (cpc_ratio > 2.5), mid_tier & (cpc_ratio > 2.0), mid_tier & (cpc_ratio > 1.5), mid_tier,
+            cpc_ratio > 2.0, cpc_ratio > 1.5, cpc_ratio > 1.2,
+        ],
+        [10, 5, 0, 20, 15, 10, 0, 25, 20, 15],
+        default=5
+    )
+
+    efficiency_reason = np.full(n, '', dtype=object)
+    _fill_reason(efficiency_reason, (top_tier & (cpc_ratio > 3.0)) | (low_tier & (cpc_ratio > 2.0)),
+                 'CPC 과다 ({:.0f}원)', cpc)
+    _fill_reason(efficiency_reason, mid_tier & (cpc_ratio > 2.5), 'CPC 높음 ({:.0f}원)', cpc)
+
+    # ===== 3. 규모 리스크 점수 (0-25점) - 지출액 + ROAS 조합 =====
+    spend_level = np.select(
+        [spend > spend_p90, spend > spend_p75, spend > spend_p50],
+        [SPEND_VERY_HIGH, SPEND_HIGH, SPEND_MEDIUM],
+        default=SPEND_LOW
+    )
+
+    # ROAS 구간(행) × 지출 수준(열) 점수표
+    scale_table = np.array([
+        [10, 15, 20, 25],  # ROAS 0% (전환 0원)
+        [5, 10, 15, 20],   # ROAS < 100% (손실)
+        [0, 0, 10, 10],    # ROAS < 200% (낮은 수익)
+        [0, 0, 0, 5],      # ROAS < 300% (목표 미달)
+        [0, 0, 0, 0],      # ROAS >= 300% (목표 달성)
+    ])
+    scale_bucket = np.select([roas == 0, roas < 100, roas < 200, roas < 300], [0, 1, 2, 3], default=4)
+    scale_risk_score = scale_table[scale_bucket, spend_level]
+
+    scale_reason = np.full(n, '', dtype=object)
+    _fill_reason(scale_reason, (scale_bucket <= 1) & (spend_level == SPEND_VERY_HIGH), '고지출 ({:,.0f}원)', spend)
+    _fill_reason(scale_reason, (scale_bucket == 0) & (spend_level == SPEND_HIGH), '중간 지출')
+
+    score = profitability_score + efficiency_score + scale_risk_score
+
+    # ===== 우선순위 결정 (조건 기반, 위에서부터 먼저 일치하는 단계 적용) =====
+    insufficient = (spend < EXCLUDE_MIN_SPEND) & (clicks < EXCLUDE_MIN_CLICKS)
+    high_cpc_loss = cpc >= EXCLUDE_CPC_CRITICAL
+    very_high_cpc = cpc >= EXCLUDE_CPC_VERY_HIGH
+    no_conversion = revenue == 0
+
+    priority_conds = [
+        insufficient,
+        high_cpc_loss & (roas < 100),
+        very_high_cpc & (roas < 200),
+        no_conversion & (clicks >= EXCLUDE_CLICKS_CRITICAL),
+        no_conversion & (clicks >= EXCLUDE_CLICKS_HIGH),
+        no_conversion,
+        (roas < 100) & (spend >= spend_p75),
+        (roas < 100) & (spend >= spend_p50),
+        roas < 100,
+        (roas < 200) & (spend >= spend_p75),
+        roas < 200,
+        roas < 300,
+    ]
+    rule = np.select(priority_conds, range(len(priority_conds)), default=len(priority_conds))
+    rule_priority = np.array([
+        P_NONE, P_CRITICAL, P_CRITICAL, P_CRITICAL, P_HIGH, P_MEDIUM,
+        P_CRITICAL, P_HIGH, P_MEDIUM, P_HIGH, P_MEDIUM, P_MEDIUM, P_LOW
+    ])
+    priority_code = rule_priority[rule]
+
+    priority_reason = np.full(n, '', dtype=object)
+    _fill_reason(priority_reason, rule == 0, '데이터 부족')
+    _fill_reason(priority_reason, rule == 1, '고CPC({:.0f}원) + 저ROAS', cpc)
+    _fill_reason(priority_reason, rule == 2, '초고CPC({:.0f}원) + 저ROAS', cpc)
+    _fill_reason(priority_reason, (rule == 3) | (rule == 4), '{}클릭 전환없음', clicks)
+    _fill_reason(priority_reason, rule == 5, '전환없음 검토')
+    _fill_reason(priority_reason, rule == 6, '저ROAS + 고지출')
+    _fill_reason(priority_reason, rule == 7, '저ROAS + 중지출')
+    _fill_reason(priority_reason, rule == 9, '저조ROAS + 고지출')
+    _fill_reason(priority_reason, rule == 11, 'ROAS 개선필요')
+
+    # ===== 낭비 및 기회비용 =====
+    zero_spend = spend == 0
+    loss = ~zero_spend & (roas < 100)
+    waste = np.where(loss, spend - revenue, 0.0)
+    waste_rate = np.where(loss, 100 - roas, 0.0)
+    opportunity_loss = np.where(zero_spend, 0.0, spend * (top_avg_roas / 100) - revenue)
+
+    # ===== 점수 내림차순 정렬 (동점은 원래 순서 유지) =====
+    order = np.argsort(-score, kind='stable')
+
+    keywords = df['키워드'].to_numpy(dtype=object)[order].tolist()
+    reason_columns = zip(
+        profit_reason[order].tolist(), efficiency_reason[order].tolist(),
+        scale_reason[order].tolist(), priority_reason[order].tolist()
+    )
+    priority_code = priority_code[order]
+
+    recommendations = []
+    for (keyword, s, p, reasons, sp, rv, ro, w, wr, ol, cl, ct, cp) in zip(
+            keywords, score[order].tolist(), priority_code.tolist(), reason_columns,
+            spend[order].tolist(), revenue[order].tolist(), roas[order].tolist(),
+            waste[order].tolist(), waste_rate[order].tolist(), opportunity_loss[order].tolist(),
+            clicks[order].tolist(), ctr[order].tolist(), cpc[order].tolist()):
+        priority, priority_label = PRIORITIES[p]
+        recommendations.append({
+            'keyword': keyword,
+            'score': s,
+            'priority': priority,
+            'reason': f"{priority_label} - " + ", ".join([r for r in reasons if r][:3]),  # 최대 3개 사유
+            'spend': sp,
+            'revenue': rv,
+            'roas': ro,
+            'waste': w,
+            'waste_rate': wr,
+            'opportunity_loss': ol,
+            'clicks': cl,
+            'ctr': ct,
+            'cpc': cp
+        })
+
+    # ===== 요약 통계 (합계는 정렬 순서대로 누적 - 기존 결과와 동일한 반올림) =====
+    total_waste = sum(waste[order].tolist())
+    total_opportunity_loss = sum(opportunity_loss[order].tolist())
+
+    valid = priority_code != P_NONE
+    valid_count = int(valid.sum())
+
+    summary = {
+        'total_waste': int(total_waste),
+        'total_opportunity_loss': int(total_opportunity_loss),
+        'keywords_to_exclude': valid_count,
+        'potential_savings': f"{(total_waste / total_spend * 100):.1f}%" if total_spend > 0 else "0%",
+        'critical_priority': int((priority_code == P_CRITICAL).sum()),
+        'high_priority': int((priority_code == P_HIGH).sum()),
+        'medium_priority': int((priority_code == P_MEDIUM).sum()),
+        'low_priority': int((priority_code == P_LOW).sum()),
+        'insufficient_data': n - valid_count,
+        'avg_score': int(int(score[order][valid].sum()) / valid_count) if valid_count else 0
+    }
+
+    logger.info(
+        f'Generated {n} recommendations (avg score: {summary["avg_score"]}, '
+        f'total waste: {total_waste:.0f}원)'
+    )
+
+    return recommendations, summary
@@ -0,0 +1,218 @@
+"""
+업로드 데이터셋 저장소 (서버 측 컬럼 저장소)
+- 업로드 처리 결과 DataFrame을 로컬 디스크에 Parquet으로 저장
+- dataset_id(핸들)로 재조회 → 브라우저가 데이터를 다시 POST하지 않아도 됨
+- TTL 기반 만료 및 주기적 정리 (gunicorn 워커 간 디스크 공유)
+"""
+
+import os
+import re
+import json
+import time
+import uuid
+import logging
+import pandas as pd
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+# dataset_id 형식 (uuid4 hex) - 경로 조작 방지
+DATASET_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+
+class DatasetStore:
+    """Parquet 파일 기반 데이터셋 저장소"""
+
+    def __init__(self, root_dir, ttl_seconds=21600, sweep_interval=300):
+        """
+        Args:
+            root_dir (str): 저장 디렉토리
+            ttl_seconds (int): 마지막 접근 후 만료까지의 시간 (초)
+            sweep_interval (int): 만료 데이터 정리 최소 간격 (초)
+        """
+        self.root_dir = root_dir
+        self.ttl_seconds = ttl_seconds
+        self.sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+        os.makedirs(root_dir, exist_ok=True)
+
+    def _paths(self, dataset_id):
+        base = os.path.join(self.root_dir, dataset_id)
+        return f"{base}.parquet", f"{base}.json"
+
+    @staticmethod
+    def is_valid_id(dataset_id):
+        """dataset_id 형식 검증"""
+        return bool(dataset_id) and bool(DATASET_ID_PATTERN.match(str(dataset_id)))
+
+    def put(self, df, meta=None):
+        """
+        데이터셋 저장
+
+        Args:
+            df (pd.DataFrame): 저장할 데이터
+            meta (dict): 함께 저장할 메타데이터 (user_id, summary 등 JSON 직렬화 가능 값)
+
+        Returns:
+            str: dataset_id
+        """
+        self.sweep()
+
+        dataset_id = uuid.uuid4().hex
+        data_path, meta_path = self._paths(dataset_id)
+
+        meta = {
+            **(meta or {}),
+            'dataset_id': dataset_id,
+            'rows': len(df),
+            'columns': [str(c) for c in df.columns],
+            'created_at': pd.Timestamp.now().isoformat()
+        }
+
+        # 임시 파일에 쓰고 rename - 다른 워커가 쓰다 만 파일을 읽지 않도록
+        tmp_data, tmp_meta = f"{data_path}.tmp", f"{meta_path}.tmp"
+        df.reset_index(drop=True).to_parquet(tmp_data, index=False)
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False)
+        os.replace(tmp_data, data_path)
+        os.replace(tmp_meta, meta_path)  # 메타 파일이 마지막 - 존재하면 데이터도 완성된 상태
+
+        logger.info(f"Dataset stored: {dataset_id} ({len(df)} rows)")
+        return dataset_id
+
+    def get_meta(self, dataset_id, user_id=None):
+        """
+        메타데이터 조회 (만료/소유자 불일치 시 None)
+
+        Args:
+            dataset_id (str): 데이터셋 ID
+            user_id (str): 지정하면 저장 시 user_id와 일치해야 함
+
+        Returns:
+            dict | None: 메타데이터
+        """
+        if not self.is_valid_id(dataset_id):
+            return None
+
+        _, meta_path = self._paths(dataset_id)
+        try:
+            if time.time() - os.path.getmtime(meta_path) > self.ttl_seconds:
+                self.delete(dataset_id)
+                return None
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if user_id is not None and meta.get('user_id') != user_id:
+            logger.warning(f"Dataset owner mismatch: {dataset_id}")
+            return None
+
+        return meta
+
+    def get(self, dataset_id, user_id=None, columns=None):
+        """
+        데이터셋 조회 (접근 시 TTL 연장)
+
+        Args:
+            dataset_id (str): 데이터셋 ID
+            user_id (str): 소유자 확인용
+            columns (list): 읽을 컬럼 (None이면 전체)
+
+        Returns:
+            pd.DataFrame | None: 데이터 (없거나 만료되면 None)
+        """
+        if self.get_meta(dataset_id, user_id) is None:
+            return None
+
+        data_path, meta_path = self._paths(dataset_id)
+        try:
+            df = pd.read_parquet(data_path, columns=columns)
+            now = time.time()
+            os.utime(meta_path, (now, now))
+            return df
+        except (OSError, ValueError) as e:
+            logger.warning(f"Dataset read failed: {dataset_id} - {e}")
+            return None
+
+    def delete(self, dataset_id):
+        """데이터셋 삭제"""
+        if not self.is_valid_id(dataset_id):
+            return False
+
+        deleted = False
+        for path in self._paths(dataset_id):
+            try:
+                os.remove(path)
+                deleted = True
+            except FileNotFoundError:
+                pass
+        return deleted
+
+    def sweep(self, force=False):
+        """
+        만료 데이터셋 정리 (sweep_interval 간격으로만 실제 수행)
+
+        Returns:
+            int: 삭제된 데이터셋 수
+        """
+        now = time.time()
+        if not force and now - self._last_sweep < self.sweep_interval:
+            return 0
+        self._last_sweep = now
+
+        removed = 0
+        try:
+            entries = list(os.scandir(self.root_dir))
+        except OSError:
+            return 0
+
+        for entry in entries:
+            name = entry.name
+            try:
+                age = now - entry.stat().st_mtime
+            except OSError:
+                continue
+
+            if name.endswith('.json') and age > self.ttl_seconds:
+                if self.delete(name[:-len('.json')]):
+                    removed += 1
+            elif name.endswith('.tmp') and age > self.ttl_seconds:
+                # 쓰기 도중 중단된 임시 파일
+                try:
+                    os.remove(entry.path)
+                except OSError:
+                    pass
+            elif name.endswith('.parquet') and age > self.ttl_seconds:
+                # 메타 파일 없이 남은 데이터 파일
+                if not os.path.exists(entry.path[:-len('.parquet')] + '.json'):
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+
+        if removed:
+            logger.info(f"Dataset store sweep: {removed} expired datasets removed")
+        return removed
+
+
+_store = None
+
+
+def get_dataset_store():
+    """
+    앱 설정 기반 데이터셋 저장소 반환 (프로세스당 1개)
+
+    Returns:
+        DatasetStore: 저장소 인스턴스
+    """
+    global _store
+
+    root_dir = current_app.config.get('DATASET_STORE_DIR', 'data/datasets')
+    if _store is None or _store.root_dir != root_dir:
+        _store = DatasetStore(
+            root_dir,
+            ttl_seconds=current_app.config.get('DATASET_TTL_SECONDS', 21600),
+            sweep_interval=current_app.config.get('DATASET_SWEEP_INTERVAL', 300)
+        )
+    return _store
@@ -0,0 +1,211 @@
+"""
+AI 인사이트 캐시
+- 키: 모델 + 시스템 프롬프트 + _create_prompt 결과의 SHA-256 → 같은 지표는 OpenAI를 다시 호출하지 않음
+- 백그라운드 생성 중에는 pending 마커로 중복 요청 방지 (워커 간 공유 디스크)
+- 실패(시간 초과 등) 결과는 기본 인사이트로 저장, 일정 시간 후 재시도 허용
+"""
+
+import os
+import re
+import json
+import time
+import logging
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키 형식 (sha256 hex) - 경로 조작 방지
+INSIGHT_KEY_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+# 실패 결과 재시도 허용 시간 (초)
+FAILED_RETRY_SECONDS = 300
+
+
+class InsightCache:
+    """JSON 파일 기반 인사이트 캐시 (<key>.json 결과, <key>.pending 생성 중 마커)"""
+
+    def __init__(self, root_dir, ttl_seconds=604800, pending_timeout=120, sweep_interval=300):
+        """
+        Args:
+            root_dir (str): 저장 디렉토리
+            ttl_seconds (int): 마지막 조회 후 결과 보관 시간 (초)
+            pending_timeout (int): 생성 중 마커 유효 시간 (초, 초과 시 중단된 작업으로 간주)
+            sweep_interval (int): 만료 항목 정리 최소 간격 (초)
+        """
+        self.root_dir = root_dir
+        self.ttl_seconds = ttl_seconds
+        self.pending_timeout = pending_timeout
+        self.sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+        os.makedirs(root_dir, exist_ok=True)
+
+    @staticmethod
+    def is_valid_key(key):
+        """캐시 키 형식 검증"""
+        return bool(key) and bool(INSIGHT_KEY_PATTERN.match(str(key)))
+
+    def _paths(self, key):
+        base = os.path.join(self.root_dir, key)
+        return f"{base}.json", f"{base}.pending"
+
+    def get(self, key):
+        """
+        캐시 조회 (결과 적중 시 만료 시간 갱신)
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            dict | None: {'status': 'done'|'failed'|'pending', 'insights', 'source', ...}, 없으면 None
+        """
+        if not self.is_valid_key(key):
+            return None
+
+        result_path, pending_path = self._paths(key)
+        try:
+            with open(result_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            now = time.time()
+            os.utime(result_path, (now, now))
+            return entry
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"Insight cache read failed: {key[:12]} - {e}")
+            return None
+
+        try:
+            if time.time() - os.path.getmtime(pending_path) <= self.pending_timeout:
+                return {'status': 'pending', 'insights': None, 'source': None}
+        except OSError:
+            pass
+        return None
+
+    def claim(self, key):
+        """
+        생성 작업 선점 (결과가 없거나 재시도 가능할 때만 pending 마커 생성)
+
+        Returns:
+            bool: 선점 성공 시 True (호출자가 생성 작업을 시작해야 함)
+        """
+        if not self.is_valid_key(key):
+            return False
+
+        self.sweep()
+
+        result_path, pending_path = self._paths(key)
+        now = time.time()
+
+        try:
+            with open(result_path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if entry.get('status') != 'failed' or now - entry.get('created_at', 0) < FAILED_RETRY_SECONDS:
+                return False
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            pass
+
+        # 중단된 작업의 오래된 마커 정리
+        try:
+            if now - os.path.getmtime(pending_path) > self.pending_timeout:
+                os.remove(pending_path)
+        except OSError:
+            pass
+
+        # O_EXCL: 여러 워커가 동시에 요청해도 한 곳만 생성
+        try:
+            fd = os.open(pending_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        return True
+
+    def put(self, key, status, insights, source):
+        """
+        생성 결과 저장 후 pending 마커 제거
+
+        Args:
+            key (str): 캐시 키
+            status (str): 'done' 또는 'failed'
+            insights (str): 인사이트 텍스트
+            source (str): 'ai' 또는 'fallback'
+        """
+        if not self.is_valid_key(key):
+            raise ValueError(f"잘못된 캐시 키입니다: {key}")
+
+        result_path, pending_path = self._paths(key)
+        tmp_path = f"{result_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'status': status,
+                'insights': insights,
+                'source': source,
+                'created_at': time.time()
+            }, f, ensure_ascii=False)
+        os.replace(tmp_path, result_path)
+
+        try:
+            os.remove(pending_path)
+        except FileNotFoundError:
+            pass
+
+    def sweep(self, force=False):
+        """
+        TTL이 지난 결과/마커 삭제 (sweep_interval 간격으로만 실제 수행)
+
+        Returns:
+            int: 삭제된 파일 수
+        """
+        now = time.time()
+        if not force and now - self._last_sweep < self.sweep_interval:
+            return 0
+        self._last_sweep = now
+
+        removed = 0
+        try:
+            entries = list(os.scandir(self.root_dir))
+        except OSError:
+            return 0
+
+        for entry in entries:
+            try:
+                age = now - entry.stat().st_mtime
+            except OSError:
+                continue
+            ttl = self.ttl_seconds if entry.name.endswith('.json') else max(self.pending_timeout, 3600)
+            if age > ttl:
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+
+        if removed:
+            logger.info(f"Insight cache sweep: {removed} files removed")
+        return removed
+
+
+_cache = None
+
+
+def get_insight_cache():
+    """
+    앱 설정 기반 인사이트 캐시 반환 (프로세스당 1개)
+
+    Returns:
+        InsightCache: 캐시 인스턴스
+    """
+    global _cache
+
+    config = current_app.config
+    root_dir = config.get('AI_INSIGHTS_CACHE_DIR', 'data/insights')
+    if _cache is None or _cache.root_dir != root_dir:
+        _cache = InsightCache(
+            root_dir,
+            ttl_seconds=config.get('AI_INSIGHTS_CACHE_TTL_SECONDS', 604800),
+            # 생성 1건은 타임아웃 안에 끝나므로 그 이상 남은 마커는 중단된 작업
+            pending_timeout=config.get('AI_INSIGHTS_TIMEOUT', 30) * 2 + 30,
+            sweep_interval=config.get('AI_INSIGHTS_CACHE_SWEEP_INTERVAL', 300)
+        )
+    return _cache
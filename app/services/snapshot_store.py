@@ -0,0 +1,305 @@
+"""
+분석 스냅샷 Blob 저장소
+- 업로드/수기입력 분석 결과(DataFrame + 지표)를 세션 대신 압축 Parquet 파일로 보관
+- 세션에는 snapshot_id 포인터만 저장 → 업로드 크기와 무관하게 요청당 세션 로드 비용 일정
+- 단일 Blob 크기 제한, TTL 만료, 전체 용량 초과 시 LRU(최근 접근 순) 정리
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+# Parquet 파일 메타데이터에 스냅샷 정보를 저장할 키
+META_KEY = b'snapshot_meta'
+
+SUPPORTED_CODECS = ('zstd', 'lz4', 'snappy', 'gzip', 'none')
+
+
+class SnapshotStore:
+    """압축 Parquet Blob 기반 스냅샷 저장소 (사용자별 디렉토리)"""
+
+    def __init__(self, root_dir, codec='zstd', compression_level=None,
+                 max_blob_bytes=20 * 1024 * 1024, max_total_bytes=1024 * 1024 * 1024,
+                 ttl_seconds=86400, sweep_interval=300):
+        """
+        Args:
+            root_dir (str): 저장 디렉토리
+            codec (str): 압축 코덱 (zstd, lz4, snappy, gzip, none)
+            compression_level (int): 압축 레벨 (None이면 코덱 기본값)
+            max_blob_bytes (int): 스냅샷 1개의 최대 크기 (압축 후, 초과 시 저장하지 않음)
+            max_total_bytes (int): 전체 저장소 최대 크기 (초과 시 오래 접근하지 않은 순으로 삭제)
+            ttl_seconds (int): 마지막 접근 후 만료까지의 시간 (초)
+            sweep_interval (int): 만료/용량 정리 최소 간격 (초)
+        """
+        if codec not in SUPPORTED_CODECS:
+            raise ValueError(f"지원하지 않는 압축 코덱입니다: {codec}")
+
+        self.root_dir = root_dir
+        self.codec = codec
+        self.compression_level = compression_level
+        self.max_blob_bytes = max_blob_bytes
+        self.max_total_bytes = max_total_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+        os.makedirs(root_dir, exist_ok=True)
+
+    @staticmethod
+    def _user_key(user_id):
+        """사용자 ID → 디렉토리명 (경로 조작 방지용 해시)"""
+        return hashlib.sha256(str(user_id).encode('utf-8')).hexdigest()[:16]
+
+    def _path(self, user_id, snapshot_id):
+        return os.path.join(self.root_dir, self._user_key(user_id), f"{int(snapshot_id)}.parquet")
+
+    @staticmethod
+    def _to_table(df):
+        """
+        DataFrame → Arrow 테이블 변환
+
+        타입이 섞인 object 컬럼(예: 숫자와 '-' 혼재)은 Arrow가 변환하지 못하므로 문자열로 저장
+        """
+        df = df.reset_index(drop=True)
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df = df.copy()
+            for col in df.columns[df.dtypes == object]:
+                df[col] = df[col].map(lambda v: v if v is None or isinstance(v, str) else str(v))
+            return pa.Table.from_pandas(df, preserve_index=False)
+
+    def put(self, user_id, snapshot_id, df, meta=None):
+        """
+        스냅샷 저장
+
+        Args:
+            user_id (str): 사용자 ID
+            snapshot_id (int): 스냅샷 ID
+            df (pd.DataFrame): 원본 데이터
+            meta (dict): 함께 저장할 정보 (name, metrics, insights 등)
+
+        Returns:
+            int | None: 저장된 Blob 크기 (bytes), 크기 제한 초과 시 None
+        """
+        self.sweep()
+
+        path = self._path(user_id, snapshot_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        meta = {
+            **(meta or {}),
+            'snapshot_id': int(snapshot_id),
+            'rows': len(df),
+            'created_at': pd.Timestamp.now().isoformat()
+        }
+
+        table = self._to_table(df)
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            META_KEY: json.dumps(meta, ensure_ascii=False, default=str).encode('utf-8')
+        })
+
+        # 임시 파일에 쓰고 rename - 다른 워커가 쓰다 만 파일을 읽지 않도록
+        tmp_path = f"{path}.tmp"
+        pq.write_table(
+            table, tmp_path,
+            compression=self.codec,
+            compression_level=self.compression_level
+        )
+
+        size = os.path.getsize(tmp_path)
+        if size > self.max_blob_bytes:
+            os.remove(tmp_path)
+            logger.warning(
+                f"Snapshot blob too large, not stored: {snapshot_id} "
+                f"({size} bytes > {self.max_blob_bytes} bytes)"
+            )
+            return None
+
+        os.replace(tmp_path, path)
+        logger.info(f"Snapshot blob stored: {snapshot_id} ({len(df)} rows, {size} bytes, {self.codec})")
+        return size
+
+    def _fresh_path(self, user_id, snapshot_id):
+        """만료되지 않은 Blob 경로 반환 (없거나 만료 시 None)"""
+        try:
+            path = self._path(user_id, snapshot_id)
+        except (TypeError, ValueError):
+            return None
+
+        try:
+            if time.time() - os.path.getmtime(path) > self.ttl_seconds:
+                self._remove(path)
+                return None
+        except OSError:
+            return None
+        return path
+
+    def get_meta(self, user_id, snapshot_id):
+        """
+        스냅샷 정보만 조회 (데이터 본문은 읽지 않음)
+
+        Returns:
+            dict | None: 저장 시 meta (없거나 만료 시 None)
+        """
+        path = self._fresh_path(user_id, snapshot_id)
+        if path is None:
+            return None
+
+        try:
+            metadata = pq.read_schema(path).metadata or {}
+            return json.loads(metadata.get(META_KEY, b'{}'))
+        except (OSError, ValueError, pa.ArrowException) as e:
+            logger.warning(f"Snapshot blob meta read failed: {snapshot_id} - {e}")
+            return None
+
+    def get(self, user_id, snapshot_id, columns=None):
+        """
+        스냅샷 조회 (접근 시 TTL/LRU 순서 갱신)
+
+        Args:
+            user_id (str): 사용자 ID
+            snapshot_id (int): 스냅샷 ID
+            columns (list): 읽을 컬럼 (None이면 전체)
+
+        Returns:
+            tuple | None: (DataFrame, meta), 없거나 만료 시 None
+        """
+        path = self._fresh_path(user_id, snapshot_id)
+        if path is None:
+            return None
+
+        try:
+            table = pq.read_table(path, columns=columns)
+            meta = json.loads((table.schema.metadata or {}).get(META_KEY, b'{}'))
+            now = time.time()
+            os.utime(path, (now, now))
+            return table.to_pandas(), meta
+        except (OSError, ValueError, pa.ArrowException) as e:
+            logger.warning(f"Snapshot blob read failed: {snapshot_id} - {e}")
+            return None
+
+    def delete(self, user_id, snapshot_id):
+        """스냅샷 삭제"""
+        try:
+            return self._remove(self._path(user_id, snapshot_id))
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def _entries(self):
+        """저장소 내 모든 Blob 파일의 (경로, 크기, mtime)"""
+        entries = []
+        try:
+            user_dirs = list(os.scandir(self.root_dir))
+        except OSError:
+            return entries
+
+        for user_dir in user_dirs:
+            if not user_dir.is_dir():
+                continue
+            try:
+                files = list(os.scandir(user_dir.path))
+            except OSError:
+                continue
+            for entry in files:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.path, stat.st_size, stat.st_mtime))
+        return entries
+
+    def usage(self):
+        """
+        저장소 사용량
+
+        Returns:
+            dict: blob 수와 전체 크기 (bytes)
+        """
+        entries = [e for e in self._entries() if e[0].endswith('.parquet')]
+        return {
+            'blobs': len(entries),
+            'total_bytes': sum(size for _, size, _ in entries),
+            'max_total_bytes': self.max_total_bytes
+        }
+
+    def sweep(self, force=False):
+        """
+        만료 Blob 삭제 후 전체 용량 초과 시 LRU 순으로 삭제 (sweep_interval 간격으로만 실제 수행)
+
+        Returns:
+            int: 삭제된 Blob 수
+        """
+        now = time.time()
+        if not force and now - self._last_sweep < self.sweep_interval:
+            return 0
+        self._last_sweep = now
+
+        expired = 0
+        live = []
+        for path, size, mtime in self._entries():
+            if now - mtime > self.ttl_seconds:
+                # 만료 Blob 및 쓰기 도중 중단된 임시 파일
+                if self._remove(path) and path.endswith('.parquet'):
+                    expired += 1
+            elif path.endswith('.parquet'):
+                live.append((mtime, size, path))
+
+        # LRU: 가장 오래 접근하지 않은 Blob부터 삭제
+        evicted = 0
+        total = sum(size for _, size, _ in live)
+        if total > self.max_total_bytes:
+            live.sort()
+            for _, size, path in live:
+                if total <= self.max_total_bytes:
+                    break
+                if self._remove(path):
+                    evicted += 1
+                total -= size
+
+        if expired or evicted:
+            logger.info(f"Snapshot store sweep: {expired} expired, {evicted} evicted (LRU)")
+        return expired + evicted
+
+
+_store = None
+
+
+def get_snapshot_store():
+    """
+    앱 설정 기반 스냅샷 저장소 반환 (프로세스당 1개)
+
+    Returns:
+        SnapshotStore: 저장소 인스턴스
+    """
+    global _store
+
+    config = current_app.config
+    root_dir = config.get('SNAPSHOT_STORE_DIR', 'data/snapshots')
+    if _store is None or _store.root_dir != root_dir:
+        _store = SnapshotStore(
+            root_dir,
+            codec=config.get('SNAPSHOT_STORE_CODEC', 'zstd'),
+            compression_level=config.get('SNAPSHOT_STORE_COMPRESSION_LEVEL'),
+            max_blob_bytes=config.get('SNAPSHOT_MAX_BLOB_MB', 20) * 1024 * 1024,
+            max_total_bytes=config.get('SNAPSHOT_STORE_MAX_MB', 1024) * 1024 * 1024,
+            ttl_seconds=config.get('SNAPSHOT_TTL_SECONDS', 86400),
+            sweep_interval=config.get('SNAPSHOT_SWEEP_INTERVAL', 300)
+        )
+    return _store
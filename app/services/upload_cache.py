@@ -0,0 +1,208 @@
+"""
+업로드 결과 캐시 (파일 내용 해시 기반)
+- 동일한 보고서 파일을 다시 업로드하면 파싱/통합/중복 합산을 건너뛰고 가공 결과를 재사용
+- 키: 업로드 바이트의 SHA-256 + 가공 로직 버전 → 로직 변경 시 자동 무효화
+- 로컬 디스크 저장 (gunicorn 워커 간 공유), 전체 용량 초과 시 LRU(최근 접근 순) 정리
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import pandas as pd
+from flask import current_app
+
+logger = logging.getLogger(__name__)
+
+# 캐시 키 형식 (sha256 hex) - 경로 조작 방지
+CACHE_KEY_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class UploadCache:
+    """Parquet(가공 데이터) + JSON(요약 정보) 파일 기반 캐시"""
+
+    def __init__(self, root_dir, max_total_bytes=512 * 1024 * 1024, sweep_interval=300):
+        """
+        Args:
+            root_dir (str): 저장 디렉토리
+            max_total_bytes (int): 전체 캐시 최대 크기 (초과 시 오래 접근하지 않은 순으로 삭제)
+            sweep_interval (int): 용량 정리 최소 간격 (초)
+        """
+        self.root_dir = root_dir
+        self.max_total_bytes = max_total_bytes
+        self.sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+        os.makedirs(root_dir, exist_ok=True)
+
+    @staticmethod
+    def content_key(stream, version):
+        """
+        업로드 스트림의 캐시 키 계산 (읽은 후 스트림 위치는 처음으로 되돌림)
+
+        Args:
+            stream: 파일 객체 (seek 가능)
+            version (str): 가공 로직 버전
+
+        Returns:
+            str: 캐시 키 (sha256 hex)
+        """
+        digest = hashlib.sha256(f'v{version}:'.encode('utf-8'))
+        stream.seek(0)
+        for chunk in iter(lambda: stream.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+        stream.seek(0)
+        return digest.hexdigest()
+
+    def _paths(self, key):
+        base = os.path.join(self.root_dir, key)
+        return f"{base}.parquet", f"{base}.json"
+
+    def get(self, key):
+        """
+        캐시 조회 (적중 시 LRU 순서 갱신)
+
+        Args:
+            key (str): 캐시 키
+
+        Returns:
+            tuple | None: (DataFrame, meta), 없으면 None
+        """
+        if not CACHE_KEY_PATTERN.match(str(key)):
+            return None
+
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            df = pd.read_parquet(data_path)
+            now = time.time()
+            os.utime(meta_path, (now, now))
+            return df, meta
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Upload cache read failed: {key[:12]} - {e}")
+            self.delete(key)
+            return None
+
+    def put(self, key, df, meta):
+        """
+        캐시 저장
+
+        Args:
+            key (str): 캐시 키
+            df (pd.DataFrame): 가공 결과 데이터
+            meta (dict): 함께 저장할 정보 (summary, data_type, warning 등)
+        """
+        if not CACHE_KEY_PATTERN.match(str(key)):
+            raise ValueError(f"잘못된 캐시 키입니다: {key}")
+
+        self.sweep()
+
+        data_path, meta_path = self._paths(key)
+        tmp_data, tmp_meta = f"{data_path}.{os.getpid()}.tmp", f"{meta_path}.{os.getpid()}.tmp"
+
+        # 임시 파일에 쓰고 rename - 메타 파일이 마지막 (존재하면 데이터도 완성된 상태)
+        df.reset_index(drop=True).to_parquet(tmp_data, index=False, compression='zstd')
+        with open(tmp_meta, 'w', encoding='utf-8') as f:
+            json.dump({**meta, 'rows': len(df), 'cached_at': pd.Timestamp.now().isoformat()},
+                      f, ensure_ascii=False)
+        os.replace(tmp_data, data_path)
+        os.replace(tmp_meta, meta_path)
+
+        logger.info(f"Upload cache stored: {key[:12]} ({len(df)} rows)")
+
+    def delete(self, key):
+        """캐시 항목 삭제"""
+        deleted = False
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+                deleted = True
+            except FileNotFoundError:
+                pass
+        return deleted
+
+    def sweep(self, force=False):
+        """
+        전체 용량 초과 시 LRU 순으로 삭제 (sweep_interval 간격으로만 실제 수행)
+
+        Returns:
+            int: 삭제된 캐시 항목 수
+        """
+        now = time.time()
+        if not force and now - self._last_sweep < self.sweep_interval:
+            return 0
+        self._last_sweep = now
+
+        entries = {}
+        try:
+            files = list(os.scandir(self.root_dir))
+        except OSError:
+            return 0
+
+        for entry in files:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+
+            if entry.name.endswith('.tmp'):
+                # 쓰기 도중 중단된 임시 파일
+                if now - stat.st_mtime > 3600:
+                    try:
+                        os.remove(entry.path)
+                    except OSError:
+                        pass
+                continue
+
+            key, _, ext = entry.name.partition('.')
+            item = entries.setdefault(key, {'size': 0, 'atime': 0.0})
+            item['size'] += stat.st_size
+            if ext == 'json':
+                item['atime'] = stat.st_mtime  # 조회 시 메타 파일 mtime 갱신
+
+        total = sum(item['size'] for item in entries.values())
+        if total <= self.max_total_bytes:
+            return 0
+
+        removed = 0
+        for key, item in sorted(entries.items(), key=lambda kv: kv[1]['atime']):
+            if total <= self.max_total_bytes:
+                break
+            if self.delete(key):
+                removed += 1
+            total -= item['size']
+
+        logger.info(f"Upload cache sweep: {removed} entries evicted (LRU)")
+        return removed
+
+
+_cache = None
+
+
+def get_upload_cache():
+    """
+    앱 설정 기반 업로드 캐시 반환 (프로세스당 1개, 비활성화 시 None)
+
+    Returns:
+        UploadCache | None: 캐시 인스턴스
+    """
+    global _cache
+
+    config = current_app.config
+    if not config.get('UPLOAD_CACHE_ENABLED', True):
+        return None
+
+    root_dir = config.get('UPLOAD_CACHE_DIR', 'data/upload_cache')
+    if _cache is None or _cache.root_dir != root_dir:
+        _cache = UploadCache(
+            root_dir,
+            max_total_bytes=config.get('UPLOAD_CACHE_MAX_MB', 512) * 1024 * 1024,
+            sweep_interval=config.get('UPLOAD_CACHE_SWEEP_INTERVAL', 300)
+        )
+    return _cache
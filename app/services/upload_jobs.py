@@ -0,0 +1,378 @@
+"""
+업로드 처리 작업 큐 (비동기 업로드)
+- 대용량 업로드를 요청 워커(gunicorn sync) 밖의 로컬 프로세스 풀에서 처리
+- 작업 상태/업로드 원본/결과를 로컬 디스크에 저장 → 어느 워커에서든 진행 상황/결과 조회 가능
+- 외부 브로커 없이 동작 (작업은 접수한 워커의 프로세스 풀에서 실행)
+- 단계: parse → normalize → metrics → insights
+"""
+
+import os
+import re
+import json
+import time
+import uuid
+import pickle
+import shutil
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+from flask import Flask, current_app
+
+logger = logging.getLogger(__name__)
+
+# job_id 형식 (uuid4 hex) - 경로 조작 방지
+JOB_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+# 작업 처리 단계 (진행률 계산 순서)
+JOB_STAGES = ['parse', 'normalize', 'metrics', 'insights']
+
+STATUS_FILE = 'status.json'
+RESULT_FILE = 'result.json'
+UPLOAD_FILE = 'upload.bin'
+
+
+def _json_default(value):
+    """numpy 스칼라/배열 및 기타 값 JSON 변환"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+class UploadJobStore:
+    """작업 디렉토리 기반 상태 저장소 (<root>/<job_id>/status.json, result.json, upload.bin)"""
+
+    def __init__(self, root_dir, ttl_seconds=3600, sweep_interval=300):
+        """
+        Args:
+            root_dir (str): 저장 디렉토리
+            ttl_seconds (int): 마지막 상태 변경 후 작업 보관 시간 (초)
+            sweep_interval (int): 만료 작업 정리 최소 간격 (초)
+        """
+        self.root_dir = root_dir
+        self.ttl_seconds = ttl_seconds
+        self.sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+        os.makedirs(root_dir, exist_ok=True)
+
+    @staticmethod
+    def is_valid_id(job_id):
+        """job_id 형식 검증"""
+        return bool(job_id) and bool(JOB_ID_PATTERN.match(str(job_id)))
+
+    def _job_dir(self, job_id):
+        return os.path.join(self.root_dir, job_id)
+
+    def upload_path(self, job_id):
+        """업로드 원본 파일 경로"""
+        return os.path.join(self._job_dir(job_id), UPLOAD_FILE)
+
+    def _write_json(self, job_id, name, data):
+        """임시 파일에 쓰고 rename (읽는 쪽에서 쓰다 만 파일을 보지 않도록)"""
+        path = os.path.join(self._job_dir(job_id), name)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, default=_json_default)
+        os.replace(tmp_path, path)
+
+    def _read_json(self, job_id, name):
+        if not self.is_valid_id(job_id):
+            return None
+        try:
+            with open(os.path.join(self._job_dir(job_id), name), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Upload job read failed: {job_id} {name} - {e}")
+            return None
+
+    def create(self, stream, meta):
+        """
+        작업 등록 (업로드 원본을 디스크에 저장하고 queued 상태로 기록)
+
+        Args:
+            stream: 업로드 파일 스트림
+            meta (dict): 작업 정보 (user_id, kind, filename, params 등 JSON 직렬화 가능 값)
+
+        Returns:
+            str: job_id
+        """
+        self.sweep()
+
+        job_id = uuid.uuid4().hex
+        os.makedirs(self._job_dir(job_id))
+
+        stream.seek(0)
+        with open(self.upload_path(job_id), 'wb') as f:
+            shutil.copyfileobj(stream, f)
+
+        now = time.time()
+        self._write_json(job_id, STATUS_FILE, {
+            **meta,
+            'job_id': job_id,
+            'status': 'queued',
+            'stage': None,
+            'progress': 0,
+            'error': None,
+            'created_at': now,
+            'updated_at': now
+        })
+        return job_id
+
+    def get_status(self, job_id):
+        """
+        작업 상태 조회
+
+        Returns:
+            dict | None: 상태 정보 (없으면 None)
+        """
+        return self._read_json(job_id, STATUS_FILE)
+
+    def get_result(self, job_id):
+        """
+        완료된 작업의 결과 조회
+
+        Returns:
+            dict | None: 결과 payload (완료 전이거나 없으면 None)
+        """
+        return self._read_json(job_id, RESULT_FILE)
+
+    def update(self, job_id, **fields):
+        """작업 상태 갱신"""
+        status = self.get_status(job_id)
+        if status is None:
+            return None
+        status.update(fields, updated_at=time.time())
+        self._write_json(job_id, STATUS_FILE, status)
+        return status
+
+    def set_stage(self, job_id, stage):
+        """처리 단계 갱신 (진행률은 단계 순서 기준)"""
+        index = JOB_STAGES.index(stage)
+        return self.update(job_id, status='running', stage=stage,
+                           progress=int(index * 100 / len(JOB_STAGES)))
+
+    def finish(self, job_id, result):
+        """결과 저장 후 완료 처리 (결과 파일이 먼저 → done 상태면 결과도 존재)"""
+        self._write_json(job_id, RESULT_FILE, result)
+        self._discard_upload(job_id)
+        return self.update(job_id, status='done', stage=None, progress=100)
+
+    def fail(self, job_id, error, status_code=500):
+        """실패 처리 (status_code: 결과 조회 시 응답 코드 - 400 형식 오류 / 413 크기 초과 / 500 처리 오류)"""
+        self._discard_upload(job_id)
+        return self.update(job_id, status='failed', error=error, status_code=status_code)
+
+    def _discard_upload(self, job_id):
+        try:
+            os.remove(self.upload_path(job_id))
+        except FileNotFoundError:
+            pass
+
+    def delete(self, job_id):
+        """작업 디렉토리 삭제"""
+        if not self.is_valid_id(job_id):
+            return False
+        shutil.rmtree(self._job_dir(job_id), ignore_errors=True)
+        return True
+
+    def sweep(self, force=False):
+        """
+        마지막 상태 변경 후 TTL이 지난 작업 삭제 (sweep_interval 간격으로만 실제 수행)
+
+        Returns:
+            int: 삭제된 작업 수
+        """
+        now = time.time()
+        if not force and now - self._last_sweep < self.sweep_interval:
+            return 0
+        self._last_sweep = now
+
+        removed = 0
+        try:
+            entries = list(os.scandir(self.root_dir))
+        except OSError:
+            return 0
+
+        for entry in entries:
+            if not entry.is_dir() or not self.is_valid_id(entry.name):
+                continue
+            try:
+                mtime = os.path.getmtime(os.path.join(entry.path, STATUS_FILE))
+            except OSError:
+                mtime = entry.stat().st_mtime
+            if now - mtime > self.ttl_seconds:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                removed += 1
+
+        if removed:
+            logger.info(f"Upload job sweep: {removed} expired jobs removed")
+        return removed
+
+
+# ========================================
+# 작업 실행 (프로세스 풀 워커)
+# ========================================
+
+_worker_app = None
+
+
+def _init_worker(config):
+    """
+    풀 워커 프로세스 초기화 - 요청 워커의 설정으로 최소 Flask 앱 컨텍스트 생성
+    (서비스의 get_xxx_store() 등이 current_app.config를 읽으므로)
+    """
+    global _worker_app
+    _worker_app = Flask('upload_jobs')
+    _worker_app.config.update(config)
+    _worker_app.app_context().push()
+
+
+def run_job(root_dir, job_id, handler, params):
+    """
+    작업 1건 실행 (풀 워커 프로세스에서 호출)
+
+    handler(source, progress=..., **params)는 결과 payload(dict)를 반환.
+    ValueError(보고서 형식 오류 등)는 메시지를 그대로 (status_code 속성이 있으면 그 코드, 없으면 400),
+    그 외 예외는 '처리 중 오류'로 기록
+
+    Args:
+        root_dir (str): 작업 저장소 디렉토리
+        job_id (str): 작업 ID
+        handler (callable): 모듈 최상위 처리 함수 (pickle 가능해야 함)
+        params (dict): handler 추가 인자
+    """
+    store = UploadJobStore(root_dir, sweep_interval=float('inf'))
+    started = time.time()
+
+    try:
+        with open(store.upload_path(job_id), 'rb') as source:
+            result = handler(source, progress=lambda stage: store.set_stage(job_id, stage), **params)
+        store.finish(job_id, result)
+        logger.info(f"Upload job done: {job_id} ({time.time() - started:.1f}s)")
+    except ValueError as e:
+        logger.warning(f"Upload job rejected: {job_id} - {e}")
+        store.fail(job_id, str(e), status_code=getattr(e, 'status_code', 400))
+    except Exception as e:
+        logger.exception(f"Upload job failed: {job_id}")
+        store.fail(job_id, f'처리 중 오류: {str(e)}')
+
+
+def _picklable_config(config):
+    """풀 워커에 전달할 설정 (대문자 키 중 pickle 가능한 값만)"""
+    result = {}
+    for key, value in config.items():
+        if not key.isupper():
+            continue
+        try:
+            pickle.dumps(value)
+        except Exception:
+            continue
+        result[key] = value
+    return result
+
+
+class UploadJobQueue:
+    """작업 저장소 + 로컬 프로세스 풀 (요청 워커 프로세스당 1개)"""
+
+    def __init__(self, store, max_workers=2, config=None):
+        """
+        Args:
+            store (UploadJobStore): 작업 상태 저장소
+            max_workers (int): 풀 워커 프로세스 수
+            config (dict): 풀 워커 앱 설정
+        """
+        self.store = store
+        self.max_workers = max_workers
+        self.config = config or {}
+        self._executor = None
+        self._pid = None
+
+    def _get_executor(self):
+        # fork된 자식(gunicorn preload 등)에서는 부모의 풀을 쓰지 않고 새로 생성
+        if self._executor is None or self._pid != os.getpid():
+            # spawn: 요청 워커의 DB 커넥션/스레드 상태를 복제하지 않음
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker,
+                initargs=(self.config,)
+            )
+            self._pid = os.getpid()
+        return self._executor
+
+    def submit(self, stream, handler, meta, params=None):
+        """
+        작업 등록 후 프로세스 풀에 제출
+
+        Args:
+            stream: 업로드 파일 스트림
+            handler (callable): 모듈 최상위 처리 함수
+            meta (dict): 작업 정보 (user_id, kind, filename 등)
+            params (dict): handler 추가 인자
+
+        Returns:
+            str: job_id
+        """
+        job_id = self.store.create(stream, meta)
+        try:
+            future = self._get_executor().submit(run_job, self.store.root_dir, job_id, handler, params or {})
+        except BrokenProcessPool:
+            # 풀 워커가 비정상 종료되면 풀 전체가 사용 불가 → 새로 생성 후 재시도
+            logger.warning('Upload job pool broken - recreating')
+            self._executor = None
+            future = self._get_executor().submit(run_job, self.store.root_dir, job_id, handler, params or {})
+        future.add_done_callback(lambda f: self._on_done(job_id, f))
+        logger.info(f"Upload job queued: {job_id} ({meta.get('kind')}, {meta.get('filename')})")
+        return job_id
+
+    def _on_done(self, job_id, future):
+        """풀 워커가 비정상 종료된 경우 (run_job 내부에서 처리하지 못한 실패)"""
+        error = future.exception()
+        if error is not None:
+            logger.error(f"Upload job worker crashed: {job_id} - {error}")
+            self.store.fail(job_id, f'처리 중 오류: {str(error)}')
+
+    def shutdown(self, wait=True):
+        """프로세스 풀 종료"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+_queue = None
+
+
+def get_upload_job_queue():
+    """
+    앱 설정 기반 업로드 작업 큐 반환 (프로세스당 1개, 비활성화 시 None)
+
+    Returns:
+        UploadJobQueue | None: 작업 큐 인스턴스
+    """
+    global _queue
+
+    config = current_app.config
+    if not config.get('UPLOAD_JOBS_ENABLED', True):
+        return None
+
+    root_dir = config.get('UPLOAD_JOB_DIR', 'data/upload_jobs')
+    if _queue is None or _queue.store.root_dir != root_dir:
+        if _queue is not None:
+            _queue.shutdown(wait=False)
+        store = UploadJobStore(
+            root_dir,
+            ttl_seconds=config.get('UPLOAD_JOB_TTL_SECONDS', 3600),
+            sweep_interval=config.get('UPLOAD_JOB_SWEEP_INTERVAL', 300)
+        )
+        _queue = UploadJobQueue(
+            store,
+            max_workers=config.get('UPLOAD_JOB_WORKERS', 2),
+            config=_picklable_config(config)
+        )
+    return _queue
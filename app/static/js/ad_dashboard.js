@@ -3,6 +3,7 @@ let currentSnapshotId = null;
 let currentMetrics = null;
 let trendChart = null;
 let manualDataBuffer = [];
+let insightsPollTimer = null;
 
 // 페이지 로드 시 실행
 document.addEventListener('DOMContentLoaded', function() {
@@ -109,6 +110,7 @@ async function uploadFile(file) {
                 displayChart(result.metrics.daily_trend);
                 displayCampaigns(result.metrics.campaigns);
                 displayInsights(result.insights);
+                pollInsights(result.insights_id, result.insights_status);
             }, 150);
 
             alert('✅ 분석 완료!');
@@ -324,6 +326,29 @@ function displayInsights(insights) {
     document.getElementById('aiInsights').textContent = insights;
 }
 
+// 백그라운드 AI 인사이트 완료 시 교체 (생성 중에는 기본 인사이트 표시)
+function pollInsights(insightsId, status, attempt = 0) {
+    clearTimeout(insightsPollTimer);
+    if (!insightsId || status !== 'pending' || attempt >= 40) return;
+
+    insightsPollTimer = setTimeout(async () => {
+        try {
+            const response = await fetch(`/api/ad-analysis/insights/${insightsId}`, {
+                credentials: 'same-origin'
+            });
+            const data = await response.json();
+
+            if (data.status === 'done') {
+                displayInsights(data.insights);
+            } else if (response.status === 202) {
+                pollInsights(insightsId, 'pending', attempt + 1);
+            }
+        } catch (error) {
+            console.error('Insights poll error:', error);
+        }
+    }, 3000);
+}
+
 // 분석 저장
 function saveCurrentAnalysis() {
     if (!currentSnapshotId) {
@@ -374,23 +399,12 @@ async function confirmSave() {
     }
 }
 
-// 저장된 분석 목록 로드
-async function loadSnapshots() {
-    try {
-        const response = await fetch('/api/ad-analysis/snapshots?saved_only=true', {
-            credentials: 'same-origin'
-        });
+// 저장된 분석 목록 (페이지 단위로 누적)
+let loadedSnapshots = [];
+let snapshotCursor = null;
 
-        const result = await response.json();
-        const snapshots = result.snapshots;
-
-        // 목록 표시
-        const listContainer = document.getElementById('snapshotList');
-
-        if (snapshots.length === 0) {
-            listContainer.innerHTML = '<p style="text-align:center; color:#7f8c8d;">저장된 분석이 없습니다.</p>';
-        } else {
-            listContainer.innerHTML = snapshots.map(s => `
+function renderSnapshotItem(s) {
+    return `
                 <div class="snapshot-item">
                     <div class="snapshot-info">
                         <h4>${s.snapshot_name}</h4>
@@ -402,11 +416,36 @@ async function loadSnapshots() {
                         <button class="btn btn-danger" onclick="deleteSnapshot(${s.id})">삭제</button>
                     </div>
                 </div>
-            `).join('');
+            `;
+}
+
+// 저장된 분석 목록 로드 (append=true면 다음 페이지를 이어서 표시)
+async function loadSnapshots(append = false) {
+    try {
+        const params = new URLSearchParams({ saved_only: 'true' });
+        if (append && snapshotCursor) params.set('cursor', snapshotCursor);
+
+        const response = await fetch(`/api/ad-analysis/snapshots?${params}`, {
+            credentials: 'same-origin'
+        });
+
+        const result = await response.json();
+        loadedSnapshots = append ? loadedSnapshots.concat(result.snapshots) : result.snapshots;
+        snapshotCursor = result.next_cursor;
+
+        // 목록 표시
+        const listContainer = document.getElementById('snapshotList');
+
+        if (loadedSnapshots.length === 0) {
+            listContainer.innerHTML = '<p style="text-align:center; color:#7f8c8d;">저장된 분석이 없습니다.</p>';
+        } else {
+            listContainer.innerHTML = loadedSnapshots.map(renderSnapshotItem).join('') + (snapshotCursor
+                ? '<div style="text-align:center; margin-top:10px;"><button class="btn btn-secondary" onclick="loadSnapshots(true)">더 보기</button></div>'
+                : '');
         }
 
         // 비교 셀렉트박스 업데이트
-        updateCompareSelects(snapshots);
+        updateCompareSelects(loadedSnapshots);
 
     } catch (error) {
         console.error('Load snapshots error:', error);
@@ -434,6 +473,7 @@ async function loadSnapshot(snapshotId) {
             displayChart(data.metrics.daily_trend);
             displayCampaigns(data.metrics.campaigns);
             displayInsights(data.insights);
+            pollInsights(data.insights_id, data.insights_status);
         }, 150);
 
     } catch (error) {
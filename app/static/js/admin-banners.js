@@ -176,7 +176,7 @@ async function updateBannerOrder() {
     const orderList = Array.from(items).map(item => parseInt(item.dataset.id));
 
     try {
-        await fetch('/admin/api/banners/reorder', {
+        const response = await fetch('/admin/api/banners/reorder', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
             credentials: 'same-origin',
@@ -185,6 +185,12 @@ async function updateBannerOrder() {
                 order_list: orderList
             })
         });
+        const data = await response.json();
+        if (!data.success) {
+            // 다른 관리자가 배너를 추가/삭제한 경우 등 → 목록 다시 불러오기
+            alert(data.message || '순서 변경 실패');
+            loadBanners(currentBannerType);
+        }
     } catch (error) {
         alert('순서 변경 실패');
     }
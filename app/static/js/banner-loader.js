@@ -39,6 +39,37 @@ async function loadBanners(bannerType, containerId) {
     }
 }
 
+/**
+ * 여러 배너 영역을 한 번의 요청으로 로드
+ * 응답에 ETag/Cache-Control이 있어 재방문 시 브라우저 캐시 또는 304로 처리됨
+ * @param {Array<[string, string]>} slots - [[bannerType, containerId], ...]
+ */
+async function loadBannerGroup(slots) {
+    const present = slots.filter(([, containerId]) => document.getElementById(containerId));
+    if (present.length === 0) return;
+
+    try {
+        const types = present.map(([bannerType]) => bannerType).join(',');
+        const response = await fetch(`/api/banners?types=${encodeURIComponent(types)}`, {
+            credentials: 'same-origin'
+        });
+        const data = await response.json();
+        if (!data.success) return;
+
+        present.forEach(([bannerType, containerId]) => {
+            const banners = data.banners[bannerType] || [];
+            if (banners.length > 0) {
+                displayBanners(banners, containerId, bannerType);
+                trackImpressions(banners);
+            } else {
+                document.getElementById(containerId).style.display = 'none';
+            }
+        });
+    } catch (error) {
+        console.error('Banner load error:', error);
+    }
+}
+
 function displayBanners(banners, containerId, bannerType) {
     const container = document.getElementById(containerId);
     if (!container) return;
@@ -92,65 +123,113 @@ function displayLargeBanner(banner, container) {
         return;
     }
 
-    // 모바일이면 모바일 이미지, 아니면 데스크톱 이미지 사용
-    const imageUrl = isMobile() && banner.mobile_image_url
-        ? banner.mobile_image_url
-        : banner.image_url;
-
     container.innerHTML = `
         <a href="${banner.link_url || '#'}"
            target="_blank"
            rel="noopener noreferrer"
            onclick="trackClick(${banner.id})"
            class="banner-link">
-            <img src="${imageUrl}"
-                 alt="${banner.title}"
-                 class="banner-image"
-                 loading="lazy">
+            ${bannerImage(banner, 'class="banner-image" loading="lazy"')}
         </a>
     `;
     container.style.display = 'block';
 }
 
+/**
+ * 배너 이미지 HTML 생성
+ * 모바일이면 모바일 이미지, 아니면 데스크톱 이미지 사용
+ * 변환본(image_variants)이 있으면 WebP + JPEG/PNG 1x/2x srcset, 없으면 원본
+ */
+function bannerImage(banner, attrs) {
+    const useMobile = isMobile() && banner.mobile_image_url;
+    const imageUrl = useMobile ? banner.mobile_image_url : banner.image_url;
+    const variants = banner.image_variants && banner.image_variants[useMobile ? 'mobile' : 'desktop'];
+
+    if (!variants) {
+        return `<img src="${imageUrl}" alt="${banner.title}" ${attrs}>`;
+    }
+
+    const srcset = urls => Object.entries(urls).map(([density, url]) => `${url} ${density}`).join(', ');
+    return `
+        <picture class="banner-picture">
+            <source type="image/webp" srcset="${srcset(variants.webp)}">
+            <img src="${variants.fallback['1x']}" srcset="${srcset(variants.fallback)}" alt="${banner.title}" ${attrs}>
+        </picture>
+    `;
+}
+
 /**
  * 그리드 배너 HTML 생성
  * 모바일이면 mobile_image_url 사용 (이미 필터링됨)
  */
 function createGridBanner(banner) {
-    // 모바일이면 모바일 이미지 사용
-    const imageUrl = isMobile() && banner.mobile_image_url
-        ? banner.mobile_image_url
-        : banner.image_url;
-
     return `
         <a href="${banner.link_url || '#'}"
            target="_blank"
            rel="noopener noreferrer"
            onclick="trackClick(${banner.id})"
            class="grid-banner-item">
-            <img src="${imageUrl}"
-                 alt="${banner.title}"
-                 loading="lazy">
+            ${bannerImage(banner, 'loading="lazy"')}
         </a>
     `;
 }
 
-function trackImpressions(banners) {
-    banners.forEach(banner => {
-        fetch(`/api/banners/${banner.id}/impression`, {
-            method: 'POST',
-            credentials: 'same-origin'
-        }).catch(() => {});
-    });
+// 노출/클릭 이벤트 큐 (페이지당 1회 beacon으로 일괄 전송)
+const BANNER_EVENTS_URL = '/api/banners/events';
+const BANNER_EVENTS_MAX = 200;        // 서버 BANNER_EVENT_BATCH_MAX와 동일
+const BANNER_EVENTS_DELAY = 3000;     // 여러 배너 영역 로드를 모아서 전송
+let bannerEventQueue = [];
+let bannerEventTimer = null;
+
+function queueBannerEvent(bannerId, eventType) {
+    bannerEventQueue.push({ banner_id: bannerId, event_type: eventType, ts: Date.now() });
+
+    if (bannerEventQueue.length >= BANNER_EVENTS_MAX) {
+        flushBannerEvents();
+    } else if (!bannerEventTimer) {
+        bannerEventTimer = setTimeout(flushBannerEvents, BANNER_EVENTS_DELAY);
+    }
 }
 
-function trackClick(bannerId) {
-    fetch(`/api/banners/${bannerId}/click`, {
+function flushBannerEvents() {
+    clearTimeout(bannerEventTimer);
+    bannerEventTimer = null;
+    if (bannerEventQueue.length === 0) return;
+
+    const events = bannerEventQueue.splice(0, BANNER_EVENTS_MAX);
+    const body = JSON.stringify({ events });
+
+    // sendBeacon은 페이지 이탈/새 탭 이동 중에도 전송 보장
+    if (navigator.sendBeacon && navigator.sendBeacon(BANNER_EVENTS_URL, new Blob([body], { type: 'application/json' }))) {
+        return;
+    }
+    fetch(BANNER_EVENTS_URL, {
         method: 'POST',
-        credentials: 'same-origin'
+        credentials: 'same-origin',
+        headers: { 'Content-Type': 'application/json' },
+        body,
+        keepalive: true
     }).catch(() => {});
 }
 
+function trackImpressions(banners) {
+    banners.forEach(banner => queueBannerEvent(banner.id, 'impression'));
+}
+
+function trackClick(bannerId) {
+    queueBannerEvent(bannerId, 'click');
+    // 클릭은 이탈 직전일 수 있으므로 대기 중인 노출과 함께 즉시 전송
+    flushBannerEvents();
+}
+
+// 탭 전환/페이지 이탈 시 남은 이벤트 전송
+document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') {
+        flushBannerEvents();
+    }
+});
+window.addEventListener('pagehide', flushBannerEvents);
+
 /**
  * 롤링 배너 표시 (일반/쿠팡 대시보드)
  * 모바일에서 mobile_image_url이 없는 배너는 숨김
@@ -174,9 +253,6 @@ function displayRollingBanner(banners, container, containerId) {
     // 1개만 있으면 롤링 없이 표시
     if (filteredBanners.length === 1) {
         const banner = filteredBanners[0];
-        const imageUrl = isMobile() && banner.mobile_image_url
-            ? banner.mobile_image_url
-            : banner.image_url;
 
         container.innerHTML = `
             <div class="rolling-banner-container">
@@ -186,9 +262,7 @@ function displayRollingBanner(banners, container, containerId) {
                            target="_blank"
                            rel="noopener noreferrer"
                            onclick="trackClick(${banner.id})">
-                            <img src="${imageUrl}"
-                                 alt="${banner.title}"
-                                 loading="lazy">
+                            ${bannerImage(banner, 'loading="lazy"')}
                         </a>
                     </div>
                 </div>
@@ -201,19 +275,13 @@ function displayRollingBanner(banners, container, containerId) {
     // 롤링 배너 HTML 생성 (모바일이면 모바일 이미지 사용)
     const bannersHTML = filteredBanners
         .map((banner, index) => {
-            const imageUrl = isMobile() && banner.mobile_image_url
-                ? banner.mobile_image_url
-                : banner.image_url;
-
             return `
                 <div class="rolling-banner-item ${index === 0 ? 'active' : ''}" data-index="${index}">
                     <a href="${banner.link_url || '#'}"
                        target="_blank"
                        rel="noopener noreferrer"
                        onclick="trackClick(${banner.id})">
-                        <img src="${imageUrl}"
-                             alt="${banner.title}"
-                             loading="${index === 0 ? 'eager' : 'lazy'}">
+                        ${bannerImage(banner, `loading="${index === 0 ? 'eager' : 'lazy'}"`)}
                     </a>
                 </div>
             `;
@@ -372,57 +440,30 @@ function resumeRolling(containerId) {
     state.isPaused = false;
 }
 
-// 페이지 로드 시 자동 실행 - home_dashboard.html용
-if (document.getElementById('homeTopBanner')) {
-    loadBanners('home_top', 'homeTopBanner');
-}
-if (document.getElementById('homeGridBanners')) {
-    loadBanners('home_grid', 'homeGridBanners');
-}
-if (document.getElementById('homeBottomBanner')) {
-    loadBanners('home_bottom', 'homeBottomBanner');
-}
-
-// ad_dashboard_v2.html용
-if (document.getElementById('generalGridBanners')) {
-    loadBanners('grid_general', 'generalGridBanners');
-}
-
-// ad_dashboard_coupang.html용
-if (document.getElementById('coupangGridBanners')) {
-    loadBanners('grid_coupang', 'coupangGridBanners');
-}
-
-// profit_simulator.html (순마진계산기)용
-if (document.getElementById('profitBanners')) {
-    loadBanners('grid_profit', 'profitBanners');
-}
-
-// ad_efficiency.html (손익분기ROAS)용
-if (document.getElementById('efficiencyBanners')) {
-    loadBanners('grid_efficiency', 'efficiencyBanners');
-}
-
-// keyword_combiner.html (키워드조합기)용
-if (document.getElementById('keywordBanners')) {
-    loadBanners('grid_keyword', 'keywordBanners');
-}
-
-// 화면 리사이즈 시 배너 다시 로드 (debounce 적용)
+// 페이지별 배너 영역 (페이지에 있는 영역만 한 번의 요청으로 로드)
+const HOME_BANNER_SLOTS = [
+    ['home_top', 'homeTopBanner'],          // home_dashboard.html
+    ['home_grid', 'homeGridBanners'],
+    ['home_bottom', 'homeBottomBanner']
+];
+const PAGE_BANNER_SLOTS = [
+    ...HOME_BANNER_SLOTS,
+    ['grid_general', 'generalGridBanners'], // ad_dashboard_v2.html
+    ['grid_coupang', 'coupangGridBanners'], // ad_dashboard_coupang.html
+    ['grid_profit', 'profitBanners'],       // profit_simulator.html (순마진계산기)
+    ['grid_efficiency', 'efficiencyBanners'], // ad_efficiency.html (손익분기ROAS)
+    ['grid_keyword', 'keywordBanners']      // keyword_combiner.html (키워드조합기)
+];
+
+// 페이지 로드 시 자동 실행
+loadBannerGroup(PAGE_BANNER_SLOTS);
+
+// 화면 리사이즈 시 홈 대시보드 배너 다시 로드 (debounce 적용, 브라우저 캐시/304로 처리)
 let resizeTimeout;
 window.addEventListener('resize', () => {
     clearTimeout(resizeTimeout);
     resizeTimeout = setTimeout(() => {
-        // 홈 대시보드 배너 다시 로드
-        if (document.getElementById('homeTopBanner')) {
-            loadBanners('home_top', 'homeTopBanner');
-        }
-        if (document.getElementById('homeGridBanners')) {
-            loadBanners('home_grid', 'homeGridBanners');
-        }
-        if (document.getElementById('homeBottomBanner')) {
-            loadBanners('home_bottom', 'homeBottomBanner');
-        }
+        loadBannerGroup(HOME_BANNER_SLOTS);
     }, 250);
 });
 
@@ -3,12 +3,13 @@
 # ========================================
 # 유틸리티 함수 모음
 
-from .db_utils import get_db_connection, execute_query, execute_many
+from .db_utils import get_db_connection, get_pool_status, execute_query, execute_many
 from .helpers import allowed_file, format_currency, format_percentage, clean_filename
 
 __all__ = [
     # DB Utils
     'get_db_connection',
+    'get_pool_status',
     'execute_query',
     'execute_many',
 
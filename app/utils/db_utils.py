@@ -5,6 +5,9 @@
 - 트랜잭션 관리
 """
 
+import os
+import time
+import threading
 import pymysql
 from pymysql.cursors import DictCursor
 from contextlib import contextmanager
@@ -19,9 +22,32 @@ class DatabaseError(Exception):
     pass
 
 
+class PoolExhaustedError(DatabaseError):
+    """커넥션 풀 고갈 (pool_size + max_overflow 모두 사용 중, timeout 초과)"""
+    pass
+
+
+def _connection_params(config):
+    """설정 객체에서 PyMySQL 연결 파라미터 추출"""
+    return dict(
+        host=config['DB_HOST'],
+        port=config['DB_PORT'],
+        user=config['DB_USER'],
+        password=config['DB_PASSWORD'],
+        database=config['DB_NAME'],
+        charset='utf8mb4',
+        cursorclass=DictCursor,
+        autocommit=False,  # 명시적 트랜잭션 관리
+        local_infile=config.get('DB_LOCAL_INFILE', False)  # LOAD DATA LOCAL INFILE (일별 데이터 일괄 적재)
+    )
+
+
 def get_db_connection():
     """
-    데이터베이스 연결 생성
+    데이터베이스 연결 생성 (풀을 거치지 않는 단독 연결)
+
+    init_db.py 같은 스크립트용. 요청 처리 경로는 get_db_cursor()/transaction()을
+    사용하면 커넥션 풀에서 연결을 빌려 쓴다.
 
     Returns:
         pymysql.Connection: 데이터베이스 연결 객체
@@ -30,22 +56,274 @@ def get_db_connection():
         DatabaseError: 연결 실패 시
     """
     try:
-        connection = pymysql.connect(
-            host=current_app.config['DB_HOST'],
-            port=current_app.config['DB_PORT'],
-            user=current_app.config['DB_USER'],
-            password=current_app.config['DB_PASSWORD'],
-            database=current_app.config['DB_NAME'],
-            charset='utf8mb4',
-            cursorclass=DictCursor,
-            autocommit=False  # 명시적 트랜잭션 관리
-        )
+        connection = pymysql.connect(**_connection_params(current_app.config))
         return connection
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
         raise DatabaseError(f"데이터베이스 연결 실패: {str(e)}")
 
 
+class ConnectionPool:
+    """
+    PyMySQL 커넥션 풀 (워커 프로세스 단위)
+
+    - pool_size: 유휴 상태로 유지할 최대 커넥션 수
+    - max_overflow: pool_size를 넘어 임시로 열 수 있는 커넥션 수 (반납 시 닫힘)
+    - timeout: 풀이 고갈됐을 때 반납을 기다리는 최대 시간 (초)
+    - recycle: 커넥션 최대 수명 (초), 초과 시 대여 시점에 새로 연결
+    - pre_ping: 대여 시 ping으로 생존 여부 확인 (wait_timeout으로 끊긴 연결 제거)
+    """
+
+    def __init__(self, creator, pool_size=10, max_overflow=20, timeout=30,
+                 recycle=3600, pre_ping=True):
+        """
+        Args:
+            creator (callable): 새 커넥션을 반환하는 함수
+            pool_size (int): 유휴 커넥션 최대 수
+            max_overflow (int): 추가 허용 커넥션 수
+            timeout (float): 고갈 시 대기 시간 (초)
+            recycle (int): 커넥션 최대 수명 (초, 0 이하면 재활용 안 함)
+            pre_ping (bool): 대여 시 ping 여부
+        """
+        self.pid = os.getpid()
+        self.pool_size = max(int(pool_size), 1)
+        self.max_overflow = max(int(max_overflow), 0)
+        self.timeout = float(timeout)
+        self.recycle = int(recycle)
+        self.pre_ping = pre_ping
+
+        self._creator = creator
+        self._idle = []  # LIFO - 최근에 쓴 커넥션부터 재사용
+        self._num_open = 0
+        self._checked_out = 0
+        self._cond = threading.Condition(threading.Lock())
+
+        self._stats = {
+            'checkouts': 0,
+            'connects': 0,
+            'recycled': 0,
+            'ping_failures': 0,
+            'waits': 0,
+            'exhausted': 0,
+            'peak_checked_out': 0,
+            'wait_time_ms': 0.0
+        }
+
+    def _connect(self):
+        """새 커넥션 생성 (생성 시각 기록)"""
+        conn = self._creator()
+        conn._pool_born_at = time.monotonic()
+        with self._cond:
+            self._stats['connects'] += 1
+        return conn
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _validate(self, conn):
+        """대여 직전 커넥션 검증 - 수명 초과/끊긴 연결은 새 연결로 교체"""
+        born_at = getattr(conn, '_pool_born_at', 0)
+
+        if self.recycle > 0 and time.monotonic() - born_at > self.recycle:
+            self._close_quietly(conn)
+            with self._cond:
+                self._stats['recycled'] += 1
+            return self._connect()
+
+        if self.pre_ping:
+            try:
+                conn.ping(reconnect=False)
+            except Exception as e:
+                logger.warning(f"Pooled connection ping failed, reconnecting: {e}")
+                self._close_quietly(conn)
+                with self._cond:
+                    self._stats['ping_failures'] += 1
+                return self._connect()
+
+        return conn
+
+    def acquire(self):
+        """
+        커넥션 대여
+
+        Returns:
+            pymysql.Connection: 검증된 커넥션
+
+        Raises:
+            PoolExhaustedError: timeout 내에 커넥션을 얻지 못한 경우
+            DatabaseError: 새 연결 생성 실패 시
+        """
+        conn = None
+        waited = False
+        started = time.monotonic()
+        deadline = started + self.timeout
+
+        with self._cond:
+            while True:
+                if self._idle:
+                    conn = self._idle.pop()
+                    break
+                if self._num_open < self.pool_size + self.max_overflow:
+                    # 슬롯만 먼저 확보하고 실제 연결은 락 밖에서 생성
+                    self._num_open += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats['exhausted'] += 1
+                    logger.error(
+                        f"Connection pool exhausted: open={self._num_open}, "
+                        f"pool_size={self.pool_size}, max_overflow={self.max_overflow}"
+                    )
+                    raise PoolExhaustedError(
+                        f"커넥션 풀 고갈: {self.timeout}초 동안 사용 가능한 연결이 없습니다"
+                    )
+                if not waited:
+                    self._stats['waits'] += 1
+                    waited = True
+                self._cond.wait(remaining)
+
+            self._checked_out += 1
+            self._stats['checkouts'] += 1
+            self._stats['peak_checked_out'] = max(self._stats['peak_checked_out'], self._checked_out)
+            if waited:
+                self._stats['wait_time_ms'] += (time.monotonic() - started) * 1000
+
+        try:
+            return self._connect() if conn is None else self._validate(conn)
+        except Exception as e:
+            with self._cond:
+                self._num_open -= 1
+                self._checked_out -= 1
+                self._cond.notify()
+            logger.error(f"Database connection failed: {e}")
+            raise DatabaseError(f"데이터베이스 연결 실패: {str(e)}")
+
+    def release(self, conn, reset=True):
+        """
+        커넥션 반납
+
+        Args:
+            conn (pymysql.Connection): 대여했던 커넥션
+            reset (bool): True면 ROLLBACK으로 열린 트랜잭션/스냅샷 정리
+                (commit 직후라면 False로 왕복 1회 생략)
+        """
+        keep = conn.open
+        if keep and reset:
+            try:
+                conn.rollback()
+            except Exception:
+                keep = False
+
+        with self._cond:
+            self._checked_out -= 1
+            if keep and len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                conn = None
+            else:
+                self._num_open -= 1
+            self._cond.notify()
+
+        # overflow 커넥션이거나 끊긴 커넥션은 닫기
+        if conn is not None:
+            self._close_quietly(conn)
+
+    def dispose(self):
+        """유휴 커넥션 전부 닫기 (워커 종료 시)"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._num_open -= len(idle)
+        for conn in idle:
+            self._close_quietly(conn)
+        logger.info(f"Connection pool disposed: {len(idle)} idle connections closed")
+
+    def status(self):
+        """
+        풀 상태 및 누적 지표
+
+        Returns:
+            dict: open/idle/checked_out/overflow 및 checkouts, exhausted 등 누적 카운터
+        """
+        with self._cond:
+            return {
+                'pid': self.pid,
+                'pool_size': self.pool_size,
+                'max_overflow': self.max_overflow,
+                'open': self._num_open,
+                'idle': len(self._idle),
+                'checked_out': self._checked_out,
+                'overflow': max(self._num_open - self.pool_size, 0),
+                **self._stats,
+                'wait_time_ms': round(self._stats['wait_time_ms'], 2)
+            }
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """
+    현재 워커 프로세스의 커넥션 풀 반환 (최초 호출 시 생성)
+
+    gunicorn fork 이후 부모 프로세스의 소켓을 공유하지 않도록 pid가 바뀌면 새로 만든다.
+
+    Returns:
+        ConnectionPool: 커넥션 풀
+    """
+    global _pool
+
+    pool = _pool
+    if pool is not None and pool.pid == os.getpid():
+        return pool
+
+    with _pool_lock:
+        if _pool is None or _pool.pid != os.getpid():
+            config = current_app.config
+            params = _connection_params(config)
+            _pool = ConnectionPool(
+                creator=lambda: pymysql.connect(**params),
+                pool_size=config.get('DB_POOL_SIZE', 10),
+                max_overflow=config.get('DB_MAX_OVERFLOW', 20),
+                timeout=config.get('DB_POOL_TIMEOUT', 30),
+                recycle=config.get('DB_POOL_RECYCLE', 3600),
+                pre_ping=config.get('DB_POOL_PRE_PING', True)
+            )
+            logger.info(
+                f"Connection pool created (pid={_pool.pid}, "
+                f"pool_size={_pool.pool_size}, max_overflow={_pool.max_overflow})"
+            )
+        return _pool
+
+
+def get_pool_status():
+    """
+    커넥션 풀 상태 조회 (모니터링용)
+
+    Returns:
+        dict: 풀 상태 (풀이 아직 생성되지 않았으면 {'initialized': False})
+    """
+    pool = _pool
+    if pool is None or pool.pid != os.getpid():
+        return {'initialized': False}
+    return {'initialized': True, **pool.status()}
+
+
+def dispose_pool():
+    """현재 워커의 커넥션 풀 정리 (gunicorn worker_exit 훅에서 호출)"""
+    global _pool
+
+    with _pool_lock:
+        pool, _pool = _pool, None
+
+    if pool is not None and pool.pid == os.getpid():
+        pool.dispose()
+
+
 @contextmanager
 def get_db_cursor(commit=False):
     """
@@ -62,22 +340,27 @@ def get_db_cursor(commit=False):
         with get_db_cursor(commit=True) as cursor:
             cursor.execute("INSERT INTO table VALUES (%s)", (value,))
     """
+    pool = get_pool()
     connection = None
     cursor = None
+    committed = False
 
     try:
-        connection = get_db_connection()
+        connection = pool.acquire()
         cursor = connection.cursor()
 
         yield cursor
 
         if commit:
             connection.commit()
+            committed = True
             logger.debug("Transaction committed")
 
+    except PoolExhaustedError:
+        raise
+
     except Exception as e:
         if connection:
-            connection.rollback()
             logger.error(f"Transaction rolled back: {e}")
         raise DatabaseError(f"쿼리 실행 실패: {str(e)}")
 
@@ -85,7 +368,8 @@ def get_db_cursor(commit=False):
         if cursor:
             cursor.close()
         if connection:
-            connection.close()
+            # 커밋하지 않은 경우 반납 시 ROLLBACK
+            pool.release(connection, reset=not committed)
 
 
 def execute_query(sql, params=None, fetch_one=False, fetch_all=True):
@@ -208,12 +492,12 @@ def execute_many(sql, params_list):
         int: 영향받은 총 행의 개수
 
     Example:
-        # 일별 데이터 배치 삽입
-        sql = "INSERT INTO ad_daily_data (snapshot_id, date, spend) VALUES (%s, %s, %s)"
+        # 일별 팩트 배치 삽입
+        sql = "INSERT INTO ad_daily_facts (user_id, date, campaign_name, spend) VALUES (%s, %s, %s, %s)"
         params = [
-            (snapshot_id, '2024-11-01', 150000),
-            (snapshot_id, '2024-11-02', 160000),
-            (snapshot_id, '2024-11-03', 170000)
+            (user_id, '2024-11-01', '검색_브랜드', 150000),
+            (user_id, '2024-11-02', '검색_브랜드', 160000),
+            (user_id, '2024-11-03', '검색_브랜드', 170000)
         ]
         execute_many(sql, params)
     """
@@ -294,21 +578,26 @@ def transaction():
             cursor.execute("UPDATE table2 ...")
             # 자동 커밋
     """
+    pool = get_pool()
     connection = None
     cursor = None
+    committed = False
 
     try:
-        connection = get_db_connection()
+        connection = pool.acquire()
         cursor = connection.cursor()
 
         yield cursor
 
         connection.commit()
+        committed = True
         logger.debug("Transaction committed successfully")
 
+    except PoolExhaustedError:
+        raise
+
     except Exception as e:
         if connection:
-            connection.rollback()
             logger.error(f"Transaction rolled back due to error: {e}")
         raise DatabaseError(f"트랜잭션 실패: {str(e)}")
 
@@ -316,7 +605,7 @@ def transaction():
         if cursor:
             cursor.close()
         if connection:
-            connection.close()
+            pool.release(connection, reset=not committed)
 
 
 def init_database():
@@ -331,7 +620,11 @@ def init_database():
     required_tables = [
         'users',
         'ad_analysis_snapshots',
-        'ad_daily_data',
+        'ad_daily_facts',
+        'ad_daily_fact_versions',
+        'ad_metrics_daily',
+        'ad_metrics_weekly',
+        'ad_metrics_monthly',
         'ad_campaign_memos',
         'ad_monthly_goals'
     ]
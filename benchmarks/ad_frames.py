@@ -0,0 +1,67 @@
+"""
+벤치마크/테스트용 광고 분석 데이터 생성
+- make_daily_frame: save_snapshot 입력 형식의 일별/캠페인별 광고 데이터
+- legacy_daily_records: 기존 save_snapshot의 행 단위(iterrows) 변환 (비교 기준)
+- make_campaigns: metrics_summary['campaigns'] 형식의 캠페인 목록
+- full_sort_diff: 캠페인 증감 전체 외부 조인 후 정렬 (diff_campaigns 비교 기준)
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def make_daily_frame(rows, seed=0, campaigns=50):
+    """테스트/벤치마크용 광고 일별 데이터 (save_snapshot 입력 형식)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.Timestamp('2026-01-01') + pd.to_timedelta(rng.integers(0, 365, rows), unit='D')
+    return pd.DataFrame({
+        'date': dates.strftime('%Y-%m-%d'),
+        'campaign_name': [f'캠페인_{i}' for i in rng.integers(0, campaigns, rows)],
+        'spend': rng.uniform(1000, 500000, rows).round(2),
+        'impressions': rng.integers(0, 100000, rows),
+        'clicks': rng.integers(0, 5000, rows),
+        'conversions': rng.integers(0, 300, rows),
+        'revenue': rng.uniform(0, 2000000, rows).round(2),
+    })
+
+
+def legacy_daily_records(df, snapshot_id):
+    """기존 save_snapshot의 행 단위 변환 (비교 기준)"""
+    df = df.copy()
+    df['date'] = pd.to_datetime(df['date']).dt.date
+    records = []
+    for _, row in df.iterrows():
+        records.append((
+            snapshot_id,
+            row['date'],
+            row['campaign_name'],
+            float(row['spend']),
+            int(row.get('impressions', 0)),
+            int(row['clicks']),
+            int(row['conversions']),
+            float(row['revenue'])
+        ))
+    return records
+
+
+def make_campaigns(count, seed=0, offset=0):
+    """테스트/벤치마크용 metrics_summary['campaigns'] (캠페인명 campaign_{offset}..)"""
+    rng = np.random.default_rng(seed)
+    spend = rng.uniform(0, 500000, count).round(2)
+    revenue = (spend * rng.uniform(0, 6, count)).round(2)
+    return [
+        {'campaign_name': f'campaign_{offset + i}', 'spend': float(spend[i]), 'revenue': float(revenue[i])}
+        for i in range(count)
+    ]
+
+
+def full_sort_diff(campaigns_a, campaigns_b, top_k, key='revenue'):
+    """전체 외부 조인 후 정렬 (비교 기준)"""
+    a = pd.DataFrame(campaigns_a).set_index('campaign_name')[['spend', 'revenue']]
+    b = pd.DataFrame(campaigns_b).set_index('campaign_name')[['spend', 'revenue']]
+    delta = a.sub(b, fill_value=0)[key].rename('delta').reset_index()
+    ordered = delta.sort_values(['delta', 'campaign_name'], ascending=[False, True])
+    gainers = ordered[ordered['delta'] > 0]['campaign_name'].head(top_k).tolist()
+    ordered = delta.sort_values(['delta', 'campaign_name'])
+    losers = ordered[ordered['delta'] < 0]['campaign_name'].head(top_k).tolist()
+    return gainers, losers
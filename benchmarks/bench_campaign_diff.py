@@ -0,0 +1,47 @@
+"""
+두 스냅샷 캠페인별 증감 벤치마크 (1k / 5k / 50k 캠페인)
+- 해시 조인 + 힙 상위 K 선택(diff_campaigns) vs 전체 외부 조인 후 정렬
+- 메모리의 metrics_summary['campaigns']만 사용 (DB 조회 시간 제외)
+
+실행:
+    python -m benchmarks.bench_campaign_diff
+    python -m benchmarks.bench_campaign_diff --sizes 5000 --top 20 --repeat 5
+"""
+
+import argparse
+import time
+
+from app.services.ad_compare import diff_campaigns
+from benchmarks.ad_frames import make_campaigns, full_sort_diff
+
+
+def _best_of(func, repeat):
+    """repeat회 실행 중 최소 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='캠페인별 증감 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 5_000, 50_000])
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'campaigns':>10} {'full sort(ms)':>14} {'heap(ms)':>9} {'speedup':>9}")
+    for size in args.sizes:
+        # 이전 스냅샷 대비 2% 캠페인이 종료/신규
+        campaigns_b = make_campaigns(size, seed=1)
+        campaigns_a = make_campaigns(size, seed=2, offset=size // 50)
+
+        full = _best_of(lambda: full_sort_diff(campaigns_a, campaigns_b, args.top), args.repeat)
+        heap = _best_of(lambda: diff_campaigns(campaigns_a, campaigns_b, args.top), args.repeat)
+        print(f"{size:>10,} {full * 1000:>14.1f} {heap * 1000:>9.1f} {full / heap:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""
+쿠팡 보고서 가공 벤치마크
+- 기존 마스크별 합산 + 2차 groupby + 행 단위 ROAS 문자열 변환 vs 단일 groupby 집계 (10k / 100k / 1M행)
+
+실행:
+    python -m benchmarks.bench_coupang_report
+    python -m benchmarks.bench_coupang_report --sizes 10000 100000 --repeat 5
+"""
+
+import argparse
+import time
+
+from app.services.coupang_report import process_coupang_report
+from benchmarks.coupang_reports import make_report_frame, legacy_process
+
+
+def _best_of(func, repeat):
+    """repeat회 실행 중 최소 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='쿠팡 보고서 가공 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'keywords':>9} {'legacy(s)':>10} {'groupby(s)':>11} {'speedup':>9}")
+    for size in args.sizes:
+        report = make_report_frame(size, seed=42)
+
+        grouped = _best_of(lambda: process_coupang_report(report.copy()), args.repeat)
+        legacy = _best_of(lambda: legacy_process(report.copy()), args.repeat)
+        keywords = len(process_coupang_report(report.copy())['df'])
+        print(f"{size:>10,} {keywords:>9,} {legacy:>10.4f} {grouped:>11.4f} {legacy / grouped:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+"""
+쿠팡 키워드 스코어링 벤치마크
+- 기존 iterrows 루프 vs 컬럼 단위 엔진 (1k / 10k / 100k 키워드)
+
+실행:
+    python -m benchmarks.bench_coupang_scoring
+    python -m benchmarks.bench_coupang_scoring --sizes 1000 10000 --skip-legacy-above 10000
+"""
+
+import argparse
+import time
+
+from app.services.coupang_scoring import build_recommendations
+from benchmarks.coupang_keywords import make_keyword_frame, legacy_recommendations
+
+
+def _best_of(func, repeat):
+    """repeat회 실행 중 최소 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='쿠팡 키워드 스코어링 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy-above', type=int, default=None,
+                        help='이 크기를 넘으면 기존 루프 측정 생략 (100k에서 수십 초 소요)')
+    args = parser.parse_args()
+
+    print(f"{'keywords':>10} {'legacy(s)':>12} {'vectorized(s)':>14} {'speedup':>9}")
+    for size in args.sizes:
+        df = make_keyword_frame(size, seed=42)
+
+        vectorized = _best_of(lambda: build_recommendations(df), args.repeat)
+
+        if args.skip_legacy_above is not None and size > args.skip_legacy_above:
+            print(f"{size:>10,} {'-':>12} {vectorized:>14.4f} {'-':>9}")
+            continue
+
+        legacy = _best_of(lambda: legacy_recommendations(df), 1)
+        print(f"{size:>10,} {legacy:>12.4f} {vectorized:>14.4f} {legacy / vectorized:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+쿠팡 보고서 Excel 파싱 벤치마크
+- 기존 경로: file.read() → BytesIO → pd.read_excel (전체 컬럼)
+- 스트리밍 경로: read_excel_columns (read-only 행 파싱 + 컬럼 프로젝션 + 청크 단위 타입 변환)
+- 실행 시간(최소값)과 tracemalloc 기준 최대 메모리 비교
+
+실행:
+    python -m benchmarks.bench_excel_ingest
+    python -m benchmarks.bench_excel_ingest --sizes 10000 100000 200000 --repeat 1
+"""
+
+import argparse
+import gc
+import io
+import os
+import time
+import tracemalloc
+
+import pandas as pd
+
+from app.services.coupang_report import COUPANG_REPORT_COLUMNS
+from app.utils.excel_reader import read_excel_columns
+from benchmarks.coupang_workbooks import coupang_workbook_path
+
+
+def legacy_read(path):
+    """기존 upload_coupang 파싱 경로"""
+    with open(path, 'rb') as f:
+        file_content = f.read()
+    return pd.read_excel(io.BytesIO(file_content), engine='openpyxl')
+
+
+def streaming_read(path):
+    """스트리밍 파싱 경로 (업로드 스트림 대신 파일 객체 사용)"""
+    with open(path, 'rb') as f:
+        return read_excel_columns(f, columns=COUPANG_REPORT_COLUMNS)
+
+
+def measure(func, path, repeat):
+    """
+    실행 시간과 최대 메모리 측정
+
+    Returns:
+        tuple: (최소 실행 시간(초), 최대 메모리(MB), 결과 DataFrame 메모리(MB))
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        df = func(path)
+        best = min(best, time.perf_counter() - started)
+        del df
+
+    # 메모리는 tracemalloc 오버헤드가 있으므로 별도 1회 측정
+    gc.collect()
+    tracemalloc.start()
+    df = func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak / 1024 ** 2, df.memory_usage(deep=True).sum() / 1024 ** 2
+
+
+def main():
+    parser = argparse.ArgumentParser(description='쿠팡 보고서 Excel 파싱 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} {'file(MB)':>9} {'path':>10} {'time(s)':>9} {'peak(MB)':>10} {'frame(MB)':>10}")
+    for size in args.sizes:
+        path = coupang_workbook_path(size)
+        file_mb = os.path.getsize(path) / 1024 ** 2
+
+        results = {}
+        for name, func in [('legacy', legacy_read), ('streaming', streaming_read)]:
+            results[name] = measure(func, path, args.repeat)
+            elapsed, peak, frame = results[name]
+            print(f"{size:>9,} {file_mb:>9.1f} {name:>10} {elapsed:>9.2f} {peak:>10.1f} {frame:>10.1f}")
+
+        legacy, streaming = results['legacy'], results['streaming']
+        print(f"{'':>9} {'':>9} {'ratio':>10} {legacy[0] / streaming[0]:>8.1f}x {legacy[1] / streaming[1]:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
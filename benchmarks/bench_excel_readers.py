@@ -0,0 +1,61 @@
+"""
+Excel 리더 엔진 벤치마크
+- 소/중/대 쿠팡 보고서(1k / 10k / 100k행)에서 엔진별 파싱 시간 비교
+- pd.read_excel(openpyxl) 기준 대비 read_excel_columns 엔진별 속도
+
+실행:
+    python -m benchmarks.bench_excel_readers
+    python -m benchmarks.bench_excel_readers --sizes 1000 10000 --repeat 5
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from app.services.coupang_report import COUPANG_REPORT_COLUMNS
+from app.utils.excel_reader import read_excel_columns, available_engines
+from benchmarks.coupang_workbooks import coupang_workbook_path
+
+
+def _best_of(func, repeat):
+    """repeat회 실행 중 최소 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Excel 리더 엔진 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1_000, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-baseline-above', type=int, default=None,
+                        help='이 크기를 넘으면 pd.read_excel 기준 측정 생략 (100k에서 1분 이상 소요)')
+    args = parser.parse_args()
+
+    engines = available_engines()
+    print(f"engines: {', '.join(engines)}")
+    print(f"{'rows':>9} {'reader':>22} {'time(s)':>9} {'speedup':>9}")
+
+    for size in args.sizes:
+        path = coupang_workbook_path(size)
+
+        baseline = None
+        if args.skip_baseline_above is None or size <= args.skip_baseline_above:
+            baseline = _best_of(lambda: pd.read_excel(path, engine='openpyxl'), args.repeat)
+            print(f"{size:>9,} {'pd.read_excel(openpyxl)':>22} {baseline:>9.3f} {'1.0x':>9}")
+
+        for engine in engines:
+            elapsed = _best_of(
+                lambda: read_excel_columns(path, columns=COUPANG_REPORT_COLUMNS, engine=engine),
+                args.repeat
+            )
+            speedup = f"{baseline / elapsed:.1f}x" if baseline else '-'
+            print(f"{size:>9,} {engine:>22} {elapsed:>9.3f} {speedup:>9}")
+
+
+if __name__ == '__main__':
+    main()
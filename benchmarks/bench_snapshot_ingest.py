@@ -0,0 +1,66 @@
+"""
+광고 스냅샷 일별 데이터 적재 준비 벤치마크 (10k / 100k / 1M행)
+- 기존 iterrows 행 단위 변환 vs 컬럼 단위 형변환/(날짜, 캠페인) 합산 + 다중 행 upsert 파라미터 생성 vs LOAD DATA용 TSV 생성
+- data_json(원본 JSON 사본) 생성 시간/크기
+- DB 왕복 시간은 포함하지 않음 (클라이언트 측 CPU 비용만 측정)
+
+실행:
+    python -m benchmarks.bench_snapshot_ingest
+    python -m benchmarks.bench_snapshot_ingest --sizes 10000 100000 --repeat 3
+"""
+
+import argparse
+import time
+
+import pandas as pd
+
+from app.services.ad_bulk_loader import prepare_daily_frame, build_fact_upserts, build_daily_tsv
+from benchmarks.ad_frames import make_daily_frame, legacy_daily_records
+
+
+def _best_of(func, repeat):
+    """repeat회 실행 중 최소 시간 (초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _bulk_inserts(df):
+    daily = prepare_daily_frame(df)
+    for _ in build_fact_upserts('bench', 1, daily):
+        pass
+
+
+def _data_json(df):
+    df = df.copy()
+    df['date'] = pd.to_datetime(df['date'])
+    return df.to_json(orient='records', date_format='iso')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='광고 스냅샷 적재 준비 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'iterrows(s)':>12} {'insert(s)':>10} {'tsv(s)':>8} {'speedup':>9} "
+          f"{'data_json(s)':>13} {'json MB':>8} {'tsv MB':>7}")
+    for size in args.sizes:
+        df = make_daily_frame(size, seed=42)
+
+        legacy = _best_of(lambda: legacy_daily_records(df, 1), args.repeat)
+        bulk = _best_of(lambda: _bulk_inserts(df), args.repeat)
+        tsv = _best_of(lambda: build_daily_tsv(prepare_daily_frame(df)), args.repeat)
+        data_json = _best_of(lambda: _data_json(df), args.repeat)
+
+        json_mb = len(_data_json(df)) / 1024 / 1024
+        tsv_mb = len(build_daily_tsv(prepare_daily_frame(df))) / 1024 / 1024
+        print(f"{size:>10,} {legacy:>12.3f} {bulk:>10.3f} {tsv:>8.3f} {legacy / bulk:>8.1f}x "
+              f"{data_json:>13.3f} {json_mb:>8.1f} {tsv_mb:>7.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,400 @@
+"""
+벤치마크/테스트용 쿠팡 키워드 데이터 생성 + 기존 iterrows 스코어링 루프 (레퍼런스 구현)
+- make_keyword_frame: 모든 점수 구간/우선순위 분기를 통과하도록 구성한 키워드 데이터
+- legacy_recommendations: 컬럼 단위 엔진 이전의 행 단위 루프 (parity 테스트/속도 비교 기준)
+"""
+
+import numpy as np
+import pandas as pd
+
+from app.services.coupang_scoring import (
+    EXCLUDE_MIN_SPEND, EXCLUDE_MIN_CLICKS,
+    EXCLUDE_CPC_CRITICAL, EXCLUDE_CPC_VERY_HIGH,
+    EXCLUDE_CLICKS_CRITICAL, EXCLUDE_CLICKS_HIGH
+)
+
+
+def make_keyword_frame(n, seed=0):
+    """
+    업로드 처리 후 형태의 쿠팡 키워드 데이터 생성 (테스트/벤치마크 공용)
+
+    전환 0원, 광고비 0원, 저지출(데이터 부족), 고CPC, 비검색/리타겟팅 행을 섞어
+    모든 점수 구간과 우선순위 분기를 통과하도록 구성
+    """
+    rng = np.random.default_rng(seed)
+
+    clicks = rng.integers(0, 120, n)
+    cpc = rng.choice([80, 150, 250, 400, 550, 900, 1500], n) * rng.uniform(0.8, 1.2, n)
+    spend = np.round(clicks * cpc)
+    spend[rng.random(n) < 0.02] = 0
+
+    roas = rng.choice(
+        [0, 10, 35, 70, 120, 170, 250, 350, 600, 1200],
+        n, p=[0.15, 0.05, 0.05, 0.1, 0.1, 0.1, 0.1, 0.1, 0.15, 0.1]
+    ) * rng.uniform(0.9, 1.1, n)
+    revenue = np.round(spend * roas / 100)
+    roas = np.where(spend > 0, np.round(revenue / np.where(spend > 0, spend, 1) * 100, 2), 0)
+
+    impressions = clicks * rng.integers(20, 200, n)
+    placement = rng.choice(['검색 영역', '비검색영역 (통합)', '리타겟팅 (통합)'], n, p=[0.9, 0.05, 0.05])
+
+    df = pd.DataFrame({
+        '키워드': [f'키워드{i}' for i in range(n)],
+        '광고 노출 지면': placement,
+        '노출수': impressions,
+        '클릭수': clicks,
+        '광고비': spend,
+        '총 주문수': (revenue // 20000).astype(int),
+        '총 판매수량': (revenue // 18000).astype(int),
+        '총 전환매출액': revenue,
+        '클릭률': np.where(impressions > 0, clicks / np.where(impressions > 0, impressions, 1) * 100, 0),
+        'ROAS': roas,
+    })
+    df['CPC'] = (df['광고비'] / df['클릭수']).replace([np.inf, -np.inf], 0).fillna(0)
+    return df
+
+
+def legacy_recommendations(df, target_roas=400):
+    """기존 coupang_recommendations()의 행 단위 스코어링 루프 (레퍼런스 구현)"""
+    if '광고 노출 지면' in df.columns:
+        df = df[df['광고 노출 지면'] == '검색 영역'].copy()
+
+    if len(df) == 0:
+        return [], {
+            'total_waste': 0,
+            'total_opportunity_loss': 0,
+            'keywords_to_exclude': 0,
+            'potential_savings': '0%',
+            'critical_priority': 0,
+            'high_priority': 0,
+            'medium_priority': 0,
+            'low_priority': 0
+        }
+
+    # 기본 통계 계산
+    total_spend = df['광고비'].sum()
+    total_revenue = df['총 전환매출액'].sum()
+    avg_roas = (total_revenue / total_spend * 100) if total_spend > 0 else 0
+
+    # === Phase 2: 중앙값 기반 통계 (Robust Statistics) ===
+    median_cpc = df['CPC'].median()
+    median_ctr = df['클릭률'].median()
+
+    # CPC 백분위수
+    cpc_percentiles = {
+        'p25': df['CPC'].quantile(0.25),
+        'p50': df['CPC'].quantile(0.50),
+        'p75': df['CPC'].quantile(0.75),
+        'p90': df['CPC'].quantile(0.90)
+    }
+
+    # 지출액 백분위수
+    spend_percentiles = {
+        'p25': df['광고비'].quantile(0.25),
+        'p50': df['광고비'].quantile(0.50),
+        'p75': df['광고비'].quantile(0.75),
+        'p90': df['광고비'].quantile(0.90)
+    }
+
+    # 성과 구간별 통계
+    tier_stats = {}
+    tier_definitions = {
+        'elite': df[df['ROAS'] >= 500],
+        'high': df[(df['ROAS'] >= 300) & (df['ROAS'] < 500)],
+        'mid': df[(df['ROAS'] >= 150) & (df['ROAS'] < 300)],
+        'low': df[df['ROAS'] < 150]
+    }
+
+    for tier_name, tier_df in tier_definitions.items():
+        if len(tier_df) > 0:
+            tier_stats[tier_name] = {
+                'median_cpc': tier_df['CPC'].median(),
+                'p75_cpc': tier_df['CPC'].quantile(0.75),
+                'count': len(tier_df),
+                'avg_roas': tier_df['ROAS'].mean()
+            }
+
+    # 상위 성과 키워드 기준 (기회비용 계산용)
+    top_performers = df[df['ROAS'] >= target_roas]
+    if len(top_performers) > 0:
+        top_avg_roas = top_performers['ROAS'].mean()
+    else:
+        top_avg_roas = avg_roas
+
+    recommendations = []
+
+    for _, row in df.iterrows():
+        keyword = row['키워드']
+        spend = float(row['광고비'])
+        revenue = float(row['총 전환매출액'])
+        roas = float(row.get('ROAS', 0))
+        clicks = int(row['클릭수'])
+        ctr = float(row['클릭률'])
+        cpc = float(row['CPC'])
+
+        # === Phase 2: 새로운 스코어링 시스템 ===
+        reasons = []
+
+        # === 1. 수익성 점수 (0-50점) - ROAS 기반 ===
+        if revenue == 0:
+            profitability_score = 50
+            reasons.append("전환 0원")
+        elif roas < 20:
+            profitability_score = 45
+            reasons.append(f"ROAS {roas:.1f}% (극심한 손실)")
+        elif roas < 50:
+            profitability_score = 40
+            reasons.append(f"ROAS {roas:.1f}% (심각한 손실)")
+        elif roas < 100:
+            profitability_score = 35
+            reasons.append(f"ROAS {roas:.1f}% (손실)")
+        elif roas < 150:
+            profitability_score = 25
+            reasons.append(f"ROAS {roas:.1f}% (낮은 수익)")
+        elif roas < 200:
+            profitability_score = 15
+            reasons.append(f"ROAS {roas:.1f}% (목표 미달)")
+        elif roas < 300:
+            profitability_score = 10
+            reasons.append(f"ROAS {roas:.1f}% (목표 근접)")
+        else:
+            profitability_score = 0  # ROAS >= 300%
+
+        # === 2. 효율성 점수 (0-25점) - 성과 구간별 CPC 비교 ===
+        # 키워드 성과 구간 판정
+        if roas >= 500:
+            tier = 'elite'
+        elif roas >= 300:
+            tier = 'high'
+        elif roas >= 150:
+            tier = 'mid'
+        else:
+            tier = 'low'
+
+        # 해당 구간의 중앙값 CPC
+        if tier in tier_stats and tier_stats[tier]['count'] >= 3:
+            tier_median_cpc = tier_stats[tier]['median_cpc']
+        else:
+            tier_median_cpc = median_cpc  # fallback
+
+        # CPC 비율 계산
+        if tier_median_cpc > 0:
+            cpc_ratio = cpc / tier_median_cpc
+        else:
+            cpc_ratio = 1.0
+
+        # 성과 구간별로 다른 기준 적용
+        if tier in ['elite', 'high']:
+            # 고성과 키워드: CPC 기준 관대
+            if cpc_ratio > 3.0:
+                efficiency_score = 10
+                reasons.append(f"CPC 과다 ({cpc:.0f}원)")
+            elif cpc_ratio > 2.5:
+                efficiency_score = 5
+            else:
+                efficiency_score = 0
+        elif tier == 'mid':
+            # 중성과 키워드: 보통 기준
+            if cpc_ratio > 2.5:
+                efficiency_score = 20
+                reasons.append(f"CPC 높음 ({cpc:.0f}원)")
+            elif cpc_ratio > 2.0:
+                efficiency_score = 15
+            elif cpc_ratio > 1.5:
+                efficiency_score = 10
+            else:
+                efficiency_score = 0
+        else:
+            # 저성과 키워드: CPC 기준 엄격
+            if cpc_ratio > 2.0:
+                efficiency_score = 25
+                reasons.append(f"CPC 과다 ({cpc:.0f}원)")
+            elif cpc_ratio > 1.5:
+                efficiency_score = 20
+            elif cpc_ratio > 1.2:
+                efficiency_score = 15
+            else:
+                efficiency_score = 5
+
+        # === 3. 규모 리스크 점수 (0-25점) - 지출액 + ROAS 조합 ===
+        # 지출 수준 판정
+        if spend > spend_percentiles['p90']:
+            spend_level = 'very_high'
+        elif spend > spend_percentiles['p75']:
+            spend_level = 'high'
+        elif spend > spend_percentiles['p50']:
+            spend_level = 'medium'
+        else:
+            spend_level = 'low'
+
+        # ROAS와 지출 조합으로 점수 계산
+        if roas == 0:
+            # 전환 0원 케이스
+            if spend_level == 'very_high':
+                scale_risk_score = 25
+                reasons.append(f"고지출 ({spend:,.0f}원)")
+            elif spend_level == 'high':
+                scale_risk_score = 20
+                reasons.append(f"중간 지출")
+            elif spend_level == 'medium':
+                scale_risk_score = 15
+            else:
+                scale_risk_score = 10
+        elif roas < 100:
+            # 손실 케이스
+            if spend_level == 'very_high':
+                scale_risk_score = 20
+                reasons.append(f"고지출 ({spend:,.0f}원)")
+            elif spend_level == 'high':
+                scale_risk_score = 15
+            elif spend_level == 'medium':
+                scale_risk_score = 10
+            else:
+                scale_risk_score = 5
+        elif roas < 200:
+            # 낮은 수익 케이스
+            if spend_level in ['very_high', 'high']:
+                scale_risk_score = 10
+            else:
+                scale_risk_score = 0
+        elif roas < 300:
+            # 목표 미달 케이스
+            if spend_level == 'very_high':
+                scale_risk_score = 5
+            else:
+                scale_risk_score = 0
+        else:
+            # 목표 달성 (ROAS >= 300%)
+            scale_risk_score = 0
+
+        # 총점 계산
+        score = profitability_score + efficiency_score + scale_risk_score
+
+        # === Phase 3: 개선된 우선순위 결정 (조건 기반) ===
+        # 0단계: 데이터 부족 판정
+        if spend < EXCLUDE_MIN_SPEND and clicks < EXCLUDE_MIN_CLICKS:
+            priority = None
+            priority_label = '데이터 부족'
+            reasons.append('데이터 부족')
+        # 1단계: 고CPC + 저ROAS → 즉시제외 (광고비 무관)
+        elif cpc >= EXCLUDE_CPC_CRITICAL and roas < 100:
+            priority = 'critical'
+            priority_label = '즉시 제외'
+            reasons.append(f'고CPC({cpc:.0f}원) + 저ROAS')
+        elif cpc >= EXCLUDE_CPC_VERY_HIGH and roas < 200:
+            priority = 'critical'
+            priority_label = '즉시 제외'
+            reasons.append(f'초고CPC({cpc:.0f}원) + 저ROAS')
+        # 2단계: 전환없음 (ROAS 0%)
+        elif revenue == 0:
+            if clicks >= EXCLUDE_CLICKS_CRITICAL:
+                priority = 'critical'
+                priority_label = '즉시 제외'
+                reasons.append(f'{clicks}클릭 전환없음')
+            elif clicks >= EXCLUDE_CLICKS_HIGH:
+                priority = 'high'
+                priority_label = '조속히 제외'
+                reasons.append(f'{clicks}클릭 전환없음')
+            else:
+                priority = 'medium'
+                priority_label = '검토 필요'
+                reasons.append('전환없음 검토')
+        # 3단계: ROAS 1~100% (손실)
+        elif roas < 100:
+            if spend >= spend_percentiles['p75']:
+                priority = 'critical'
+                priority_label = '즉시 제외'
+                reasons.append('저ROAS + 고지출')
+            elif spend >= spend_percentiles['p50']:
+                priority = 'high'
+                priority_label = '조속히 제외'
+                reasons.append('저ROAS + 중지출')
+            else:
+                priority = 'medium'
+                priority_label = '검토 필요'
+        # 4단계: ROAS 100~200% (저조)
+        elif roas < 200:
+            if spend >= spend_percentiles['p75']:
+                priority = 'high'
+                priority_label = '조속히 제외'
+                reasons.append('저조ROAS + 고지출')
+            else:
+                priority = 'medium'
+                priority_label = '검토 필요'
+        # 5단계: ROAS 200~300% (목표 근접)
+        elif roas < 300:
+            priority = 'medium'
+            priority_label = '검토 필요'
+            reasons.append('ROAS 개선필요')
+        # 6단계: ROAS 300%+ (양호)
+        else:
+            priority = 'low'
+            priority_label = '모니터링'
+
+        # === 낭비 및 기회비용 계산 ===
+        if spend == 0:
+            # 광고비 0원인 경우 - 비정상 데이터 (낭비 없음)
+            waste = 0
+            waste_rate = 0
+            expected_revenue = 0
+            opportunity_loss = 0
+        elif roas < 100:
+            # 손실 케이스: 광고비 - 매출
+            waste = spend - revenue
+            waste_rate = 100 - roas
+            # 기회비용: 이 광고비를 상위 성과 키워드에 투자했을 때의 기대 매출
+            expected_revenue = spend * (top_avg_roas / 100)
+            opportunity_loss = expected_revenue - revenue
+        else:
+            # 목표 미달 케이스: 낭비 없음
+            waste = 0
+            waste_rate = 0
+            # 기회비용: 이 광고비를 상위 성과 키워드에 투자했을 때의 기대 매출
+            expected_revenue = spend * (top_avg_roas / 100)
+            opportunity_loss = expected_revenue - revenue
+
+        # === 추천 사유 생성 ===
+        reason = f"{priority_label} - " + ", ".join(reasons[:3])  # 최대 3개 사유
+
+        recommendations.append({
+            'keyword': keyword,
+            'score': int(score),
+            'priority': priority,
+            'reason': reason,
+            'spend': spend,
+            'revenue': revenue,
+            'roas': roas,
+            'waste': float(waste),
+            'waste_rate': float(waste_rate),
+            'opportunity_loss': float(opportunity_loss),
+            'clicks': clicks,
+            'ctr': ctr,
+            'cpc': cpc
+        })
+
+    # === 정렬: 점수 높은 순 ===
+    recommendations.sort(key=lambda x: -x['score'])
+
+    # === 요약 통계 ===
+    total_waste = sum(r['waste'] for r in recommendations)
+    total_opportunity_loss = sum(r['opportunity_loss'] for r in recommendations)
+
+    # 데이터 부족 키워드 분리
+    insufficient_data = [r for r in recommendations if r['priority'] is None]
+    valid_recommendations = [r for r in recommendations if r['priority'] is not None]
+
+    summary = {
+        'total_waste': int(total_waste),
+        'total_opportunity_loss': int(total_opportunity_loss),
+        'keywords_to_exclude': len(valid_recommendations),
+        'potential_savings': f"{(total_waste / total_spend * 100):.1f}%" if total_spend > 0 else "0%",
+        'critical_priority': len([r for r in valid_recommendations if r['priority'] == 'critical']),
+        'high_priority': len([r for r in valid_recommendations if r['priority'] == 'high']),
+        'medium_priority': len([r for r in valid_recommendations if r['priority'] == 'medium']),
+        'low_priority': len([r for r in valid_recommendations if r['priority'] == 'low']),
+        'insufficient_data': len(insufficient_data),
+        'avg_score': int(sum(r['score'] for r in valid_recommendations) / len(valid_recommendations)) if valid_recommendations else 0
+    }
+
+
+    return recommendations, summary
@@ -0,0 +1,105 @@
+"""
+벤치마크/테스트용 쿠팡 보고서 데이터 생성 + 기존 가공 경로 (레퍼런스 구현)
+- make_report_frame: 지면(검색/비검색/리타겟팅)과 14일/1일 컬럼을 섞은 원본 보고서 형태 데이터
+- legacy_process: 마스크별 합산 + 2차 groupby + 문자열 ROAS 변환 경로 (parity 테스트/속도 비교 기준)
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def make_report_frame(n, seed=0):
+    """
+    업로드 직후 형태의 쿠팡 보고서 데이터 생성 (벤치마크에서도 사용)
+
+    중복 키워드, 공백이 섞인 키워드, 비검색/리타겟팅 지면, 노출/클릭/광고비 0원 행을 포함
+    """
+    rng = np.random.default_rng(seed)
+
+    base_keywords = [f'키워드 {i}' for i in range(max(1, n // 4))]
+    keywords = rng.choice(base_keywords, n).astype(object)
+    spaced = rng.random(n) < 0.05
+    keywords[spaced] = [f'  {k.replace(" ", "   ")} ' for k in keywords[spaced]]
+
+    placement = rng.choice(
+        ['검색 영역', '비검색 영역', '리타겟팅', None], n, p=[0.8, 0.1, 0.07, 0.03]
+    ).astype(object)
+    keywords[np.isin(placement, ['비검색 영역', '리타겟팅'])] = '-'
+
+    impressions = rng.integers(0, 5000, n)
+    clicks = np.minimum(impressions, rng.integers(0, 80, n))
+    spend = clicks * rng.integers(50, 1500, n)
+    revenue = np.round(spend * rng.choice([0, 0.5, 2, 4, 8], n) * rng.uniform(0.5, 1.5, n)).astype(np.int64)
+    orders = revenue // 20000
+
+    return pd.DataFrame({
+        '키워드': keywords,
+        '광고 노출 지면': placement,
+        '노출수': impressions,
+        '클릭수': clicks,
+        '클릭률': np.round(clicks / np.maximum(impressions, 1) * 100, 2),
+        '광고비': spend,
+        '총 주문수(14일)': orders,
+        '총 판매수량(14일)': orders + rng.integers(0, 2, n),
+        '총 전환매출액(14일)': revenue,
+        '총광고수익률(14일)': np.round(revenue / np.maximum(spend, 1) * 100, 1),
+    })
+
+
+def legacy_process(df):
+    """기존 process_coupang_report()의 통합/중복 합산/ROAS 파싱 단계 (레퍼런스 구현)"""
+    df = df.rename(columns={
+        '총 전환매출액(14일)': '총 전환매출액',
+        '총 주문수(14일)': '총 주문수',
+        '총 판매수량(14일)': '총 판매수량',
+        '총광고수익률(14일)': '총광고수익률',
+    })
+    df['키워드'] = df['키워드'].astype(str).str.replace(r'\s+', ' ', regex=True).str.strip()
+
+    non_search_mask = df['광고 노출 지면'].str.contains('비검색', na=False)
+    retargeting_mask = df['광고 노출 지면'].str.contains('리타겟팅', na=False)
+    search_only_df = df[~(non_search_mask | retargeting_mask)].copy()
+
+    aggregated_rows = []
+    for mask, name in [(non_search_mask, '비검색영역 (통합)'), (retargeting_mask, '리타겟팅 (통합)')]:
+        if mask.sum() > 0:
+            part = df[mask].copy()
+            row = {'키워드': name, '광고 노출 지면': name}
+            for col in ['노출수', '클릭수', '광고비', '총 주문수', '총 판매수량', '총 전환매출액']:
+                row[col] = part[col].sum()
+            row['클릭률'] = row['클릭수'] / row['노출수'] * 100 if row['노출수'] > 0 else 0
+            if row['광고비'] > 0:
+                row['총광고수익률'] = f"{row['총 전환매출액'] / row['광고비'] * 100:.2f}%"
+            else:
+                row['총광고수익률'] = "0.00%"
+            aggregated_rows.append(row)
+
+    if aggregated_rows:
+        df = pd.concat([search_only_df, pd.DataFrame(aggregated_rows)], ignore_index=True)
+    else:
+        df = search_only_df
+
+    keyword_groups = df.groupby('키워드', as_index=False).agg({
+        '노출수': 'sum',
+        '클릭수': 'sum',
+        '광고비': 'sum',
+        '총 주문수': 'sum',
+        '총 판매수량': 'sum',
+        '총 전환매출액': 'sum',
+        '광고 노출 지면': 'first',
+    })
+    keyword_groups['클릭률'] = (keyword_groups['클릭수'] / keyword_groups['노출수'] * 100).replace([np.inf, -np.inf], 0).fillna(0)
+    keyword_groups['총광고수익률'] = keyword_groups.apply(
+        lambda row: f"{(row['총 전환매출액'] / row['광고비'] * 100):.2f}%" if row['광고비'] > 0 else "0.00%",
+        axis=1
+    )
+    df = keyword_groups
+
+    if df['클릭률'].max() <= 1:
+        df['클릭률'] = df['클릭률'] * 100
+    df['ROAS'] = df['총광고수익률'].str.rstrip('%').astype(float)
+    df['CPC'] = (df['광고비'] / df['클릭수']).replace([np.inf, -np.inf], 0).fillna(0)
+    numeric_cols = df.select_dtypes(include=[np.number]).columns
+    for col in numeric_cols:
+        df[col] = df[col].replace([np.inf, -np.inf], 0).fillna(0)
+    return df
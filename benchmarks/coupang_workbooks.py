@@ -0,0 +1,97 @@
+"""
+벤치마크용 쿠팡 광고 보고서 Excel 생성
+- sample_data/coupang_kitchen_sample.py의 키워드 데이터를 원하는 행 수로 확장
+- 실제 쿠팡 보고서처럼 분석에 쓰지 않는 컬럼(캠페인/상품/옵션 정보 등)을 함께 포함
+- 생성한 파일은 임시 디렉토리에 캐시 (100k행 생성에 수십 초 소요)
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+import numpy as np
+from openpyxl import Workbook
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sample_data'))
+from coupang_kitchen_sample import generate_sample_data  # noqa: E402
+
+# 분석에 쓰지 않지만 실제 보고서에 포함되는 컬럼
+EXTRA_COLUMNS = [
+    '날짜', '광고유형', '캠페인 ID', '캠페인명', '광고그룹', '광고집행 상품명', '광고집행 옵션ID',
+    '광고전환매출발생 상품명', '광고전환매출발생 옵션ID', '노출 지면 상세',
+    '직접 주문수(1일)', '간접 주문수(1일)', '직접 전환매출액(1일)', '간접 전환매출액(1일)',
+    '총 주문수(1일)', '총 판매수량(1일)', '총 전환매출액(1일)', '총광고수익률(1일)',
+]
+
+
+def build_coupang_rows(n_rows, seed=0):
+    """
+    샘플 키워드 데이터를 n_rows행으로 확장
+
+    Returns:
+        tuple: (헤더 리스트, 행 리스트)
+    """
+    base = generate_sample_data()
+    rng = np.random.default_rng(seed)
+
+    idx = rng.integers(0, len(base), n_rows)
+    scale = rng.uniform(0.5, 1.5, n_rows)
+    day = rng.integers(0, 30, n_rows)
+
+    spend = np.round(base['광고비'].to_numpy()[idx] * scale).astype(np.int64)
+    revenue = np.round(base['총 전환매출액(14일)'].to_numpy()[idx] * scale).astype(np.int64)
+    orders = np.round(base['총 주문수(14일)'].to_numpy()[idx] * scale).astype(np.int64)
+    quantity = np.round(base['총 판매수량(14일)'].to_numpy()[idx] * scale).astype(np.int64)
+    clicks = np.maximum(1, np.round(base['클릭수'].to_numpy()[idx] * scale)).astype(np.int64)
+    impressions = np.round(base['노출수'].to_numpy()[idx] * scale).astype(np.int64)
+    roas = np.where(spend > 0, np.round(revenue / np.maximum(spend, 1) * 100, 1), 0.0)
+    ctr = np.round(clicks / np.maximum(impressions, 1) * 100, 2)
+
+    keywords = base['키워드'].to_numpy()[idx]
+    placements = base['광고 노출 지면'].to_numpy()[idx]
+    suffix = rng.integers(0, max(1, n_rows // 300), n_rows)
+
+    header = ['키워드', '광고 노출 지면', '노출수', '클릭수', '클릭률', '광고비',
+              '총 주문수(14일)', '총 판매수량(14일)', '총 전환매출액(14일)', '총광고수익률(14일)'] + EXTRA_COLUMNS
+
+    start = date(2025, 1, 1)
+    rows = []
+    for i in range(n_rows):
+        keyword = keywords[i] if keywords[i] == '-' else f'{keywords[i]} {suffix[i]}'
+        rows.append([
+            keyword, placements[i], int(impressions[i]), int(clicks[i]), float(ctr[i]), int(spend[i]),
+            int(orders[i]), int(quantity[i]), int(revenue[i]), float(roas[i]),
+            start + timedelta(days=int(day[i])), '매출최적화', 1000 + i % 40, f'캠페인 {i % 40}',
+            f'광고그룹 {i % 200}', f'주방용품 상품 {i % 1500}', 80000000 + i % 1500,
+            f'주방용품 상품 {(i * 7) % 1500}', 80000000 + (i * 7) % 1500, placements[i],
+            int(orders[i] // 2), int(orders[i] - orders[i] // 2),
+            int(revenue[i] // 2), int(revenue[i] - revenue[i] // 2),
+            int(orders[i] // 3), int(quantity[i] // 3), int(revenue[i] // 3),
+            float(np.round(roas[i] / 3, 1)),
+        ])
+    return header, rows
+
+
+def coupang_workbook_path(n_rows, seed=0):
+    """
+    n_rows행 쿠팡 보고서 xlsx 경로 반환 (없으면 생성)
+
+    Returns:
+        str: 파일 경로
+    """
+    path = os.path.join(tempfile.gettempdir(), f'coupang_bench_{n_rows}_{seed}.xlsx')
+    if os.path.exists(path):
+        return path
+
+    header, rows = build_coupang_rows(n_rows, seed)
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Sheet1')
+    ws.append(header)
+    for row in rows:
+        ws.append(row)
+
+    tmp_path = f'{path}.tmp'
+    wb.save(tmp_path)
+    os.replace(tmp_path, path)
+    return path
@@ -31,6 +31,10 @@ class DevelopmentConfig:
     # 데이터베이스 연결 풀 설정
     DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 10))
     DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 20))
+    DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', 30))  # 풀 고갈 시 대기 시간 (초)
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 3600))  # 커넥션 최대 수명 (초, MariaDB wait_timeout보다 짧게)
+    DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'true').lower() == 'true'  # 대여 시 ping 확인
+    DB_LOCAL_INFILE = os.getenv('DB_LOCAL_INFILE', 'false').lower() == 'true'  # LOAD DATA LOCAL INFILE 허용 (서버 local_infile=ON 필요)
 
     # 세션 설정
     SESSION_TYPE = os.getenv('SESSION_TYPE', 'filesystem')
@@ -53,11 +57,61 @@ class DevelopmentConfig:
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'uploads')
     MAX_CONTENT_LENGTH = int(os.getenv('MAX_FILE_SIZE_MB', 10)) * 1024 * 1024  # MB to bytes
     ALLOWED_EXTENSIONS = {'xlsx', 'xls', 'csv'}
+    EXCEL_READER_ENGINE = os.getenv('EXCEL_READER_ENGINE', 'auto')  # auto, calamine, openpyxl
+
+    # 업로드 데이터셋 저장소 (Parquet, 워커 간 공유 디스크)
+    DATASET_STORE_DIR = os.getenv('DATASET_STORE_DIR', 'data/datasets')
+    DATASET_TTL_SECONDS = int(os.getenv('DATASET_TTL_SECONDS', 21600))  # 마지막 접근 후 만료 시간 (초)
+    DATASET_SWEEP_INTERVAL = int(os.getenv('DATASET_SWEEP_INTERVAL', 300))  # 만료 데이터 정리 간격 (초)
+
+    # 업로드 결과 캐시 (동일 파일 재업로드 시 파싱 생략, 워커 간 공유 디스크)
+    UPLOAD_CACHE_ENABLED = os.getenv('UPLOAD_CACHE_ENABLED', 'true').lower() == 'true'
+    UPLOAD_CACHE_DIR = os.getenv('UPLOAD_CACHE_DIR', 'data/upload_cache')
+    UPLOAD_CACHE_MAX_MB = int(os.getenv('UPLOAD_CACHE_MAX_MB', 512))  # 전체 최대 크기 (초과 시 LRU 삭제)
+
+    # 업로드 작업 큐 (async=true 업로드를 로컬 프로세스 풀에서 처리, 상태는 워커 간 공유 디스크)
+    UPLOAD_JOBS_ENABLED = os.getenv('UPLOAD_JOBS_ENABLED', 'true').lower() == 'true'
+    UPLOAD_JOB_DIR = os.getenv('UPLOAD_JOB_DIR', 'data/upload_jobs')
+    UPLOAD_JOB_WORKERS = int(os.getenv('UPLOAD_JOB_WORKERS', 2))  # 요청 워커당 풀 프로세스 수
+    UPLOAD_JOB_TTL_SECONDS = int(os.getenv('UPLOAD_JOB_TTL_SECONDS', 3600))  # 완료/실패 후 결과 보관 시간 (초)
+
+    # 분석 스냅샷 Blob 저장소 (세션에는 snapshot_id만 저장)
+    SNAPSHOT_STORE_DIR = os.getenv('SNAPSHOT_STORE_DIR', 'data/snapshots')
+    SNAPSHOT_STORE_CODEC = os.getenv('SNAPSHOT_STORE_CODEC', 'zstd')  # zstd, lz4, snappy, gzip, none
+    SNAPSHOT_MAX_BLOB_MB = int(os.getenv('SNAPSHOT_MAX_BLOB_MB', 20))  # 스냅샷 1개 최대 크기 (압축 후)
+    SNAPSHOT_STORE_MAX_MB = int(os.getenv('SNAPSHOT_STORE_MAX_MB', 1024))  # 전체 최대 크기 (초과 시 LRU 삭제)
+    SNAPSHOT_TTL_SECONDS = int(os.getenv('SNAPSHOT_TTL_SECONDS', 86400))  # 마지막 접근 후 만료 시간 (초)
+    SNAPSHOT_SWEEP_INTERVAL = int(os.getenv('SNAPSHOT_SWEEP_INTERVAL', 300))  # 만료/용량 정리 간격 (초)
+
+    # 광고 분석 스냅샷 DB 저장 (AdAnalyzer.save_snapshot)
+    AD_SNAPSHOT_STORE_DATA_JSON = os.getenv('AD_SNAPSHOT_STORE_DATA_JSON', 'false').lower() == 'true'  # 원본 JSON 사본 저장 (ad_daily_facts와 중복)
+    AD_BULK_INSERT_CHUNK_ROWS = int(os.getenv('AD_BULK_INSERT_CHUNK_ROWS', 2000))  # 다중 행 INSERT 1문장당 행 수
 
     # 배너 업로드 설정
     BANNER_UPLOAD_FOLDER = os.path.join('app', 'static', 'uploads', 'banners')
     MAX_BANNER_FILE_SIZE = 5 * 1024 * 1024  # 5MB
     ALLOWED_BANNER_EXTENSIONS = {'jpg', 'jpeg', 'png', 'gif', 'webp'}
+    BANNER_IMAGE_PROCESSING_ENABLED = os.getenv('BANNER_IMAGE_PROCESSING_ENABLED', 'true').lower() == 'true'  # 1x/2x WebP + JPEG/PNG 변환본 생성
+    BANNER_IMAGE_SYNC_MAX_BYTES = int(os.getenv('BANNER_IMAGE_SYNC_MAX_BYTES', 512 * 1024))  # 이보다 큰 업로드는 백그라운드 변환
+    BANNER_IMAGE_WEBP_QUALITY = int(os.getenv('BANNER_IMAGE_WEBP_QUALITY', 82))
+    BANNER_IMAGE_WORKERS = int(os.getenv('BANNER_IMAGE_WORKERS', 1))  # 백그라운드 변환 스레드 수
+
+    # 배너 노출/클릭 카운터 write-behind (워커 메모리에서 합산 후 주기적으로 일괄 UPDATE)
+    BANNER_COUNTER_BUFFER_ENABLED = os.getenv('BANNER_COUNTER_BUFFER_ENABLED', 'true').lower() == 'true'
+    BANNER_COUNTER_FLUSH_INTERVAL = float(os.getenv('BANNER_COUNTER_FLUSH_INTERVAL', 5))  # 반영 주기 (초)
+    BANNER_COUNTER_MAX_PENDING = int(os.getenv('BANNER_COUNTER_MAX_PENDING', 1000))  # 대기 이벤트 수 초과 시 즉시 반영
+    BANNER_EVENT_BATCH_MAX = int(os.getenv('BANNER_EVENT_BATCH_MAX', 200))  # 배치 이벤트 API 요청당 최대 이벤트 수
+
+    # 배너 이벤트 로그 (banner_analytics 일괄 적재 + 시간별/일별 집계)
+    BANNER_EVENT_LOG_ENABLED = os.getenv('BANNER_EVENT_LOG_ENABLED', 'true').lower() == 'true'
+    BANNER_EVENT_LOG_FLUSH_INTERVAL = float(os.getenv('BANNER_EVENT_LOG_FLUSH_INTERVAL', 10))  # 적재 주기 (초)
+    BANNER_EVENT_LOG_MAX_PENDING = int(os.getenv('BANNER_EVENT_LOG_MAX_PENDING', 5000))  # 대기 이벤트 수 초과 시 즉시 적재
+    BANNER_EVENT_LOG_MAX_BACKLOG = int(os.getenv('BANNER_EVENT_LOG_MAX_BACKLOG', 50000))  # DB 장애 시 보관할 최대 이벤트 수
+
+    # 활성 배너 조회 캐시 (워커 메모리 TTL 캐시, 배너 변경 시 버전 파일로 전체 워커 무효화)
+    BANNER_CACHE_TTL_SECONDS = float(os.getenv('BANNER_CACHE_TTL_SECONDS', 60))  # 0이면 캐시 사용 안 함
+    BANNER_HTTP_MAX_AGE = int(os.getenv('BANNER_HTTP_MAX_AGE', 60))  # /api/banners 묶음 응답 브라우저 캐시 시간 (초, 이후 ETag로 재검증)
+    BANNER_CACHE_VERSION_FILE = os.getenv('BANNER_CACHE_VERSION_FILE', 'data/banner_cache.version')  # 워커 간 공유 디스크
 
     # OpenAI 설정
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
@@ -65,6 +119,10 @@ class DevelopmentConfig:
     OPENAI_MODEL = 'gpt-4'
     OPENAI_MAX_TOKENS = 1500
     OPENAI_TEMPERATURE = 0.7
+    AI_INSIGHTS_TIMEOUT = int(os.getenv('AI_INSIGHTS_TIMEOUT', 30))  # OpenAI 요청 최대 대기 (초, 초과 시 기본 인사이트)
+    AI_INSIGHTS_WORKERS = int(os.getenv('AI_INSIGHTS_WORKERS', 4))  # 워커당 백그라운드 생성 스레드 수
+    AI_INSIGHTS_CACHE_DIR = os.getenv('AI_INSIGHTS_CACHE_DIR', 'data/insights')  # 프롬프트 해시 기반 결과 캐시 (워커 간 공유 디스크)
+    AI_INSIGHTS_CACHE_TTL_SECONDS = int(os.getenv('AI_INSIGHTS_CACHE_TTL_SECONDS', 604800))  # 마지막 조회 후 보관 시간 (초)
 
     # 메인 사이트 설정
     MAIN_SITE_URL = os.getenv('MAIN_SITE_URL', 'https://mbizsquare.com')
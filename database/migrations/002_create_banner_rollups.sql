@@ -0,0 +1,58 @@
+-- ========================================
+-- Banner Analytics Rollup Tables
+-- ========================================
+-- 배너 이벤트 로그 집계 테이블 (시간별/일별)
+-- 생성일: 2026-10-17
+--
+-- banner_analytics(원본 이벤트)는 버퍼에서 일괄 INSERT로 적재하고,
+-- 같은 트랜잭션에서 아래 집계 테이블을 INSERT ... ON DUPLICATE KEY UPDATE로 증분 갱신한다.
+-- 통계/시계열 API는 원본 이벤트 대신 집계 테이블만 조회한다.
+
+-- 1. init_db.py / setup_database.py 로 만든 구 스키마(event_date, event_count)는
+--    기록된 적이 없으므로 보관용으로 이름을 바꾸고 001 스키마로 다시 생성
+SET @sql = (SELECT IF(
+    (SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'banner_analytics' AND COLUMN_NAME = 'event_date') > 0,
+    'RENAME TABLE banner_analytics TO banner_analytics_legacy',
+    'SELECT 1'
+));
+PREPARE stmt FROM @sql;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+CREATE TABLE IF NOT EXISTS banner_analytics (
+    id INT PRIMARY KEY AUTO_INCREMENT,
+    banner_id INT NOT NULL COMMENT '배너 ID',
+    event_type ENUM('impression', 'click') NOT NULL COMMENT '이벤트 타입',
+    ip_address VARCHAR(45) DEFAULT NULL COMMENT '클라이언트 IP 주소',
+    user_agent TEXT DEFAULT NULL COMMENT '브라우저 정보',
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '발생일시',
+    FOREIGN KEY (banner_id) REFERENCES banners(id) ON DELETE CASCADE,
+    INDEX idx_banner_date (banner_id, created_at),
+    INDEX idx_event_type (event_type, created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='배너 분석 로그';
+
+-- 2. 시간별 집계
+CREATE TABLE IF NOT EXISTS banner_stats_hourly (
+    banner_id INT NOT NULL COMMENT '배너 ID',
+    stat_hour DATETIME NOT NULL COMMENT '집계 시각 (정시)',
+    impressions INT NOT NULL DEFAULT 0 COMMENT '노출 수',
+    clicks INT NOT NULL DEFAULT 0 COMMENT '클릭 수',
+    PRIMARY KEY (banner_id, stat_hour),
+    INDEX idx_hour (stat_hour),
+    FOREIGN KEY (banner_id) REFERENCES banners(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='배너 시간별 집계';
+
+-- 3. 일별 집계
+CREATE TABLE IF NOT EXISTS banner_stats_daily (
+    banner_id INT NOT NULL COMMENT '배너 ID',
+    stat_date DATE NOT NULL COMMENT '집계 일자',
+    impressions INT NOT NULL DEFAULT 0 COMMENT '노출 수',
+    clicks INT NOT NULL DEFAULT 0 COMMENT '클릭 수',
+    PRIMARY KEY (banner_id, stat_date),
+    INDEX idx_date (stat_date),
+    FOREIGN KEY (banner_id) REFERENCES banners(id) ON DELETE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='배너 일별 집계';
+
+-- 완료 메시지
+SELECT '✅ 배너 집계 테이블 생성 완료' AS status;
@@ -0,0 +1,22 @@
+-- ========================================
+-- Banner Image Variants
+-- ========================================
+-- 배너 이미지 변환본(1x/2x WebP + JPEG/PNG) URL 컬럼 추가
+-- 생성일: 2026-10-17
+--
+-- 형식: {"desktop": {"width": 970, "height": 90, "webp": {"1x": "...", "2x": "..."}, "fallback": {...}},
+--        "mobile": {...} | null}
+-- NULL이면 변환 전(또는 변환 실패)이므로 image_url / mobile_image_url 원본 사용
+
+SET @sql = (SELECT IF(
+    (SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'banners' AND COLUMN_NAME = 'image_variants') = 0,
+    'ALTER TABLE banners ADD COLUMN image_variants TEXT DEFAULT NULL COMMENT "이미지 변환본 URL (JSON)" AFTER mobile_image_url',
+    'SELECT 1'
+));
+PREPARE stmt FROM @sql;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+-- 완료 메시지
+SELECT '✅ 배너 이미지 변환본 컬럼 추가 완료' AS status;
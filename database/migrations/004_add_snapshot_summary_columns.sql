@@ -0,0 +1,51 @@
+-- ========================================
+-- Snapshot Summary Columns
+-- ========================================
+-- 분석 목록 조회용 요약 지표 컬럼 + keyset 페이지네이션 인덱스
+-- 생성일: 2026-10-17
+--
+-- 목록 API는 metrics_summary(JSON 전체: campaigns, daily_trend 포함) 대신 아래 컬럼만 조회한다.
+-- AdAnalyzer.calculate_metrics 가 metrics_summary 와 함께 같은 UPDATE 문으로 갱신한다.
+
+-- 1. 요약 컬럼 추가 (이미 있으면 무시)
+SET @sql = (SELECT IF(
+    (SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'ad_analysis_snapshots' AND COLUMN_NAME = 'total_spend') = 0,
+    'ALTER TABLE ad_analysis_snapshots
+        ADD COLUMN total_spend DECIMAL(14, 2) DEFAULT NULL COMMENT "총 지출액 (요약)" AFTER metrics_summary,
+        ADD COLUMN total_revenue DECIMAL(14, 2) DEFAULT NULL COMMENT "총 매출액 (요약)" AFTER total_spend,
+        ADD COLUMN total_impressions BIGINT DEFAULT NULL COMMENT "총 노출수 (요약)" AFTER total_revenue,
+        ADD COLUMN total_clicks INT DEFAULT NULL COMMENT "총 클릭수 (요약)" AFTER total_impressions,
+        ADD COLUMN total_conversions INT DEFAULT NULL COMMENT "총 전환수 (요약)" AFTER total_clicks,
+        ADD COLUMN avg_roas DECIMAL(10, 2) DEFAULT NULL COMMENT "ROAS (요약)" AFTER total_conversions,
+        ADD COLUMN avg_ctr DECIMAL(8, 2) DEFAULT NULL COMMENT "CTR (요약)" AFTER avg_roas,
+        ADD COLUMN avg_cpc DECIMAL(12, 0) DEFAULT NULL COMMENT "CPC (요약)" AFTER avg_ctr,
+        ADD COLUMN avg_cpa DECIMAL(12, 0) DEFAULT NULL COMMENT "CPA (요약)" AFTER avg_cpc,
+        ADD COLUMN cvr DECIMAL(8, 2) DEFAULT NULL COMMENT "전환율 (요약)" AFTER avg_cpa,
+        ADD COLUMN total_days INT DEFAULT NULL COMMENT "데이터 일수 (요약)" AFTER cvr,
+        ADD INDEX idx_user_created (user_id, created_at),
+        ADD INDEX idx_user_saved_created (user_id, is_saved, created_at)',
+    'SELECT 1'
+));
+PREPARE stmt FROM @sql;
+EXECUTE stmt;
+DEALLOCATE PREPARE stmt;
+
+-- 2. 기존 스냅샷 요약 채우기 (metrics_summary JSON에서 1회 추출)
+UPDATE ad_analysis_snapshots
+SET total_spend = JSON_EXTRACT(metrics_summary, '$.total_spend'),
+    total_revenue = JSON_EXTRACT(metrics_summary, '$.total_revenue'),
+    total_impressions = JSON_EXTRACT(metrics_summary, '$.total_impressions'),
+    total_clicks = JSON_EXTRACT(metrics_summary, '$.total_clicks'),
+    total_conversions = JSON_EXTRACT(metrics_summary, '$.total_conversions'),
+    avg_roas = JSON_EXTRACT(metrics_summary, '$.avg_roas'),
+    avg_ctr = JSON_EXTRACT(metrics_summary, '$.avg_ctr'),
+    avg_cpc = JSON_EXTRACT(metrics_summary, '$.avg_cpc'),
+    avg_cpa = JSON_EXTRACT(metrics_summary, '$.avg_cpa'),
+    cvr = JSON_EXTRACT(metrics_summary, '$.cvr'),
+    total_days = JSON_EXTRACT(metrics_summary, '$.total_days')
+WHERE metrics_summary IS NOT NULL
+  AND total_spend IS NULL;
+
+-- 완료 메시지
+SELECT '✅ 스냅샷 요약 컬럼 추가 완료' AS status;
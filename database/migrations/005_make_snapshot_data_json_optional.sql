@@ -0,0 +1,15 @@
+-- ========================================
+-- Optional Snapshot data_json
+-- ========================================
+-- 분석 스냅샷 원본 JSON 사본(data_json)을 선택 저장으로 변경
+-- 생성일: 2026-10-17
+--
+-- 일별 데이터는 ad_daily_facts에 (user_id, date, campaign_name) 기준으로 적재되므로 data_json은 중복 사본이다.
+-- AD_SNAPSHOT_STORE_DATA_JSON=false(기본)이면 NULL로 저장한다.
+-- 설정 시 대용량(수십만 행) 데이터도 저장할 수 있도록 LONGTEXT로 변경한다.
+
+ALTER TABLE ad_analysis_snapshots
+    MODIFY COLUMN data_json LONGTEXT DEFAULT NULL COMMENT '원본 데이터 사본 (JSON 형식, AD_SNAPSHOT_STORE_DATA_JSON 설정 시에만 저장)';
+
+-- 완료 메시지
+SELECT '✅ 스냅샷 data_json 선택 저장 변경 완료' AS status;
@@ -0,0 +1,53 @@
+-- ========================================
+-- Ad Daily Facts
+-- ========================================
+-- 사용자별 일별 광고 데이터 팩트 테이블 (업로드 중복 제거)
+-- 생성일: 2026-10-17
+--
+-- 업로드마다 스냅샷별 ad_daily_data 사본을 만들던 방식에서는 최근 30일 보고서를 매일 올리면
+-- 같은 날짜가 약 30번 저장되고, 기간을 가로지르는 조회(페이싱, 추이)가 모든 사본을 읽었다.
+-- 신규 업로드는 ad_daily_facts 에 (user_id, date, campaign_name) 기준으로 덮어쓰고(last-write-wins),
+-- 스냅샷은 user_id + period_start ~ period_end 기간 뷰로 조회한다.
+-- 스냅샷 삭제 시 AdAnalyzer 가 같은 트랜잭션에서 그 업로드 값이 남아 있는 팩트(source_snapshot_id)를
+-- 이전 업로드 값(008, ad_daily_fact_versions)으로 복원하거나 삭제한다.
+
+-- 1. 팩트 테이블
+CREATE TABLE IF NOT EXISTS ad_daily_facts (
+    user_id VARCHAR(20) NOT NULL COMMENT '사용자 ID',
+    date DATE NOT NULL COMMENT '날짜',
+    campaign_name VARCHAR(255) NOT NULL COMMENT '캠페인명',
+    spend DECIMAL(12, 2) NOT NULL DEFAULT 0 COMMENT '지출액 (원)',
+    impressions INT NOT NULL DEFAULT 0 COMMENT '노출수',
+    clicks INT NOT NULL DEFAULT 0 COMMENT '클릭수',
+    conversions INT NOT NULL DEFAULT 0 COMMENT '전환수 (구매)',
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0 COMMENT '매출액 (원)',
+    source_snapshot_id INT DEFAULT NULL COMMENT '마지막으로 반영한 업로드의 스냅샷 ID',
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '반영일시',
+    PRIMARY KEY (user_id, date, campaign_name),
+    FOREIGN KEY (source_snapshot_id) REFERENCES ad_analysis_snapshots(id) ON DELETE SET NULL,
+    INDEX idx_source_snapshot (source_snapshot_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='사용자별 일별/캠페인별 광고 데이터 (업로드 중복 제거)';
+
+-- 2. 기존 스냅샷 사본 이관 ((사용자, 날짜, 캠페인)별 가장 최근 스냅샷 값)
+INSERT IGNORE INTO ad_daily_facts
+    (user_id, date, campaign_name, spend, impressions, clicks, conversions, revenue, source_snapshot_id)
+SELECT latest.user_id, d.date, d.campaign_name,
+       SUM(d.spend), COALESCE(SUM(d.impressions), 0), COALESCE(SUM(d.clicks), 0),
+       COALESCE(SUM(d.conversions), 0), COALESCE(SUM(d.revenue), 0), d.snapshot_id
+FROM ad_daily_data d
+JOIN (
+    SELECT s.user_id, d2.date, d2.campaign_name, MAX(d2.snapshot_id) AS snapshot_id
+    FROM ad_daily_data d2
+    JOIN ad_analysis_snapshots s ON s.id = d2.snapshot_id
+    GROUP BY s.user_id, d2.date, d2.campaign_name
+) latest
+    ON latest.snapshot_id = d.snapshot_id
+    AND latest.date = d.date
+    AND latest.campaign_name = d.campaign_name
+GROUP BY latest.user_id, d.date, d.campaign_name, d.snapshot_id;
+
+-- ad_daily_data 는 이관 확인 후 정리 가능 (애플리케이션은 더 이상 읽거나 쓰지 않음)
+--   TRUNCATE TABLE ad_daily_data;
+
+-- 완료 메시지
+SELECT '✅ 일별 팩트 테이블 생성 완료' AS status;
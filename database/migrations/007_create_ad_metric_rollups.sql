@@ -0,0 +1,92 @@
+-- ========================================
+-- Ad Metric Rollups
+-- ========================================
+-- 사용자별 일/주/월 광고 성과 집계 테이블 (장기 추이 API)
+-- 생성일: 2026-10-17
+--
+-- 스냅샷 비교는 저장된 metrics_summary 두 개만 비교할 수 있어 12개월 ROAS/CTR/CPA 추이를 보려면
+-- 모든 스냅샷을 읽어야 했다. ad_daily_facts 를 (user_id, campaign_name, 구간 시작일) 단위로 합산해 두고,
+-- 스냅샷 저장/삭제 트랜잭션에서 스냅샷 기간이 걸친 구간만 다시 계산한다.
+-- campaign_name = '' 행은 해당 구간의 전체 캠페인 합계이며, 추이 API와 예산 페이싱은 이 행만 읽는다.
+-- 예산 페이싱은 기존 DATE_FORMAT(d.date, '%Y-%m') = ? 스캔(겹치는 스냅샷 지출 중복 합산) 대신
+-- ad_metrics_monthly 합계 행 1행만 읽는다.
+
+-- 1. 일별 집계
+CREATE TABLE IF NOT EXISTS ad_metrics_daily (
+    user_id VARCHAR(20) NOT NULL COMMENT '사용자 ID',
+    campaign_name VARCHAR(255) NOT NULL COMMENT '캠페인명 (빈 문자열: 전체 합계)',
+    stat_date DATE NOT NULL COMMENT '집계 일자',
+    spend DECIMAL(16, 2) NOT NULL DEFAULT 0 COMMENT '지출액 (원)',
+    revenue DECIMAL(16, 2) NOT NULL DEFAULT 0 COMMENT '매출액 (원)',
+    impressions BIGINT NOT NULL DEFAULT 0 COMMENT '노출수',
+    clicks BIGINT NOT NULL DEFAULT 0 COMMENT '클릭수',
+    conversions BIGINT NOT NULL DEFAULT 0 COMMENT '전환수',
+    PRIMARY KEY (user_id, campaign_name, stat_date),
+    INDEX idx_user_date (user_id, stat_date)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='사용자별 일별 광고 성과 집계';
+
+-- 2. 주별 집계 (월요일 시작)
+CREATE TABLE IF NOT EXISTS ad_metrics_weekly (
+    user_id VARCHAR(20) NOT NULL COMMENT '사용자 ID',
+    campaign_name VARCHAR(255) NOT NULL COMMENT '캠페인명 (빈 문자열: 전체 합계)',
+    week_start DATE NOT NULL COMMENT '주 시작일 (월요일)',
+    spend DECIMAL(16, 2) NOT NULL DEFAULT 0 COMMENT '지출액 (원)',
+    revenue DECIMAL(16, 2) NOT NULL DEFAULT 0 COMMENT '매출액 (원)',
+    impressions BIGINT NOT NULL DEFAULT 0 COMMENT '노출수',
+    clicks BIGINT NOT NULL DEFAULT 0 COMMENT '클릭수',
+    conversions BIGINT NOT NULL DEFAULT 0 COMMENT '전환수',
+    PRIMARY KEY (user_id, campaign_name, week_start),
+    INDEX idx_user_week (user_id, week_start)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='사용자별 주별 광고 성과 집계';
+
+-- 3. 월별 집계
+CREATE TABLE IF NOT EXISTS ad_metrics_monthly (
+    user_id VARCHAR(20) NOT NULL COMMENT '사용자 ID',
+    campaign_name VARCHAR(255) NOT NULL COMMENT '캠페인명 (빈 문자열: 전체 합계)',
+    month_start DATE NOT NULL COMMENT '대상 월 (1일)',
+    spend DECIMAL(16, 2) NOT NULL DEFAULT 0 COMMENT '지출액 (원)',
+    revenue DECIMAL(16, 2) NOT NULL DEFAULT 0 COMMENT '매출액 (원)',
+    impressions BIGINT NOT NULL DEFAULT 0 COMMENT '노출수',
+    clicks BIGINT NOT NULL DEFAULT 0 COMMENT '클릭수',
+    conversions BIGINT NOT NULL DEFAULT 0 COMMENT '전환수',
+    PRIMARY KEY (user_id, campaign_name, month_start),
+    INDEX idx_user_month (user_id, month_start)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='사용자별 월별 광고 성과 집계';
+
+-- 4. 기존 일별 팩트에서 채우기 (캠페인별 + 전체 합계)
+INSERT IGNORE INTO ad_metrics_daily (user_id, campaign_name, stat_date, spend, revenue, impressions, clicks, conversions)
+SELECT user_id, campaign_name, date, SUM(spend), SUM(revenue), SUM(impressions), SUM(clicks), SUM(conversions)
+FROM ad_daily_facts
+GROUP BY user_id, campaign_name, date;
+
+INSERT IGNORE INTO ad_metrics_daily (user_id, campaign_name, stat_date, spend, revenue, impressions, clicks, conversions)
+SELECT user_id, '', date, SUM(spend), SUM(revenue), SUM(impressions), SUM(clicks), SUM(conversions)
+FROM ad_daily_facts
+GROUP BY user_id, date;
+
+INSERT IGNORE INTO ad_metrics_weekly (user_id, campaign_name, week_start, spend, revenue, impressions, clicks, conversions)
+SELECT user_id, campaign_name, DATE_SUB(date, INTERVAL WEEKDAY(date) DAY),
+       SUM(spend), SUM(revenue), SUM(impressions), SUM(clicks), SUM(conversions)
+FROM ad_daily_facts
+GROUP BY user_id, campaign_name, DATE_SUB(date, INTERVAL WEEKDAY(date) DAY);
+
+INSERT IGNORE INTO ad_metrics_weekly (user_id, campaign_name, week_start, spend, revenue, impressions, clicks, conversions)
+SELECT user_id, '', DATE_SUB(date, INTERVAL WEEKDAY(date) DAY),
+       SUM(spend), SUM(revenue), SUM(impressions), SUM(clicks), SUM(conversions)
+FROM ad_daily_facts
+GROUP BY user_id, DATE_SUB(date, INTERVAL WEEKDAY(date) DAY);
+
+INSERT IGNORE INTO ad_metrics_monthly (user_id, campaign_name, month_start, spend, revenue, impressions, clicks, conversions)
+SELECT user_id, campaign_name, DATE_FORMAT(date, '%Y-%m-01'),
+       SUM(spend), SUM(revenue), SUM(impressions), SUM(clicks), SUM(conversions)
+FROM ad_daily_facts
+GROUP BY user_id, campaign_name, DATE_FORMAT(date, '%Y-%m-01');
+
+INSERT IGNORE INTO ad_metrics_monthly (user_id, campaign_name, month_start, spend, revenue, impressions, clicks, conversions)
+SELECT user_id, '', DATE_FORMAT(date, '%Y-%m-01'),
+       SUM(spend), SUM(revenue), SUM(impressions), SUM(clicks), SUM(conversions)
+FROM ad_daily_facts
+GROUP BY user_id, DATE_FORMAT(date, '%Y-%m-01');
+
+-- 완료 메시지
+SELECT '✅ 광고 성과 집계 테이블 생성 완료' AS status;
@@ -0,0 +1,46 @@
+-- ========================================
+-- Ad Daily Fact Versions
+-- ========================================
+-- 업로드가 덮어쓴 일별 팩트의 이전 값 (스냅샷 삭제 시 복원용)
+-- 생성일: 2026-10-17
+--
+-- ad_daily_facts 는 (user_id, date, campaign_name) 기준 마지막 업로드 값만 보관하므로, 최신 업로드 스냅샷을
+-- 삭제하면 그 기간을 함께 덮던 이전 스냅샷의 일별 데이터/추이/예산 페이싱이 비어 보였다.
+-- 업로드가 기존 팩트를 덮어쓰기 전에 그 값을 원래 업로드(snapshot_id)의 이전 값으로 보관하고,
+-- 스냅샷 삭제 시 그 업로드 값이 남은 팩트를 남은 업로드 중 가장 최근 이전 값으로 복원한다.
+-- 덮어쓴 (날짜, 캠페인)만 보관하므로 겹치지 않는 업로드는 행이 늘지 않는다.
+-- 이전 값은 원래 업로드 스냅샷이 삭제되면 함께 삭제된다 (ON DELETE CASCADE).
+
+-- 1. 이전 값 테이블
+CREATE TABLE IF NOT EXISTS ad_daily_fact_versions (
+    user_id VARCHAR(20) NOT NULL COMMENT '사용자 ID',
+    date DATE NOT NULL COMMENT '날짜',
+    campaign_name VARCHAR(255) NOT NULL COMMENT '캠페인명',
+    snapshot_id INT NOT NULL COMMENT '이 값을 올린 업로드의 스냅샷 ID',
+    spend DECIMAL(12, 2) NOT NULL DEFAULT 0 COMMENT '지출액 (원)',
+    impressions INT NOT NULL DEFAULT 0 COMMENT '노출수',
+    clicks INT NOT NULL DEFAULT 0 COMMENT '클릭수',
+    conversions INT NOT NULL DEFAULT 0 COMMENT '전환수 (구매)',
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0 COMMENT '매출액 (원)',
+    PRIMARY KEY (user_id, date, campaign_name, snapshot_id),
+    FOREIGN KEY (snapshot_id) REFERENCES ad_analysis_snapshots(id) ON DELETE CASCADE,
+    INDEX idx_snapshot (snapshot_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci COMMENT='업로드가 덮어쓴 일별 팩트 이전 값 (스냅샷 삭제 시 복원)';
+
+-- 2. 기존 스냅샷 사본 중 팩트에 반영되지 않은(덮어쓴) 값 이관
+INSERT IGNORE INTO ad_daily_fact_versions
+    (user_id, date, campaign_name, snapshot_id, spend, impressions, clicks, conversions, revenue)
+SELECT s.user_id, d.date, d.campaign_name, d.snapshot_id,
+       SUM(d.spend), COALESCE(SUM(d.impressions), 0), COALESCE(SUM(d.clicks), 0),
+       COALESCE(SUM(d.conversions), 0), COALESCE(SUM(d.revenue), 0)
+FROM ad_daily_data d
+JOIN ad_analysis_snapshots s ON s.id = d.snapshot_id
+JOIN ad_daily_facts f
+    ON f.user_id = s.user_id
+    AND f.date = d.date
+    AND f.campaign_name = d.campaign_name
+WHERE f.source_snapshot_id <> d.snapshot_id
+GROUP BY s.user_id, d.date, d.campaign_name, d.snapshot_id;
+
+-- 완료 메시지
+SELECT '✅ 일별 팩트 이전 값 테이블 생성 완료' AS status;
@@ -12,6 +12,11 @@
 -- ========================================
 
 -- 기존 테이블 존재 확인 및 삭제 (주의!)
+-- DROP TABLE IF EXISTS ad_metrics_monthly;
+-- DROP TABLE IF EXISTS ad_metrics_weekly;
+-- DROP TABLE IF EXISTS ad_metrics_daily;
+-- DROP TABLE IF EXISTS ad_daily_fact_versions;
+-- DROP TABLE IF EXISTS ad_daily_facts;
 -- DROP TABLE IF EXISTS ad_daily_data;
 -- DROP TABLE IF EXISTS ad_campaign_memos;
 -- DROP TABLE IF EXISTS ad_monthly_goals;
@@ -26,8 +31,23 @@ CREATE TABLE IF NOT EXISTS ad_analysis_snapshots (
     snapshot_name VARCHAR(255) NOT NULL COMMENT '분석 이름',
     period_start DATE NOT NULL COMMENT '분석 시작일',
     period_end DATE NOT NULL COMMENT '분석 종료일',
-    data_json TEXT NOT NULL COMMENT '원본 데이터 (JSON 형식)',
+    data_json LONGTEXT DEFAULT NULL COMMENT '원본 데이터 사본 (JSON 형식, AD_SNAPSHOT_STORE_DATA_JSON 설정 시에만 저장)',
     metrics_summary JSON COMMENT '계산된 지표 (캐싱용)',
+
+    -- 목록 조회용 요약 지표 (calculate_metrics 시 metrics_summary와 함께 갱신,
+    -- 기간이 겹치는 업로드/삭제 시 같은 트랜잭션에서 다시 계산)
+    total_spend DECIMAL(14, 2) DEFAULT NULL COMMENT '총 지출액 (요약)',
+    total_revenue DECIMAL(14, 2) DEFAULT NULL COMMENT '총 매출액 (요약)',
+    total_impressions BIGINT DEFAULT NULL COMMENT '총 노출수 (요약)',
+    total_clicks INT DEFAULT NULL COMMENT '총 클릭수 (요약)',
+    total_conversions INT DEFAULT NULL COMMENT '총 전환수 (요약)',
+    avg_roas DECIMAL(10, 2) DEFAULT NULL COMMENT 'ROAS (요약)',
+    avg_ctr DECIMAL(8, 2) DEFAULT NULL COMMENT 'CTR (요약)',
+    avg_cpc DECIMAL(12, 0) DEFAULT NULL COMMENT 'CPC (요약)',
+    avg_cpa DECIMAL(12, 0) DEFAULT NULL COMMENT 'CPA (요약)',
+    cvr DECIMAL(8, 2) DEFAULT NULL COMMENT '전환율 (요약)',
+    total_days INT DEFAULT NULL COMMENT '데이터 일수 (요약)',
+
     ai_insights TEXT COMMENT 'AI 생성 인사이트',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP COMMENT '생성일시',
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '수정일시',
@@ -41,15 +61,19 @@ CREATE TABLE IF NOT EXISTS ad_analysis_snapshots (
     -- 인덱스
     INDEX idx_user_date (user_id, period_start, period_end) COMMENT '사용자별 기간 검색',
     INDEX idx_saved (user_id, is_saved) COMMENT '저장된 분석 필터링',
-    INDEX idx_created (created_at) COMMENT '생성일시 정렬'
+    INDEX idx_created (created_at) COMMENT '생성일시 정렬',
+    INDEX idx_user_created (user_id, created_at) COMMENT '목록 keyset 페이지네이션',
+    INDEX idx_user_saved_created (user_id, is_saved, created_at) COMMENT '저장된 분석 목록 keyset 페이지네이션'
 
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
 COMMENT='광고 분석 스냅샷 - 각 분석 세션을 저장';
 
 
 -- ========================================
--- 2. 일별 광고 데이터 테이블
+-- 2. 일별 광고 데이터 테이블 (레거시)
 -- ========================================
+-- 스냅샷별 일별 데이터 사본. 신규 업로드는 ad_daily_facts(5번)에만 저장하며,
+-- 기존 행은 006 마이그레이션에서 ad_daily_facts로 이관됨
 CREATE TABLE IF NOT EXISTS ad_daily_data (
     id INT PRIMARY KEY AUTO_INCREMENT COMMENT '데이터 ID',
     snapshot_id INT NOT NULL COMMENT '스냅샷 ID (ad_analysis_snapshots.id 참조)',
@@ -122,6 +146,130 @@ CREATE TABLE IF NOT EXISTS ad_monthly_goals (
 COMMENT='월별 목표 설정 - 예산 및 목표 ROAS';
 
 
+-- ========================================
+-- 5. 사용자 일별 팩트 / 성과 집계 테이블
+-- ========================================
+-- 업로드한 일별 데이터는 (user_id, date, campaign_name) 1행으로 보관 (마지막 업로드 값으로 덮어씀)
+-- 스냅샷은 이 테이블의 기간 뷰 (user_id + period_start ~ period_end)
+CREATE TABLE IF NOT EXISTS ad_daily_facts (
+    user_id VARCHAR(20) NOT NULL COMMENT '사용자 ID',
+    date DATE NOT NULL COMMENT '날짜',
+    campaign_name VARCHAR(255) NOT NULL COMMENT '캠페인명',
+
+    -- 광고 지표
+    spend DECIMAL(12, 2) NOT NULL DEFAULT 0 COMMENT '지출액 (원)',
+    impressions INT NOT NULL DEFAULT 0 COMMENT '노출수',
+    clicks INT NOT NULL DEFAULT 0 COMMENT '클릭수',
+    conversions INT NOT NULL DEFAULT 0 COMMENT '전환수 (구매)',
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0 COMMENT '매출액 (원)',
+
+    source_snapshot_id INT DEFAULT NULL COMMENT '마지막으로 반영한 업로드의 스냅샷 ID',
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '반영일시',
+
+    -- 기본키 ((user_id, date) 범위 조회 경로)
+    PRIMARY KEY (user_id, date, campaign_name),
+
+    -- 외래키 (스냅샷 삭제 시 AdAnalyzer.delete_snapshot이 이 업로드 값이 남은 팩트를 이전 값으로 복원하거나 삭제)
+    FOREIGN KEY (source_snapshot_id) REFERENCES ad_analysis_snapshots(id) ON DELETE SET NULL,
+
+    -- 인덱스
+    INDEX idx_source_snapshot (source_snapshot_id) COMMENT '업로드별 반영 행'
+
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='사용자별 일별/캠페인별 광고 데이터 (업로드 중복 제거)';
+
+-- 업로드가 덮어쓴 일별 팩트의 이전 값 (스냅샷 삭제 시 남은 업로드 중 가장 최근 값으로 복원)
+CREATE TABLE IF NOT EXISTS ad_daily_fact_versions (
+    user_id VARCHAR(20) NOT NULL COMMENT '사용자 ID',
+    date DATE NOT NULL COMMENT '날짜',
+    campaign_name VARCHAR(255) NOT NULL COMMENT '캠페인명',
+    snapshot_id INT NOT NULL COMMENT '이 값을 올린 업로드의 스냅샷 ID',
+
+    -- 광고 지표
+    spend DECIMAL(12, 2) NOT NULL DEFAULT 0 COMMENT '지출액 (원)',
+    impressions INT NOT NULL DEFAULT 0 COMMENT '노출수',
+    clicks INT NOT NULL DEFAULT 0 COMMENT '클릭수',
+    conversions INT NOT NULL DEFAULT 0 COMMENT '전환수 (구매)',
+    revenue DECIMAL(12, 2) NOT NULL DEFAULT 0 COMMENT '매출액 (원)',
+
+    -- 기본키 ((user_id, date, campaign_name)별 업로드 값)
+    PRIMARY KEY (user_id, date, campaign_name, snapshot_id),
+
+    -- 외래키 (업로드 스냅샷 삭제 시 이전 값도 삭제)
+    FOREIGN KEY (snapshot_id) REFERENCES ad_analysis_snapshots(id) ON DELETE CASCADE,
+
+    -- 인덱스
+    INDEX idx_snapshot (snapshot_id) COMMENT '업로드별 이전 값'
+
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='업로드가 덮어쓴 일별 팩트 이전 값 (스냅샷 삭제 시 복원)';
+
+-- 일/주/월 성과 집계 (ad_daily_facts에서 계산, 스냅샷 저장/삭제 시 스냅샷 기간이 걸친 구간만 갱신)
+-- campaign_name = '' 행은 구간의 전체 캠페인 합계 (추이 API, 예산 페이싱 조회)
+CREATE TABLE IF NOT EXISTS ad_metrics_daily (
+    user_id VARCHAR(20) NOT NULL COMMENT '사용자 ID',
+    campaign_name VARCHAR(255) NOT NULL COMMENT '캠페인명 (빈 문자열: 전체 합계)',
+    stat_date DATE NOT NULL COMMENT '집계 일자',
+
+    -- 광고 지표 합계
+    spend DECIMAL(16, 2) NOT NULL DEFAULT 0 COMMENT '지출액 (원)',
+    revenue DECIMAL(16, 2) NOT NULL DEFAULT 0 COMMENT '매출액 (원)',
+    impressions BIGINT NOT NULL DEFAULT 0 COMMENT '노출수',
+    clicks BIGINT NOT NULL DEFAULT 0 COMMENT '클릭수',
+    conversions BIGINT NOT NULL DEFAULT 0 COMMENT '전환수',
+
+    -- 기본키 ((user_id, campaign_name) 구간 범위 조회 경로)
+    PRIMARY KEY (user_id, campaign_name, stat_date),
+
+    -- 인덱스 (업로드 기간 재계산 시 삭제 범위)
+    INDEX idx_user_date (user_id, stat_date)
+
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='사용자별 일별 광고 성과 집계';
+
+CREATE TABLE IF NOT EXISTS ad_metrics_weekly (
+    user_id VARCHAR(20) NOT NULL COMMENT '사용자 ID',
+    campaign_name VARCHAR(255) NOT NULL COMMENT '캠페인명 (빈 문자열: 전체 합계)',
+    week_start DATE NOT NULL COMMENT '주 시작일 (월요일)',
+
+    -- 광고 지표 합계
+    spend DECIMAL(16, 2) NOT NULL DEFAULT 0 COMMENT '지출액 (원)',
+    revenue DECIMAL(16, 2) NOT NULL DEFAULT 0 COMMENT '매출액 (원)',
+    impressions BIGINT NOT NULL DEFAULT 0 COMMENT '노출수',
+    clicks BIGINT NOT NULL DEFAULT 0 COMMENT '클릭수',
+    conversions BIGINT NOT NULL DEFAULT 0 COMMENT '전환수',
+
+    -- 기본키 ((user_id, campaign_name) 구간 범위 조회 경로)
+    PRIMARY KEY (user_id, campaign_name, week_start),
+
+    -- 인덱스 (업로드 기간 재계산 시 삭제 범위)
+    INDEX idx_user_week (user_id, week_start)
+
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='사용자별 주별 광고 성과 집계';
+
+CREATE TABLE IF NOT EXISTS ad_metrics_monthly (
+    user_id VARCHAR(20) NOT NULL COMMENT '사용자 ID',
+    campaign_name VARCHAR(255) NOT NULL COMMENT '캠페인명 (빈 문자열: 전체 합계)',
+    month_start DATE NOT NULL COMMENT '대상 월 (1일)',
+
+    -- 광고 지표 합계
+    spend DECIMAL(16, 2) NOT NULL DEFAULT 0 COMMENT '지출액 (원)',
+    revenue DECIMAL(16, 2) NOT NULL DEFAULT 0 COMMENT '매출액 (원)',
+    impressions BIGINT NOT NULL DEFAULT 0 COMMENT '노출수',
+    clicks BIGINT NOT NULL DEFAULT 0 COMMENT '클릭수',
+    conversions BIGINT NOT NULL DEFAULT 0 COMMENT '전환수',
+
+    -- 기본키 ((user_id, campaign_name) 구간 범위 조회 경로)
+    PRIMARY KEY (user_id, campaign_name, month_start),
+
+    -- 인덱스 (업로드 기간 재계산 시 삭제 범위)
+    INDEX idx_user_month (user_id, month_start)
+
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+COMMENT='사용자별 월별 광고 성과 집계';
+
+
 -- ========================================
 -- 샘플 데이터 (선택적)
 -- ========================================
@@ -135,12 +283,12 @@ VALUES
 ('test_user', '11월 1주차 테스트', '2024-11-04', '2024-11-10', '[]', true, '테스트,샘플');
 
 -- 샘플 일별 데이터
-INSERT INTO ad_daily_data
-(snapshot_id, date, campaign_name, spend, impressions, clicks, conversions, revenue)
+INSERT INTO ad_daily_facts
+(user_id, date, campaign_name, spend, impressions, clicks, conversions, revenue, source_snapshot_id)
 VALUES
-(1, '2024-11-04', '블프_신규', 150000, 45000, 1200, 48, 540000),
-(1, '2024-11-05', '블프_신규', 160000, 48000, 1300, 52, 580000),
-(1, '2024-11-04', '기존고객_A', 80000, 20000, 800, 30, 360000);
+('test_user', '2024-11-04', '블프_신규', 150000, 45000, 1200, 48, 540000, 1),
+('test_user', '2024-11-05', '블프_신규', 160000, 48000, 1300, 52, 580000, 1),
+('test_user', '2024-11-04', '기존고객_A', 80000, 20000, 800, 30, 360000, 1);
 
 -- 샘플 목표
 INSERT INTO ad_monthly_goals
@@ -162,7 +162,30 @@ def when_ready(server):
 
 
 def worker_exit(server, worker):
-    """워커 종료 시 호출"""
+    """워커 종료 시 호출 (워커 프로세스 안에서 실행)"""
+    # 버퍼에 남은 배너 노출/클릭 카운트 반영 (DB 풀 정리 전에)
+    try:
+        from app.services.banner_counters import flush_banner_counters
+        flushed = flush_banner_counters()
+        if flushed:
+            server.log.info(f"Banner counters flushed on exit: {flushed} events")
+    except Exception as e:
+        server.log.warning(f"Banner counter flush failed: {e}")
+
+    try:
+        from app.services.banner_analytics import flush_banner_events
+        flushed = flush_banner_events()
+        if flushed:
+            server.log.info(f"Banner events flushed on exit: {flushed} events")
+    except Exception as e:
+        server.log.warning(f"Banner event log flush failed: {e}")
+
+    # max_requests 재시작 시 유휴 DB 커넥션 정리
+    try:
+        from app.utils.db_utils import dispose_pool
+        dispose_pool()
+    except Exception as e:
+        server.log.warning(f"DB pool dispose failed: {e}")
     server.log.info(f"Worker exited (pid: {worker.pid})")
 
 
@@ -114,188 +114,207 @@ categories = {
     }
 }
 
-# 전체 키워드 리스트 생성 (카테고리 정보 포함)
-all_keywords = []
-for cat_name, cat_data in categories.items():
-    for kw in cat_data['keywords']:
-        all_keywords.append({
-            'keyword': kw,
-            'category': cat_name,
-            'prices': cat_data['prices']
+def generate_sample_data(seed=2024):
+    """
+    샘플 키워드 데이터 생성
+
+    Args:
+        seed (int): 난수 시드
+
+    Returns:
+        pd.DataFrame: 쿠팡 광고 보고서 형식 데이터 (검색 키워드 + 비검색영역 + 리타겟팅)
+    """
+    # 전체 키워드 리스트 생성 (카테고리 정보 포함)
+    all_keywords = []
+    for cat_name, cat_data in categories.items():
+        for kw in cat_data['keywords']:
+            all_keywords.append({
+                'keyword': kw,
+                'category': cat_name,
+                'prices': cat_data['prices']
+            })
+
+    num_keywords = len(all_keywords)
+
+    # 총 광고비 설정 (약 600만원)
+    np.random.seed(seed)
+    total_ad_spend = 6_200_000
+
+    # 키워드별 광고비 분배 (롱테일 분포)
+    weights = np.random.exponential(1, num_keywords)
+    weights = weights / weights.sum()
+    ad_spends = (weights * total_ad_spend).astype(int)
+    ad_spends[-1] = total_ad_spend - ad_spends[:-1].sum()
+
+    # 데이터 생성
+    data = []
+
+    for i, kw_info in enumerate(all_keywords):
+        keyword = kw_info['keyword']
+        category = kw_info['category']
+        prices = kw_info['prices']
+
+        ad_spend = ad_spends[i]
+
+        # 제품 가격 랜덤 선택
+        product_price = np.random.choice(prices)
+
+        # CPC (클릭당 비용): 200~500원
+        cpc = np.random.randint(200, 500)
+        clicks = max(1, ad_spend // cpc)
+
+        # CTR (클릭률): 1~4%
+        ctr = np.random.uniform(1.0, 4.0)
+        impressions = int(clicks / (ctr / 100))
+
+        # ROAS 분포 설정 (평균 ~1000% 목표, 현실적 분포)
+        # 실제 광고에서는 전환 0, 낭비 키워드가 상당수 존재
+        rand_val = np.random.random()
+
+        if rand_val < 0.05:  # 5% - 전환 없음 (0%) - 광고비만 소진
+            target_roas = 0.0
+        elif rand_val < 0.12:  # 7% - 극히 낭비 (1~50%)
+            target_roas = np.random.uniform(0.01, 0.5)
+        elif rand_val < 0.20:  # 8% - 낭비 (50~150%)
+            target_roas = np.random.uniform(0.5, 1.5)
+        elif rand_val < 0.32:  # 12% - 손해 (150~350%)
+            target_roas = np.random.uniform(1.5, 3.5)
+        elif rand_val < 0.47:  # 15% - 저조 (350~600%)
+            target_roas = np.random.uniform(3.5, 6.0)
+        elif rand_val < 0.62:  # 15% - 보통 (600~900%)
+            target_roas = np.random.uniform(6.0, 9.0)
+        elif rand_val < 0.77:  # 15% - 양호 (900~1300%)
+            target_roas = np.random.uniform(9.0, 13.0)
+        elif rand_val < 0.90:  # 13% - 우수 (1300~2200%)
+            target_roas = np.random.uniform(13.0, 22.0)
+        else:  # 10% - 탁월 (2200~4000%)
+            target_roas = np.random.uniform(22.0, 40.0)
+
+        # 목표 매출 계산
+        target_revenue = int(ad_spend * target_roas)
+
+        # 주문수 역산
+        if target_roas == 0:
+            # 전환 0건
+            orders = 0
+            quantity = 0
+            revenue = 0
+        else:
+            additional_purchase_rate = np.random.uniform(1.1, 1.4)
+            orders = max(1, int(target_revenue / (product_price * additional_purchase_rate)))
+            quantity = int(orders * additional_purchase_rate)
+            revenue = quantity * product_price
+
+        # 실제 ROAS
+        actual_roas = round((revenue / ad_spend) * 100, 1) if ad_spend > 0 else 0
+
+        # 전환율 재계산 (주문수 기준)
+        actual_cvr = round((orders / clicks * 100), 2) if clicks > 0 else 0
+
+        data.append({
+            '키워드': keyword,
+            '광고 노출 지면': '검색 영역',
+            '노출수': impressions,
+            '클릭수': clicks,
+            '클릭률': round(ctr, 2),
+            '광고비': ad_spend,
+            '총 주문수(14일)': orders,
+            '총 판매수량(14일)': quantity,
+            '총 전환매출액(14일)': revenue,
+            '총광고수익률(14일)': actual_roas
         })
 
-num_keywords = len(all_keywords)
-print(f"총 키워드 수: {num_keywords}개")
-
-# 총 광고비 설정 (약 600만원)
-np.random.seed(2024)
-total_ad_spend = 6_200_000
-
-# 키워드별 광고비 분배 (롱테일 분포)
-weights = np.random.exponential(1, num_keywords)
-weights = weights / weights.sum()
-ad_spends = (weights * total_ad_spend).astype(int)
-ad_spends[-1] = total_ad_spend - ad_spends[:-1].sum()
-
-# 데이터 생성
-data = []
-
-for i, kw_info in enumerate(all_keywords):
-    keyword = kw_info['keyword']
-    category = kw_info['category']
-    prices = kw_info['prices']
-
-    ad_spend = ad_spends[i]
-
-    # 제품 가격 랜덤 선택
-    product_price = np.random.choice(prices)
-
-    # CPC (클릭당 비용): 200~500원
-    cpc = np.random.randint(200, 500)
-    clicks = max(1, ad_spend // cpc)
-
-    # CTR (클릭률): 1~4%
-    ctr = np.random.uniform(1.0, 4.0)
-    impressions = int(clicks / (ctr / 100))
-
-    # ROAS 분포 설정 (평균 ~1000% 목표, 현실적 분포)
-    # 실제 광고에서는 전환 0, 낭비 키워드가 상당수 존재
-    rand_val = np.random.random()
-
-    if rand_val < 0.05:  # 5% - 전환 없음 (0%) - 광고비만 소진
-        target_roas = 0.0
-    elif rand_val < 0.12:  # 7% - 극히 낭비 (1~50%)
-        target_roas = np.random.uniform(0.01, 0.5)
-    elif rand_val < 0.20:  # 8% - 낭비 (50~150%)
-        target_roas = np.random.uniform(0.5, 1.5)
-    elif rand_val < 0.32:  # 12% - 손해 (150~350%)
-        target_roas = np.random.uniform(1.5, 3.5)
-    elif rand_val < 0.47:  # 15% - 저조 (350~600%)
-        target_roas = np.random.uniform(3.5, 6.0)
-    elif rand_val < 0.62:  # 15% - 보통 (600~900%)
-        target_roas = np.random.uniform(6.0, 9.0)
-    elif rand_val < 0.77:  # 15% - 양호 (900~1300%)
-        target_roas = np.random.uniform(9.0, 13.0)
-    elif rand_val < 0.90:  # 13% - 우수 (1300~2200%)
-        target_roas = np.random.uniform(13.0, 22.0)
-    else:  # 10% - 탁월 (2200~4000%)
-        target_roas = np.random.uniform(22.0, 40.0)
-
-    # 목표 매출 계산
-    target_revenue = int(ad_spend * target_roas)
-
-    # 주문수 역산
-    if target_roas == 0:
-        # 전환 0건
-        orders = 0
-        quantity = 0
-        revenue = 0
-    else:
-        additional_purchase_rate = np.random.uniform(1.1, 1.4)
-        orders = max(1, int(target_revenue / (product_price * additional_purchase_rate)))
-        quantity = int(orders * additional_purchase_rate)
-        revenue = quantity * product_price
-
-    # 실제 ROAS
-    actual_roas = round((revenue / ad_spend) * 100, 1) if ad_spend > 0 else 0
-
-    # 전환율 재계산 (주문수 기준)
-    actual_cvr = round((orders / clicks * 100), 2) if clicks > 0 else 0
+    # 비검색영역 추가 (전체의 약 12%)
+    non_search_spend = int(total_ad_spend * 0.12)
+    non_search_roas = np.random.uniform(7.0, 9.0)  # 비검색은 ROAS 약간 낮음
+    non_search_revenue = int(non_search_spend * non_search_roas)
+    data.append({
+        '키워드': '-',
+        '광고 노출 지면': '비검색영역 (상품상세,장바구니)',
+        '노출수': 720000,
+        '클릭수': 3500,
+        '클릭률': 0.49,
+        '광고비': non_search_spend,
+        '총 주문수(14일)': int(non_search_revenue / 21900),
+        '총 판매수량(14일)': int(non_search_revenue / 21900 * 1.2),
+        '총 전환매출액(14일)': non_search_revenue,
+        '총광고수익률(14일)': round((non_search_revenue / non_search_spend) * 100, 1)
+    })
 
+    # 리타겟팅 추가 (ROAS 높음)
+    retarget_spend = int(total_ad_spend * 0.08)
+    retarget_roas = np.random.uniform(13.0, 16.0)
+    retarget_revenue = int(retarget_spend * retarget_roas)
     data.append({
-        '키워드': keyword,
-        '광고 노출 지면': '검색 영역',
-        '노출수': impressions,
-        '클릭수': clicks,
-        '클릭률': round(ctr, 2),
-        '광고비': ad_spend,
-        '총 주문수(14일)': orders,
-        '총 판매수량(14일)': quantity,
-        '총 전환매출액(14일)': revenue,
-        '총광고수익률(14일)': actual_roas
+        '키워드': '-',
+        '광고 노출 지면': '리타겟팅',
+        '노출수': 280000,
+        '클릭수': 2400,
+        '클릭률': 0.86,
+        '광고비': retarget_spend,
+        '총 주문수(14일)': int(retarget_revenue / 24900),
+        '총 판매수량(14일)': int(retarget_revenue / 24900 * 1.3),
+        '총 전환매출액(14일)': retarget_revenue,
+        '총광고수익률(14일)': round((retarget_revenue / retarget_spend) * 100, 1)
     })
 
-# 비검색영역 추가 (전체의 약 12%)
-non_search_spend = int(total_ad_spend * 0.12)
-non_search_roas = np.random.uniform(7.0, 9.0)  # 비검색은 ROAS 약간 낮음
-non_search_revenue = int(non_search_spend * non_search_roas)
-data.append({
-    '키워드': '-',
-    '광고 노출 지면': '비검색영역 (상품상세,장바구니)',
-    '노출수': 720000,
-    '클릭수': 3500,
-    '클릭률': 0.49,
-    '광고비': non_search_spend,
-    '총 주문수(14일)': int(non_search_revenue / 21900),
-    '총 판매수량(14일)': int(non_search_revenue / 21900 * 1.2),
-    '총 전환매출액(14일)': non_search_revenue,
-    '총광고수익률(14일)': round((non_search_revenue / non_search_spend) * 100, 1)
-})
-
-# 리타겟팅 추가 (ROAS 높음)
-retarget_spend = int(total_ad_spend * 0.08)
-retarget_roas = np.random.uniform(13.0, 16.0)
-retarget_revenue = int(retarget_spend * retarget_roas)
-data.append({
-    '키워드': '-',
-    '광고 노출 지면': '리타겟팅',
-    '노출수': 280000,
-    '클릭수': 2400,
-    '클릭률': 0.86,
-    '광고비': retarget_spend,
-    '총 주문수(14일)': int(retarget_revenue / 24900),
-    '총 판매수량(14일)': int(retarget_revenue / 24900 * 1.3),
-    '총 전환매출액(14일)': retarget_revenue,
-    '총광고수익률(14일)': round((retarget_revenue / retarget_spend) * 100, 1)
-})
-
-# DataFrame 생성
-df = pd.DataFrame(data)
-
-# 결과 확인
-final_spend = df['광고비'].sum()
-final_revenue = df['총 전환매출액(14일)'].sum()
-final_roas = final_revenue / final_spend
-
-print(f"\n=== 최종 결과 ===")
-print(f"총 광고비: {final_spend:,}원")
-print(f"총 매출: {final_revenue:,}원")
-print(f"평균 ROAS: {final_roas * 100:.1f}%")
-print(f"키워드 수: {len(df)}개")
-
-# ROAS 분포 통계 (세분화)
-print("\n=== ROAS 분포 ===")
-roas_col = df['총광고수익률(14일)']
-print(f"전환없음 (0%): {len(df[roas_col == 0])}개")
-print(f"극히낭비 (1~100%): {len(df[(roas_col > 0) & (roas_col <= 100)])}개")
-print(f"낭비 (100~200%): {len(df[(roas_col > 100) & (roas_col <= 200)])}개")
-print(f"손해 (200~400%): {len(df[(roas_col > 200) & (roas_col <= 400)])}개")
-print(f"저조 (400~600%): {len(df[(roas_col > 400) & (roas_col <= 600)])}개")
-print(f"보통 (600~900%): {len(df[(roas_col > 600) & (roas_col <= 900)])}개")
-print(f"양호 (900~1300%): {len(df[(roas_col > 900) & (roas_col <= 1300)])}개")
-print(f"우수 (1300~2200%): {len(df[(roas_col > 1300) & (roas_col <= 2200)])}개")
-print(f"탁월 (2200%+): {len(df[roas_col > 2200])}개")
-
-# Excel 저장
-output_dir = os.path.dirname(os.path.abspath(__file__))
-output_path = os.path.join(output_dir, 'coupang_kitchen_sample.xlsx')
-df.to_excel(output_path, index=False, engine='openpyxl')
-print(f"\n파일 저장: {output_path}")
-
-# 상위 20개 키워드 출력 (광고비 기준)
-print("\n=== 상위 20개 키워드 (광고비 기준) ===")
-top20 = df.nlargest(20, '광고비')[['키워드', '광고비', '총 전환매출액(14일)', '총광고수익률(14일)']]
-print(top20.to_string(index=False))
-
-# 저조 키워드 출력
-print("\n=== 저조 키워드 (ROAS 600% 이하) ===")
-low_keywords = df[df['총광고수익률(14일)'] <= 600].sort_values('광고비', ascending=False)
-low_keywords = low_keywords[['키워드', '광고비', '총 전환매출액(14일)', '총광고수익률(14일)']]
-print(low_keywords.head(15).to_string(index=False))
-print(f"\n저조 키워드 총 광고비: {low_keywords['광고비'].sum():,}원")
-
-# 우수 키워드 출력
-print("\n=== 우수 키워드 (ROAS 1200% 이상) ===")
-good_keywords = df[df['총광고수익률(14일)'] >= 1200].sort_values('총광고수익률(14일)', ascending=False)
-good_keywords = good_keywords[['키워드', '광고비', '총 전환매출액(14일)', '총광고수익률(14일)']]
-print(good_keywords.head(15).to_string(index=False))
+    # DataFrame 생성
+    df = pd.DataFrame(data)
+
+    return df
+
+
+def main():
+    df = generate_sample_data()
+
+    # 결과 확인
+    final_spend = df['광고비'].sum()
+    final_revenue = df['총 전환매출액(14일)'].sum()
+    final_roas = final_revenue / final_spend
+
+    print(f"\n=== 최종 결과 ===")
+    print(f"총 광고비: {final_spend:,}원")
+    print(f"총 매출: {final_revenue:,}원")
+    print(f"평균 ROAS: {final_roas * 100:.1f}%")
+    print(f"키워드 수: {len(df)}개")
+
+    # ROAS 분포 통계 (세분화)
+    print("\n=== ROAS 분포 ===")
+    roas_col = df['총광고수익률(14일)']
+    print(f"전환없음 (0%): {len(df[roas_col == 0])}개")
+    print(f"극히낭비 (1~100%): {len(df[(roas_col > 0) & (roas_col <= 100)])}개")
+    print(f"낭비 (100~200%): {len(df[(roas_col > 100) & (roas_col <= 200)])}개")
+    print(f"손해 (200~400%): {len(df[(roas_col > 200) & (roas_col <= 400)])}개")
+    print(f"저조 (400~600%): {len(df[(roas_col > 400) & (roas_col <= 600)])}개")
+    print(f"보통 (600~900%): {len(df[(roas_col > 600) & (roas_col <= 900)])}개")
+    print(f"양호 (900~1300%): {len(df[(roas_col > 900) & (roas_col <= 1300)])}개")
+    print(f"우수 (1300~2200%): {len(df[(roas_col > 1300) & (roas_col <= 2200)])}개")
+    print(f"탁월 (2200%+): {len(df[roas_col > 2200])}개")
+
+    # Excel 저장
+    output_dir = os.path.dirname(os.path.abspath(__file__))
+    output_path = os.path.join(output_dir, 'coupang_kitchen_sample.xlsx')
+    df.to_excel(output_path, index=False, engine='openpyxl')
+    print(f"\n파일 저장: {output_path}")
+
+    # 상위 20개 키워드 출력 (광고비 기준)
+    print("\n=== 상위 20개 키워드 (광고비 기준) ===")
+    top20 = df.nlargest(20, '광고비')[['키워드', '광고비', '총 전환매출액(14일)', '총광고수익률(14일)']]
+    print(top20.to_string(index=False))
+
+    # 저조 키워드 출력
+    print("\n=== 저조 키워드 (ROAS 600% 이하) ===")
+    low_keywords = df[df['총광고수익률(14일)'] <= 600].sort_values('광고비', ascending=False)
+    low_keywords = low_keywords[['키워드', '광고비', '총 전환매출액(14일)', '총광고수익률(14일)']]
+    print(low_keywords.head(15).to_string(index=False))
+    print(f"\n저조 키워드 총 광고비: {low_keywords['광고비'].sum():,}원")
+
+    # 우수 키워드 출력
+    print("\n=== 우수 키워드 (ROAS 1200% 이상) ===")
+    good_keywords = df[df['총광고수익률(14일)'] >= 1200].sort_values('총광고수익률(14일)', ascending=False)
+    good_keywords = good_keywords[['키워드', '광고비', '총 전환매출액(14일)', '총광고수익률(14일)']]
+    print(good_keywords.head(15).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
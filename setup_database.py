@@ -107,16 +107,32 @@ try:
             id INT PRIMARY KEY AUTO_INCREMENT,
             banner_id INT NOT NULL,
             event_type ENUM('impression', 'click') NOT NULL,
-            event_date DATE NOT NULL,
-            event_count INT DEFAULT 1,
+            ip_address VARCHAR(45) DEFAULT NULL,
+            user_agent TEXT DEFAULT NULL,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             FOREIGN KEY (banner_id) REFERENCES banners(id) ON DELETE CASCADE,
-            UNIQUE KEY uk_banner_event_date (banner_id, event_type, event_date),
-            INDEX idx_date (event_date)
+            INDEX idx_banner_date (banner_id, created_at),
+            INDEX idx_event_type (event_type, created_at)
         ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
     """)
     print("   ✅ banner_analytics 테이블 생성 완료")
 
+    # 시간별/일별 집계 (이벤트 로그 반영 시 증분 갱신)
+    for table, column, column_type in (('banner_stats_hourly', 'stat_hour', 'DATETIME'),
+                                       ('banner_stats_daily', 'stat_date', 'DATE')):
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                banner_id INT NOT NULL,
+                {column} {column_type} NOT NULL,
+                impressions INT NOT NULL DEFAULT 0,
+                clicks INT NOT NULL DEFAULT 0,
+                PRIMARY KEY (banner_id, {column}),
+                INDEX idx_{column} ({column}),
+                FOREIGN KEY (banner_id) REFERENCES banners(id) ON DELETE CASCADE
+            ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+        """)
+    print("   ✅ banner_stats_hourly / banner_stats_daily 테이블 생성 완료")
+
     conn.commit()
 
     # ========================================
@@ -152,7 +168,8 @@ try:
     cursor.execute("SHOW TABLES")
     tables = cursor.fetchall()
 
-    banner_tables = ['banners', 'admin_users', 'admin_sessions', 'banner_analytics']
+    banner_tables = ['banners', 'admin_users', 'admin_sessions', 'banner_analytics',
+                     'banner_stats_hourly', 'banner_stats_daily']
 
     for table in banner_tables:
         cursor.execute(f"SHOW TABLES LIKE '{table}'")
@@ -0,0 +1,167 @@
+"""
+광고 일별 데이터 일괄 적재 테스트
+- 컬럼 단위 형변환 + (날짜, 캠페인)별 합산 결과가 기존 행 단위(iterrows) 변환의 합계와 동일
+- 청크 단위 다중 행 INSERT ... ON DUPLICATE KEY UPDATE / LOAD DATA TSV 이스케이프
+- 덮어쓰기 전 같은 (날짜, 캠페인) 키의 기존 팩트를 이전 값으로 보관 (청크 단위 키 IN)
+- save_snapshot: 사용자 일별 팩트 반영, data_json 선택 저장, 서버 local_infile OFF 시 INSERT로 대체
+"""
+
+from contextlib import contextmanager
+
+import pandas as pd
+import pytest
+from flask import Flask
+
+from app.services import ad_analyzer
+from app.services.ad_analyzer import AdAnalyzer
+from app.services.ad_bulk_loader import (
+    DAILY_COLUMNS, prepare_daily_frame, build_fact_upserts, build_version_archives, build_daily_tsv,
+    upsert_daily_facts
+)
+from benchmarks.ad_frames import make_daily_frame, legacy_daily_records
+
+
+class FakeCursor:
+    def __init__(self, local_infile=0):
+        self.local_infile = local_infile
+        self.executed = []
+        self.lastrowid = 42
+        self.rowcount = 0
+
+    def execute(self, sql, params=()):
+        self.executed.append((sql, params))
+
+    def fetchone(self):
+        return {'enabled': self.local_infile}
+
+    def fetchall(self):
+        return []
+
+
+def test_prepare_matches_legacy_row_conversion():
+    df = make_daily_frame(300, seed=1, campaigns=3)
+    daily = prepare_daily_frame(df)
+    params = [params for _, params in build_fact_upserts('u1', 7, daily, chunk_rows=1000)][0]
+    assert all(type(value) in (int, float, str) for value in params)
+
+    # 기존 행 단위 변환 결과를 (날짜, 캠페인)별로 합산한 값과 동일
+    legacy = pd.DataFrame(legacy_daily_records(df, 7), columns=['snapshot_id', *DAILY_COLUMNS])
+    legacy['date'] = legacy['date'].astype(str)
+    expected = legacy.groupby(['date', 'campaign_name'])[list(DAILY_COLUMNS[2:])].sum()
+
+    width = len(DAILY_COLUMNS) + 2
+    rows = [params[i:i + width] for i in range(0, len(params), width)]
+    assert len(rows) == len(expected) < len(df)
+    for user_id, snapshot_id, day, name, spend, impressions, clicks, conversions, revenue in rows:
+        assert (user_id, snapshot_id) == ('u1', 7)
+        row = expected.loc[(day, name)]
+        assert spend == pytest.approx(row['spend']) and revenue == pytest.approx(row['revenue'])
+        assert (impressions, clicks, conversions) == (row['impressions'], row['clicks'], row['conversions'])
+
+
+def test_missing_impressions_defaults_to_zero():
+    df = make_daily_frame(5).drop(columns=['impressions'])
+    assert prepare_daily_frame(df)['impressions'].tolist() == [0] * 5
+
+
+def test_non_numeric_value_rejected():
+    df = make_daily_frame(3)
+    df.loc[1, 'clicks'] = None
+    with pytest.raises(ValueError):
+        prepare_daily_frame(df)
+
+
+def test_upserts_are_chunked():
+    daily = prepare_daily_frame(make_daily_frame(2500, campaigns=10_000))
+    assert len(daily) == 2500
+    statements = list(build_fact_upserts('u1', 1, daily, chunk_rows=1000))
+
+    assert [len(params) // (len(DAILY_COLUMNS) + 2) for _, params in statements] == [1000, 1000, 500]
+    sql, params = statements[-1]
+    assert sql.count('(%s, %s, %s, %s, %s, %s, %s, %s, %s)') == 500
+    assert sql.endswith('revenue = VALUES(revenue)') and 'ON DUPLICATE KEY UPDATE source_snapshot_id' in sql
+    assert len(params) == 500 * 9
+
+
+def test_version_archives_are_chunked_by_key():
+    daily = prepare_daily_frame(make_daily_frame(2500, campaigns=10_000))
+    statements = list(build_version_archives('u1', daily, chunk_rows=1000))
+
+    assert [(len(params) - 1) // 2 for _, params in statements] == [1000, 1000, 500]
+    sql, params = statements[-1]
+    assert sql.startswith('INSERT IGNORE INTO ad_daily_fact_versions')
+    assert 'FROM ad_daily_facts' in sql and 'source_snapshot_id IS NOT NULL' in sql
+    assert sql.endswith('(date, campaign_name) IN (' + ', '.join(['(%s, %s)'] * 500) + ')')
+    assert params[:3] == ['u1', *daily.iloc[2000][['date', 'campaign_name']].tolist()]
+
+
+def test_tsv_escapes_separators():
+    df = make_daily_frame(1)
+    df['campaign_name'] = ['a\tb\\c\nd']
+    line = build_daily_tsv(prepare_daily_frame(df)).decode('utf-8')
+
+    assert line.endswith('\n') and line.count('\n') == 2
+    fields = line.split('\t')
+    assert fields[1] == 'a\\' and fields[2].startswith('b\\\\c\\\nd')
+
+
+def test_load_data_used_only_when_server_allows():
+    daily = prepare_daily_frame(make_daily_frame(6000, campaigns=10_000))
+    rows = len(daily)
+
+    cursor = FakeCursor(local_infile=0)
+    assert upsert_daily_facts(cursor, 'u1', 1, daily, local_infile=True) == (rows, 'insert')
+
+    cursor = FakeCursor(local_infile=1)
+    assert upsert_daily_facts(cursor, 'u1', 1, daily, local_infile=True) == (rows, 'load_data')
+    sql, params = cursor.executed[-1]
+    assert sql.startswith('LOAD DATA LOCAL INFILE %s REPLACE INTO TABLE ad_daily_facts')
+    assert params[1:] == ('u1', 1)
+
+
+@pytest.fixture
+def app_cursor(monkeypatch):
+    cursor = FakeCursor()
+
+    @contextmanager
+    def fake_transaction():
+        yield cursor
+
+    monkeypatch.setattr(ad_analyzer, 'transaction', fake_transaction)
+    app = Flask(__name__)
+    with app.app_context():
+        yield app, cursor
+
+
+def test_save_snapshot_skips_data_json_by_default(app_cursor):
+    app, cursor = app_cursor
+    df = make_daily_frame(10)
+    df.loc[0, 'campaign_name'] = '  블프_신규!!!  '
+
+    assert AdAnalyzer('u1').save_snapshot(df, '9월 분석') == 42
+
+    snapshot_sql, snapshot_params = cursor.executed[0]
+    assert snapshot_params[0] == 'u1' and snapshot_params[4] is None
+    assert snapshot_params[2] == pd.to_datetime(df['date']).min().date()
+
+    # 덮어쓸 기존 팩트 보관 후 반영
+    archive_sql, params = cursor.executed[1]
+    assert archive_sql.startswith('INSERT IGNORE INTO ad_daily_fact_versions') and params[0] == 'u1'
+
+    fact_sql, params = cursor.executed[2]
+    assert fact_sql.startswith('INSERT INTO ad_daily_facts')
+    assert params[:2] == ['u1', 42] and params[3] == '블프_신규'
+
+    # 업로드 기간의 일/주/월 집계 갱신 후 기간이 겹치는 스냅샷 요약 갱신
+    assert 'ad_metrics_monthly' in cursor.executed[-2][0]
+    overlap_sql, overlap_params = cursor.executed[-1]
+    assert 'FROM ad_analysis_snapshots' in overlap_sql and 'metrics_summary IS NOT NULL' in overlap_sql
+    assert overlap_params == ('u1', snapshot_params[3], snapshot_params[2])
+
+
+def test_save_snapshot_stores_data_json_when_enabled(app_cursor):
+    app, cursor = app_cursor
+    app.config['AD_SNAPSHOT_STORE_DATA_JSON'] = True
+
+    AdAnalyzer('u1').save_snapshot(make_daily_frame(3), '9월 분석')
+    assert cursor.executed[0][1][4].startswith('[{"date":')
@@ -0,0 +1,175 @@
+"""
+스냅샷 비교 테스트
+- N개 비교: 소유권 + 지표를 1회 쿼리로 조회, 전체/캠페인별 변화율 행렬
+- 2개 비교: 기존 응답 형식 유지, 쿼리 1회
+- 캠페인별 증감: 해시 조인 + 힙 선택 결과가 전체 정렬 결과와 동일, 기여도 합 = 전체 변화
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import ad_analyzer
+from app.services.ad_analyzer import AdAnalyzer
+from app.services.ad_compare import change_matrix, build_campaign_matrix, diff_campaigns
+from benchmarks.ad_frames import make_campaigns, full_sort_diff
+
+
+def make_summary(roas, cpa, campaigns):
+    return {
+        'avg_roas': roas, 'avg_ctr': 2.0, 'avg_cpa': cpa, 'cvr': 5.0, 'avg_cpc': 500,
+        'campaigns': [
+            {'campaign_name': name, 'spend': spend, 'revenue': spend * roas, 'conversions': 10,
+             'roas': roas, 'ctr': 2.0, 'cpa': cpa, 'cvr': 5.0, 'cpc': 500, 'rank': 1, 'status': 'good'}
+            for name, spend in campaigns
+        ]
+    }
+
+
+SUMMARIES = {
+    1: make_summary(2.0, 10000, [('검색', 100000), ('쇼핑', 50000)]),
+    2: make_summary(3.0, 8000, [('검색', 120000), ('쇼핑', 40000), ('리타겟팅', 30000)]),
+    3: make_summary(4.0, 12000, [('검색', 90000), ('리타겟팅', 60000)]),
+}
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    calls = []
+
+    def fake_execute_query(sql, params=None, fetch_one=False):
+        calls.append((' '.join(sql.split()), params))
+        ids, user_id = params[:-1], params[-1]
+        return [
+            {'id': snapshot_id, 'snapshot_name': f'{snapshot_id}주차', 'period_start': '2026-09-01',
+             'period_end': '2026-09-07', 'metrics_summary': json.dumps(SUMMARIES[snapshot_id])}
+            for snapshot_id in reversed(ids) if snapshot_id in SUMMARIES and user_id == 'u1'
+        ]
+
+    monkeypatch.setattr(ad_analyzer, 'execute_query', fake_execute_query)
+    return calls
+
+
+def test_change_matrix_baselines():
+    values = pd.DataFrame([[100.0, 150.0, 75.0], [0.0, 10.0, np.nan]], columns=[1, 2, 3])
+
+    first = change_matrix(values, 'first')
+    assert first.iloc[0].tolist()[1:] == [50.0, -25.0] and np.isnan(first.iloc[0, 0])
+    assert first.iloc[1, 1] == 0.0 and np.isnan(first.iloc[1, 2])
+
+    previous = change_matrix(values, 'previous')
+    assert previous.iloc[0].tolist()[1:] == [50.0, -50.0]
+
+
+def test_compare_many_is_one_query(queries):
+    result = AdAnalyzer('u1').compare_many([1, 2, 3, 2])
+
+    assert len(queries) == 1
+    sql, params = queries[0]
+    assert 'WHERE id IN (%s, %s, %s) AND user_id = %s' in sql
+    assert params == (1, 2, 3, 'u1')
+
+    assert [info['id'] for info in result['snapshots']] == [1, 2, 3]
+    roas = result['metrics']['avg_roas']
+    assert roas['values'] == [2.0, 3.0, 4.0]
+    assert roas['change'] == [None, 50.0, 100.0]
+    assert roas['trend'] == [None, 'up', 'up']
+
+    # CPA는 낮을수록 좋음
+    cpa = result['metrics']['avg_cpa']
+    assert cpa['change'] == [None, -20.0, 20.0] and cpa['trend'] == [None, 'up', 'down']
+    assert result['summary'].startswith('✓ ROAS 100.0% 개선')
+
+
+def test_campaign_matrix_joins_on_name(queries):
+    campaigns = AdAnalyzer('u1').compare_many([1, 2, 3], baseline='previous')['campaigns']
+
+    # 마지막 스냅샷 지출액 순, 마지막에 없는 캠페인은 뒤로
+    assert campaigns['names'] == ['검색', '리타겟팅', '쇼핑']
+    spend = campaigns['metrics']['spend']
+    assert spend['values'] == [[100000.0, 120000.0, 90000.0], [None, 30000.0, 60000.0], [50000.0, 40000.0, None]]
+    assert spend['change'] == [[None, 20.0, -25.0], [None, None, 100.0], [None, -20.0, None]]
+    assert campaigns['metrics']['cpa']['trend'][0] == [None, 'up', 'down']
+
+
+def test_campaign_matrix_without_campaigns():
+    assert build_campaign_matrix([1, 2], [{}, {'campaigns': []}]) == {'names': [], 'metrics': {}}
+
+
+def test_compare_many_rejects_foreign_or_missing(queries):
+    assert AdAnalyzer('u1').compare_many([1, 99]) is None
+    assert AdAnalyzer('u2').compare_many([1, 2]) is None
+
+
+@pytest.mark.parametrize('snapshot_ids, baseline', [([1], 'first'), (list(range(1, 20)), 'first'), ([1, 2], 'last')])
+def test_compare_many_rejects_invalid(queries, snapshot_ids, baseline):
+    with pytest.raises(ValueError):
+        AdAnalyzer('u1').compare_many(snapshot_ids, baseline)
+    assert queries == []
+
+
+def test_pair_compare_keeps_response_shape(queries):
+    result = AdAnalyzer('u1').compare_snapshots(2, 1)
+
+    assert len(queries) == 1
+    assert result['comparison']['avg_roas'] == {'a': 3.0, 'b': 2.0, 'change': 50.0, 'trend': 'up'}
+    assert result['comparison']['avg_cpa']['trend'] == 'up'
+    assert result['snapshot_a']['id'] == 2 and result['snapshot_b']['id'] == 1
+    assert 'metrics_summary' not in result['snapshot_a']
+    assert AdAnalyzer('u2').compare_snapshots(2, 1) is None
+
+
+@pytest.mark.parametrize('key', ['revenue', 'spend'])
+def test_diff_top_k_matches_full_sort(key):
+    campaigns_b = make_campaigns(5000, seed=1)
+    campaigns_a = make_campaigns(4900, seed=2, offset=200)
+
+    result = diff_campaigns(campaigns_a, campaigns_b, top_k=25, sort=key)
+    gainers, losers = full_sort_diff(campaigns_a, campaigns_b, 25, key)
+
+    assert [item['campaign_name'] for item in result['gainers']] == gainers
+    assert [item['campaign_name'] for item in result['losers']] == losers
+    assert result['campaign_count'] == 5100
+    assert (result['new_campaigns'], result['stopped_campaigns']) == (100, 200)
+
+
+def test_diff_contributions_sum_to_total_change():
+    campaigns_b = make_campaigns(40, seed=3)
+    campaigns_a = make_campaigns(30, seed=4, offset=15)
+
+    result = diff_campaigns(campaigns_a, campaigns_b, top_k=100, sort='roas_contribution')
+    rows = result['gainers'] + result['losers']
+    totals = result['totals']
+
+    spend_a = sum(item['spend'] for item in campaigns_a)
+    revenue_b = sum(item['revenue'] for item in campaigns_b)
+    assert totals['a']['spend'] == pytest.approx(spend_a) and totals['b']['revenue'] == pytest.approx(revenue_b)
+
+    roas_change = totals['a']['revenue'] / totals['a']['spend'] - totals['b']['revenue'] / totals['b']['spend']
+    assert sum(item['roas_contribution'] for item in rows) == pytest.approx(roas_change, abs=1e-3)
+    assert sum(item['revenue_delta'] for item in rows) == pytest.approx(totals['delta']['revenue'], abs=0.1)
+    assert sum(item['revenue_contribution'] for item in rows) == pytest.approx(
+        100 if totals['delta']['revenue'] > 0 else -100, abs=0.5
+    )
+
+    statuses = {item['campaign_name']: item['status'] for item in rows}
+    assert statuses['campaign_0'] == 'stopped' and statuses['campaign_44'] == 'new'
+    assert statuses['campaign_20'] == 'both'
+
+
+def test_diff_rejects_invalid_sort():
+    with pytest.raises(ValueError):
+        diff_campaigns([], [], sort='cpa')
+
+
+def test_compare_campaigns_is_one_query(queries):
+    result = AdAnalyzer('u1').compare_campaigns(3, 1, top_k=5)
+
+    assert len(queries) == 1
+    assert [item['campaign_name'] for item in result['gainers']] == ['리타겟팅', '검색']
+    assert [item['campaign_name'] for item in result['losers']] == ['쇼핑']
+    assert result['losers'][0]['status'] == 'stopped'
+    assert result['snapshot_a']['id'] == 3 and result['snapshot_b']['id'] == 1
+    assert AdAnalyzer('u2').compare_campaigns(3, 1) is None
@@ -0,0 +1,141 @@
+"""
+광고 지표 계산 테스트
+- 스냅샷 기간의 사용자 일별 팩트를 DB GROUP BY로 집계 (원본 행 조회 없음)
+- 결과가 기존 원본 행 + pandas groupby 계산과 동일
+"""
+
+import json
+import re
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services import ad_analyzer
+from app.services.ad_analyzer import AdAnalyzer
+from app.utils.helpers import calculate_roas, calculate_ctr, calculate_cpa, calculate_cvr, calculate_cpc
+
+
+def make_rows(rows=400, seed=3):
+    """ad_daily_facts 행 (DictCursor 결과 형식)"""
+    rng = np.random.default_rng(seed)
+    return [{
+        'user_id': 'u1',
+        'date': date(2026, 9, 1 + int(rng.integers(0, 30))),
+        'campaign_name': f'캠페인_{int(rng.integers(0, 12))}',
+        'spend': Decimal(f'{rng.uniform(1000, 90000):.2f}'),
+        'revenue': Decimal(f'{rng.uniform(0, 400000):.2f}'),
+        'clicks': int(rng.integers(0, 500)),
+        'conversions': int(rng.integers(0, 40)),
+        'impressions': int(rng.integers(0, 20000)),
+    } for _ in range(rows)]
+
+
+def legacy_metrics(rows):
+    """기존 calculate_metrics의 원본 행 기반 캠페인/일별 계산 (비교 기준)"""
+    df = pd.DataFrame(rows)
+    sums = {'spend': 'sum', 'revenue': 'sum', 'clicks': 'sum', 'conversions': 'sum', 'impressions': 'sum'}
+
+    campaigns = df.groupby('campaign_name').agg(sums).reset_index()
+    campaigns['roas'] = campaigns.apply(lambda row: calculate_roas(row['revenue'], row['spend']), axis=1)
+    campaigns['ctr'] = campaigns.apply(lambda row: calculate_ctr(row['clicks'], row['impressions']), axis=1)
+    campaigns['cpa'] = campaigns.apply(lambda row: calculate_cpa(row['spend'], row['conversions']), axis=1)
+    campaigns['cvr'] = campaigns.apply(lambda row: calculate_cvr(row['conversions'], row['clicks']), axis=1)
+    campaigns['cpc'] = campaigns.apply(lambda row: calculate_cpc(row['spend'], row['clicks']), axis=1)
+
+    daily = df.groupby('date').agg(sums).reset_index()
+    daily['roas'] = daily.apply(lambda row: calculate_roas(row['revenue'], row['spend']), axis=1)
+    daily['roas_ma7'] = daily['roas'].rolling(window=7, min_periods=1).mean().round(2)
+
+    return campaigns.set_index('campaign_name'), daily
+
+
+class FakeDB:
+    """GROUP BY 쿼리를 원본 행으로 계산해 돌려주는 execute_query 대체"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+        self.updates = []
+
+    def execute_query(self, sql, params=None, fetch_one=False):
+        if fetch_one:
+            return {'user_id': 'u1', 'period_start': date(2026, 9, 1), 'period_end': date(2026, 9, 30)}
+
+        self.queries.append((sql, params))
+        column = re.search(r'GROUP BY (\w+)', sql).group(1)
+        groups = {}
+        for row in self.rows:
+            group = groups.setdefault(row[column], {
+                column: row[column], 'spend': Decimal('0'), 'revenue': Decimal('0'),
+                'clicks': Decimal('0'), 'conversions': Decimal('0'), 'impressions': Decimal('0')
+            })
+            for key in ('spend', 'revenue', 'clicks', 'conversions', 'impressions'):
+                group[key] += row[key]
+        return [groups[key] for key in sorted(groups)]
+
+    def execute_update(self, sql, params=None):
+        self.updates.append(params)
+        return 1
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeDB(make_rows())
+    monkeypatch.setattr(ad_analyzer, 'execute_query', db.execute_query)
+    monkeypatch.setattr(ad_analyzer, 'execute_update', db.execute_update)
+    return db
+
+
+def test_only_aggregated_rows_are_queried(fake_db):
+    AdAnalyzer(1).calculate_metrics(1)
+
+    assert len(fake_db.queries) == 2
+    for sql, params in fake_db.queries:
+        assert 'SELECT *' not in sql and 'FROM ad_daily_facts' in sql
+        assert 'WHERE user_id = %s AND date >= %s AND date < %s' in sql
+        assert params == ('u1', date(2026, 9, 1), date(2026, 10, 1))
+
+
+def test_matches_row_level_calculation(fake_db):
+    metrics = AdAnalyzer(1).calculate_metrics(1)
+    campaigns, daily = legacy_metrics(fake_db.rows)
+
+    assert metrics['total_spend'] == pytest.approx(float(sum(row['spend'] for row in fake_db.rows)))
+    assert metrics['total_clicks'] == sum(row['clicks'] for row in fake_db.rows)
+    assert metrics['total_days'] == len(daily)
+    assert metrics['period_start'] == str(daily['date'].min())
+
+    for item in metrics['campaigns']:
+        expected = campaigns.loc[item['campaign_name']]
+        for key in ('roas', 'ctr', 'cpa', 'cvr', 'cpc'):
+            assert item[key] == expected[key], (item['campaign_name'], key)
+
+    roas = [item['roas'] for item in metrics['campaigns']]
+    assert roas == sorted(roas, reverse=True)
+    assert [item['rank'] for item in metrics['campaigns']] == list(range(1, len(roas) + 1))
+
+    assert [item['roas_ma7'] for item in metrics['daily_trend']] == daily['roas_ma7'].tolist()
+    assert metrics['daily_trend'][0]['date'] == str(daily['date'].iloc[0])
+
+
+def test_result_is_json_serializable(fake_db):
+    metrics = AdAnalyzer(1).calculate_metrics(1)
+
+    stored = json.loads(fake_db.updates[0][0])
+    assert stored['campaigns'][0]['status'] in ('excellent', 'good', 'poor')
+    assert isinstance(stored['daily_trend'][0]['impressions'], int)
+    assert fake_db.updates[0][1] == metrics['total_spend']
+
+
+def test_empty_snapshot_returns_empty(monkeypatch):
+    fake_db = FakeDB([])
+    monkeypatch.setattr(ad_analyzer, 'execute_query', fake_db.execute_query)
+    assert AdAnalyzer(1).calculate_metrics(1) == {}
+
+
+def test_missing_snapshot_returns_empty(monkeypatch):
+    monkeypatch.setattr(ad_analyzer, 'execute_query', lambda sql, params=None, fetch_one=False: None)
+    assert AdAnalyzer(1).calculate_metrics(1) == {}
@@ -0,0 +1,49 @@
+"""
+예산 페이싱 지출 집계 테스트
+- 월 범위는 반열린 날짜 범위 (DATE_FORMAT 비교 없음)
+- 페이싱은 월별 집계의 전체 합계 1행만 조회
+"""
+
+from datetime import date
+
+import pytest
+
+from app.services import ad_spend_rollup
+from app.services.ad_analyzer import AdAnalyzer
+from app.services.ad_spend_rollup import month_range, next_month
+
+
+def test_month_range_is_half_open():
+    assert month_range('2026-10') == (date(2026, 10, 1), date(2026, 11, 1))
+    assert month_range('2026-12') == (date(2026, 12, 1), date(2027, 1, 1))
+    assert next_month(date(2026, 2, 14)) == date(2026, 3, 1)
+
+
+@pytest.mark.parametrize('value', ['2026-13', '2026', 'abc', None])
+def test_month_range_rejects_invalid(value):
+    with pytest.raises(ValueError):
+        month_range(value)
+
+
+def test_pacing_reads_monthly_rollup(monkeypatch):
+    queries = []
+
+    def fake_execute_query(sql, params=None, fetch_one=False):
+        queries.append((sql, params))
+        return {'spend': '1500000.00'}
+
+    monkeypatch.setattr(ad_spend_rollup, 'execute_query', fake_execute_query)
+    monkeypatch.setattr(AdAnalyzer, '_get_monthly_goal', lambda self, year_month: {'budget': 3000000})
+
+    pacing = AdAnalyzer('u1').calculate_budget_pacing('2025-04')
+
+    assert pacing['spent'] == 1500000.0
+    assert pacing['spent_rate'] == 50.0
+    sql, params = queries[0]
+    assert 'ad_metrics_monthly' in sql and "campaign_name = ''" in sql
+    assert params == ('u1', date(2025, 4, 1))
+
+
+def test_pacing_rejects_invalid_month():
+    with pytest.raises(ValueError):
+        AdAnalyzer('u1').calculate_budget_pacing('2025/04')
@@ -0,0 +1,119 @@
+"""
+광고 성과 추이 테스트
+- 구간 수(max_points)에 맞는 가장 세밀한 단위 자동 선택 (1년 일별 = 365개)
+- 추이 조회는 집계 테이블 1개를 (user_id, campaign_name, 구간) 범위로 1회 조회
+- 스냅샷 저장 시 업로드 기간이 걸친 일/주/월 구간만 다시 계산
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.services import ad_trend
+from app.services.ad_trend import (
+    bucket_range, count_buckets, choose_granularity, refresh_metric_rollups, get_trend
+)
+
+
+class FakeCursor:
+    def __init__(self):
+        self.executed = []
+
+    def execute(self, sql, params=()):
+        self.executed.append((' '.join(sql.split()), params))
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    calls = []
+
+    def fake_execute_query(sql, params=None, fetch_one=False):
+        calls.append((' '.join(sql.split()), params))
+        return [
+            {'bucket': params[2], 'spend': Decimal('100000.00'), 'revenue': Decimal('350000.00'),
+             'impressions': 20000, 'clicks': 400, 'conversions': 20},
+            {'bucket': params[2].replace(day=2), 'spend': Decimal('0.00'), 'revenue': Decimal('0.00'),
+             'impressions': 0, 'clicks': 0, 'conversions': 0},
+        ]
+
+    monkeypatch.setattr(ad_trend, 'execute_query', fake_execute_query)
+    return calls
+
+
+def test_bucket_ranges_are_aligned_and_half_open():
+    # 2026-10-14 (수) ~ 2026-10-20 (화): 월요일 시작 주 2개
+    assert bucket_range(date(2026, 10, 14), date(2026, 10, 20), 'week') == (date(2026, 10, 12), date(2026, 10, 26))
+    assert bucket_range(date(2026, 11, 15), date(2026, 12, 3), 'month') == (date(2026, 11, 1), date(2027, 1, 1))
+    assert count_buckets(date(2026, 10, 14), date(2026, 10, 20), 'week') == 2
+    assert count_buckets(date(2026, 11, 15), date(2026, 12, 3), 'month') == 2
+    assert count_buckets(date(2026, 1, 1), date(2026, 12, 31), 'day') == 365
+
+
+def test_auto_granularity_downsamples_to_max_points():
+    year = (date(2025, 10, 18), date(2026, 10, 17))
+    assert choose_granularity(*year) == 'day'
+    assert choose_granularity(*year, max_points=60) == 'week'
+    assert choose_granularity(*year, max_points=13) == 'month'
+    assert choose_granularity(date(2000, 1, 1), date(2026, 1, 1), max_points=12) == 'month'
+
+
+def test_year_of_daily_points_is_one_indexed_query(queries):
+    trend = get_trend('u1', date(2025, 10, 18), date(2026, 10, 17))
+
+    assert len(queries) == 1
+    sql, params = queries[0]
+    assert 'FROM ad_metrics_daily' in sql
+    assert 'WHERE user_id = %s AND campaign_name = %s AND stat_date >= %s AND stat_date < %s' in sql
+    assert params == ('u1', '', date(2025, 10, 18), date(2026, 10, 18))
+
+    assert trend['granularity'] == 'day' and trend['campaign_name'] is None
+    point = trend['series'][0]
+    assert point['date'] == '2025-10-18'
+    assert point['spend'] == 100000.0 and point['impressions'] == 20000
+    assert point['roas'] == 3.5 and point['ctr'] == 2.0 and point['cpa'] == 5000
+    assert trend['series'][1]['roas'] == 0
+
+
+def test_campaign_month_trend(queries):
+    trend = get_trend('u1', date(2025, 11, 15), date(2026, 10, 17), granularity='month', campaign_name='블프_신규')
+
+    sql, params = queries[0]
+    assert 'FROM ad_metrics_monthly' in sql
+    assert params == ('u1', '블프_신규', date(2025, 11, 1), date(2026, 11, 1))
+    assert trend['granularity'] == 'month' and trend['series'][0]['date'] == '2025-11-01'
+
+
+@pytest.mark.parametrize('start, end, granularity', [
+    (date(2026, 10, 17), date(2026, 10, 1), 'auto'),
+    (date(2026, 1, 1), date(2026, 2, 1), 'hour'),
+    (date(2020, 1, 1), date(2026, 10, 17), 'day'),
+])
+def test_invalid_requests_rejected(queries, start, end, granularity):
+    with pytest.raises(ValueError):
+        get_trend('u1', start, end, granularity=granularity)
+    assert queries == []
+
+
+def test_refresh_recomputes_spanned_buckets():
+    cursor = FakeCursor()
+    refresh_metric_rollups(cursor, 'u1', date(2026, 9, 20), date(2026, 10, 5))
+
+    # 단위별 삭제 + 캠페인별 + 전체 합계
+    assert len(cursor.executed) == 9
+    tables = ('ad_metrics_daily', 'ad_metrics_weekly', 'ad_metrics_monthly')
+    ranges = (
+        (date(2026, 9, 20), date(2026, 10, 6)),
+        (date(2026, 9, 14), date(2026, 10, 12)),
+        (date(2026, 9, 1), date(2026, 11, 1)),
+    )
+    for index, (table, (start, end)) in enumerate(zip(tables, ranges)):
+        delete, by_campaign, total = cursor.executed[index * 3:index * 3 + 3]
+
+        assert delete[0].startswith(f'DELETE FROM {table}') and delete[1] == ('u1', start, end)
+        assert by_campaign[0].startswith(f'INSERT INTO {table}') and 'FROM ad_daily_facts' in by_campaign[0]
+        assert 'GROUP BY user_id, campaign_name' in by_campaign[0] and by_campaign[1] == ('u1', start, end)
+        assert total[1] == ('', 'u1', start, end)
+
+        where = by_campaign[0].split('WHERE')[1].split('GROUP BY')[0]
+        assert 'date >= %s AND date < %s' in where and 'DATE_FORMAT' not in where
@@ -0,0 +1,162 @@
+"""
+배너 이벤트 로그/집계 테스트
+- 이벤트 행 펼치기, 다중 행 INSERT 분할, 시간별/일별 증분 집계 문장
+- 버퍼 적재/실패 복구/보관 한도, 존재하지 않는 배너 제외, 빈 구간 0 채우기
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, date
+
+from app.services import banner_analytics
+from app.services.banner_analytics import (
+    BannerEventLog, expand_events, build_event_inserts, build_rollup_upserts, write_events, fill_timeseries
+)
+
+T1 = datetime(2026, 10, 17, 9, 15, 30)
+T2 = datetime(2026, 10, 17, 10, 5, 0)
+
+
+class RecordingWriter:
+    """적재 요청 기록 (fail=True면 예외)"""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+
+    def __call__(self, rows):
+        if self.fail:
+            raise RuntimeError('db down')
+        self.calls.append(list(rows))
+
+
+class FakeCursor:
+    """banners 조회 결과를 고정하고 실행된 문장을 기록"""
+
+    def __init__(self, existing_ids):
+        self.existing_ids = existing_ids
+        self.executed = []
+
+    def execute(self, sql, params=()):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return [{'id': banner_id} for banner_id in self.existing_ids]
+
+
+def test_expand_events():
+    rows = expand_events({1: (2, 1)}, '1.2.3.4', 'x' * 600, T1)
+
+    assert [row[1] for row in rows] == ['impression', 'impression', 'click']
+    assert all(row[0] == 1 and row[2] == '1.2.3.4' and row[4] == T1 for row in rows)
+    assert len(rows[0][3]) == banner_analytics.MAX_USER_AGENT_LENGTH
+
+
+def test_build_event_inserts_chunks(monkeypatch):
+    monkeypatch.setattr(banner_analytics, 'INSERT_CHUNK_ROWS', 2)
+    rows = expand_events({1: (3, 0), 2: (0, 1)}, created_at=T1)
+
+    statements = build_event_inserts(rows)
+    assert len(statements) == 2
+    sql, params = statements[0]
+    assert sql.startswith('INSERT INTO banner_analytics')
+    assert sql.count('(%s, %s, %s, %s, %s)') == 2
+    assert params[:5] == (1, 'impression', None, None, T1)
+    assert statements[1][0].count('(%s, %s, %s, %s, %s)') == 2
+
+
+def test_build_rollup_upserts():
+    rows = (expand_events({2: (2, 1), 1: (1, 0)}, created_at=T1)
+            + expand_events({2: (1, 0)}, created_at=T2))
+
+    hourly, daily = build_rollup_upserts(rows)
+    assert hourly[0].startswith('INSERT INTO banner_stats_hourly')
+    assert 'ON DUPLICATE KEY UPDATE impressions = impressions + VALUES(impressions)' in hourly[0]
+    assert hourly[1] == (
+        1, datetime(2026, 10, 17, 9), 1, 0,
+        2, datetime(2026, 10, 17, 9), 2, 1,
+        2, datetime(2026, 10, 17, 10), 1, 0,
+    )
+    assert daily[0].startswith('INSERT INTO banner_stats_daily')
+    assert daily[1] == (1, date(2026, 10, 17), 1, 0, 2, date(2026, 10, 17), 3, 1)
+
+
+def test_write_events_skips_unknown_banners(monkeypatch):
+    cursor = FakeCursor(existing_ids=[1])
+
+    @contextmanager
+    def fake_get_db_cursor(commit=False):
+        assert commit
+        yield cursor
+
+    monkeypatch.setattr(banner_analytics, 'get_db_cursor', fake_get_db_cursor)
+    write_events(expand_events({1: (1, 0), 99: (5, 0)}, created_at=T1))
+
+    statements = [sql for sql, _ in cursor.executed]
+    assert statements[0].startswith('SELECT id FROM banners')
+    assert len(statements) == 4  # 존재 확인 + 로그 INSERT + 시간별 + 일별
+    assert cursor.executed[1][1] == (1, 'impression', None, None, T1)
+
+
+def test_write_events_all_unknown(monkeypatch):
+    cursor = FakeCursor(existing_ids=[])
+
+    @contextmanager
+    def fake_get_db_cursor(commit=False):
+        yield cursor
+
+    monkeypatch.setattr(banner_analytics, 'get_db_cursor', fake_get_db_cursor)
+    write_events(expand_events({99: (1, 0)}, created_at=T1))
+    assert len(cursor.executed) == 1
+
+
+def test_event_log_flush():
+    writer = RecordingWriter()
+    event_log = BannerEventLog(writer, flush_interval=3600)
+
+    event_log.add(expand_events({1: (2, 0)}, created_at=T1))
+    event_log.add(expand_events({2: (0, 1)}, created_at=T1))
+    assert event_log.status()['pending_events'] == 3
+
+    assert event_log.flush() == 3
+    assert len(writer.calls) == 1 and len(writer.calls[0]) == 3
+    assert event_log.status()['flushed_events'] == 3
+    assert event_log.flush() == 0
+    assert len(writer.calls) == 1
+
+
+def test_event_log_failure_restores_and_caps_backlog():
+    event_log = BannerEventLog(RecordingWriter(fail=True), flush_interval=3600, max_backlog=4)
+
+    event_log.add(expand_events({1: (3, 0)}, created_at=T1))
+    assert event_log.flush() == 0
+    assert event_log.status()['pending_events'] == 3
+
+    event_log.add(expand_events({2: (2, 0)}, created_at=T2))
+    assert event_log.flush() == 0
+
+    status = event_log.status()
+    assert status['pending_events'] == 4
+    assert status['dropped_events'] == 1
+    assert status['failures'] == 2
+
+    writer = RecordingWriter()
+    event_log.writer = writer
+    assert event_log.flush() == 4
+    assert [row[0] for row in writer.calls[0]] == [1, 1, 2, 2]  # 오래된 이벤트부터 폐기
+
+
+def test_fill_timeseries_day():
+    rows = [{'bucket': date(2026, 10, 16), 'impressions': 200, 'clicks': 5}]
+    series = fill_timeseries(rows, date(2026, 10, 15), date(2026, 10, 17))
+
+    assert [point['date'] for point in series] == ['2026-10-15', '2026-10-16', '2026-10-17']
+    assert series[0] == {'date': '2026-10-15', 'impressions': 0, 'clicks': 0, 'ctr': 0}
+    assert series[1]['ctr'] == 2.5
+
+
+def test_fill_timeseries_hour():
+    rows = [{'bucket': datetime(2026, 10, 17, 9), 'impressions': 3, 'clicks': 1}]
+    series = fill_timeseries(rows, datetime(2026, 10, 17, 8), datetime(2026, 10, 17, 10), 'hour')
+
+    assert [point['date'] for point in series] == ['2026-10-17 08:00', '2026-10-17 09:00', '2026-10-17 10:00']
+    assert series[1]['ctr'] == 33.33
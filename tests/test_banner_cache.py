@@ -0,0 +1,99 @@
+"""
+활성 배너 캐시 테스트
+- TTL 동안 재조회 없음, 무효화/버전 파일 변경 시 재조회 (워커 간)
+- 동시 만료 시 한 번만 조회, 조회 실패 시 만료된 캐시 사용
+"""
+
+import time
+import threading
+
+import pytest
+
+from app.services.banner_cache import ActiveBannerCache
+
+
+class CountingLoader:
+    """타입별 조회 횟수 기록 (delay로 느린 DB 흉내, fail=True면 예외)"""
+
+    def __init__(self, delay=0):
+        self.calls = 0
+        self.delay = delay
+        self.fail = False
+        self._lock = threading.Lock()
+
+    def __call__(self, banner_type):
+        with self._lock:
+            self.calls += 1
+            call = self.calls
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError('db down')
+        return [{'banner_type': banner_type, 'call': call}]
+
+
+def test_cached_within_ttl():
+    loader = CountingLoader()
+    cache = ActiveBannerCache(ttl_seconds=60)
+
+    assert cache.get('home_top', loader) == cache.get('home_top', loader)
+    cache.get('home_grid', loader)
+    assert loader.calls == 2
+    assert cache.status()['hits'] == 1
+
+
+def test_ttl_expiry():
+    loader = CountingLoader()
+    cache = ActiveBannerCache(ttl_seconds=0.05)
+
+    cache.get('home_top', loader)
+    time.sleep(0.1)
+    assert cache.get('home_top', loader)[0]['call'] == 2
+
+
+def test_invalidate_across_workers(tmp_path):
+    version_path = str(tmp_path / 'banner_cache.version')
+    loader_a, loader_b = CountingLoader(), CountingLoader()
+    worker_a = ActiveBannerCache(ttl_seconds=60, version_path=version_path)
+    worker_b = ActiveBannerCache(ttl_seconds=60, version_path=version_path)
+
+    worker_a.get('home_top', loader_a)
+    worker_b.get('home_top', loader_b)
+
+    worker_a.invalidate()  # 관리자 요청을 처리한 워커
+    worker_a.get('home_top', loader_a)
+    worker_b.get('home_top', loader_b)
+    assert (loader_a.calls, loader_b.calls) == (2, 2)
+
+    # 연속 무효화도 구분 (mtime 해상도와 무관)
+    worker_a.invalidate()
+    worker_b.get('home_top', loader_b)
+    assert loader_b.calls == 3
+
+
+def test_single_load_under_concurrency():
+    loader = CountingLoader(delay=0.1)
+    cache = ActiveBannerCache(ttl_seconds=60)
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(cache.get('home_top', loader))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loader.calls == 1
+    assert len(results) == 8
+
+
+def test_stale_served_on_failure():
+    loader = CountingLoader()
+    cache = ActiveBannerCache(ttl_seconds=0.01)
+    first = cache.get('home_top', loader)
+
+    time.sleep(0.05)
+    loader.fail = True
+    assert cache.get('home_top', loader) == first
+    assert cache.status()['stale_served'] == 1
+
+    with pytest.raises(RuntimeError):
+        cache.get('home_grid', loader)
@@ -0,0 +1,155 @@
+"""
+배너 카운터 write-behind 버퍼 테스트
+- 배너 ID별 합산, 단일 UPDATE 생성, 반영 실패 시 복구, 대기 이벤트 초과 시 즉시 반영
+- 배치 이벤트 검증/합산, /api/banners/events 일괄 반영
+"""
+
+import time
+import threading
+
+from flask import Flask
+
+from app.services.banner_counters import BannerCounterBuffer, build_counter_update, aggregate_events
+
+
+class RecordingWriter:
+    """반영 요청 기록 (fail=True면 예외)"""
+
+    def __init__(self, fail=False):
+        self.calls = []
+        self.fail = fail
+        self.called = threading.Event()
+
+    def __call__(self, counts):
+        if self.fail:
+            raise RuntimeError('db down')
+        self.calls.append(dict(counts))
+        self.called.set()
+
+
+def test_build_counter_update():
+    sql, params = build_counter_update({7: (3, 1), 2: (5, 0)})
+
+    assert sql.count('UPDATE banners') == 1
+    assert 'impression_count = impression_count + CASE id WHEN %s THEN %s WHEN %s THEN %s ELSE 0 END' in sql
+    assert sql.endswith('WHERE id IN (%s, %s)')
+    assert params == (2, 5, 7, 3, 2, 0, 7, 1, 2, 7)
+    assert sql.count('%s') == len(params)
+
+
+def test_coalesces_per_banner():
+    writer = RecordingWriter()
+    buffer = BannerCounterBuffer(writer, flush_interval=3600)
+
+    for _ in range(8):
+        buffer.add(1, impressions=1)
+    buffer.add(2, impressions=1)
+    buffer.add(1, clicks=1)
+    assert buffer.status()['pending_events'] == 10
+    assert buffer.status()['pending_banners'] == 2
+
+    assert buffer.flush() == 10
+    assert writer.calls == [{1: (8, 1), 2: (1, 0)}]
+
+    status = buffer.status()
+    assert status['pending_events'] == 0
+    assert status['flushes'] == 1
+    assert status['flushed_events'] == 10
+    assert status['last_flush_ms'] is not None
+    assert buffer.flush() == 0  # 빈 버퍼는 DB 접근 없음
+    assert len(writer.calls) == 1
+
+
+def test_failed_flush_is_restored():
+    writer = RecordingWriter(fail=True)
+    buffer = BannerCounterBuffer(writer, flush_interval=3600)
+    buffer.add(3, impressions=2)
+
+    assert buffer.flush() == 0
+    assert buffer.status()['failures'] == 1
+
+    buffer.add(3, clicks=1)
+    writer.fail = False
+    assert buffer.flush() == 3
+    assert writer.calls == [{3: (2, 1)}]
+
+
+def test_flushes_when_pending_exceeds_limit():
+    writer = RecordingWriter()
+    buffer = BannerCounterBuffer(writer, flush_interval=3600, max_pending=5)
+
+    for banner_id in range(5):
+        buffer.add(banner_id, impressions=1)
+
+    assert writer.called.wait(5)
+    deadline = time.time() + 5
+    while buffer.status()['pending_events'] and time.time() < deadline:
+        time.sleep(0.01)
+    assert sum(sum(v[0] for v in call.values()) for call in writer.calls) == 5
+
+
+def test_aggregate_events():
+    events = [
+        {'banner_id': 1, 'event_type': 'impression', 'ts': 1700000000000},
+        {'banner_id': 1, 'event_type': 'impression'},
+        {'banner_id': 2, 'event_type': 'click', 'ts': 1700000000000.5},
+        {'banner_id': 1, 'event_type': 'click'},
+        {'banner_id': '3', 'event_type': 'impression'},
+        {'banner_id': True, 'event_type': 'impression'},
+        {'banner_id': 0, 'event_type': 'click'},
+        {'banner_id': 4, 'event_type': 'view'},
+        {'banner_id': 5, 'event_type': 'click', 'ts': 'now'},
+        'impression',
+    ]
+
+    counts, accepted, rejected = aggregate_events(events)
+    assert counts == {1: (2, 1), 2: (0, 1)}
+    assert (accepted, rejected) == (4, 6)
+
+
+def make_events_client(monkeypatch, buffer):
+    from app.routes.public_banners import public_banner_bp
+
+    app = Flask(__name__)
+    app.config.update(BANNER_EVENT_BATCH_MAX=5, BANNER_EVENT_LOG_ENABLED=False)
+    app.register_blueprint(public_banner_bp)
+    monkeypatch.setattr('app.services.banner_service.get_banner_counter_buffer', lambda: buffer)
+    return app.test_client()
+
+
+def test_events_endpoint_buffers_batch(monkeypatch):
+    writer = RecordingWriter()
+    buffer = BannerCounterBuffer(writer, flush_interval=3600)
+    client = make_events_client(monkeypatch, buffer)
+
+    # sendBeacon 전송처럼 Content-Type 없이 와도 처리
+    response = client.post('/api/banners/events', data=(
+        '{"events": [{"banner_id": 1, "event_type": "impression"},'
+        ' {"banner_id": 2, "event_type": "impression"},'
+        ' {"banner_id": 1, "event_type": "click"}, {"banner_id": -1, "event_type": "click"}]}'
+    ), content_type='text/plain')
+    assert response.get_json() == {'success': True, 'accepted': 3, 'rejected': 1}
+
+    buffer.flush()
+    assert writer.calls == [{1: (1, 1), 2: (1, 0)}]
+
+
+def test_events_endpoint_writes_single_statement(monkeypatch):
+    writer = RecordingWriter()
+    client = make_events_client(monkeypatch, None)
+    monkeypatch.setattr('app.services.banner_service.write_counts', writer)
+
+    response = client.post('/api/banners/events', json=[
+        {'banner_id': 3, 'event_type': 'impression'}, {'banner_id': 3, 'event_type': 'impression'}
+    ])
+    assert response.get_json()['accepted'] == 2
+    assert writer.calls == [{3: (2, 0)}]
+
+
+def test_events_endpoint_rejects_invalid_payload(monkeypatch):
+    client = make_events_client(monkeypatch, None)
+
+    assert client.post('/api/banners/events', data='not json').status_code == 400
+    assert client.post('/api/banners/events', json={'events': 'x'}).status_code == 400
+    too_many = [{'banner_id': 1, 'event_type': 'impression'}] * 6
+    assert client.post('/api/banners/events', json=too_many).status_code == 413
@@ -0,0 +1,136 @@
+"""
+배너 이미지 변환 테스트
+- 배너 타입별 규격 검증, 1x/2x 크기 결정
+- WebP + JPEG/PNG 변환본 생성, 메타데이터 제거, 애니메이션 GIF 제외
+- 업로드 저장 시 규격 불일치 거부, 변환 결과 DB 기록
+"""
+
+import io
+import os
+import json
+from contextlib import contextmanager
+
+import pytest
+from flask import Flask
+from PIL import Image
+from werkzeug.datastructures import FileStorage
+
+from app.services import banner_images
+from app.services.banner_images import validate_dimensions, variant_sizes, build_variants, process_banner_images
+from app.services.banner_service import BannerService
+
+
+def save_image(path, size, mode='RGB', exif=False, fmt='JPEG'):
+    img = Image.new(mode, size, (200, 30, 30, 128) if mode == 'RGBA' else (200, 30, 30))
+    kwargs = {}
+    if exif:
+        info = Image.Exif()
+        info[0x010F] = 'Camera Maker'
+        kwargs['exif'] = info.tobytes()
+    img.save(path, fmt, **kwargs)
+    return str(path)
+
+
+@pytest.fixture
+def app(tmp_path):
+    app = Flask(__name__)
+    app.config.update(
+        BANNER_UPLOAD_FOLDER=str(tmp_path / 'banners'),
+        ALLOWED_BANNER_EXTENSIONS={'jpg', 'jpeg', 'png', 'gif', 'webp'},
+        BANNER_CACHE_TTL_SECONDS=0,
+    )
+    with app.app_context():
+        yield app
+
+
+def test_validate_dimensions():
+    validate_dimensions('home_top', 1940, 180)
+    validate_dimensions('home_top', 970, 90)
+    validate_dimensions('unknown', 10, 10)
+
+    with pytest.raises(ValueError, match='970x90'):
+        validate_dimensions('home_top', 728, 90)  # 작음
+    with pytest.raises(ValueError):
+        validate_dimensions('home_top', 1940, 400)  # 비율 다름
+
+
+def test_variant_sizes():
+    assert variant_sizes('home_top', 1940, 180) == {'1x': (970, 90), '2x': (1940, 180)}
+    assert variant_sizes('home_top', 1200, 111) == {'1x': (970, 90)}  # 2x 업스케일 없음
+    assert variant_sizes(None, 750, 300) == {'1x': (375, 150), '2x': (750, 300)}
+    assert variant_sizes(None, 4000, 1000) == {'1x': (970, 242), '2x': (1940, 485)}
+    assert variant_sizes(None, 400, 100) == {'1x': (400, 100)}
+
+
+def test_build_variants_strips_metadata(tmp_path):
+    path = save_image(tmp_path / 'a.jpg', (1940, 180), exif=True)
+
+    variants = build_variants(path, 'home_top')
+    assert variants['webp'] == {'1x': 'a_1x.webp', '2x': 'a_2x.webp'}
+    assert variants['fallback'] == {'1x': 'a_1x.jpg', '2x': 'a_2x.jpg'}
+    assert (variants['width'], variants['height']) == (970, 90)
+
+    with Image.open(tmp_path / 'a_1x.webp') as img:
+        assert img.size == (970, 90)
+        assert not img.getexif()
+    with Image.open(tmp_path / 'a_2x.jpg') as img:
+        assert img.size == (1940, 180)
+        assert not img.getexif()
+
+
+def test_build_variants_alpha_uses_png(tmp_path):
+    path = save_image(tmp_path / 'b.png', (1676, 200), mode='RGBA', fmt='PNG')
+
+    variants = build_variants(path, 'home_grid')
+    assert variants['fallback'] == {'1x': 'b_1x.png', '2x': 'b_2x.png'}
+    with Image.open(tmp_path / 'b_1x.png') as img:
+        assert img.mode == 'RGBA'
+
+
+def test_animated_gif_skipped(tmp_path):
+    frames = [Image.new('RGB', (970, 90), color) for color in ((255, 0, 0), (0, 255, 0))]
+    path = str(tmp_path / 'c.gif')
+    frames[0].save(path, save_all=True, append_images=frames[1:])
+
+    assert build_variants(path, 'home_top') is None
+
+
+def test_save_rejects_wrong_size(app):
+    buffer = io.BytesIO()
+    Image.new('RGB', (300, 300)).save(buffer, 'PNG')
+    buffer.seek(0)
+
+    with pytest.raises(ValueError, match='home_top'):
+        BannerService._save_banner_image(FileStorage(buffer, filename='배너.png'), 'home_top')
+    assert os.listdir(app.config['BANNER_UPLOAD_FOLDER']) == []
+
+
+def test_process_banner_images_records_variants(app, monkeypatch):
+    upload_folder = app.config['BANNER_UPLOAD_FOLDER']
+    os.makedirs(upload_folder)
+    save_image(os.path.join(upload_folder, 'd.jpg'), (1940, 180))
+    save_image(os.path.join(upload_folder, 'd_m.jpg'), (750, 300))
+
+    executed = []
+
+    class Cursor:
+        def execute(self, sql, params):
+            executed.append((sql, params))
+
+    @contextmanager
+    def fake_get_db_cursor(commit=False):
+        yield Cursor()
+
+    monkeypatch.setattr(banner_images, 'get_db_cursor', fake_get_db_cursor)
+    result = process_banner_images(7, 'home_top', '/static/uploads/banners/d.jpg', '/static/uploads/banners/d_m.jpg')
+
+    assert result['desktop']['webp']['2x'] == '/static/uploads/banners/d_2x.webp'
+    assert result['mobile']['fallback']['1x'] == '/static/uploads/banners/d_m_1x.jpg'
+    sql, params = executed[0]
+    assert sql.startswith('UPDATE banners SET image_variants')
+    assert json.loads(params[0]) == result
+    assert params[1:] == (7, '/static/uploads/banners/d.jpg')
+
+    banner_images.delete_variants('/static/uploads/banners/d.jpg', upload_folder)
+    assert sorted(os.listdir(upload_folder)) == ['d.jpg', 'd_m.jpg', 'd_m_1x.jpg', 'd_m_1x.webp',
+                                                 'd_m_2x.jpg', 'd_m_2x.webp']
@@ -0,0 +1,63 @@
+"""
+배너 순서 변경 테스트
+- 전체 순서를 1개의 UPDATE 문으로 반영
+- 현재 배너 목록과 다른 순서 목록(누락/중복/다른 타입) 거부
+"""
+
+from contextlib import contextmanager
+
+import pytest
+from flask import Flask
+
+from app.services import banner_service
+from app.services.banner_service import BannerService
+
+
+class FakeCursor:
+    def __init__(self, current_ids):
+        self.current_ids = current_ids
+        self.executed = []
+
+    def execute(self, sql, params=()):
+        self.executed.append((sql, params))
+
+    def fetchall(self):
+        return [{'id': banner_id} for banner_id in self.current_ids]
+
+
+@pytest.fixture
+def cursor(monkeypatch):
+    cursor = FakeCursor([3, 5, 9])
+
+    @contextmanager
+    def fake_get_db_cursor(commit=False):
+        yield cursor
+
+    monkeypatch.setattr(banner_service, 'get_db_cursor', fake_get_db_cursor)
+    app = Flask(__name__)
+    app.config.update(BANNER_CACHE_TTL_SECONDS=0)
+    with app.app_context():
+        yield cursor
+
+
+def test_build_reorder_query():
+    sql, params = BannerService._build_reorder_query('home_grid', [9, 3, 5])
+
+    assert sql == ("UPDATE banners SET position_order = CASE id WHEN %s THEN %s WHEN %s THEN %s WHEN %s THEN %s END "
+                   "WHERE banner_type = %s AND id IN (%s, %s, %s)")
+    assert params == (9, 1, 3, 2, 5, 3, 'home_grid', 9, 3, 5)
+
+
+def test_reorder_single_statement(cursor):
+    assert BannerService.reorder_banners('home_grid', [9, 3, 5]) is True
+
+    assert len(cursor.executed) == 2
+    assert 'FOR UPDATE' in cursor.executed[0][0]
+    assert cursor.executed[1][0].startswith('UPDATE banners SET position_order = CASE id')
+
+
+@pytest.mark.parametrize('order_list', [[9, 3], [9, 3, 5, 7], [9, 3, 3]])
+def test_reorder_rejects_mismatch(cursor, order_list):
+    with pytest.raises(ValueError):
+        BannerService.reorder_banners('home_grid', order_list)
+    assert len(cursor.executed) == 1  # 잠금 조회만 하고 UPDATE 없음
@@ -0,0 +1,74 @@
+"""
+쿠팡 보고서 가공 parity 테스트
+- 기존 마스크별 합산 + 2차 groupby + 문자열 ROAS 변환 경로(레퍼런스 구현)와
+  단일 groupby 집계 결과가 동일한지 검증
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.coupang_report import (
+    process_coupang_report, CoupangReportError, _round_percent
+)
+from benchmarks.coupang_reports import make_report_frame, legacy_process
+
+
+@pytest.mark.parametrize('n,seed', [(50, 0), (2_000, 1), (20_000, 2)])
+def test_matches_legacy(n, seed):
+    report = make_report_frame(n, seed)
+
+    result = process_coupang_report(report.copy())
+    expected = legacy_process(report.copy())
+
+    pd.testing.assert_frame_equal(result['df'], expected, check_exact=True)
+    assert result['data_type'] == '14일'
+    assert result['warning'] is None
+
+
+def test_consolidated_rows():
+    report = make_report_frame(500, seed=3)
+    df = process_coupang_report(report)['df']
+
+    for name in ['비검색영역 (통합)', '리타겟팅 (통합)']:
+        row = df[df['키워드'] == name]
+        assert len(row) == 1
+        assert row['광고 노출 지면'].iloc[0] == name
+    assert df['키워드'].is_unique
+    assert df['키워드'].is_monotonic_increasing
+    # 검색영역 '-' 키워드는 없어야 함 (비검색/리타겟팅만 '-' 사용)
+    assert (df['키워드'] == '-').sum() == 0
+
+
+def test_search_only_report():
+    report = make_report_frame(300, seed=4)
+    report = report[report['광고 노출 지면'] == '검색 영역'].reset_index(drop=True)
+
+    result = process_coupang_report(report.copy())
+    pd.testing.assert_frame_equal(result['df'], legacy_process(report.copy()), check_exact=True)
+
+
+def test_one_day_fallback():
+    report = make_report_frame(100, seed=5)
+    report = report.rename(columns=lambda c: c.replace('(14일)', '(1일)'))
+
+    result = process_coupang_report(report)
+    assert result['data_type'] == '1일'
+    assert result['warning']
+
+
+def test_missing_revenue_column():
+    report = make_report_frame(10).drop(columns=['총 전환매출액(14일)'])
+    with pytest.raises(CoupangReportError):
+        process_coupang_report(report)
+
+
+def test_round_percent_matches_string_format():
+    rng = np.random.default_rng(6)
+    values = np.concatenate([
+        rng.uniform(-1000, 5000, 50_000),
+        np.arange(0, 100, 0.005),          # .xx5 경계값
+        np.array([0.125, 1.005, 2.675, -0.125, -0.001, 0.0]),
+    ])
+    expected = np.array([float(f"{v:.2f}") for v in values])
+    np.testing.assert_array_equal(_round_percent(values.copy()), expected)
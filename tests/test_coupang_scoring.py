@@ -0,0 +1,43 @@
+"""
+쿠팡 키워드 스코어링 엔진 parity 테스트
+- 기존 iterrows 기반 루프(레퍼런스 구현)와 컬럼 단위 엔진의 결과가 동일한지 검증
+"""
+
+import pytest
+
+from app.services.coupang_scoring import build_recommendations
+from benchmarks.coupang_keywords import make_keyword_frame, legacy_recommendations
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2, 3])
+@pytest.mark.parametrize('target_roas', [400, 150])
+def test_parity_with_legacy_loop(seed, target_roas):
+    df = make_keyword_frame(3000, seed=seed)
+
+    expected = legacy_recommendations(df, target_roas)
+    actual = build_recommendations(df, target_roas)
+
+    assert actual[1] == expected[1]
+    assert actual[0] == expected[0]
+
+
+def test_parity_small_tiers_fall_back_to_global_median():
+    # 구간별 키워드가 3개 미만이면 전체 중앙값 CPC 사용
+    df = make_keyword_frame(8, seed=7)
+    assert build_recommendations(df) == legacy_recommendations(df)
+
+
+def test_empty_after_search_area_filter():
+    df = make_keyword_frame(50, seed=0)
+    df['광고 노출 지면'] = '리타겟팅 (통합)'
+
+    recommendations, summary = build_recommendations(df)
+
+    assert recommendations == []
+    assert summary == legacy_recommendations(df)[1]
+
+
+def test_scores_sorted_descending():
+    recommendations, _ = build_recommendations(make_keyword_frame(500, seed=5))
+    scores = [r['score'] for r in recommendations]
+    assert scores == sorted(scores, reverse=True)
@@ -0,0 +1,89 @@
+"""
+업로드 데이터셋 저장소 테스트
+- 저장/조회 왕복, 소유자 확인, TTL 만료 및 정리 동작 검증
+"""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from app.services.dataset_store import DatasetStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DatasetStore(str(tmp_path / 'datasets'), ttl_seconds=60, sweep_interval=0)
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame({
+        '키워드': ['주방세제', '고무장갑', '수세미'],
+        '광고비': [1200.0, 0.0, 530.0],
+        '클릭수': [10, 0, 3],
+        'ROAS': [350.5, 0.0, 120.0],
+    })
+
+
+def test_roundtrip(store, frame):
+    dataset_id = store.put(frame, {'user_id': 'u1', 'summary': {'총광고비': 1730}})
+
+    loaded = store.get(dataset_id, user_id='u1')
+    pd.testing.assert_frame_equal(loaded, frame)
+
+    meta = store.get_meta(dataset_id)
+    assert meta['rows'] == 3
+    assert meta['summary'] == {'총광고비': 1730}
+    assert meta['columns'] == list(frame.columns)
+
+
+def test_column_projection(store, frame):
+    dataset_id = store.put(frame, {'user_id': 'u1'})
+    loaded = store.get(dataset_id, user_id='u1', columns=['키워드', 'ROAS'])
+    assert list(loaded.columns) == ['키워드', 'ROAS']
+
+
+def test_owner_mismatch(store, frame):
+    dataset_id = store.put(frame, {'user_id': 'u1'})
+    assert store.get(dataset_id, user_id='u2') is None
+    assert store.get_meta(dataset_id, user_id='u2') is None
+
+
+@pytest.mark.parametrize('dataset_id', ['', '../etc/passwd', 'abc', 'g' * 32, None])
+def test_invalid_id(store, dataset_id):
+    assert store.get(dataset_id) is None
+    assert store.delete(dataset_id) is False
+
+
+def test_expired_dataset(store, frame):
+    dataset_id = store.put(frame, {'user_id': 'u1'})
+    _, meta_path = store._paths(dataset_id)
+    past = time.time() - 120
+    os.utime(meta_path, (past, past))
+
+    assert store.get(dataset_id, user_id='u1') is None
+    assert not os.listdir(store.root_dir)
+
+
+def test_access_extends_ttl(store, frame):
+    dataset_id = store.put(frame, {'user_id': 'u1'})
+    _, meta_path = store._paths(dataset_id)
+    past = time.time() - 50
+    os.utime(meta_path, (past, past))
+
+    assert store.get(dataset_id, user_id='u1') is not None
+    assert time.time() - os.path.getmtime(meta_path) < 5
+
+
+def test_sweep(store, frame):
+    expired_id = store.put(frame, {'user_id': 'u1'})
+    live_id = store.put(frame, {'user_id': 'u1'})
+    _, meta_path = store._paths(expired_id)
+    past = time.time() - 120
+    os.utime(meta_path, (past, past))
+
+    assert store.sweep(force=True) == 1
+    assert store.get_meta(expired_id) is None
+    assert store.get_meta(live_id) is not None
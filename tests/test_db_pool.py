@@ -0,0 +1,234 @@
+"""
+커넥션 풀 테스트 (가짜 creator - DB 없이)
+- 대여/반납 재사용, overflow 커넥션은 반납 시 닫힘
+- 고갈 시 timeout 후 PoolExhaustedError, get_pool_status 누적 카운터
+- 수명(recycle) 초과/ping 실패 커넥션은 대여 시 새 연결로 교체
+- 커밋하지 않은 커넥션은 반납 시 ROLLBACK, fork 후(pid 변경) 풀 새로 생성
+"""
+
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+from app.utils import db_utils
+from app.utils.db_utils import ConnectionPool, PoolExhaustedError, DatabaseError
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, sql, params=None):
+        self.conn.executed.append(sql)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, number):
+        self.number = number
+        self.open = True
+        self.alive = True
+        self.executed = []
+        self.commits = 0
+        self.rollbacks = 0
+        self.pings = 0
+
+    def ping(self, reconnect=False):
+        self.pings += 1
+        if not self.alive:
+            raise ConnectionError('MySQL server has gone away')
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.open = False
+
+
+class FakeCreator:
+    def __init__(self):
+        self.connections = []
+
+    def __call__(self):
+        conn = FakeConnection(len(self.connections))
+        self.connections.append(conn)
+        return conn
+
+
+@pytest.fixture
+def creator():
+    return FakeCreator()
+
+
+def make_pool(creator, **kwargs):
+    options = dict(pool_size=2, max_overflow=1, timeout=0.05, recycle=3600, pre_ping=True)
+    options.update(kwargs)
+    return ConnectionPool(creator, **options)
+
+
+def test_checkout_checkin_reuses_connection(creator):
+    pool = make_pool(creator)
+
+    conn = pool.acquire()
+    assert pool.status()['checked_out'] == 1
+    pool.release(conn)
+
+    assert pool.acquire() is conn
+    assert len(creator.connections) == 1
+    assert conn.pings == 1 and conn.rollbacks == 1
+
+    status = pool.status()
+    assert (status['open'], status['idle'], status['checked_out']) == (1, 0, 1)
+    assert (status['checkouts'], status['connects']) == (2, 1)
+
+
+def test_overflow_connection_closed_on_release(creator):
+    pool = make_pool(creator)
+    conns = [pool.acquire() for _ in range(3)]
+
+    status = pool.status()
+    assert (status['open'], status['overflow'], status['peak_checked_out']) == (3, 1, 3)
+
+    for conn in conns:
+        pool.release(conn)
+
+    # pool_size(2)개만 유휴로 남고 나머지는 닫힘
+    assert [conn.open for conn in conns] == [True, True, False]
+    status = pool.status()
+    assert (status['open'], status['idle'], status['overflow'], status['checked_out']) == (2, 2, 0, 0)
+
+
+def test_exhausted_pool_times_out(creator, monkeypatch):
+    pool = make_pool(creator, pool_size=1, max_overflow=0)
+    monkeypatch.setattr(db_utils, '_pool', pool)
+    held = pool.acquire()
+
+    started = time.monotonic()
+    with pytest.raises(PoolExhaustedError):
+        pool.acquire()
+    assert time.monotonic() - started >= 0.05
+
+    status = db_utils.get_pool_status()
+    assert status['initialized'] is True
+    assert (status['exhausted'], status['waits'], status['checked_out'], status['open']) == (1, 1, 1, 1)
+
+    pool.release(held)
+    assert db_utils.get_pool_status()['idle'] == 1
+
+
+def test_waiter_gets_released_connection(creator):
+    pool = make_pool(creator, pool_size=1, max_overflow=0, timeout=5)
+    held = pool.acquire()
+    timer = threading.Timer(0.05, pool.release, (held,))
+    timer.start()
+
+    assert pool.acquire() is held
+    timer.join()
+    status = pool.status()
+    assert status['waits'] == 1 and status['wait_time_ms'] > 0 and status['exhausted'] == 0
+
+
+def test_connection_recycled_after_lifetime(creator):
+    pool = make_pool(creator, recycle=60)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn._pool_born_at -= 61
+
+    fresh = pool.acquire()
+    assert fresh is not conn and not conn.open
+    assert pool.status()['recycled'] == 1 and len(creator.connections) == 2
+
+
+def test_ping_failure_replaces_connection(creator):
+    pool = make_pool(creator)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.alive = False
+
+    fresh = pool.acquire()
+    assert fresh is not conn and not conn.open and fresh.open
+    status = pool.status()
+    assert (status['ping_failures'], status['open'], status['checked_out']) == (1, 1, 1)
+
+
+def test_connect_failure_frees_slot(creator):
+    def failing():
+        raise ConnectionError('refused')
+
+    pool = make_pool(failing, pool_size=1, max_overflow=0)
+    with pytest.raises(DatabaseError):
+        pool.acquire()
+    status = pool.status()
+    assert (status['open'], status['checked_out']) == (0, 0)
+
+
+def test_release_rolls_back_unless_committed(creator):
+    pool = make_pool(creator)
+
+    conn = pool.acquire()
+    pool.release(conn)
+    assert conn.rollbacks == 1
+
+    conn = pool.acquire()
+    pool.release(conn, reset=False)
+    assert conn.rollbacks == 1
+
+    # 끊긴 커넥션은 풀에 돌려놓지 않음
+    conn = pool.acquire()
+    conn.open = False
+    pool.release(conn)
+    assert pool.status()['idle'] == 0 and pool.status()['open'] == 0
+
+
+@pytest.fixture
+def app_pool(creator, monkeypatch):
+    """앱 설정 기반 get_pool() - pymysql.connect를 가짜 creator로 대체"""
+    monkeypatch.setattr(db_utils, '_pool', None)
+    monkeypatch.setattr(db_utils.pymysql, 'connect', lambda **params: creator())
+
+    app = Flask(__name__)
+    app.config.update(
+        DB_HOST='localhost', DB_PORT=3306, DB_USER='u', DB_PASSWORD='p', DB_NAME='db',
+        DB_POOL_SIZE=2, DB_MAX_OVERFLOW=0, DB_POOL_TIMEOUT=0.05
+    )
+    with app.app_context():
+        yield creator
+
+
+def test_cursor_rolls_back_uncommitted_connection(app_pool):
+    with db_utils.get_db_cursor() as cursor:
+        cursor.execute('SELECT 1')
+    conn = app_pool.connections[0]
+    assert (conn.commits, conn.rollbacks) == (0, 1)
+
+    with db_utils.get_db_cursor(commit=True) as cursor:
+        cursor.execute('UPDATE t SET a = 1')
+    assert (conn.commits, conn.rollbacks) == (1, 1)
+
+    with pytest.raises(DatabaseError):
+        with db_utils.get_db_cursor(commit=True):
+            raise RuntimeError('boom')
+    assert (conn.commits, conn.rollbacks) == (1, 2)
+    assert db_utils.get_pool_status()['checked_out'] == 0
+
+
+def test_pool_recreated_after_fork(app_pool, monkeypatch):
+    parent = db_utils.get_pool()
+    assert db_utils.get_pool() is parent
+
+    monkeypatch.setattr(db_utils.os, 'getpid', lambda: parent.pid + 1)
+    assert db_utils.get_pool_status() == {'initialized': False}
+
+    child = db_utils.get_pool()
+    assert child is not parent and child.pid == parent.pid + 1
+    assert db_utils.get_pool_status()['initialized'] is True
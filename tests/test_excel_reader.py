@@ -0,0 +1,128 @@
+"""
+스트리밍 Excel 리더 parity 테스트
+- 모든 리더 엔진에서 pd.read_excel(engine='openpyxl') 결과와 값/타입이 동일한지 검증
+"""
+
+import io
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from app.utils import excel_reader
+from app.utils.excel_reader import read_excel_columns, resolve_engine, available_engines, ExcelReadError
+
+ENGINES = available_engines()
+
+
+def write_workbook(rows, header, sheets=None):
+    """행 리스트로 xlsx 바이트 생성 (셀 타입을 그대로 유지하기 위해 openpyxl 직접 사용)"""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'Sheet1'
+    ws.append(header)
+    for row in rows:
+        ws.append(row)
+    for name in sheets or []:
+        extra = wb.create_sheet(name)
+        extra.append(header)
+        for row in rows[:3]:
+            extra.append(row)
+
+    buf = io.BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+@pytest.fixture
+def coupang_like():
+    rng = np.random.default_rng(7)
+    header = ['날짜', '키워드', '광고 노출 지면', '노출수', '클릭수', '광고비',
+              '클릭률', '총광고수익률(14일)', '비고', '비고']
+    rows = []
+    for i in range(257):
+        clicks = int(rng.integers(0, 200))
+        rows.append([
+            datetime(2025, 1, 1 + i % 28),
+            '-' if i % 50 == 0 else f'키워드{i}',
+            '비검색영역' if i % 50 == 0 else '검색 영역',
+            int(rng.integers(0, 10000)),
+            clicks,
+            float(clicks * 300) if i % 3 else clicks * 300,  # 정수값 float 혼재
+            None if i % 17 == 0 else round(float(rng.uniform(0, 5)), 2),
+            f'{rng.uniform(0, 900):.2f}%',
+            '' if i % 5 else '메모',
+            None,
+        ])
+        if i == 100:
+            rows.append([None] * len(header))  # 중간 빈 행
+    return header, rows
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+@pytest.mark.parametrize('chunk_size', [10000, 64])
+def test_matches_read_excel(coupang_like, chunk_size, engine):
+    header, rows = coupang_like
+    content = write_workbook(rows, header)
+
+    expected = pd.read_excel(io.BytesIO(content), engine='openpyxl')
+    actual = read_excel_columns(io.BytesIO(content), chunk_size=chunk_size, engine=engine)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_column_projection(coupang_like, engine):
+    header, rows = coupang_like
+    content = write_workbook(rows, header)
+    columns = ['키워드', '광고비', '클릭률', '없는컬럼']
+
+    expected = pd.read_excel(io.BytesIO(content), engine='openpyxl')[['키워드', '광고비', '클릭률']]
+    actual = read_excel_columns(io.BytesIO(content), columns=columns, chunk_size=50, engine=engine)
+
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_sheet_priority(coupang_like, engine):
+    header, rows = coupang_like
+    content = write_workbook(rows, header, sheets=['광고데이터'])
+
+    df = read_excel_columns(io.BytesIO(content), sheet_name=['일별데이터', '광고데이터', 0], engine=engine)
+    assert len(df) == 3
+
+    df = read_excel_columns(io.BytesIO(content), sheet_name=['일별데이터', 0], engine=engine)
+    assert len(df) == len(rows)
+
+    with pytest.raises(ExcelReadError):
+        read_excel_columns(io.BytesIO(content), sheet_name='없는시트', engine=engine)
+
+
+def test_reads_from_path(coupang_like, tmp_path):
+    header, rows = coupang_like
+    path = tmp_path / 'report.xlsx'
+    path.write_bytes(write_workbook(rows, header))
+
+    expected = pd.read_excel(path, engine='openpyxl')
+    for engine in ENGINES:
+        pd.testing.assert_frame_equal(read_excel_columns(str(path), engine=engine), expected)
+
+
+@pytest.mark.parametrize('engine', ENGINES)
+def test_header_only(engine):
+    content = write_workbook([], ['키워드', '광고비'])
+    df = read_excel_columns(io.BytesIO(content), engine=engine)
+    assert list(df.columns) == ['키워드', '광고비']
+    assert len(df) == 0
+
+
+def test_engine_fallback(monkeypatch):
+    monkeypatch.setattr(excel_reader, 'CalamineWorkbook', None)
+    assert available_engines() == ['openpyxl']
+    assert resolve_engine('auto') == 'openpyxl'
+    assert resolve_engine('calamine') == 'openpyxl'
+
+    with pytest.raises(ValueError):
+        resolve_engine('xlrd')
@@ -0,0 +1,172 @@
+"""
+AI 인사이트 캐시/백그라운드 생성 테스트
+- 프롬프트 해시 키, pending 선점, 실패 후 재시도 허용 시간
+- 같은 지표는 모델을 한 번만 호출, 시간 초과 시 기본 인사이트 저장
+"""
+
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+from flask import Flask
+
+from app.services import insight_cache
+from app.services.ai_insights import AIInsights
+from app.services.insight_cache import InsightCache, get_insight_cache
+
+KEY = 'a' * 64
+
+
+class FakeCompletions:
+    """chat.completions.create 호출 횟수 기록 (fail=True면 시간 초과 예외)"""
+
+    def __init__(self, fail=False):
+        self.calls = 0
+        self.fail = fail
+
+    def create(self, **kwargs):
+        self.calls += 1
+        if self.fail:
+            raise TimeoutError('Request timed out.')
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content='AI 분석 결과'))])
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return InsightCache(str(tmp_path / 'insights'), pending_timeout=60, sweep_interval=0)
+
+
+@pytest.fixture
+def app_context(tmp_path, monkeypatch):
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    app = Flask(__name__)
+    app.config.update(AI_INSIGHTS_CACHE_DIR=str(tmp_path / 'app_insights'), AI_INSIGHTS_TIMEOUT=5)
+    with app.app_context():
+        yield app
+    insight_cache._cache = None
+
+
+def make_metrics(spend=1_000_000):
+    return {
+        'total_spend': spend, 'total_revenue': 3_500_000, 'avg_roas': 3.5, 'avg_ctr': 1.8,
+        'avg_cpa': 25_000, 'cvr': 2.1, 'avg_order_value': 87_500, 'total_conversions': 40,
+        'campaigns': [{'campaign_name': '캠페인A', 'roas': 3.5, 'spend': spend, 'ctr': 1.8, 'cvr': 2.1}],
+        'daily_trend': [],
+    }
+
+
+def make_ai(completions):
+    ai = AIInsights()
+    ai.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return ai
+
+
+def wait_done(key, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        entry = get_insight_cache().get(key)
+        if entry is not None and entry['status'] != 'pending':
+            return entry
+        time.sleep(0.02)
+    raise AssertionError('background insights not finished')
+
+
+def test_claim_and_put(cache):
+    assert cache.get(KEY) is None
+    assert cache.claim(KEY) is True
+    assert cache.claim(KEY) is False  # 생성 중 중복 요청
+    assert cache.get(KEY)['status'] == 'pending'
+
+    cache.put(KEY, 'done', '인사이트', 'ai')
+    entry = cache.get(KEY)
+    assert (entry['status'], entry['insights'], entry['source']) == ('done', '인사이트', 'ai')
+    assert cache.claim(KEY) is False
+    assert not os.path.exists(cache._paths(KEY)[1])
+
+
+def test_stale_pending_is_reclaimed(cache):
+    assert cache.claim(KEY)
+    past = time.time() - 120
+    os.utime(cache._paths(KEY)[1], (past, past))
+
+    assert cache.get(KEY) is None
+    assert cache.claim(KEY) is True
+
+
+def test_failed_retry_after(cache, monkeypatch):
+    cache.put(KEY, 'failed', '기본 인사이트', 'fallback')
+    assert cache.claim(KEY) is False
+
+    monkeypatch.setattr(insight_cache, 'FAILED_RETRY_SECONDS', 0)
+    assert cache.claim(KEY) is True
+
+
+def test_invalid_key(cache):
+    assert cache.get('../../etc/passwd') is None
+    assert cache.claim('abc') is False
+    with pytest.raises(ValueError):
+        cache.put('abc', 'done', '', 'ai')
+
+
+def test_prompt_key_is_stable(app_context):
+    ai = AIInsights()
+    assert ai.prompt_key(make_metrics()) == ai.prompt_key(make_metrics())
+    assert ai.prompt_key(make_metrics()) != ai.prompt_key(make_metrics(spend=2_000_000))
+
+
+def test_without_client_returns_fallback(app_context):
+    result = AIInsights().request_insights(make_metrics())
+    assert result['status'] == 'done'
+    assert result['source'] == 'fallback'
+    assert result['insights_id'] is None
+
+
+def test_model_called_once_per_prompt(app_context):
+    completions = FakeCompletions()
+    ai = make_ai(completions)
+
+    first = ai.request_insights(make_metrics())
+    assert first['status'] == 'pending'
+    assert first['insights'] == ai._generate_fallback_insights(make_metrics())
+
+    entry = wait_done(first['insights_id'])
+    assert entry['insights'] == 'AI 분석 결과'
+
+    second = make_ai(completions).request_insights(make_metrics())
+    assert second == {'insights_id': first['insights_id'], 'status': 'done',
+                      'insights': 'AI 분석 결과', 'source': 'ai'}
+    assert completions.calls == 1
+
+
+def test_timeout_falls_back(app_context):
+    completions = FakeCompletions(fail=True)
+    ai = make_ai(completions)
+
+    result = ai.request_insights(make_metrics())
+    entry = wait_done(result['insights_id'])
+    assert entry['status'] == 'failed'
+    assert entry['insights'] == ai._generate_fallback_insights(make_metrics())
+
+    # 재시도 허용 시간 전에는 다시 호출하지 않고 기본 인사이트 반환
+    again = ai.request_insights(make_metrics())
+    assert again['status'] == 'done'
+    assert again['source'] == 'fallback'
+    assert completions.calls == 1
+
+
+def test_prompt_built_once_per_request(app_context):
+    ai = make_ai(FakeCompletions())
+    calls = []
+    create_prompt = ai._create_prompt
+
+    def counting_create_prompt(metrics, df=None):
+        calls.append(metrics)
+        return create_prompt(metrics, df)
+
+    ai._create_prompt = counting_create_prompt
+    result = ai.request_insights(make_metrics(spend=3_000_000))
+
+    assert len(calls) == 1
+    assert result['insights_id'] == ai.prompt_key(make_metrics(spend=3_000_000))
+    wait_done(result['insights_id'])
@@ -0,0 +1,65 @@
+"""
+공개 배너 묶음 조회 API 테스트
+- 여러 타입 한 번에 반환, 공개 필드만 포함
+- ETag/Cache-Control, If-None-Match 일치 시 304, 배너 변경 시 ETag 변경
+"""
+
+import pytest
+from flask import Flask
+
+from app.routes.public_banners import public_banner_bp
+from app.services.banner_service import BannerService
+
+BANNERS = {
+    'home_top': [{'id': 1, 'banner_type': 'home_top', 'title': '상단', 'image_url': '/a.png',
+                  'mobile_image_url': None, 'link_url': 'https://example.com', 'position_order': 1,
+                  'click_count': 3, 'impression_count': 100}],
+    'home_grid': [],
+}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    banners = {key: [dict(banner) for banner in value] for key, value in BANNERS.items()}
+    monkeypatch.setattr(BannerService, 'get_active_banners', staticmethod(lambda banner_type: banners.get(banner_type, [])))
+
+    app = Flask(__name__)
+    app.config.update(BANNER_HTTP_MAX_AGE=30)
+    app.register_blueprint(public_banner_bp)
+    client = app.test_client()
+    client.banners = banners
+    return client
+
+
+def test_returns_requested_types(client):
+    response = client.get('/api/banners?types=home_top,home_grid,home_top')
+    data = response.get_json()
+
+    assert response.status_code == 200
+    assert set(data['banners']) == {'home_top', 'home_grid'}
+    assert data['banners']['home_grid'] == []
+    assert 'click_count' not in data['banners']['home_top'][0]
+    assert response.headers['Cache-Control'] in ('public, max-age=30', 'max-age=30, public')
+    assert response.headers['ETag']
+
+
+def test_not_modified(client):
+    etag = client.get('/api/banners?types=home_top').headers['ETag']
+
+    response = client.get('/api/banners?types=home_top', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+    # 노출/클릭 카운터 변경은 ETag에 영향 없음
+    client.banners['home_top'][0]['impression_count'] += 10
+    assert client.get('/api/banners?types=home_top', headers={'If-None-Match': etag}).status_code == 304
+
+    client.banners['home_top'][0]['link_url'] = 'https://example.com/new'
+    response = client.get('/api/banners?types=home_top', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.headers['ETag'] != etag
+
+
+@pytest.mark.parametrize('query', ['', '?types=', '?types=home_top,unknown'])
+def test_invalid_types(client, query):
+    assert client.get(f'/api/banners{query}').status_code == 400
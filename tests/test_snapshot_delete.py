@@ -0,0 +1,378 @@
+"""
+스냅샷 삭제 테스트
+- 이 업로드 값이 남아 있는 일별 팩트는 남은 업로드 중 가장 최근 업로드의 이전 값으로 복원
+  (다른 업로드에 없던 (날짜, 캠페인)만 삭제) - 상세/추이/예산 페이싱에 이전 업로드 값이 그대로 보임
+- 삭제/저장 후 같은 트랜잭션에서 일/주/월 집계와 기간이 겹치는 스냅샷 요약을 다시 계산
+- 다른 사용자/없는 스냅샷은 아무것도 바꾸지 않음
+"""
+
+import json
+from contextlib import contextmanager
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+from flask import Flask
+
+from app.services import ad_analyzer, ad_trend, ad_spend_rollup
+from app.services.ad_analyzer import AdAnalyzer, SUMMARY_COLUMNS, FACT_METRIC_COLUMNS
+from app.services.ad_spend_rollup import get_monthly_spend
+from app.services.ad_trend import ROLLUP_TABLES, TREND_METRIC_COLUMNS, bucket_start
+
+# 집계 테이블 -> 단위
+GRANULARITIES = {table: granularity for granularity, (table, _) in ROLLUP_TABLES.items()}
+
+
+def as_date(value):
+    return value if isinstance(value, date) else datetime.strptime(value, '%Y-%m-%d').date()
+
+
+class FakeDatabase:
+    """스냅샷/일별 팩트/이전 값/집계를 메모리에 보관하는 가짜 DB (AdAnalyzer가 실행하는 문장만 해석)"""
+
+    def __init__(self):
+        self.snapshots = {}
+        self.facts = {}
+        self.versions = {}
+        self.rollups = {table: {} for table in GRANULARITIES}
+        self.executed = []
+
+    @contextmanager
+    def transaction(self):
+        yield FakeCursor(self)
+
+    def execute_query(self, sql, params=None, fetch_one=False):
+        cursor = FakeCursor(self)
+        cursor.execute(sql, params)
+        return cursor.fetchone() if fetch_one else cursor.fetchall()
+
+    def execute_update(self, sql, params=None):
+        return FakeCursor(self).execute(sql, params)
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.rows = []
+        self.lastrowid = None
+
+    def fetchone(self):
+        return self.rows[0] if self.rows else None
+
+    def fetchall(self):
+        return self.rows
+
+    def _facts_in(self, user_id, start, end):
+        return [(key, fact) for key, fact in sorted(self.db.facts.items())
+                if key[0] == user_id and start <= key[1] < end]
+
+    def execute(self, sql, params=()):
+        sql = ' '.join(sql.split())
+        self.db.executed.append((sql, params))
+        db = self.db
+        self.rows = []
+
+        if sql.startswith('INSERT INTO ad_analysis_snapshots'):
+            user_id, name, period_start, period_end, _ = params
+            self.lastrowid = max(db.snapshots, default=0) + 1
+            db.snapshots[self.lastrowid] = {
+                'id': self.lastrowid, 'user_id': user_id, 'snapshot_name': name,
+                'period_start': period_start, 'period_end': period_end, 'metrics_summary': None,
+                'ai_insights': None, **dict.fromkeys(SUMMARY_COLUMNS)
+            }
+            return 1
+
+        if sql.startswith('INSERT IGNORE INTO ad_daily_fact_versions'):
+            user_id, keys = params[0], params[1:]
+            archived = 0
+            for day, campaign in zip(keys[::2], keys[1::2]):
+                fact = db.facts.get((user_id, as_date(day), campaign))
+                if fact and fact['source_snapshot_id'] is not None:
+                    key = (user_id, as_date(day), campaign, fact['source_snapshot_id'])
+                    if key not in db.versions:
+                        db.versions[key] = {column: fact[column] for column in FACT_METRIC_COLUMNS}
+                        archived += 1
+            return archived
+
+        if sql.startswith('INSERT INTO ad_daily_facts (user_id, source_snapshot_id'):
+            for start in range(0, len(params), 9):
+                user_id, snapshot_id, day, campaign, *values = params[start:start + 9]
+                db.facts[(user_id, as_date(day), campaign)] = {
+                    **dict(zip(('spend', 'impressions', 'clicks', 'conversions', 'revenue'), values)),
+                    'source_snapshot_id': snapshot_id
+                }
+            return len(params) // 9
+
+        if sql.startswith('INSERT INTO ad_daily_facts') and 'FROM ad_daily_fact_versions' in sql:
+            user_id, snapshot_id, excluded = params
+            restored = 0
+            for key, fact in list(db.facts.items()):
+                if key[0] != user_id or fact['source_snapshot_id'] != snapshot_id:
+                    continue
+                candidates = [version_key[3] for version_key in db.versions
+                              if version_key[:3] == key and version_key[3] != excluded]
+                if candidates:
+                    latest = max(candidates)
+                    db.facts[key] = {**db.versions[(*key, latest)], 'source_snapshot_id': latest}
+                    restored += 1
+            return restored
+
+        if sql.startswith('SELECT period_start, period_end FROM ad_analysis_snapshots'):
+            snapshot_id, user_id = params
+            snapshot = db.snapshots.get(snapshot_id)
+            if snapshot and snapshot['user_id'] == user_id:
+                self.rows = [{'period_start': snapshot['period_start'], 'period_end': snapshot['period_end']}]
+            return len(self.rows)
+
+        if sql.startswith('SELECT user_id, period_start, period_end FROM ad_analysis_snapshots WHERE id'):
+            snapshot = db.snapshots.get(params[0])
+            self.rows = [{key: snapshot[key] for key in ('user_id', 'period_start', 'period_end')}] if snapshot else []
+            return len(self.rows)
+
+        if sql.startswith('SELECT id, user_id, period_start, period_end FROM ad_analysis_snapshots'):
+            user_id, end, start = params
+            self.rows = [
+                {key: snapshot[key] for key in ('id', 'user_id', 'period_start', 'period_end')}
+                for snapshot in db.snapshots.values()
+                if snapshot['user_id'] == user_id and snapshot['metrics_summary'] is not None
+                and snapshot['period_start'] <= end and snapshot['period_end'] >= start
+            ]
+            return len(self.rows)
+
+        if sql.startswith('SELECT * FROM ad_analysis_snapshots'):
+            snapshot_id, user_id = params
+            snapshot = db.snapshots.get(snapshot_id)
+            self.rows = [dict(snapshot)] if snapshot and snapshot['user_id'] == user_id else []
+            return len(self.rows)
+
+        if sql.startswith('UPDATE ad_analysis_snapshots SET metrics_summary'):
+            snapshot = db.snapshots[params[-1]]
+            snapshot['metrics_summary'] = params[0]
+            snapshot.update(zip(SUMMARY_COLUMNS, params[1:-1]))
+            return 1
+
+        if sql.startswith('SELECT date, campaign_name, spend'):
+            self.rows = [
+                {'date': key[1], 'campaign_name': key[2], **{column: fact[column] for column in FACT_METRIC_COLUMNS}}
+                for key, fact in self._facts_in(*params)
+            ]
+            return len(self.rows)
+
+        if 'COALESCE(SUM(spend), 0)' in sql:
+            group_column = sql.split()[1].rstrip(',')
+            groups = {}
+            for (_, day, campaign), fact in self._facts_in(*params):
+                row = groups.setdefault(day if group_column == 'date' else campaign,
+                                        dict.fromkeys(TREND_METRIC_COLUMNS, 0))
+                for column in TREND_METRIC_COLUMNS:
+                    row[column] += fact[column]
+            self.rows = [{group_column: group, **row} for group, row in sorted(groups.items())]
+            return len(self.rows)
+
+        if sql.startswith('DELETE FROM ad_daily_facts'):
+            user_id, snapshot_id = params
+            keys = [key for key, fact in db.facts.items()
+                    if key[0] == user_id and fact['source_snapshot_id'] == snapshot_id]
+            for key in keys:
+                del db.facts[key]
+            return len(keys)
+
+        if sql.startswith('DELETE FROM ad_analysis_snapshots'):
+            snapshot_id, user_id = params
+            if db.snapshots.get(snapshot_id, {}).get('user_id') != user_id:
+                return 0
+            del db.snapshots[snapshot_id]
+            # 이전 값 ON DELETE CASCADE, 팩트 ON DELETE SET NULL
+            for key in [key for key in db.versions if key[3] == snapshot_id]:
+                del db.versions[key]
+            for fact in db.facts.values():
+                if fact['source_snapshot_id'] == snapshot_id:
+                    fact['source_snapshot_id'] = None
+            return 1
+
+        table = sql.split('FROM ')[1].split()[0] if sql.startswith('SELECT') else sql.split()[2]
+        if table in GRANULARITIES and sql.startswith('SELECT'):
+            if len(params) == 2:
+                # get_monthly_spend(): 월 합계 1행
+                user_id, month = params
+                row = db.rollups[table].get((user_id, '', month))
+                self.rows = [row] if row else []
+            else:
+                user_id, campaign_name, start, end = params
+                self.rows = [
+                    {'bucket': bucket, **metrics}
+                    for (user, campaign, bucket), metrics in sorted(db.rollups[table].items())
+                    if user == user_id and campaign == campaign_name and start <= bucket < end
+                ]
+            return len(self.rows)
+
+        if table in GRANULARITIES and sql.startswith('DELETE'):
+            user_id, start, end = params
+            rollup = db.rollups[table]
+            for key in [key for key in rollup if key[0] == user_id and start <= key[2] < end]:
+                del rollup[key]
+            return 0
+
+        if table in GRANULARITIES and sql.startswith('INSERT'):
+            # 캠페인별: (user_id, 시작, 끝) / 전체 합계: ('', user_id, 시작, 끝)
+            total = len(params) == 4
+            campaign_name, (user_id, start, end) = (params[0], params[1:]) if total else (None, params)
+            rollup = db.rollups[table]
+            for (_, day, campaign), fact in self._facts_in(user_id, start, end):
+                key = (user_id, campaign_name if total else campaign, bucket_start(day, GRANULARITIES[table]))
+                row = rollup.setdefault(key, dict.fromkeys(TREND_METRIC_COLUMNS, 0))
+                for column in TREND_METRIC_COLUMNS:
+                    row[column] += fact[column]
+            return len(rollup)
+
+        raise AssertionError(f'unexpected SQL: {sql}')
+
+
+@pytest.fixture
+def db(monkeypatch):
+    db = FakeDatabase()
+    monkeypatch.setattr(ad_analyzer, 'transaction', db.transaction)
+    monkeypatch.setattr(ad_analyzer, 'execute_query', db.execute_query)
+    monkeypatch.setattr(ad_analyzer, 'execute_update', db.execute_update)
+    monkeypatch.setattr(ad_trend, 'execute_query', db.execute_query)
+    monkeypatch.setattr(ad_spend_rollup, 'execute_query', db.execute_query)
+
+    app = Flask(__name__)
+    with app.app_context():
+        yield db
+
+
+def upload(db, user_id, rows):
+    """save_snapshot() + calculate_metrics() (rows: [(일, 캠페인, 지출)], 매출은 지출의 3배)"""
+    df = pd.DataFrame([
+        {'date': f'2026-10-{day:02d}', 'campaign_name': campaign, 'spend': spend, 'impressions': 1000,
+         'clicks': 20, 'conversions': 2, 'revenue': spend * 3}
+        for day, campaign, spend in rows
+    ])
+    analyzer = AdAnalyzer(user_id)
+    snapshot_id = analyzer.save_snapshot(df, '업로드')
+    analyzer.calculate_metrics(snapshot_id)
+    db.executed.clear()
+    return snapshot_id
+
+
+def fact_values(db, user_id):
+    return {(key[1].day, key[2]): fact['spend'] for key, fact in sorted(db.facts.items()) if key[0] == user_id}
+
+
+def day_series(user_id, granularity='day'):
+    trend = AdAnalyzer(user_id).get_trend(date(2026, 10, 1), date(2026, 10, 31), granularity=granularity)
+    return [(point['date'], point['spend']) for point in trend['series']]
+
+
+def test_delete_duplicate_upload_keeps_older_snapshot_data(db):
+    # 같은 기간 보고서를 두 번 올린 뒤 중복(최신) 삭제
+    older = upload(db, 'u1', [(day, '검색', 10000) for day in (1, 2, 3)])
+    newer = upload(db, 'u1', [(day, '검색', 12000) for day in (1, 2, 3)])
+
+    assert AdAnalyzer('u1').delete_snapshot(newer) is True
+
+    detail = AdAnalyzer('u1').get_snapshot_detail(older)
+    assert [(row['date'], row['spend']) for row in detail['daily_data']] == [
+        ('2026-10-01', 10000.0), ('2026-10-02', 10000.0), ('2026-10-03', 10000.0)
+    ]
+    assert detail['metrics']['total_spend'] == 30000.0
+    assert day_series('u1') == [('2026-10-01', 10000.0), ('2026-10-02', 10000.0), ('2026-10-03', 10000.0)]
+    assert get_monthly_spend('u1', '2026-10') == 30000.0
+    assert all(fact['source_snapshot_id'] == older for fact in db.facts.values())
+
+
+def test_delete_newer_overlapping_upload_restores_previous_values(db):
+    older = upload(db, 'u1', [(day, '검색', 10000) for day in (1, 2, 3)])
+    newer = upload(db, 'u1', [(3, '검색', 20000), (3, '쇼핑', 5000), (4, '검색', 20000)])
+    assert fact_values(db, 'u1')[(3, '검색')] == 20000
+
+    AdAnalyzer('u1').delete_snapshot(newer)
+
+    # 10/3 검색은 이전 업로드 값으로 복원, 삭제한 업로드에만 있던 키는 삭제
+    assert fact_values(db, 'u1') == {(1, '검색'): 10000, (2, '검색'): 10000, (3, '검색'): 10000}
+    assert AdAnalyzer('u1').get_snapshot_detail(older)['metrics']['total_spend'] == 30000.0
+    assert day_series('u1', 'month') == [('2026-10-01', 30000.0)]
+    # 삭제한 업로드의 이전 값은 함께 삭제, 복원된 업로드 값은 그 스냅샷 삭제 시까지 유지
+    assert list(db.versions) == [('u1', date(2026, 10, 3), '검색', older)]
+
+
+def test_delete_older_upload_keeps_newer_values(db):
+    older = upload(db, 'u1', [(day, '검색', 10000) for day in (1, 2, 3)])
+    newer = upload(db, 'u1', [(day, '검색', 20000) for day in (3, 4)])
+
+    AdAnalyzer('u1').delete_snapshot(older)
+
+    assert fact_values(db, 'u1') == {(3, '검색'): 20000, (4, '검색'): 20000}
+    assert db.versions == {}
+    assert AdAnalyzer('u1').get_snapshot_detail(newer)['metrics']['total_spend'] == 40000.0
+
+
+@pytest.mark.parametrize('order', [(2, 1), (1, 2)])
+def test_chained_deletes_fall_back_to_oldest_upload(db, order):
+    snapshot_ids = [upload(db, 'u1', [(1, '검색', spend)]) for spend in (10000, 20000, 30000)]
+
+    for index in order:
+        AdAnalyzer('u1').delete_snapshot(snapshot_ids[index])
+
+    assert fact_values(db, 'u1') == {(1, '검색'): 10000}
+    assert db.facts[('u1', date(2026, 10, 1), '검색')]['source_snapshot_id'] == snapshot_ids[0]
+
+
+def test_overlapping_upload_refreshes_existing_summary(db):
+    older = upload(db, 'u1', [(day, '검색', 10000) for day in (1, 2, 3)])
+    upload(db, 'u1', [(day, '검색', 20000) for day in (3, 4)])
+
+    # 겹치는 기존 스냅샷의 요약이 일별 데이터와 일치
+    detail = AdAnalyzer('u1').get_snapshot_detail(older)
+    assert sum(row['spend'] for row in detail['daily_data']) == detail['metrics']['total_spend'] == 40000.0
+    assert db.snapshots[older]['total_spend'] == 40000.0
+    assert json.loads(db.snapshots[older]['metrics_summary'])['campaigns'][0]['spend'] == 40000.0
+
+
+def test_delete_refreshes_rollups_and_summaries_in_transaction(db):
+    older = upload(db, 'u1', [(day, '검색', 10000) for day in (1, 2, 3)])
+    newer = upload(db, 'u1', [(day, '검색', 20000) for day in (3, 4)])
+    assert db.snapshots[older]['total_spend'] == 40000.0
+
+    AdAnalyzer('u1').delete_snapshot(newer)
+
+    statements = [' '.join(sql.split()[:3]) for sql, _ in db.executed]
+    assert statements[:5] == [
+        'SELECT period_start, period_end', 'INSERT INTO ad_daily_facts', 'DELETE FROM ad_daily_facts',
+        'DELETE FROM ad_analysis_snapshots', 'DELETE FROM ad_metrics_daily'
+    ]
+    refreshes = [(sql.split()[2], params) for sql, params in db.executed if sql.startswith('DELETE FROM ad_metrics')]
+    assert refreshes == [
+        ('ad_metrics_daily', ('u1', date(2026, 10, 3), date(2026, 10, 5))),
+        ('ad_metrics_weekly', ('u1', date(2026, 9, 28), date(2026, 10, 5))),
+        ('ad_metrics_monthly', ('u1', date(2026, 10, 1), date(2026, 11, 1))),
+    ]
+    assert statements[-1] == 'UPDATE ad_analysis_snapshots SET'
+    assert db.snapshots[older]['total_spend'] == 30000.0
+
+
+def test_delete_changes_trend_and_pacing(db):
+    upload(db, 'u1', [(day, '검색', 10000) for day in (1, 2)])
+    newer = upload(db, 'u1', [(day, '검색', 20000) for day in (3, 4)])
+    upload(db, 'u2', [(1, '검색', 5000)])
+
+    assert day_series('u1', 'week') == [('2026-09-28', 60000.0)]
+    assert get_monthly_spend('u1', '2026-10') == 60000.0
+
+    AdAnalyzer('u1').delete_snapshot(newer)
+
+    assert day_series('u1') == [('2026-10-01', 10000.0), ('2026-10-02', 10000.0)]
+    assert get_monthly_spend('u1', '2026-10') == 20000.0
+    # 다른 사용자 집계는 그대로
+    assert day_series('u2') == [('2026-10-01', 5000.0)]
+
+
+@pytest.mark.parametrize('user_id, snapshot_id', [('u2', 1), ('u1', 99)])
+def test_delete_foreign_or_missing_snapshot(db, user_id, snapshot_id):
+    upload(db, 'u1', [(day, '검색', 10000) for day in (1, 2, 3)])
+    facts = {key: dict(fact) for key, fact in db.facts.items()}
+
+    assert AdAnalyzer(user_id).delete_snapshot(snapshot_id) is False
+    assert db.facts == facts and len(db.snapshots) == 1
+    assert len(db.executed) == 1
@@ -0,0 +1,82 @@
+"""
+분석 목록 조회 테스트
+- 요약 컬럼만 조회 (metrics_summary JSON 파싱 없음)
+- created_at 기준 keyset 페이지네이션 커서
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.services import ad_analyzer
+from app.services.ad_analyzer import AdAnalyzer, SUMMARY_COLUMNS
+
+
+def make_row(snapshot_id, created_at, total_spend=Decimal('150000.00')):
+    row = {
+        'id': snapshot_id,
+        'snapshot_name': f'분석 {snapshot_id}',
+        'period_start': '2026-09-01',
+        'period_end': '2026-09-30',
+        'created_at': created_at,
+        'tags': None,
+        'memo': None,
+        'is_saved': 1,
+    }
+    row.update({column: None for column in SUMMARY_COLUMNS})
+    if total_spend is not None:
+        row.update(total_spend=total_spend, total_revenue=Decimal('450000.00'), avg_roas=Decimal('300.00'),
+                   total_impressions=12000, total_clicks=240, total_days=30)
+    return row
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    calls = []
+
+    def fake_execute_query(sql, params=None, fetch_one=False):
+        calls.append((sql, params))
+        return [make_row(i, datetime(2026, 10, 17, 12, 0, 0)) for i in (9, 8, 7)][:params[-1]]
+
+    monkeypatch.setattr(ad_analyzer, 'execute_query', fake_execute_query)
+    return calls
+
+
+def test_list_reads_summary_columns_only(queries):
+    snapshots, next_cursor = AdAnalyzer(1).get_snapshots(saved_only=True, limit=5)
+
+    sql, params = queries[0]
+    assert 'metrics_summary' not in sql
+    assert 'total_spend' in sql and 'ORDER BY created_at DESC, id DESC' in sql
+    assert params == (1, 6)
+    assert next_cursor is None
+
+    summary = snapshots[0]['metrics_summary']
+    assert summary['total_spend'] == 150000.0 and isinstance(summary['total_spend'], float)
+    assert summary['total_clicks'] == 240
+    assert 'total_spend' not in snapshots[0]
+    assert snapshots[0]['created_at'] == '2026-10-17 12:00:00'
+
+
+def test_next_page_uses_keyset_cursor(queries):
+    analyzer = AdAnalyzer(1)
+    snapshots, next_cursor = analyzer.get_snapshots(limit=2)
+
+    assert [s['id'] for s in snapshots] == [9, 8]
+    assert next_cursor == '2026-10-17T12:00:00_8'
+
+    analyzer.get_snapshots(limit=2, cursor=next_cursor)
+    sql, params = queries[1]
+    assert 'created_at < %s OR (created_at = %s AND id < %s)' in sql
+    assert params == (1, datetime(2026, 10, 17, 12), datetime(2026, 10, 17, 12), 8, 3)
+
+
+def test_uncalculated_snapshot_has_empty_summary():
+    assert AdAnalyzer._pop_summary(make_row(1, datetime(2026, 10, 17), total_spend=None)) == {}
+
+
+@pytest.mark.parametrize('cursor', ['abc', '2026-10-17T12:00:00_x', '2026-10-17_3'])
+def test_invalid_cursor_rejected(cursor):
+    with pytest.raises(ValueError):
+        AdAnalyzer.decode_cursor(cursor)
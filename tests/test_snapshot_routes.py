@@ -0,0 +1,91 @@
+"""
+업로드/수기입력 라우트의 스냅샷 저장 테스트
+- 저장소 크기 제한(SNAPSHOT_MAX_BLOB_MB) 초과 시 413, 세션에 스냅샷 포인터를 남기지 않음
+- 제한 이내면 저장 후 상세 조회 가능
+"""
+
+import io
+
+import pytest
+from flask import Flask
+
+from app.routes import ad_analysis
+from app.services import snapshot_store
+from app.services.ai_insights import AIInsights
+
+ROWS = [
+    {'date': '2026-10-01', 'campaign_name': '검색_브랜드', 'spend': 10000, 'impressions': 2000,
+     'clicks': 40, 'conversions': 2, 'revenue': 35000},
+    {'date': '2026-10-02', 'campaign_name': '검색_브랜드', 'spend': 12000, 'impressions': 2400,
+     'clicks': 48, 'conversions': 3, 'revenue': 42000},
+]
+
+CSV = (
+    '날짜,캠페인명,지출액,노출수,클릭수,전환수,매출액\n'
+    '2026-10-01,검색_브랜드,10000,2000,40,2,35000\n'
+    '2026-10-02,검색_브랜드,12000,2400,48,3,42000\n'
+)
+
+
+def make_client(tmp_path, monkeypatch, max_blob_mb):
+    monkeypatch.setattr(snapshot_store, '_store', None)
+    monkeypatch.setattr(AIInsights, 'request_insights', lambda self, metrics, df: {
+        'insights_id': None, 'status': 'done', 'insights': '기본 인사이트', 'source': 'fallback'
+    })
+
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    app.config.update(
+        SNAPSHOT_STORE_DIR=str(tmp_path / 'snapshots'), SNAPSHOT_MAX_BLOB_MB=max_blob_mb,
+        SNAPSHOT_SWEEP_INTERVAL=0
+    )
+    app.register_blueprint(ad_analysis.ad_bp)
+    return app.test_client()
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    return make_client(tmp_path, monkeypatch, max_blob_mb=20)
+
+
+@pytest.fixture
+def tiny_client(tmp_path, monkeypatch):
+    # 0MB 제한: 모든 스냅샷이 크기 초과
+    return make_client(tmp_path, monkeypatch, max_blob_mb=0)
+
+
+def upload(client):
+    return client.post('/api/ad-analysis/upload', data={'file': (io.BytesIO(CSV.encode('utf-8')), 'ads.csv')})
+
+
+def test_manual_input_stores_snapshot(client):
+    response = client.post('/api/ad-analysis/manual-input', json={'data': ROWS})
+    assert response.status_code == 200
+
+    snapshot_id = response.get_json()['snapshot_id']
+    with client.session_transaction() as sess:
+        assert sess['snapshot_id'] == snapshot_id
+
+    detail = client.get(f'/api/ad-analysis/snapshots/{snapshot_id}').get_json()
+    assert len(detail['daily_data']) == 2
+
+
+def test_upload_stores_snapshot(client):
+    response = upload(client)
+    assert response.status_code == 200
+    assert response.get_json()['insights'] == '기본 인사이트'
+
+
+@pytest.mark.parametrize('send', [
+    lambda client: client.post('/api/ad-analysis/manual-input', json={'data': ROWS}),
+    upload,
+])
+def test_oversized_snapshot_rejected(tiny_client, send):
+    response = send(tiny_client)
+    data = response.get_json()
+
+    assert response.status_code == 413
+    assert data['success'] is False and '0MB' in data['error']
+    with tiny_client.session_transaction() as sess:
+        assert 'snapshot_id' not in sess
+    assert snapshot_store._store.usage()['blobs'] == 0
@@ -0,0 +1,96 @@
+"""
+분석 스냅샷 Blob 저장소 테스트
+- 압축 저장/조회 왕복, 사용자 분리, 크기 제한, TTL 만료, LRU 정리 검증
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.snapshot_store import SnapshotStore
+
+
+def make_frame(n=200, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'date': pd.date_range('2025-01-01', periods=n, freq='h').strftime('%Y-%m-%d'),
+        'campaign_name': rng.choice(['검색_브랜드', '검색_일반', '디스플레이'], n),
+        'spend': rng.integers(0, 100000, n).astype(float),
+        'clicks': rng.integers(0, 500, n),
+        'revenue': rng.integers(0, 500000, n).astype(float),
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(str(tmp_path / 'snapshots'), ttl_seconds=60, sweep_interval=0)
+
+
+@pytest.mark.parametrize('codec', ['zstd', 'lz4'])
+def test_roundtrip(tmp_path, codec):
+    store = SnapshotStore(str(tmp_path / codec), codec=codec, sweep_interval=0)
+    df = make_frame()
+    metrics = {'total_spend': 1234.5, 'campaigns': [{'name': '검색_브랜드', 'roas': 312.4}]}
+
+    assert store.put('u1', 1700000000, df, {'name': '업로드', 'metrics': metrics}) > 0
+
+    loaded, meta = store.get('u1', 1700000000)
+    pd.testing.assert_frame_equal(loaded, df)
+    assert meta['metrics'] == metrics
+    assert meta['name'] == '업로드'
+    assert meta['rows'] == len(df)
+    assert store.get_meta('u1', 1700000000)['metrics'] == metrics
+
+
+def test_mixed_object_column(store):
+    df = pd.DataFrame({'keyword': ['a', 'b', 'c'], 'rank': [1, '-', 3.5]})
+    store.put('u1', 1, df)
+    loaded, _ = store.get('u1', 1)
+    assert loaded['rank'].tolist() == ['1', '-', '3.5']
+
+
+def test_users_are_isolated(store):
+    store.put('u1', 1, make_frame())
+    assert store.get('u2', 1) is None
+    assert store.get_meta('u2', 1) is None
+
+
+def test_blob_size_limit(tmp_path):
+    store = SnapshotStore(str(tmp_path), max_blob_bytes=1024, sweep_interval=0)
+    assert store.put('u1', 1, make_frame(5000)) is None
+    assert store.get('u1', 1) is None
+    assert store.usage()['blobs'] == 0
+
+
+def test_expired_snapshot(store):
+    store.put('u1', 1, make_frame())
+    past = time.time() - 120
+    os.utime(store._path('u1', 1), (past, past))
+    assert store.get('u1', 1) is None
+    assert store.usage()['blobs'] == 0
+
+
+def test_lru_eviction(tmp_path):
+    store = SnapshotStore(str(tmp_path), sweep_interval=0)
+    for i in range(3):
+        store.put('u1', i, make_frame(seed=i))
+    blob_size = store.usage()['total_bytes'] // 3
+
+    # 0번을 가장 최근에 접근 → 1번이 가장 오래된 Blob
+    now = time.time()
+    for i, age in [(0, 0), (1, 30), (2, 20)]:
+        os.utime(store._path('u1', i), (now - age, now - age))
+
+    store.max_total_bytes = blob_size * 2 + blob_size // 2
+    assert store.sweep(force=True) == 1
+    assert store.get_meta('u1', 1) is None
+    assert store.get_meta('u1', 0) is not None
+    assert store.get_meta('u1', 2) is not None
+
+
+def test_invalid_snapshot_id(store):
+    assert store.get('u1', '../x') is None
+    assert store.delete('u1', None) is False
@@ -0,0 +1,91 @@
+"""
+업로드 결과 캐시 테스트
+- 내용 해시 키, 저장/조회 왕복, LRU 정리, 손상된 항목 처리 검증
+"""
+
+import io
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from app.services.upload_cache import UploadCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return UploadCache(str(tmp_path / 'upload_cache'), sweep_interval=0)
+
+
+def make_result(n=50):
+    return pd.DataFrame({
+        '키워드': [f'키워드{i}' for i in range(n)],
+        '광고비': [float(i * 100) for i in range(n)],
+        '총광고수익률': [f'{i * 10:.2f}%' for i in range(n)],
+        'ROAS': [float(i * 10) for i in range(n)],
+    })
+
+
+def test_content_key():
+    stream = io.BytesIO(b'report bytes')
+    stream.seek(5)
+
+    key = UploadCache.content_key(stream, '1')
+    assert stream.tell() == 0
+    assert len(key) == 64
+    assert key == UploadCache.content_key(io.BytesIO(b'report bytes'), '1')
+    assert key != UploadCache.content_key(io.BytesIO(b'report bytes'), '2')
+    assert key != UploadCache.content_key(io.BytesIO(b'other bytes'), '1')
+
+
+def test_roundtrip(cache):
+    key = UploadCache.content_key(io.BytesIO(b'a'), '1')
+    assert cache.get(key) is None
+
+    df = make_result()
+    meta = {'summary': {'총광고비': 122500}, 'data_type': '14일', 'warning': None}
+    cache.put(key, df, meta)
+
+    cached_df, cached_meta = cache.get(key)
+    pd.testing.assert_frame_equal(cached_df, df)
+    assert cached_meta['summary'] == meta['summary']
+    assert cached_meta['data_type'] == '14일'
+    assert cached_meta['rows'] == len(df)
+
+
+def test_invalid_key(cache):
+    assert cache.get('../../etc/passwd') is None
+    with pytest.raises(ValueError):
+        cache.put('abc', make_result(), {})
+
+
+def test_corrupt_entry_is_dropped(cache):
+    key = UploadCache.content_key(io.BytesIO(b'a'), '1')
+    cache.put(key, make_result(), {'summary': {}, 'data_type': '14일'})
+    data_path, _ = cache._paths(key)
+    with open(data_path, 'wb') as f:
+        f.write(b'not parquet')
+
+    assert cache.get(key) is None
+    assert not os.listdir(cache.root_dir)
+
+
+def test_lru_eviction(cache):
+    keys = [UploadCache.content_key(io.BytesIO(bytes([i])), '1') for i in range(3)]
+    for key in keys:
+        cache.put(key, make_result(), {'summary': {}, 'data_type': '14일'})
+
+    # 0번을 가장 최근에 조회 → 1번이 가장 오래된 항목
+    now = time.time()
+    for key, age in zip(keys, [0, 30, 20]):
+        _, meta_path = cache._paths(key)
+        os.utime(meta_path, (now - age, now - age))
+
+    entry_size = sum(os.path.getsize(p) for p in cache._paths(keys[0]))
+    cache.max_total_bytes = entry_size * 2 + entry_size // 2
+
+    assert cache.sweep(force=True) == 1
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
@@ -0,0 +1,125 @@
+"""
+업로드 작업 큐 테스트
+- 작업 상태 저장소 수명주기(queued → running → done/failed), 만료 정리, 작업 실행 오류 처리
+- 프로세스 풀을 통한 실제 비동기 실행
+"""
+
+import io
+import os
+import time
+
+import numpy as np
+import pytest
+
+from app.routes.ad_analysis import SnapshotTooLargeError
+from app.services.upload_jobs import UploadJobStore, UploadJobQueue, run_job
+
+
+def echo_handler(source, progress=None, multiplier=1):
+    """업로드 바이트 길이를 돌려주는 처리 함수 (풀 워커에서 pickle로 전달되도록 모듈 최상위 정의)"""
+    progress('parse')
+    size = len(source.read())
+    progress('metrics')
+    return {'success': True, 'size': size * multiplier, 'total': np.int64(size)}
+
+
+def invalid_handler(source, progress=None):
+    raise ValueError('필수 컬럼 누락')
+
+
+def broken_handler(source, progress=None):
+    raise RuntimeError('boom')
+
+
+def oversized_handler(source, progress=None):
+    raise SnapshotTooLargeError('데이터가 너무 큽니다')
+
+
+@pytest.fixture
+def store(tmp_path):
+    return UploadJobStore(str(tmp_path / 'jobs'), ttl_seconds=60, sweep_interval=0)
+
+
+def create_job(store, payload=b'report bytes'):
+    return store.create(io.BytesIO(payload), {'user_id': 'u1', 'kind': 'upload', 'filename': 'a.xlsx'})
+
+
+def test_lifecycle(store):
+    job_id = create_job(store)
+    assert UploadJobStore.is_valid_id(job_id)
+
+    status = store.get_status(job_id)
+    assert status['status'] == 'queued'
+    assert status['user_id'] == 'u1'
+    with open(store.upload_path(job_id), 'rb') as f:
+        assert f.read() == b'report bytes'
+
+    status = store.set_stage(job_id, 'metrics')
+    assert status['status'] == 'running'
+    assert status['stage'] == 'metrics'
+    assert 0 < status['progress'] < 100
+    assert store.get_result(job_id) is None
+
+    store.finish(job_id, {'success': True, 'total': np.int64(3)})
+    assert store.get_status(job_id)['status'] == 'done'
+    assert store.get_status(job_id)['progress'] == 100
+    assert store.get_result(job_id) == {'success': True, 'total': 3}
+    assert not os.path.exists(store.upload_path(job_id))
+
+
+def test_invalid_id(store):
+    assert store.get_status('../../etc/passwd') is None
+    assert store.get_result('abc') is None
+    assert store.delete('../x') is False
+
+
+def test_run_job(store):
+    job_id = create_job(store)
+    run_job(store.root_dir, job_id, echo_handler, {'multiplier': 2})
+
+    assert store.get_status(job_id)['status'] == 'done'
+    assert store.get_result(job_id) == {'success': True, 'size': 24, 'total': 12}
+
+
+@pytest.mark.parametrize('handler,message,status_code', [
+    (invalid_handler, '필수 컬럼 누락', 400),
+    (broken_handler, '처리 중 오류: boom', 500),
+    (oversized_handler, '데이터가 너무 큽니다', 413),
+])
+def test_run_job_failure(store, handler, message, status_code):
+    job_id = create_job(store)
+    run_job(store.root_dir, job_id, handler, {})
+
+    status = store.get_status(job_id)
+    assert status['status'] == 'failed'
+    assert status['error'] == message
+    assert status['status_code'] == status_code
+    assert store.get_result(job_id) is None
+    assert not os.path.exists(store.upload_path(job_id))
+
+
+def test_sweep_expired(store):
+    old_job, new_job = create_job(store), create_job(store)
+    status_path = os.path.join(store.root_dir, old_job, 'status.json')
+    past = time.time() - 120
+    os.utime(status_path, (past, past))
+
+    assert store.sweep(force=True) == 1
+    assert store.get_status(old_job) is None
+    assert store.get_status(new_job) is not None
+
+
+def test_queue_runs_in_process_pool(store):
+    queue = UploadJobQueue(store, max_workers=1)
+    try:
+        job_id = queue.submit(io.BytesIO(b'x' * 100), echo_handler,
+                              {'user_id': 'u1', 'kind': 'upload', 'filename': 'a.xlsx'}, {'multiplier': 3})
+
+        deadline = time.time() + 60
+        while store.get_status(job_id)['status'] not in ('done', 'failed') and time.time() < deadline:
+            time.sleep(0.05)
+
+        assert store.get_status(job_id)['status'] == 'done'
+        assert store.get_result(job_id)['size'] == 300
+    finally:
+        queue.shutdown()